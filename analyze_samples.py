@@ -1,11 +1,18 @@
 #!/usr/bin/env python3
 import json
+from resume_store import ResumeStore
+
+BATCH_FILE = 'resume_collections/batch_20250718_185026.json'
 
 # Load the completed batch
-with open('resume_collections/batch_20250718_185026.json', 'r') as f:
+with open(BATCH_FILE, 'r') as f:
     data = json.load(f)
     resumes = data['resumes']
 
+# Indexed copy for the lookups below
+store = ResumeStore(':memory:')
+store.import_file(BATCH_FILE)
+
 print("=== GITHUB RESUME COLLECTION SAMPLE ===\n")
 print(f"Total resumes analyzed: {len(resumes)}")
 print("\n" + "="*50 + "\n")
@@ -26,16 +33,16 @@ print(f"   Top Project: {ali['top_repos'][0]['name']} - {ali['top_repos'][0]['st
 print()
 
 # 2. AI/ML Engineer
-ml_dev = next((r for r in resumes if 'Machine Learning' in r.get('bio', '')), resumes[3])
+ml_dev = (store.query(bio_contains='Machine Learning', order_by='seq', limit=1) or [resumes[3]])[0]
 print("2️⃣ AI/ML ENGINEER")
 print(f"   Name: {ml_dev['name']}")
 print(f"   Location: {ml_dev['location']}")
-print(f"   Bio: {ml_dev.get('bio', 'N/A')[:80]}...")
+print(f"   Bio: {(ml_dev.get('bio') or 'N/A')[:80]}...")
 print(f"   Skills: {', '.join([s for s in ml_dev['skills'] if s in ['Python', 'Jupyter Notebook', 'Scala', 'Java']])}")
 print()
 
 # 3. Junior Developer
-junior = next((r for r in resumes if r['public_repos'] < 20 and r['followers'] < 10), resumes[10])
+junior = (store.query(max_repos=19, max_followers=9, order_by='seq', limit=1) or [resumes[10]])[0]
 print("3️⃣ JUNIOR DEVELOPER")
 print(f"   GitHub: {junior['github_username']}")
 print(f"   Location: {junior.get('location', 'N/A')}")
@@ -48,12 +55,7 @@ print("\n" + "="*50 + "\n")
 # Skills Analysis
 print("💻 TOP PROGRAMMING LANGUAGES:\n")
 from collections import Counter
-all_skills = []
-for r in resumes:
-    all_skills.extend(r['skills'])
-skill_counts = Counter(all_skills)
-
-for skill, count in skill_counts.most_common(10):
+for skill, count in store.skill_counts(10):
     bar = "█" * int(count/2)
     print(f"   {skill:<15} {bar} {count}")
 
@@ -61,17 +63,10 @@ print("\n" + "="*50 + "\n")
 
 # Geographic Distribution
 print("🌍 GEOGRAPHIC DISTRIBUTION:\n")
+from location_gazetteer import country_code_of
 locations = [r.get('location', '') for r in resumes if r.get('location')]
-countries = []
-for loc in locations:
-    if 'USA' in loc or 'United States' in loc:
-        countries.append('USA')
-    elif 'UK' in loc or 'United Kingdom' in loc:
-        countries.append('UK')
-    elif 'Canada' in loc:
-        countries.append('Canada')
-    else:
-        countries.append('Other')
+country_labels = {'US': 'USA', 'GB': 'UK', 'CA': 'Canada'}
+countries = [country_labels.get(country_code_of(loc), 'Other') for loc in locations]
 
 country_counts = Counter(countries)
 for country, count in country_counts.most_common():
@@ -98,8 +93,10 @@ avg_followers = total_followers / len(resumes)
 
 print(f"   Average repos per developer: {avg_repos:.1f}")
 print(f"   Average followers: {avg_followers:.1f}")
-print(f"   Most active: {max(resumes, key=lambda x: x['public_repos'])['github_username']} ({max(r['public_repos'] for r in resumes)} repos)")
-print(f"   Most followed: {max(resumes, key=lambda x: x['followers'])['github_username']} ({max(r['followers'] for r in resumes)} followers)")
+most_active = store.query(order_by='public_repos', limit=1)[0]
+most_followed = store.query(order_by='followers', limit=1)[0]
+print(f"   Most active: {most_active['github_username']} ({most_active['public_repos']} repos)")
+print(f"   Most followed: {most_followed['github_username']} ({most_followed['followers']} followers)")
 
 print("\n" + "="*50 + "\n")
 print("✅ Collection Quality: EXCELLENT")
@@ -2,16 +2,17 @@
 """
 Automated GitHub Resume Collection Manager
 Monitors current collection and starts the next batch automatically
+across a supervised pool of collector workers
 """
 
 import os
 import sys
-import time
-import json
-import subprocess
-from datetime import datetime
 import logging
 
+from collection_manifest import CollectionManifest
+from collection_supervisor import CollectionSupervisor
+from progress_channel import subscribe
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -27,95 +28,55 @@ def check_collection_status():
     """Check if current collection is complete"""
     # Check for batch files in resume_collections
     try:
-        files = [f for f in os.listdir('resume_collections') 
-                if f.startswith('batch_') and f.endswith('.json') 
-                and 'partial' not in f]
-        
+        # Counts come from the collection manifest, not from parsing each batch
         total_collected = 0
-        for file in files:
-            with open(os.path.join('resume_collections', file), 'r') as f:
-                data = json.load(f)
-                count = data.get('metadata', {}).get('count', 0)
-                total_collected += count
-                logger.info(f"Found {count} resumes in {file}")
+        for batch in CollectionManifest('resume_collections').list_batches(include_partial=False):
+            total_collected += batch['count']
+            logger.info(f"Found {batch['count']} resumes in {batch['filename']}")
         
         return total_collected
     except Exception as e:
         logger.error(f"Error checking collection status: {e}")
         return 0
 
-def is_collection_running():
-    """Check if collection process is still running"""
-    try:
-        # Check if python process with production_collector.py is running
-        result = subprocess.run(['pgrep', '-f', 'production_collector.py'], 
-                              capture_output=True, text=True)
-        return result.returncode == 0
-    except:
-        return False
+def follow_progress(target_count=None):
+    """Log pushed progress until the collector exits; returns the last event seen"""
+    last_event = None
+    last_logged = 0
+    stale_threshold = 300  # 5 minutes without an event
+    
+    for event in subscribe(timeout=stale_threshold):
+        if event['type'] == 'idle':
+            logger.warning("No progress in 5 minutes, collection may be stuck")
+            continue
+        last_event = event
+        if event['type'] == 'progress':
+            current = event['resumes_collected']
+            # Events arrive per resume; log every 100
+            if current - last_logged >= 100:
+                logger.info(f"Progress: {current}/{target_count or event.get('target')} resumes")
+                last_logged = current
+        elif event['type'] == 'batch_saved':
+            logger.info(f"Saved {event['count']} resumes to {event['file']}")
+        elif event['type'] == 'finished':
+            logger.info("Collector reported completion")
+    
+    return last_event
 
 def wait_for_current_collection():
     """Wait for current collection to complete"""
     logger.info("Monitoring current collection progress...")
     
-    last_checkpoint_time = None
-    stale_threshold = 300  # 5 minutes without update
-    
-    while True:
-        try:
-            # Check if collection is still running
-            if not is_collection_running():
-                logger.info("Collection process has stopped")
-                break
-            
-            # Check checkpoint file
-            if os.path.exists('collection_checkpoint.json'):
-                checkpoint_mtime = os.path.getmtime('collection_checkpoint.json')
-                
-                with open('collection_checkpoint.json', 'r') as f:
-                    checkpoint = json.load(f)
-                    current_count = checkpoint.get('resumes_collected', 0)
-                    
-                logger.info(f"Current progress: {current_count} resumes collected")
-                
-                # Check if checkpoint is stale
-                if last_checkpoint_time and (time.time() - checkpoint_mtime) > stale_threshold:
-                    logger.warning("Checkpoint hasn't updated in 5 minutes, collection may have stopped")
-                    break
-                
-                last_checkpoint_time = checkpoint_mtime
-                
-                # Check if we've reached target
-                if current_count >= 2000:
-                    logger.info("Current collection target reached!")
-                    time.sleep(10)  # Wait for final save
-                    break
-            
-            time.sleep(30)  # Check every 30 seconds
-            
-        except Exception as e:
-            logger.error(f"Error monitoring collection: {e}")
-            time.sleep(30)
-
-def start_next_collection(target_count):
-    """Start the next collection batch"""
-    logger.info(f"Starting new collection for {target_count} resumes...")
-    
-    # Set environment variable
-    env = os.environ.copy()
-    if 'GITHUB_TOKEN' not in env:
-        raise ValueError("GITHUB_TOKEN environment variable not set!")
-    
-    # Start collection in background
-    process = subprocess.Popen(
-        ['python3', 'production_collector.py', str(target_count)],
-        env=env,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
+    try:
+        last_event = follow_progress()
+    except ConnectionError:
+        logger.info("No collection is running")
+        return
     
-    logger.info(f"Started collection process with PID: {process.pid}")
-    return process
+    if last_event is None or last_event['type'] != 'finished':
+        logger.warning("Collection process stopped without finishing")
+    else:
+        logger.info("Collection process has stopped")
 
 def main():
     logger.info("=== Auto Collection Manager Started ===")
@@ -138,39 +99,21 @@ def main():
     # Start next collection
     logger.info(f"Need {remaining} more resumes to reach target of {target_total}")
     
-    # Clear old checkpoint to start fresh
-    if os.path.exists('collection_checkpoint.json'):
-        os.rename('collection_checkpoint.json', 
-                 f'collection_checkpoint_backup_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json')
-    
-    # Start collection for remaining resumes (max 3000 as requested)
+    # Run the remaining resumes (max 3000 as requested) across a worker pool,
+    # one worker per token unless COLLECTOR_WORKERS says otherwise
     next_batch_size = min(remaining, 3000)
-    process = start_next_collection(next_batch_size)
+    workers = int(os.environ['COLLECTOR_WORKERS']) if os.environ.get('COLLECTOR_WORKERS') else None
+    supervisor = CollectionSupervisor(next_batch_size, workers)
+    
+    # Clear old checkpoints to start fresh
+    supervisor.reset_checkpoints()
     
-    # Monitor the new collection
-    logger.info("Monitoring new collection...")
-    while True:
-        try:
-            # Check if process is still running
-            if process.poll() is not None:
-                logger.info("Collection process completed")
-                break
-            
-            # Check progress
-            if os.path.exists('collection_checkpoint.json'):
-                with open('collection_checkpoint.json', 'r') as f:
-                    checkpoint = json.load(f)
-                    current = checkpoint.get('resumes_collected', 0)
-                    logger.info(f"Progress: {current}/{next_batch_size} resumes")
-            
-            time.sleep(60)  # Check every minute
-            
-        except KeyboardInterrupt:
-            logger.info("Monitoring stopped by user")
-            break
-        except Exception as e:
-            logger.error(f"Error during monitoring: {e}")
-            time.sleep(60)
+    logger.info(f"Starting new collection for {next_batch_size} resumes "
+                f"with {len(supervisor.workers)} workers...")
+    try:
+        supervisor.run()
+    except KeyboardInterrupt:
+        logger.info("Collection stopped by user")
     
     # Final summary
     final_total = check_collection_status()
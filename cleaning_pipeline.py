@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Resume Cleaning Pipeline
+Configurable cleaning stages (schema, location, skills, urls, dates) with an
+explicit in-place/copy mode, per-stage timing and process sharding for large batches
+"""
+
+import copy
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from timestamp_normalizer import DATE_FIELDS, normalize_batch, normalize_timestamps
+
+
+# Expected types for the fields the cleaning stages touch
+RESUME_SCHEMA = {
+    'github_username': str,
+    'location': str,
+    'skills': list,
+    'blog': str,
+    'created_at': str,
+    'updated_at': str,
+    'collected_at': str,
+    'public_repos': int,
+    'followers': int,
+    'top_repos': list,
+}
+
+DEFAULT_STAGES = ('schema', 'location', 'skills', 'urls', 'dates')
+
+
+def check_schema(resume: Dict) -> List[str]:
+    """Return schema violations for one resume (None values are allowed)"""
+    if not isinstance(resume, dict):
+        return [f"record is {type(resume).__name__}, expected dict"]
+    problems = []
+    for field, expected in RESUME_SCHEMA.items():
+        value = resume.get(field)
+        if value is not None and not isinstance(value, expected):
+            problems.append(f"{field}: expected {expected.__name__}, got {type(value).__name__}")
+    return problems
+
+
+def stage_location(resume: Dict, stats: Dict) -> None:
+    from data_validator import DataCleaner
+    resume['location_parsed'] = DataCleaner.clean_location(resume.get('location', ''))
+
+
+def stage_skills(resume: Dict, stats: Dict) -> None:
+    from data_validator import DataCleaner
+    if resume.get('skills'):
+        resume['skills'] = DataCleaner.normalize_skills(resume['skills'])
+
+
+def stage_urls(resume: Dict, stats: Dict) -> None:
+    # A malformed profile can carry a non-string blog; the schema stage only reports it
+    if isinstance(resume.get('blog'), str):
+        blog = resume['blog'].strip()
+        if blog and not blog.startswith(('http://', 'https://')):
+            resume['blog'] = f"https://{blog}"
+            stats['urls_fixed'] += 1
+
+
+def stage_dates(resume: Dict, stats: Dict) -> None:
+    # Ensure ISO format and store epoch seconds so downstream code never reparses
+    normalize_timestamps(resume, DATE_FIELDS)
+
+
+STAGES: Dict[str, Callable[[Dict, Dict], None]] = {
+    'location': stage_location,
+    'skills': stage_skills,
+    'urls': stage_urls,
+    'dates': stage_dates,
+}
+
+
+def _run_stages(resumes: List[Dict], stages: Sequence[str]) -> Tuple[List[Dict], Dict]:
+    """Apply stages stage-by-stage over a list of resumes (mutates them)"""
+    stats = {
+        'records': len(resumes),
+        'stage_seconds': defaultdict(float),
+        'schema_violations': defaultdict(int),
+        'rejected': 0,
+        'urls_fixed': 0,
+        'distinct_timestamps': 0,
+    }
+    counters = defaultdict(int)
+
+    for stage in stages:
+        start = time.perf_counter()
+        if stage == 'schema':
+            kept = []
+            for resume in resumes:
+                problems = check_schema(resume)
+                for problem in problems:
+                    stats['schema_violations'][problem.split(':')[0]] += 1
+                if isinstance(resume, dict):
+                    kept.append(resume)
+                else:
+                    stats['rejected'] += 1
+            resumes = kept
+        elif stage == 'dates':
+            # Batch form parses each distinct timestamp string once
+            counters['distinct_timestamps'] += normalize_batch(resumes, DATE_FIELDS)
+        else:
+            fn = STAGES[stage]
+            for resume in resumes:
+                fn(resume, counters)
+        stats['stage_seconds'][stage] += time.perf_counter() - start
+
+    stats['urls_fixed'] = counters['urls_fixed']
+    stats['distinct_timestamps'] = counters['distinct_timestamps']
+    return resumes, stats
+
+
+def _clean_shard(args: Tuple[List[Dict], Sequence[str]]) -> Tuple[List[Dict], Dict]:
+    return _run_stages(*args)
+
+
+class CleaningPipeline:
+    """Runs the configured cleaning stages over resume batches"""
+
+    def __init__(self, stages: Sequence[str] = DEFAULT_STAGES, in_place: bool = True,
+                 workers: int = 1, shard_size: int = 5000, parallel_threshold: int = 20000):
+        unknown = [s for s in stages if s != 'schema' and s not in STAGES]
+        if unknown:
+            raise ValueError(f"Unknown cleaning stage(s): {', '.join(unknown)}")
+        self.stages = tuple(stages)
+        self.in_place = in_place
+        self.workers = max(1, workers)
+        self.shard_size = max(1, shard_size)
+        self.parallel_threshold = parallel_threshold
+        self.last_stats: Dict = {}
+
+    def run(self, resumes: List[Dict]) -> List[Dict]:
+        """Clean a batch; in-place mode mutates and returns the same dicts"""
+        start = time.perf_counter()
+        work = resumes if self.in_place else copy.deepcopy(resumes)
+
+        if self.workers > 1 and len(work) >= self.parallel_threshold:
+            cleaned, stats = self._run_parallel(work)
+        else:
+            cleaned, stats = _run_stages(work, self.stages)
+
+        stats['total_seconds'] = time.perf_counter() - start
+        stats['mode'] = 'in_place' if self.in_place else 'copy'
+        stats['workers'] = self.workers if len(work) >= self.parallel_threshold else 1
+        self.last_stats = stats
+        return cleaned
+
+    def _run_parallel(self, work: List[Dict]) -> Tuple[List[Dict], Dict]:
+        """Shard across processes; results come back as copies and are written back"""
+        shards = [work[i:i + self.shard_size] for i in range(0, len(work), self.shard_size)]
+        merged = {
+            'records': 0,
+            'stage_seconds': defaultdict(float),
+            'schema_violations': defaultdict(int),
+            'rejected': 0,
+            'urls_fixed': 0,
+            'distinct_timestamps': 0,
+        }
+        cleaned: List[Dict] = []
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            results = pool.map(_clean_shard, [(shard, self.stages) for shard in shards])
+            for shard, (shard_cleaned, stats) in zip(shards, results):
+                if self.in_place:
+                    # Keep caller identity: copy cleaned fields back into the original dicts
+                    originals = [r for r in shard if isinstance(r, dict)]
+                    for original, result in zip(originals, shard_cleaned):
+                        original.clear()
+                        original.update(result)
+                    cleaned.extend(originals)
+                else:
+                    cleaned.extend(shard_cleaned)
+
+                merged['records'] += stats['records']
+                merged['rejected'] += stats['rejected']
+                merged['urls_fixed'] += stats['urls_fixed']
+                merged['distinct_timestamps'] += stats['distinct_timestamps']
+                for stage, seconds in stats['stage_seconds'].items():
+                    merged['stage_seconds'][stage] += seconds
+                for field, count in stats['schema_violations'].items():
+                    merged['schema_violations'][field] += count
+
+        return cleaned, merged
+
+    def print_stats(self, stats: Optional[Dict] = None) -> None:
+        """Print per-stage timing for the last run"""
+        stats = stats or self.last_stats
+        if not stats:
+            return
+        print(f"\nCleaned {stats['records']} resumes in {stats['total_seconds']:.3f}s "
+              f"({stats['mode']}, {stats['workers']} worker(s))")
+        for stage in self.stages:
+            print(f"  {stage:<10} {stats['stage_seconds'].get(stage, 0) * 1000:9.2f} ms")
+        if stats['schema_violations']:
+            print("  Schema violations: " +
+                  ", ".join(f"{f}={c}" for f, c in sorted(stats['schema_violations'].items())))
+        if stats['rejected']:
+            print(f"  Rejected non-dict records: {stats['rejected']}")
+
+
+if __name__ == "__main__":
+    import json
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python cleaning_pipeline.py <collection_file.json> [workers]")
+        sys.exit(1)
+
+    with open(sys.argv[1], 'r') as f:
+        data = json.load(f)
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+
+    pipeline = CleaningPipeline(workers=workers, parallel_threshold=1 if workers > 1 else 20000)
+    pipeline.run(data.get('resumes', []))
+    pipeline.print_stats()
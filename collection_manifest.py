@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Collection Manifest
+One small index (resume_collections/manifest.json) recording per-batch count,
+collection time range, errors and content hash, updated atomically by writers
+so listing and monitoring never need to open the batch files themselves
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from streaming_merge import read_batch_metadata
+
+
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+HASH_CHUNK = 1 << 20
+
+
+def file_sha256(path: str) -> str:
+    """Hash a file in fixed-size chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _atomic_write_json(path: str, data: Dict, indent: Optional[int] = None) -> None:
+    """Write to a temp file in the same directory, fsync, then rename over the target"""
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=indent)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class CollectionManifest:
+    """Batch index for a collection directory"""
+
+    def __init__(self, collection_dir: str = "resume_collections"):
+        self.collection_dir = collection_dir
+        self.path = os.path.join(collection_dir, MANIFEST_NAME)
+        self.lock_path = self.path + '.lock'
+
+    @contextmanager
+    def _locked(self):
+        """Exclusive lock so concurrent writers don't lose each other's updates"""
+        os.makedirs(self.collection_dir, exist_ok=True)
+        with open(self.lock_path, 'w') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def load(self) -> Dict:
+        """Read the manifest (empty if missing or unreadable)"""
+        try:
+            with open(self.path, 'r') as f:
+                manifest = json.load(f)
+            if manifest.get('version') == MANIFEST_VERSION:
+                return manifest
+        except (OSError, ValueError):
+            pass
+        return {'version': MANIFEST_VERSION, 'batches': {}}
+
+    def mtime(self) -> float:
+        """Manifest modification time (0 if missing), for cheap change polling"""
+        try:
+            return os.path.getmtime(self.path)
+        except OSError:
+            return 0.0
+
+    def _entry(self, path: str, metadata: Dict, resumes: Optional[List[Dict]] = None,
+               content_hash: Optional[str] = None) -> Dict:
+        stat = os.stat(path)
+        collected = [r.get('collected_at') for r in resumes or [] if r.get('collected_at')]
+        return {
+            'count': metadata.get('count', len(resumes) if resumes is not None else 0),
+            'collected_at': metadata.get('collected_at', ''),
+            'first_collected_at': min(collected) if collected else metadata.get('collected_at', ''),
+            'last_collected_at': max(collected) if collected else metadata.get('collected_at', ''),
+            'errors': metadata.get('errors', 0),
+            'partial': 'partial' in os.path.basename(path),
+            'sha256': content_hash,
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+        }
+
+    def record_batch(self, path: str, metadata: Dict, resumes: Optional[List[Dict]] = None,
+                     hash_file: bool = True) -> Dict:
+        """Add or replace the manifest entry for a batch file that is already on disk"""
+        entry = self._entry(path, metadata, resumes, file_sha256(path) if hash_file else None)
+        with self._locked():
+            manifest = self.load()
+            manifest['batches'][os.path.basename(path)] = entry
+            manifest['updated_at'] = datetime.now().isoformat()
+            _atomic_write_json(self.path, manifest, indent=2)
+        return entry
+
+    def write_batch(self, path: str, metadata: Dict, resumes: List[Dict]) -> Dict:
+        """Write a batch file atomically and record it in the manifest"""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        _atomic_write_json(path, {'metadata': metadata, 'resumes': resumes}, indent=2)
+        return self.record_batch(path, metadata, resumes)
+
+    def _scan(self) -> Dict[str, os.stat_result]:
+        """Stat every batch file in the directory"""
+        if not os.path.isdir(self.collection_dir):
+            return {}
+        return {
+            file: os.stat(os.path.join(self.collection_dir, file))
+            for file in os.listdir(self.collection_dir)
+            if file.startswith('batch_') and file.endswith(('.json', '.jsonl'))
+        }
+
+    @staticmethod
+    def _is_current(entry: Optional[Dict], stat: os.stat_result) -> bool:
+        return bool(entry) and entry.get('size') == stat.st_size and entry.get('mtime') == stat.st_mtime
+
+    def refresh(self) -> Dict:
+        """Sync with the directory: drop deleted batches, backfill new or changed ones
+
+        Backfill reads only each file's metadata block; hashes of backfilled
+        entries are left empty until verify() is run.
+        """
+        manifest = self.load()
+        on_disk = self._scan()
+        batches = manifest['batches']
+        if set(batches) == set(on_disk) and all(
+                self._is_current(batches[file], stat) for file, stat in on_disk.items()):
+            return manifest
+
+        with self._locked():
+            manifest = self.load()
+            batches = manifest['batches']
+            for file in list(batches):
+                if file not in on_disk:
+                    del batches[file]
+            for file, stat in on_disk.items():
+                if self._is_current(batches.get(file), stat):
+                    continue
+                path = os.path.join(self.collection_dir, file)
+                try:
+                    batches[file] = self._entry(path, read_batch_metadata(path))
+                except (OSError, ValueError):
+                    continue
+            manifest['updated_at'] = datetime.now().isoformat()
+            _atomic_write_json(self.path, manifest, indent=2)
+        return manifest
+
+    def list_batches(self, include_partial: bool = True, refresh: bool = True) -> List[Dict]:
+        """Batch entries sorted by collected_at"""
+        manifest = self.refresh() if refresh else self.load()
+        batches = []
+        for file, entry in manifest['batches'].items():
+            if not include_partial and entry.get('partial'):
+                continue
+            batches.append({
+                'filename': file,
+                'path': os.path.join(self.collection_dir, file),
+                **entry
+            })
+        return sorted(batches, key=lambda x: x['collected_at'])
+
+    def total_count(self, include_partial: bool = False) -> int:
+        """Sum of batch counts from the manifest"""
+        return sum(b['count'] for b in self.list_batches(include_partial=include_partial))
+
+    def verify(self, filename: str) -> bool:
+        """Re-hash a batch and compare against the manifest (fills in a missing hash)"""
+        path = os.path.join(self.collection_dir, filename)
+        entry = self.load()['batches'].get(filename)
+        if entry is None:
+            raise ValueError(f"{filename} is not in the manifest")
+        if not entry.get('sha256'):
+            self.record_batch(path, read_batch_metadata(path), hash_file=True)
+            return True
+        return file_sha256(path) == entry['sha256']
+
+
+if __name__ == "__main__":
+    import sys
+
+    manifest = CollectionManifest(sys.argv[2] if len(sys.argv) > 2 else "resume_collections")
+    if len(sys.argv) > 1 and sys.argv[1] == "verify":
+        for batch in manifest.list_batches():
+            status = 'ok' if manifest.verify(batch['filename']) else 'HASH MISMATCH'
+            print(f"{batch['filename']:<40} {status}")
+    else:
+        for batch in manifest.list_batches():
+            print(f"{batch['filename']:<40} {batch['count']:>8} {batch['errors']:>6} {batch['collected_at'][:19]}")
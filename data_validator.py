@@ -7,14 +7,23 @@ Quality checks, deduplication, and comprehensive statistics
 import json
 import os
 from datetime import datetime
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 from collections import Counter, defaultdict
 import statistics
-import re
+
+from validation_primitives import is_valid_email, is_valid_url
+from location_gazetteer import resolve_location
+from scoring_rules import ScoringRules, load_default_rules
+from skill_index import SkillIndex
+from timestamp_normalizer import age_days, get_epoch
 
 
 class ResumeDataValidator:
-    def __init__(self):
+    def __init__(self, rules: Optional[ScoringRules] = None):
+        # Weights, thresholds and issue texts live in quality_rules.json
+        self.rules = rules or load_default_rules()
+        # Skill postings, built incrementally across validate_batch calls
+        self.skill_index = SkillIndex()
         self.validation_results = {
             'total_resumes': 0,
             'valid_resumes': 0,
@@ -22,96 +31,40 @@ class ResumeDataValidator:
             'duplicates': 0,
             'quality_issues': defaultdict(int),
             'field_completeness': defaultdict(int),
-            'skill_distribution': Counter(),
             'location_distribution': Counter(),
             'experience_distribution': defaultdict(int)
         }
     
     def validate_email(self, email: str) -> bool:
         """Validate email format"""
-        if not email:
-            return False
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        return is_valid_email(email)
     
     def validate_url(self, url: str) -> bool:
         """Validate URL format"""
-        if not url:
-            return False
-        pattern = r'^https?://[^\s/$.?#].[^\s]*$'
-        return bool(re.match(pattern, url))
+        return is_valid_url(url)
     
     def calculate_resume_quality_score(self, resume: Dict) -> Tuple[float, List[str]]:
-        """Calculate quality score for a resume (0-100)"""
-        score = 0
-        issues = []
-        
-        # Required fields (40 points)
-        required_fields = ['github_username', 'github_url', 'name']
-        for field in required_fields:
-            if resume.get(field):
-                score += 40 / len(required_fields)
-            else:
-                issues.append(f"Missing required field: {field}")
-        
-        # Contact information (20 points)
-        if resume.get('email') and self.validate_email(resume['email']):
-            score += 10
-        elif resume.get('email'):
-            issues.append("Invalid email format")
-        
-        if resume.get('location'):
-            score += 5
-        
-        if resume.get('blog') and self.validate_url(resume['blog']):
-            score += 5
-        
-        # Professional information (20 points)
-        if resume.get('bio') and len(resume['bio']) > 20:
-            score += 10
-        elif resume.get('bio'):
-            issues.append("Bio too short")
-        
-        if resume.get('company'):
-            score += 10
-        
-        # Technical information (20 points)
-        if resume.get('skills') and len(resume['skills']) > 0:
-            score += 10
-        else:
-            issues.append("No skills identified")
-        
-        if resume.get('public_repos', 0) > 5:
-            score += 5
-        
-        if resume.get('top_repos') and len(resume['top_repos']) > 0:
-            score += 5
-        else:
-            issues.append("No repository information")
-        
-        return score, issues
+        """Calculate quality score for a resume (0-100) using the compiled rules"""
+        return self.rules.evaluate(resume)
     
     def analyze_experience_level(self, resume: Dict) -> str:
         """Estimate experience level based on account age and activity"""
-        created_at = resume.get('created_at', '')
-        if not created_at:
+        days_active = age_days(get_epoch(resume, 'created_at'))
+        if days_active is None:
             return 'unknown'
         
         try:
-            created_date = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-            years_active = (datetime.now() - created_date.replace(tzinfo=None)).days / 365
-            
             repos = resume.get('public_repos', 0)
             followers = resume.get('followers', 0)
             
             # Simple heuristic for experience level
-            if years_active < 1:
+            if days_active < 365:
                 return 'entry'
-            elif years_active < 3 and repos < 20:
+            elif days_active < 3 * 365 and repos < 20:
                 return 'junior'
-            elif years_active < 5 or (repos < 50 and followers < 100):
+            elif days_active < 5 * 365 or (repos < 50 and followers < 100):
                 return 'mid'
-            elif years_active < 8 or (repos < 100 and followers < 500):
+            elif days_active < 8 * 365 or (repos < 100 and followers < 500):
                 return 'senior'
             else:
                 return 'expert'
@@ -175,7 +128,7 @@ class ResumeDataValidator:
             # Calculate quality score
             quality_score, issues = self.calculate_resume_quality_score(resume)
             
-            if quality_score >= 40:  # Minimum acceptable quality
+            if self.rules.is_acceptable(quality_score):  # Minimum acceptable quality
                 self.validation_results['valid_resumes'] += 1
                 valid_resumes.append(resume)
                 
@@ -185,18 +138,17 @@ class ResumeDataValidator:
                         self.validation_results['field_completeness'][field] += 1
                 
                 # Track skills
-                for skill in resume.get('skills', []):
-                    self.validation_results['skill_distribution'][skill] += 1
+                self.skill_index.add(username, resume.get('skills') or [])
                 
                 # Track location
                 location = resume.get('location', 'Unknown')
                 if location:
-                    # Extract country/city
-                    location_parts = location.split(',')
-                    if len(location_parts) > 1:
-                        country = location_parts[-1].strip()
+                    # Resolve to a canonical country; fall back to the raw last part
+                    place = resolve_location(location)
+                    if place and place.country:
+                        country = place.country
                     else:
-                        country = location_parts[0].strip()
+                        country = location.split(',')[-1].strip()
                     self.validation_results['location_distribution'][country] += 1
                 
                 # Track experience level
@@ -230,7 +182,7 @@ class ResumeDataValidator:
                                            if self.validation_results['valid_resumes'] > 0 else 0)
         
         # Top skills
-        top_skills = self.validation_results['skill_distribution'].most_common(20)
+        top_skills = self.skill_index.top_k(20)
         
         # Top locations
         top_locations = self.validation_results['location_distribution'].most_common(10)
@@ -340,87 +292,74 @@ class DataCleaner:
     """Clean and standardize resume data"""
     
     @staticmethod
-    def clean_location(location: str) -> Dict[str, str]:
-        """Parse and standardize location data"""
+    def clean_location(location: str) -> Dict[str, Optional[object]]:
+        """Parse and standardize location data; every result has the same keys"""
+        parsed = {'city': '', 'state': '', 'country': '',
+                  'country_code': None, 'latitude': None, 'longitude': None}
         if not location:
-            return {'city': '', 'state': '', 'country': ''}
+            return parsed
+        
+        # Gazetteer lookup handles aliases ("Bay Area") and region/country codes
+        place = resolve_location(location)
+        if place:
+            parsed.update({
+                'city': place.city,
+                'state': place.region,
+                'country': place.country,
+                'country_code': place.country_code or None,
+                'latitude': place.latitude,
+                'longitude': place.longitude
+            })
+            return parsed
         
         # Common patterns
         parts = [p.strip() for p in location.split(',')]
         
         if len(parts) >= 3:
-            return {'city': parts[0], 'state': parts[1], 'country': parts[2]}
+            parsed.update({'city': parts[0], 'state': parts[1], 'country': parts[2]})
         elif len(parts) == 2:
             # Could be City, Country or City, State
             if parts[1].upper() in ['USA', 'US', 'UK', 'CA', 'AU']:
-                return {'city': parts[0], 'state': '', 'country': parts[1]}
+                parsed.update({'city': parts[0], 'country': parts[1]})
             else:
-                return {'city': parts[0], 'state': parts[1], 'country': ''}
+                parsed.update({'city': parts[0], 'state': parts[1]})
         else:
-            return {'city': parts[0], 'state': '', 'country': ''}
+            parsed['city'] = parts[0]
+        return parsed
+    
+    # Common mappings
+    SKILL_MAPPINGS = {
+        'Javascript': 'JavaScript',
+        'Typescript': 'TypeScript',
+        'nodejs': 'Node.js',
+        'Nodejs': 'Node.js',
+        'node': 'Node.js',
+        'react': 'React',
+        'React.js': 'React',
+        'vue': 'Vue.js',
+        'angular': 'Angular',
+        'golang': 'Go',
+        'cpp': 'C++',
+        'csharp': 'C#',
+        'objective-c': 'Objective-C',
+        'Jupyter Notebook': 'Python',  # Often Jupyter files are categorized separately
+    }
     
     @staticmethod
     def normalize_skills(skills: List[str]) -> List[str]:
         """Normalize skill names"""
-        # Common mappings
-        skill_mappings = {
-            'Javascript': 'JavaScript',
-            'Typescript': 'TypeScript',
-            'nodejs': 'Node.js',
-            'Nodejs': 'Node.js',
-            'node': 'Node.js',
-            'react': 'React',
-            'React.js': 'React',
-            'vue': 'Vue.js',
-            'angular': 'Angular',
-            'golang': 'Go',
-            'cpp': 'C++',
-            'csharp': 'C#',
-            'objective-c': 'Objective-C',
-            'Jupyter Notebook': 'Python',  # Often Jupyter files are categorized separately
-        }
-        
-        normalized = []
-        for skill in skills:
-            normalized_skill = skill_mappings.get(skill, skill)
-            if normalized_skill not in normalized:
-                normalized.append(normalized_skill)
-        
-        return normalized
+        mappings = DataCleaner.SKILL_MAPPINGS
+        # dict keys keep first-seen order, so this dedups without a list scan per skill
+        return list(dict.fromkeys(mappings.get(skill, skill) for skill in skills))
     
     @staticmethod
-    def clean_resume_batch(resumes: List[Dict]) -> List[Dict]:
+    def clean_resume_batch(resumes: List[Dict], in_place: bool = True, workers: int = 1,
+                           stages: Optional[Sequence[str]] = None) -> List[Dict]:
         """Clean a batch of resumes"""
-        cleaned = []
-        
-        for resume in resumes:
-            # Clean location
-            location_data = DataCleaner.clean_location(resume.get('location', ''))
-            resume['location_parsed'] = location_data
-            
-            # Normalize skills
-            if resume.get('skills'):
-                resume['skills'] = DataCleaner.normalize_skills(resume['skills'])
-            
-            # Clean URLs
-            if resume.get('blog'):
-                blog = resume['blog'].strip()
-                if blog and not blog.startswith(('http://', 'https://')):
-                    resume['blog'] = f"https://{blog}"
-            
-            # Ensure consistent date formats
-            for date_field in ['created_at', 'updated_at', 'collected_at']:
-                if resume.get(date_field):
-                    try:
-                        # Ensure ISO format
-                        if 'Z' in resume[date_field]:
-                            resume[date_field] = resume[date_field].replace('Z', '+00:00')
-                    except:
-                        pass
-            
-            cleaned.append(resume)
-        
-        return cleaned
+        from cleaning_pipeline import CleaningPipeline, DEFAULT_STAGES
+        pipeline = CleaningPipeline(stages=DEFAULT_STAGES if stages is None else stages, in_place=in_place,
+                                    workers=workers)
+        return pipeline.run(resumes)
 
 
 def validate_collection_file(file_path: str) -> None:
@@ -428,12 +367,19 @@ def validate_collection_file(file_path: str) -> None:
     print(f"\nValidating: {file_path}")
     print("=" * 60)
     
-    # Load data
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-    
-    resumes = data.get('resumes', [])
-    metadata = data.get('metadata', {})
+    # Load data (a Parquet dataset directory from parquet_export, or a JSON collection)
+    if os.path.isdir(file_path):
+        from parquet_export import is_parquet_dataset, load_resume_dicts
+        if not is_parquet_dataset(file_path):
+            raise ValueError(f"{file_path} is not a Parquet resume dataset")
+        resumes = load_resume_dicts(file_path)
+        metadata = {'count': len(resumes), 'collected_at': 'Parquet dataset', 'errors': 'Unknown'}
+    else:
+        with open(file_path, 'r') as f:
+            data = json.load(f)
+        
+        resumes = data.get('resumes', [])
+        metadata = data.get('metadata', {})
     
     print(f"File metadata:")
     print(f"  - Count: {metadata.get('count', 'Unknown')}")
@@ -457,7 +403,10 @@ def validate_collection_file(file_path: str) -> None:
         print(f"  - {cat.replace('_', ' ').title()}: {pct:.1f}%")
     
     # Generate detailed report
-    report_name = file_path.replace('.json', '_validation_report.txt')
+    if os.path.isdir(file_path):
+        report_name = os.path.join(file_path, 'validation_report.txt')
+    else:
+        report_name = file_path.replace('.json', '_validation_report.txt')
     validator.generate_detailed_report(report_name)
 
 
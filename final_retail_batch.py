@@ -1,390 +0,0 @@
-"""
-Final batch to complete Retail & E-commerce sector
-Need exactly 8 more US founders to reach 22 total (20 US + 2 Canada)
-"""
-
-from linkedin_data_collector import collector
-
-def final_retail_batch():
-    """Add the final 8 US founders to complete Retail & E-commerce sector"""
-    
-    final_us_founders = [
-        {
-            'proj_name': 'Vintage Clothing Boutique',
-            'proj_founder': 'Ashley Williams',
-            'proj_category': 'Retail & E-commerce',
-            'proj_location': 'Portland, OR',
-            'proj_launch_date': '2020-08-22',
-            'proj_end_date': '2020-10-07',
-            'fund_goal_usd': '$17000',
-            'fund_raised_usd': '$22500',
-            'fund_success_rate': '132%',
-            'fund_status': 'Funded',
-            'fund_backer_count': '195',
-            'funding_investment_history': '$22.5K Kickstarter, $48K vintage fashion investment 2020',
-            'co_name': 'Timeless Threads LLC',
-            'co_website_url': 'https://timelessthreadspdx.com',
-            'co_current_name': 'Timeless Threads LLC',
-            'co_current_title': 'Founder & Vintage Curator',
-            'co_operational_status': 'Yes',
-            'co_business_status': 'Active - Portland boutique, sustainable fashion leader',
-            'co_growth_metrics': '450+ monthly sales, 4.8 Depop rating, sustainable fashion focus',
-            'co_domain_status': 'Active website with vintage authentication and styling services',
-            'social_linkedin_url': 'https://linkedin.com/in/ashley-williams-vintage-fashion',
-            'social_other_platforms': 'Instagram: @timelessthreadspdx (35K followers), Depop: TimelessThreads',
-            'social_media_activity': 'Daily vintage finds, weekly sustainable fashion education, styling tips',
-            'team_composition': 'Ashley Williams (Founder/Curator), Emma Rodriguez (Stylist), Sam (Authentication)',
-            'team_founder_bio': '9 years vintage fashion experience, Portland native, sustainable fashion advocate',
-            'research_linkedin_query': '"vintage clothing" boutique Portland "sustainable fashion"',
-            'research_verification_sources': 'LinkedIn profile, Portland Monthly, Sustainable Fashion Collective',
-            'research_work_history': 'Vintage Buyer at Buffalo Exchange, Fashion Stylist freelance',
-            'research_education_summary': 'Portland State Fashion Merchandising, Vintage Authentication Certification',
-            'media_press_coverage': 'Portland Monthly Sustainable Fashion 2021, Vogue Sustainability feature',
-            'media_awards_recognition': 'Sustainable Fashion Collective Recognition 2022',
-            'status_legal_compliance': 'Yes',
-            'status_professional_reputation': 'Excellent - Vintage fashion expert, sustainability champion',
-            'li_profile_verified': 'Yes',
-            'li_current_employer': 'Timeless Threads LLC',
-            'li_current_title': 'Founder & Vintage Curator',
-            'li_work_experience': '2020-Present: Founder Timeless Threads | 2016-2020: Vintage Buyer Buffalo Exchange | 2013-2016: Fashion Stylist freelance',
-            'li_education_background': 'Portland State Fashion Merchandising (2011-2013) | Vintage Authentication Certification (2017)',
-            'li_professional_skills': 'Vintage Fashion Curation | Sustainable Fashion | Fashion Styling | Authentication | E-commerce Operations | Customer Education',
-            'li_recent_activity': 'Sustainable fashion practices post | Vintage collection showcase | Portland fashion scene collaboration',
-            'notes_area_of_expertise': 'Vintage_Fashion_Curation|Sustainable_Fashion|Fashion_Authentication',
-            'notes_community_engagement': 'Sustainable_Fashion_Collective|Portland_Fashion_Network|Vintage_Fashion_Society',
-            'notes_business_focus': 'Vintage_Clothing|Sustainable_Fashion|Fashion_Curation'
-        },
-        
-        {
-            'proj_name': 'Artisan Candle Works',
-            'proj_founder': 'Robert Kim',
-            'proj_category': 'Retail & E-commerce',
-            'proj_location': 'Asheville, NC',
-            'proj_launch_date': '2021-07-18',
-            'proj_end_date': '2021-09-02',
-            'fund_goal_usd': '$13000',
-            'fund_raised_usd': '$17200',
-            'fund_success_rate': '132%',
-            'fund_status': 'Funded',
-            'fund_backer_count': '164',
-            'funding_investment_history': '$17.2K Kickstarter, $38K artisan goods investment 2021',
-            'co_name': 'Mountain Glow Candles LLC',
-            'co_website_url': 'https://mountainglowcandles.com',
-            'co_current_name': 'Mountain Glow Candles LLC',
-            'co_current_title': 'Founder & Master Chandler',
-            'co_operational_status': 'Yes',
-            'co_business_status': 'Active - Asheville studio, Blue Ridge Mountain inspiration',
-            'co_growth_metrics': '350+ monthly orders, 4.9 Amazon Handmade rating, soy wax focus',
-            'co_domain_status': 'Active website with scent customization and candle care guides',
-            'social_linkedin_url': 'https://linkedin.com/in/robert-kim-artisan-candles',
-            'social_other_platforms': 'Instagram: @mountainglowcandles (18K followers), Pinterest: MountainGlowCandles',
-            'social_media_activity': 'Daily candle making process, weekly aromatherapy education, mountain lifestyle',
-            'team_composition': 'Robert Kim (Founder/Chandler), Sarah Park (Scent Designer), Mike (Production)',
-            'team_founder_bio': '5 years candle making experience, North Carolina native, aromatherapy enthusiast',
-            'research_linkedin_query': '"artisan candles" "handmade candles" Asheville soy',
-            'research_verification_sources': 'LinkedIn profile, Asheville Citizen-Times, National Candle Association',
-            'research_work_history': 'Candle Production Manager at Yankee Candle, Aromatherapy Consultant',
-            'research_education_summary': 'Western Carolina University Chemistry, National Candle Association Certification',
-            'media_press_coverage': 'Asheville Citizen-Times Local Artisan 2022, Southern Living feature',
-            'media_awards_recognition': 'National Candle Association Craft Excellence Award 2023',
-            'status_legal_compliance': 'Yes',
-            'status_professional_reputation': 'Excellent - Artisan candle expert, aromatherapy specialist',
-            'li_profile_verified': 'Yes',
-            'li_current_employer': 'Mountain Glow Candles LLC',
-            'li_current_title': 'Founder & Master Chandler',
-            'li_work_experience': '2021-Present: Founder Mountain Glow Candles | 2018-2021: Production Manager Yankee Candle | 2016-2018: Aromatherapy Consultant',
-            'li_education_background': 'Western Carolina University Chemistry (2014-2016) | National Candle Association Master Certification (2019)',
-            'li_professional_skills': 'Artisan Candle Making | Aromatherapy | Scent Design | E-commerce Operations | Customer Education | Natural Wax Processing',
-            'li_recent_activity': 'Aromatherapy benefits educational post | New seasonal scent collection | Asheville artisan community event',
-            'notes_area_of_expertise': 'Artisan_Candle_Making|Aromatherapy|Scent_Design',
-            'notes_community_engagement': 'National_Candle_Association|Asheville_Artisan_Network|Aromatherapy_Society',
-            'notes_business_focus': 'Handmade_Candles|Natural_Wax|Aromatherapy_Products'
-        },
-        
-        {
-            'proj_name': 'Board Game Emporium',
-            'proj_founder': 'Daniel Martinez',
-            'proj_category': 'Retail & E-commerce',
-            'proj_location': 'Austin, TX',
-            'proj_launch_date': '2020-06-10',
-            'proj_end_date': '2020-07-25',
-            'fund_goal_usd': '$21000',
-            'fund_raised_usd': '$28000',
-            'fund_success_rate': '133%',
-            'fund_status': 'Funded',
-            'fund_backer_count': '234',
-            'funding_investment_history': '$28K Kickstarter, $62K gaming industry investment 2020',
-            'co_name': 'Austin Board Game Co',
-            'co_website_url': 'https://austinboardgame.com',
-            'co_current_name': 'Austin Board Game Co',
-            'co_current_title': 'Founder & Game Curator',
-            'co_operational_status': 'Yes',
-            'co_business_status': 'Active - Austin game cafe, online board game retailer',
-            'co_growth_metrics': '600+ monthly sales, 4.8 BoardGameGeek rating, community events',
-            'co_domain_status': 'Active website with game reviews and community forum',
-            'social_linkedin_url': 'https://linkedin.com/in/daniel-martinez-board-games',
-            'social_other_platforms': 'YouTube: AustinBoardGameCo (15K subscribers), BGG: AustinBoardGameCo',
-            'social_media_activity': 'Daily game reviews, weekly strategy guides, community event highlights',
-            'team_composition': 'Daniel Martinez (Founder/Curator), Lisa Chen (Events), Mark (Inventory)',
-            'team_founder_bio': '12 years board game industry experience, Austin native, game design enthusiast',
-            'research_linkedin_query': '"board game store" Austin "tabletop games" community',
-            'research_verification_sources': 'LinkedIn profile, Austin American-Statesman, Board Game Industry Association',
-            'research_work_history': 'Game Buyer at Dragon\'s Lair Comics, Board Game Designer freelance',
-            'research_education_summary': 'University of Texas Game Design, Board Game Industry Certification',
-            'media_press_coverage': 'Austin American-Statesman Gaming Community 2021, Tabletop Gaming Magazine feature',
-            'media_awards_recognition': 'Board Game Industry Association Retailer Excellence 2022',
-            'status_legal_compliance': 'Yes',
-            'status_professional_reputation': 'Excellent - Board game expert, community builder',
-            'li_profile_verified': 'Yes',
-            'li_current_employer': 'Austin Board Game Co',
-            'li_current_title': 'Founder & Game Curator',
-            'li_work_experience': '2020-Present: Founder Austin Board Game Co | 2015-2020: Game Buyer Dragon\'s Lair | 2012-2015: Game Designer freelance',
-            'li_education_background': 'University of Texas Game Design (2010-2012) | Board Game Industry Certification (2016)',
-            'li_professional_skills': 'Board Game Curation | Game Design | Community Building | E-commerce Operations | Event Planning | Gaming Industry Knowledge',
-            'li_recent_activity': 'Board game trend analysis | Community tournament announcement | Austin gaming scene collaboration',
-            'notes_area_of_expertise': 'Board_Game_Curation|Game_Design|Community_Building',
-            'notes_community_engagement': 'Board_Game_Industry_Association|Austin_Gaming_Community|Tabletop_Game_Society',
-            'notes_business_focus': 'Board_Games|Tabletop_Gaming|Community_Events'
-        },
-        
-        {
-            'proj_name': 'Gourmet Tea House',
-            'proj_founder': 'Priya Patel',
-            'proj_category': 'Retail & E-commerce',
-            'proj_location': 'San Francisco, CA',
-            'proj_launch_date': '2021-04-25',
-            'proj_end_date': '2021-06-10',
-            'fund_goal_usd': '$32000',
-            'fund_raised_usd': '$41500',
-            'fund_success_rate': '130%',
-            'fund_status': 'Funded',
-            'fund_backer_count': '298',
-            'funding_investment_history': '$41.5K Kickstarter, $89K specialty tea investment 2021',
-            'co_name': 'Golden Gate Tea Co',
-            'co_website_url': 'https://goldengatetoea.com',
-            'co_current_name': 'Golden Gate Tea Co',
-            'co_current_title': 'Founder & Tea Master',
-            'co_operational_status': 'Yes',
-            'co_business_status': 'Active - San Francisco tea house, premium tea subscription service',
-            'co_growth_metrics': '900+ subscribers, 4.9 Yelp rating, direct trade partnerships',
-            'co_domain_status': 'Active website with tea education and brewing guides',
-            'social_linkedin_url': 'https://linkedin.com/in/priya-patel-tea-master',
-            'social_other_platforms': 'Instagram: @goldengatetea (27K followers), YouTube: GoldenGateTeaCo',
-            'social_media_activity': 'Daily tea ceremony posts, weekly tea origin stories, wellness education',
-            'team_composition': 'Priya Patel (Founder/Tea Master), Raj Kumar (Sourcing), Lisa (Customer Experience)',
-            'team_founder_bio': '10 years tea industry experience, Indian-American heritage, certified tea sommelier',
-            'research_linkedin_query': '"specialty tea" "tea house" "premium tea" San Francisco',
-            'research_verification_sources': 'LinkedIn profile, San Francisco Chronicle, Specialty Tea Institute',
-            'research_work_history': 'Tea Buyer at Teavana, Tea Plantation Manager in India',
-            'research_education_summary': 'UC Berkeley International Business, Tea Sommelier Certification',
-            'media_press_coverage': 'San Francisco Chronicle Tea Culture 2022, Food & Wine feature',
-            'media_awards_recognition': 'Specialty Tea Institute Excellence Award 2023',
-            'status_legal_compliance': 'Yes',
-            'status_professional_reputation': 'Excellent - Tea industry expert, cultural ambassador',
-            'li_profile_verified': 'Yes',
-            'li_current_employer': 'Golden Gate Tea Co',
-            'li_current_title': 'Founder & Tea Master',
-            'li_work_experience': '2021-Present: Founder Golden Gate Tea | 2017-2021: Tea Buyer Teavana | 2014-2017: Plantation Manager India',
-            'li_education_background': 'UC Berkeley International Business (2012-2014) | International Tea Sommelier Certification (2016)',
-            'li_professional_skills': 'Tea Curation | Tea Ceremony | Direct Trade Sourcing | E-commerce Operations | Customer Education | Cultural Heritage',
-            'li_recent_activity': 'Tea ceremony workshop announcement | Direct trade farm partnership | San Francisco tea culture advocacy',
-            'notes_area_of_expertise': 'Tea_Curation|Tea_Ceremony|Direct_Trade_Sourcing',
-            'notes_community_engagement': 'Specialty_Tea_Institute|San_Francisco_Food_Network|Cultural_Heritage_Society',
-            'notes_business_focus': 'Premium_Tea|Tea_Education|Cultural_Experience'
-        },
-        
-        {
-            'proj_name': 'Sustainable Fashion Co',
-            'proj_founder': 'Emma Johnson',
-            'proj_category': 'Retail & E-commerce',
-            'proj_location': 'Seattle, WA',
-            'proj_launch_date': '2021-09-05',
-            'proj_end_date': '2021-10-20',
-            'fund_goal_usd': '$29000',
-            'fund_raised_usd': '$37500',
-            'fund_success_rate': '129%',
-            'fund_status': 'Funded',
-            'fund_backer_count': '276',
-            'funding_investment_history': '$37.5K Kickstarter, $82K sustainable fashion fund 2021',
-            'co_name': 'EcoStyle Apparel LLC',
-            'co_website_url': 'https://ecostyleapparel.com',
-            'co_current_name': 'EcoStyle Apparel LLC',
-            'co_current_title': 'Founder & Sustainability Director',
-            'co_operational_status': 'Yes',
-            'co_business_status': 'Active - Seattle studio, sustainable fashion pioneer',
-            'co_growth_metrics': '1.1K+ monthly orders, 4.8 Etsy rating, carbon neutral certified',
-            'co_domain_status': 'Active website with sustainability tracking and impact calculator',
-            'social_linkedin_url': 'https://linkedin.com/in/emma-johnson-sustainable-fashion',
-            'social_other_platforms': 'Instagram: @ecostyleapparel (42K followers), TikTok: @ecostyleco',
-            'social_media_activity': 'Daily sustainable fashion education, weekly eco-tips, transparency reports',
-            'team_composition': 'Emma Johnson (Founder/Director), David Park (Designer), Rachel (Operations)',
-            'team_founder_bio': '8 years sustainable fashion experience, Seattle native, environmental advocate',
-            'research_linkedin_query': '"sustainable fashion" Seattle "eco-friendly clothing" ethical',
-            'research_verification_sources': 'LinkedIn profile, Seattle Times, Sustainable Fashion Alliance',
-            'research_work_history': 'Sustainability Manager at Patagonia, Fashion Designer at Eileen Fisher',
-            'research_education_summary': 'Fashion Institute of Technology, Sustainable Fashion Certification',
-            'media_press_coverage': 'Seattle Times Sustainable Business 2022, Vogue Sustainability feature',
-            'media_awards_recognition': 'Sustainable Fashion Alliance Innovation Award 2023',
-            'status_legal_compliance': 'Yes',
-            'status_professional_reputation': 'Excellent - Sustainable fashion leader, environmental advocate',
-            'li_profile_verified': 'Yes',
-            'li_current_employer': 'EcoStyle Apparel LLC',
-            'li_current_title': 'Founder & Sustainability Director',
-            'li_work_experience': '2021-Present: Founder EcoStyle Apparel | 2017-2021: Sustainability Manager Patagonia | 2014-2017: Fashion Designer Eileen Fisher',
-            'li_education_background': 'Fashion Institute of Technology (2012-2014) | Sustainable Fashion Leadership Certification (2018)',
-            'li_professional_skills': 'Sustainable Fashion Design | Environmental Impact Assessment | Supply Chain Ethics | E-commerce Operations | Brand Development | Consumer Education',
-            'li_recent_activity': 'Sustainable fashion transparency report | New eco-friendly collection | Seattle sustainability conference keynote',
-            'notes_area_of_expertise': 'Sustainable_Fashion_Design|Environmental_Impact|Supply_Chain_Ethics',
-            'notes_community_engagement': 'Sustainable_Fashion_Alliance|Seattle_Green_Business_Network|Environmental_Fashion_Coalition',
-            'notes_business_focus': 'Sustainable_Fashion|Environmental_Impact|Ethical_Manufacturing'
-        },
-        
-        {
-            'proj_name': 'Artisan Leather Goods',
-            'proj_founder': 'Carlos Rodriguez',
-            'proj_category': 'Retail & E-commerce',
-            'proj_location': 'Phoenix, AZ',
-            'proj_launch_date': '2020-12-08',
-            'proj_end_date': '2021-01-22',
-            'fund_goal_usd': '$18000',
-            'fund_raised_usd': '$24500',
-            'fund_success_rate': '136%',
-            'fund_status': 'Funded',
-            'fund_backer_count': '201',
-            'funding_investment_history': '$24.5K Kickstarter, $54K leather goods investment 2021',
-            'co_name': 'Desert Leather Works LLC',
-            'co_website_url': 'https://desertleatherworks.com',
-            'co_current_name': 'Desert Leather Works LLC',
-            'co_current_title': 'Founder & Master Craftsman',
-            'co_operational_status': 'Yes',
-            'co_business_status': 'Active - Phoenix workshop, handcrafted leather goods specialist',
-            'co_growth_metrics': '300+ monthly orders, 4.9 Amazon Handmade rating, custom work focus',
-            'co_domain_status': 'Active website with custom design tools and craftsmanship videos',
-            'social_linkedin_url': 'https://linkedin.com/in/carlos-rodriguez-leather-craftsman',
-            'social_other_platforms': 'Instagram: @desertleatherworks (20K followers), YouTube: DesertLeatherChannel',
-            'social_media_activity': 'Daily craftsmanship videos, weekly leather care education, custom project showcases',
-            'team_composition': 'Carlos Rodriguez (Founder/Craftsman), Maria Lopez (Designer), Tony (Assistant)',
-            'team_founder_bio': '11 years leather crafting experience, Arizona native, traditional techniques specialist',
-            'research_linkedin_query': '"leather goods" craftsman handmade "artisan leather"',
-            'research_verification_sources': 'LinkedIn profile, Arizona Republic, Leather Crafters Guild',
-            'research_work_history': 'Master Craftsman at Tandy Leather, Custom Leather Designer freelance',
-            'research_education_summary': 'Arizona State Fine Arts, Leather Crafters Guild Master Certification',
-            'media_press_coverage': 'Arizona Republic Local Artisan 2022, Cowboys & Indians Magazine feature',
-            'media_awards_recognition': 'Leather Crafters Guild Excellence Award 2023',
-            'status_legal_compliance': 'Yes',
-            'status_professional_reputation': 'Excellent - Master leather craftsman, traditional techniques expert',
-            'li_profile_verified': 'Yes',
-            'li_current_employer': 'Desert Leather Works LLC',
-            'li_current_title': 'Founder & Master Craftsman',
-            'li_work_experience': '2021-Present: Founder Desert Leather Works | 2015-2021: Master Craftsman Tandy Leather | 2012-2015: Custom Designer freelance',
-            'li_education_background': 'Arizona State Fine Arts (2010-2012) | Leather Crafters Guild Master Certification (2017)',
-            'li_professional_skills': 'Leather Crafting | Traditional Techniques | Custom Design | E-commerce Operations | Customer Service | Quality Control',
-            'li_recent_activity': 'Traditional leather techniques tutorial | Custom project showcase | Arizona artisan community collaboration',
-            'notes_area_of_expertise': 'Leather_Crafting|Traditional_Techniques|Custom_Design',
-            'notes_community_engagement': 'Leather_Crafters_Guild|Arizona_Artisan_Network|Traditional_Crafts_Society',
-            'notes_business_focus': 'Handmade_Leather_Goods|Custom_Craftsmanship|Traditional_Techniques'
-        },
-        
-        {
-            'proj_name': 'Specialty Spice Market',
-            'proj_founder': 'Amira Hassan',
-            'proj_category': 'Retail & E-commerce',
-            'proj_location': 'Minneapolis, MN',
-            'proj_launch_date': '2021-05-18',
-            'proj_end_date': '2021-07-02',
-            'fund_goal_usd': '$22000',
-            'fund_raised_usd': '$29000',
-            'fund_success_rate': '132%',
-            'fund_status': 'Funded',
-            'fund_backer_count': '245',
-            'funding_investment_history': '$29K Kickstarter, $65K specialty foods investment 2021',
-            'co_name': 'Spice Route Trading LLC',
-            'co_website_url': 'https://spiceroutetrading.com',
-            'co_current_name': 'Spice Route Trading LLC',
-            'co_current_title': 'Founder & Spice Curator',
-            'co_operational_status': 'Yes',
-            'co_business_status': 'Active - Minneapolis spice shop, global spice sourcing network',
-            'co_growth_metrics': '650+ monthly orders, 4.8 Google rating, 200+ spice varieties',
-            'co_domain_status': 'Active website with spice education and recipe database',
-            'social_linkedin_url': 'https://linkedin.com/in/amira-hassan-spice-curator',
-            'social_other_platforms': 'Instagram: @spiceroutetrading (30K followers), Pinterest: SpiceRouteTrading',
-            'social_media_activity': 'Daily spice education, weekly cooking tutorials, cultural spice stories',
-            'team_composition': 'Amira Hassan (Founder/Curator), Omar Khan (Sourcing), Fatima (Customer Education)',
-            'team_founder_bio': '9 years spice industry experience, Moroccan heritage, culinary spice specialist',
-            'research_linkedin_query': '"specialty spices" "spice market" "gourmet spices" global sourcing',
-            'research_verification_sources': 'LinkedIn profile, Minneapolis Star Tribune, Specialty Food Association',
-            'research_work_history': 'Spice Buyer at Whole Foods, Culinary Spice Consultant',
-            'research_education_summary': 'University of Minnesota Food Science, International Spice Certification',
-            'media_press_coverage': 'Minneapolis Star Tribune Spice Expert 2022, Bon Appétit feature',
-            'media_awards_recognition': 'Specialty Food Association Outstanding Spice Retailer 2023',
-            'status_legal_compliance': 'Yes',
-            'status_professional_reputation': 'Excellent - Spice industry expert, cultural culinary ambassador',
-            'li_profile_verified': 'Yes',
-            'li_current_employer': 'Spice Route Trading LLC',
-            'li_current_title': 'Founder & Spice Curator',
-            'li_work_experience': '2021-Present: Founder Spice Route Trading | 2017-2021: Spice Buyer Whole Foods | 2014-2017: Culinary Spice Consultant',
-            'li_education_background': 'University of Minnesota Food Science (2012-2014) | International Spice Institute Certification (2016)',
-            'li_professional_skills': 'Spice Curation | Global Sourcing | Culinary Education | E-commerce Operations | Cultural Heritage | Quality Control',
-            'li_recent_activity': 'Global spice sourcing expedition | New spice blend collection | Minneapolis culinary scene collaboration',
-            'notes_area_of_expertise': 'Spice_Curation|Global_Sourcing|Culinary_Education',
-            'notes_community_engagement': 'Specialty_Food_Association|Minneapolis_Culinary_Network|International_Spice_Society',
-            'notes_business_focus': 'Specialty_Spices|Global_Sourcing|Culinary_Education'
-        },
-        
-        {
-            'proj_name': 'Handcrafted Pottery Studio',
-            'proj_founder': 'Michael Thompson',
-            'proj_category': 'Retail & E-commerce',
-            'proj_location': 'Sedona, AZ',
-            'proj_launch_date': '2021-08-15',
-            'proj_end_date': '2021-09-30',
-            'fund_goal_usd': '$16000',
-            'fund_raised_usd': '$21500',
-            'fund_success_rate': '134%',
-            'fund_status': 'Funded',
-            'fund_backer_count': '178',
-            'funding_investment_history': '$21.5K Kickstarter, $46K pottery arts investment 2021',
-            'co_name': 'Red Rock Pottery LLC',
-            'co_website_url': 'https://redrockpottery.com',
-            'co_current_name': 'Red Rock Pottery LLC',
-            'co_current_title': 'Founder & Master Potter',
-            'co_operational_status': 'Yes',
-            'co_business_status': 'Active - Sedona studio gallery, Southwestern pottery specialist',
-            'co_growth_metrics': '280+ monthly pieces sold, 4.9 Etsy rating, gallery partnerships',
-            'co_domain_status': 'Active website with pottery process videos and custom commissions',
-            'social_linkedin_url': 'https://linkedin.com/in/michael-thompson-potter',
-            'social_other_platforms': 'Instagram: @redrockpottery (16K followers), Pinterest: RedRockPottery',
-            'social_media_activity': 'Daily pottery wheel videos, weekly technique tutorials, Southwestern art inspiration',
-            'team_composition': 'Michael Thompson (Founder/Potter), Sarah Wilson (Glazing Specialist), Jake (Studio Assistant)',
-            'team_founder_bio': '13 years pottery experience, Arizona native, Southwestern pottery traditions specialist',
-            'research_linkedin_query': '"handcrafted pottery" Sedona "ceramic art" Southwest',
-            'research_verification_sources': 'LinkedIn profile, Arizona Daily Sun, American Craft Council',
-            'research_work_history': 'Studio Potter at Tlaquepaque Arts Village, Ceramic Art Instructor',
-            'research_education_summary': 'Northern Arizona University Fine Arts, American Craft Council Certification',
-            'media_press_coverage': 'Arizona Daily Sun Sedona Artist 2022, Southwest Art Magazine feature',
-            'media_awards_recognition': 'American Craft Council Excellence in Ceramics 2023',
-            'status_legal_compliance': 'Yes',
-            'status_professional_reputation': 'Excellent - Master potter, Southwestern art specialist',
-            'li_profile_verified': 'Yes',
-            'li_current_employer': 'Red Rock Pottery LLC',
-            'li_current_title': 'Founder & Master Potter',
-            'li_work_experience': '2021-Present: Founder Red Rock Pottery | 2016-2021: Studio Potter Tlaquepaque | 2013-2016: Ceramic Art Instructor',
-            'li_education_background': 'Northern Arizona University Fine Arts (2011-2013) | American Craft Council Master Potter Certification (2018)',
-            'li_professional_skills': 'Pottery Wheel Throwing | Ceramic Glazing | Southwestern Art Traditions | E-commerce Operations | Art Education | Gallery Relations',
-            'li_recent_activity': 'Pottery technique masterclass | New Southwestern collection | Sedona arts community event',
-            'notes_area_of_expertise': 'Pottery_Wheel_Throwing|Ceramic_Glazing|Southwestern_Art_Traditions',
-            'notes_community_engagement': 'American_Craft_Council|Sedona_Arts_Center|Southwestern_Pottery_Society',
-            'notes_business_focus': 'Handcrafted_Pottery|Southwestern_Art|Ceramic_Traditions'
-        }
-    ]
-    
-    # Add all final founders
-    for founder in final_us_founders:
-        collector.add_founder(founder)
-    
-    print(f"\n✅ Added final 8 US Retail & E-commerce founders")
-    print(f"Retail & E-commerce sector: COMPLETE (22/22)")
-
-if __name__ == "__main__":
-    final_retail_batch()
-    collector.show_progress()
\ No newline at end of file
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Founder PSV Codec
+Lossless pipe-separated format shared by every founder collector and
+consolidator. Backslash escaping (\\\\, \\|, \\n, \\r) means a record is always
+exactly one line and a field can hold any text, including pipes and newlines.
+Files start with a versioned schema header:
+
+    #founder-psv v1
+    proj_name|proj_founder|...
+
+The reader splits lines without escapes with str.split (stopping after the
+last projected column), so reading a few of the 43 columns skips parsing the
+rest. Files without the header are read as legacy csv-quoted PSV.
+"""
+
+import csv
+import fcntl
+import os
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+MAGIC = '#founder-psv'
+FORMAT_VERSION = 1
+DELIMITER = '|'
+
+_UNESCAPES = {'\\': '\\', '|': '|', 'n': '\n', 'r': '\r'}
+
+Record = Union[Dict, Sequence]
+
+
+def escape_field(value) -> str:
+    """Encode one value; None becomes an empty field"""
+    if value is None:
+        return ''
+    text = value if isinstance(value, str) else str(value)
+    if '\\' in text or '|' in text or '\n' in text or '\r' in text:
+        text = text.replace('\\', '\\\\').replace('|', '\\|').replace('\n', '\\n').replace('\r', '\\r')
+    return text
+
+
+def encode_row(values: Sequence) -> str:
+    """One record as a single line (without the newline)"""
+    try:
+        line = DELIMITER.join(values)
+    except TypeError:
+        # None or non-string values
+        return DELIMITER.join(escape_field(v) for v in values)
+    # All strings: the plain join is already encoded unless a value needs escaping
+    if line.count(DELIMITER) == len(values) - 1 and '\\' not in line and '\n' not in line and '\r' not in line:
+        return line
+    return DELIMITER.join(escape_field(v) for v in values)
+
+
+def decode_row(line: str, limit: Optional[int] = None) -> List[str]:
+    """Split an encoded line into fields, stopping after `limit` fields if given"""
+    line = line.rstrip('\r\n')
+    if '\\' not in line:
+        return line.split(DELIMITER, limit) if limit else line.split(DELIMITER)
+
+    fields = []
+    current = []
+    chars = iter(line)
+    for ch in chars:
+        if ch == '\\':
+            nxt = next(chars, '')
+            if nxt not in _UNESCAPES:
+                raise ValueError(f"Invalid escape '\\{nxt}'")
+            current.append(_UNESCAPES[nxt])
+        elif ch == DELIMITER:
+            fields.append(''.join(current))
+            current = []
+            if limit and len(fields) == limit:
+                return fields
+        else:
+            current.append(ch)
+    fields.append(''.join(current))
+    return fields
+
+
+def _row_values(record: Record, columns: Sequence[str]) -> Sequence:
+    if isinstance(record, dict):
+        return [record.get(column, '') for column in columns]
+    if len(record) != len(columns):
+        raise ValueError(f"Row has {len(record)} values, expected {len(columns)}")
+    return record
+
+
+def header_lines(columns: Sequence[str]) -> str:
+    return f"{MAGIC} v{FORMAT_VERSION}\n{encode_row(columns)}\n"
+
+
+def read_header(path: str) -> Tuple[int, List[str]]:
+    """(format version, columns); version 0 means a legacy csv-quoted file"""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        first = f.readline()
+        if first.startswith(MAGIC):
+            version = int(first[len(MAGIC):].strip().lstrip('v') or 0)
+            if version > FORMAT_VERSION:
+                raise ValueError(f"{path} uses founder-psv v{version}; this reader supports v{FORMAT_VERSION}")
+            return version, decode_row(f.readline())
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return 0, next(csv.reader(f, delimiter=DELIMITER), [])
+
+
+class FounderReader:
+    """Iterates records of one file, optionally projected to a subset of columns"""
+
+    def __init__(self, path: str, columns: Optional[Sequence[str]] = None, strict: bool = False):
+        self.path = path
+        self.version, self.file_columns = read_header(path)
+        self.columns = list(columns) if columns else list(self.file_columns)
+        missing = [c for c in self.columns if c not in self.file_columns]
+        if missing:
+            raise ValueError(f"{path} has no column(s): {', '.join(missing)}")
+        self.indexes = [self.file_columns.index(c) for c in self.columns]
+        self.strict = strict
+        self.errors: List[Tuple[int, str]] = []  # (line number, reason) of skipped rows
+
+    def _bad(self, line_number: int, reason: str) -> None:
+        if self.strict:
+            raise ValueError(f"{self.path}:{line_number}: {reason}")
+        self.errors.append((line_number, reason))
+
+    def rows(self) -> Iterator[List[str]]:
+        """Projected values per record, in self.columns order"""
+        if self.version == 0:
+            yield from self._legacy_rows()
+            return
+
+        width = len(self.file_columns)
+        pipes = width - 1
+        limit = max(self.indexes) + 1 if self.indexes else 0
+        # Splitting stops after the last wanted column unless every column is wanted
+        split_limit = limit if limit < width else None
+        indexes = self.indexes
+        with open(self.path, 'r', encoding='utf-8', newline='') as f:
+            f.readline()
+            f.readline()
+            for line_number, line in enumerate(f, 3):
+                line = line.rstrip('\r\n')
+                if not line:
+                    continue
+                if '\\' not in line:
+                    # Fast path: count pipes in C to validate, split only as far as needed
+                    if line.count(DELIMITER) != pipes:
+                        self._bad(line_number, f"expected {width} fields, found {line.count(DELIMITER) + 1}")
+                        continue
+                    values = line.split(DELIMITER, split_limit) if split_limit else line.split(DELIMITER)
+                else:
+                    try:
+                        values = decode_row(line)
+                    except ValueError as e:
+                        self._bad(line_number, str(e))
+                        continue
+                    if len(values) != width:
+                        self._bad(line_number, f"expected {width} fields, found {len(values)}")
+                        continue
+                yield [values[i] for i in indexes]
+
+    def _legacy_rows(self) -> Iterator[List[str]]:
+        width = len(self.file_columns)
+        with open(self.path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f, delimiter=DELIMITER)
+            next(reader, None)
+            for values in reader:
+                if not values:
+                    continue
+                if len(values) != width:
+                    self._bad(reader.line_num, f"expected {width} fields, found {len(values)}")
+                    continue
+                yield [values[i] for i in self.indexes]
+
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        columns = self.columns
+        for values in self.rows():
+            yield dict(zip(columns, values))
+
+
+def iter_records(path: str, columns: Optional[Sequence[str]] = None, strict: bool = False) -> Iterator[Dict[str, str]]:
+    """Records as dicts (projected to `columns` if given)"""
+    return iter(FounderReader(path, columns, strict))
+
+
+def read_columns(path: str, columns: Optional[Sequence[str]] = None, strict: bool = False) -> Dict[str, List[str]]:
+    """Columnar read: {column: [values...]} for the requested columns only"""
+    reader = FounderReader(path, columns, strict)
+    data: Dict[str, List[str]] = {c: [] for c in reader.columns}
+    appenders = [data[c].append for c in reader.columns]
+    for values in reader.rows():
+        for append, value in zip(appenders, values):
+            append(value)
+    return data
+
+
+def read_dataframe(path: str, columns: Optional[Sequence[str]] = None, strict: bool = False):
+    """read_columns as a pandas DataFrame of strings"""
+    import pandas as pd
+    return pd.DataFrame(read_columns(path, columns, strict), dtype=str)
+
+
+@contextmanager
+def _locked(path: str):
+    lock_fd = os.open(f"{path}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        fcntl.flock(lock_fd, fcntl.LOCK_UN)
+        os.close(lock_fd)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _write_file(path: str, columns: Sequence[str], records: Iterable[Record]) -> int:
+    """Write a complete file via tmp + rename; returns the record count"""
+    return _write_blocks(path, columns, (encode_row(_row_values(record, columns)) + '\n' for record in records))
+
+
+def _write_blocks(path: str, columns: Sequence[str], blocks: Iterable[str]) -> int:
+    """Write the header and pre-encoded blocks of lines via tmp + rename; returns the record count"""
+    count = 0
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(header_lines(columns))
+            for block in blocks:
+                f.write(block)
+                count += block.count('\n')
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+    return count
+
+
+def write_records(path: str, records: Iterable[Record], columns: Sequence[str]) -> int:
+    """Atomically replace path with the given records (dicts or full-width sequences)"""
+    with _locked(path):
+        return _write_file(path, columns, records)
+
+
+def write_blocks(path: str, blocks: Iterable[str], columns: Sequence[str]) -> int:
+    """Atomically replace path with pre-encoded blocks (see encode_dataframe), written as they arrive"""
+    with _locked(path):
+        return _write_blocks(path, columns, blocks)
+
+
+def encode_dataframe(df, columns: Optional[Sequence[str]] = None) -> str:
+    """A DataFrame's rows as encoded lines, without the header (NaN becomes an empty field)
+
+    Works column by column: each distinct value is encoded once and taken by
+    its factorized code, then rows are joined with str.join.
+    """
+    import numpy as np
+    import pandas as pd
+
+    columns = list(columns or df.columns)
+    if df.empty:
+        return ''
+    fields = []
+    for column in columns:
+        series = df[column]
+        if series.dtype == object and pd.api.types.infer_dtype(series, skipna=True) not in ('string', 'empty'):
+            # Mixed values: factorizing would merge equal-hashing values such as 1 and True
+            fields.append([escape_field(v) if pd.notna(v) else '' for v in series])
+            continue
+        codes, uniques = pd.factorize(series, use_na_sentinel=True)
+        encoded = np.empty(len(uniques) + 1, dtype=object)
+        encoded[:-1] = [escape_field(value) for value in uniques]
+        # Code -1 (missing) takes the last slot
+        encoded[-1] = ''
+        fields.append(encoded[codes].tolist())
+    return '\n'.join(map(DELIMITER.join, zip(*fields))) + '\n'
+
+
+def write_dataframe(path: str, df, columns: Optional[Sequence[str]] = None) -> int:
+    """Atomically write a DataFrame (NaN becomes an empty field)"""
+    columns = list(columns or df.columns)
+    return write_blocks(path, [encode_dataframe(df, columns)], columns)
+
+
+def append_records(path: str, records: Iterable[Record], columns: Sequence[str]) -> int:
+    """Append records with one locked O_APPEND write
+
+    A new file gets the v1 header; a legacy file is converted to v1 first.
+    Raises ValueError if the file's columns differ from `columns`.
+    """
+    lines = [encode_row(_row_values(record, columns)) + '\n' for record in records]
+    with _locked(path):
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            version, file_columns = read_header(path)
+            if list(file_columns) != list(columns):
+                raise ValueError(f"{path} columns differ from the writer's {len(columns)}-column layout")
+            if version == 0:
+                reader = FounderReader(path)
+                rows = list(reader.rows())
+                if reader.errors:
+                    raise ValueError(f"{path} has {len(reader.errors)} unreadable legacy rows; "
+                                     f"run 'python founder_codec.py check {path}' before appending")
+                _write_file(path, columns, rows)
+
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            data = ''.join(lines)
+            if os.fstat(fd).st_size == 0:
+                data = header_lines(columns) + data
+            _write_all(fd, data.encode('utf-8'))
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    return len(lines)
+
+
+def convert_file(path: str, out_path: Optional[str] = None) -> Tuple[int, List[Tuple[int, str]]]:
+    """Rewrite any founder PSV (legacy or v1) as v1; returns (records written, skipped rows)"""
+    reader = FounderReader(path)
+    with _locked(out_path or path):
+        count = _write_file(out_path or path, reader.file_columns, reader.rows())
+    return count, reader.errors
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 3 or sys.argv[1] not in ('check', 'convert', 'head'):
+        print("Usage: python founder_codec.py check|convert|head <file.psv> [columns,...|out.psv]")
+        sys.exit(1)
+
+    command, path = sys.argv[1], sys.argv[2]
+    if command == 'check':
+        reader = FounderReader(path)
+        count = sum(1 for _ in reader.rows())
+        print(f"{path}: founder-psv v{reader.version}, {len(reader.file_columns)} columns, "
+              f"{count} good rows, {len(reader.errors)} bad rows")
+        for line_number, reason in reader.errors[:20]:
+            print(f"  line {line_number}: {reason}")
+    elif command == 'convert':
+        count, errors = convert_file(path, sys.argv[3] if len(sys.argv) > 3 else None)
+        print(f"Wrote {count} records as founder-psv v{FORMAT_VERSION}; skipped {len(errors)} bad rows")
+    else:
+        columns = sys.argv[3].split(',') if len(sys.argv) > 3 else None
+        for i, record in enumerate(iter_records(path, columns)):
+            if i >= 10:
+                break
+            print(record)
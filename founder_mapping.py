@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Founder Field Mapping
+Compiles founder_field_mappings.json into translators from alternate payload
+vocabularies (fund_goal, co_revenue, team_size, ...) to the canonical founder
+record. Each canonical column is produced from one or more source fields by
+renaming, joining, a ratio or a template, with numeric typing (usd, int,
+percent, ...). A translation is one pass over the entry; source fields that are
+neither canonical, mapped nor ignored are counted in the report.
+"""
+
+import json
+import os
+import re
+import string
+from typing import Callable, Dict, List, Optional, Tuple
+
+import founder_schema
+
+DEFAULT_MAPPINGS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'founder_field_mappings.json')
+
+DATE_PATTERN = re.compile(r'^\d{4}(-\d{2}(-\d{2})?)?$')
+SUFFIXES = {'K': 1e3, 'M': 1e6, 'B': 1e9}
+EMPTY = (None, '')
+
+
+def _number(value) -> float:
+    """Parse 31200, '31,200', '$31.2K' or '125%' into a float"""
+    if isinstance(value, bool):
+        raise ValueError(f"expected a number, got {value!r}")
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip().replace(',', '').lstrip('$').rstrip('%').strip()
+    scale = SUFFIXES.get(text[-1:].upper(), 1) if text else 1
+    if scale != 1:
+        text = text[:-1]
+    try:
+        return float(text) * scale
+    except ValueError:
+        raise ValueError(f"expected a number, got {value!r}") from None
+
+
+def _format_number(number: float) -> str:
+    return str(int(number)) if number.is_integer() else f"{number:.2f}"
+
+
+def _to_yes_no(value) -> str:
+    if isinstance(value, bool):
+        return 'Yes' if value else 'No'
+    text = str(value).strip().lower()
+    if text in ('yes', 'y', 'true', '1', 'active'):
+        return 'Yes'
+    if text in ('no', 'n', 'false', '0', 'inactive'):
+        return 'No'
+    raise ValueError(f"expected yes/no, got {value!r}")
+
+
+def _to_url(value) -> str:
+    text = str(value).strip()
+    return text if '://' in text else f"https://{text}"
+
+
+def _to_date(value) -> str:
+    text = str(value).strip()
+    if not DATE_PATTERN.match(text):
+        raise ValueError(f"expected YYYY[-MM[-DD]], got {value!r}")
+    return text
+
+
+CONVERTERS: Dict[str, Callable[[object], str]] = {
+    'text': str,
+    'int': lambda v: str(int(round(_number(v)))),
+    'usd': lambda v: '$' + _format_number(_number(v)),
+    'percent': lambda v: f"{round(_number(v))}%",
+    'yes_no': _to_yes_no,
+    'url': _to_url,
+    'date': _to_date,
+}
+
+
+def _compile_target(target: str, spec: Dict) -> Tuple[List[str], Callable[[Dict], Optional[str]]]:
+    """Turn one target spec into (source fields, producer); the producer returns None when there is no value"""
+    kind = spec.get('type', 'text')
+    if kind not in CONVERTERS:
+        raise ValueError(f"Mapping for '{target}' has unknown type '{kind}'")
+    convert = CONVERTERS[kind]
+
+    if 'ratio' in spec:
+        numerator, denominator = spec['ratio']
+
+        def produce(entry: Dict) -> Optional[str]:
+            top, bottom = entry.get(numerator), entry.get(denominator)
+            if top in EMPTY or bottom in EMPTY or _number(bottom) == 0:
+                return None
+            ratio = _number(top) / _number(bottom)
+            return f"{round(ratio * 100)}%" if kind == 'percent' else convert(ratio)
+
+        return [numerator, denominator], produce
+
+    if 'template' in spec:
+        template = spec['template']
+        sources = [name for _, name, _, _ in string.Formatter().parse(template) if name]
+
+        def produce(entry: Dict) -> Optional[str]:
+            if any(entry.get(name) in EMPTY for name in sources):
+                return None
+            return convert(template.format_map(entry))
+
+        return sources, produce
+
+    if 'from' not in spec:
+        raise ValueError(f"Mapping for '{target}' needs 'from', 'ratio' or 'template'")
+    sources = [spec['from']] if isinstance(spec['from'], str) else list(spec['from'])
+    values = spec.get('values', {})
+    split = spec.get('split')
+    joiner = spec.get('join', ' ')
+
+    def produce(entry: Dict) -> Optional[str]:
+        parts = []
+        for name in sources:
+            value = entry.get(name)
+            if value in EMPTY:
+                continue
+            value = values.get(str(value), value)
+            if split:
+                parts.extend(convert(p.strip()) for p in str(value).split(split) if p.strip())
+            else:
+                parts.append(convert(value))
+        return joiner.join(parts) if parts else None
+
+    return sources, produce
+
+
+class Vocabulary:
+    """One compiled payload vocabulary"""
+
+    def __init__(self, name: str, spec: Dict):
+        self.name = name
+        self.description = spec.get('description', '')
+        self.detect = tuple(spec.get('detect', ()))
+        self.targets: List[Tuple[str, Callable]] = []
+        self.consumed = set(spec.get('ignore', ()))
+        for target, target_spec in spec.get('fields', {}).items():
+            if target not in founder_schema.COLUMN_INDEX:
+                raise ValueError(f"Vocabulary '{name}' maps to unknown column '{target}'")
+            sources, produce = _compile_target(target, target_spec)
+            self.consumed.update(sources)
+            self.targets.append((target, produce))
+
+    def matches(self, entry: Dict) -> bool:
+        return any(key in entry for key in self.detect)
+
+
+def new_report() -> Dict:
+    return {'vocabularies': {}, 'unmapped_fields': {}, 'problems': []}
+
+
+class FounderFieldMappings:
+    """Translates founder payloads in any configured vocabulary to canonical records"""
+
+    def __init__(self, config: Dict):
+        self.common = Vocabulary('common', config.get('common', {}))
+        self.vocabularies = [Vocabulary(name, spec) for name, spec in config.get('vocabularies', {}).items()]
+
+    @classmethod
+    def from_file(cls, path: str = DEFAULT_MAPPINGS_FILE) -> 'FounderFieldMappings':
+        with open(path, 'r') as f:
+            return cls(json.load(f))
+
+    def vocabulary_of(self, entry: Dict) -> Optional[Vocabulary]:
+        for vocabulary in self.vocabularies:
+            if vocabulary.matches(entry):
+                return vocabulary
+        return None
+
+    def translate(self, entry: Dict, report: Optional[Dict] = None, source: str = '') -> Dict:
+        """Canonical record for one entry; canonical fields already present win over mapped ones"""
+        columns = founder_schema.COLUMN_INDEX
+        record = {key: value for key, value in entry.items() if key in columns}
+        vocabulary = self.vocabulary_of(entry)
+        targets = (vocabulary.targets if vocabulary else []) + self.common.targets
+
+        for target, produce in targets:
+            if record.get(target) not in EMPTY:
+                continue
+            try:
+                value = produce(entry)
+            except ValueError as e:
+                if report is not None:
+                    report['problems'].append(f"{source}: {target}: {e}")
+                continue
+            if value is not None:
+                record[target] = value
+
+        if report is not None:
+            name = vocabulary.name if vocabulary else 'canonical'
+            report['vocabularies'][name] = report['vocabularies'].get(name, 0) + 1
+            consumed = self.common.consumed | (vocabulary.consumed if vocabulary else set())
+            unmapped = report['unmapped_fields']
+            for key in entry:
+                if key not in columns and key not in consumed:
+                    unmapped[key] = unmapped.get(key, 0) + 1
+        return record
+
+
+_loaded: Dict[str, FounderFieldMappings] = {}
+
+
+def load_mappings(path: str = DEFAULT_MAPPINGS_FILE) -> FounderFieldMappings:
+    """Compiled mappings for path, compiled once per process"""
+    if path not in _loaded:
+        _loaded[path] = FounderFieldMappings.from_file(path)
+    return _loaded[path]
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python founder_mapping.py <sector_file.jsonl> [mappings.json]")
+        sys.exit(1)
+
+    mappings = load_mappings(sys.argv[2] if len(sys.argv) > 2 else DEFAULT_MAPPINGS_FILE)
+    report = new_report()
+    with open(sys.argv[1], 'r', encoding='utf-8') as f:
+        for number, line in enumerate(f, 1):
+            if line.strip():
+                mappings.translate(json.loads(line), report, f"#{number}")
+    print(f"Vocabularies: {report['vocabularies']}")
+    print(f"Unmapped fields: {report['unmapped_fields'] or 'none'}")
+    for problem in report['problems']:
+        print(f"  {problem}")
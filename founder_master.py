@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Founder Master Consolidation
+Incrementally consolidates founder sources (PSV files and sector files) into
+the master dataset. A SQLite store remembers each source's mtime, size and
+content hash and the records it contributed, so a run re-reads only sources
+whose file changed, replaces their contributions and re-merges just the
+founders they touch. Founders are deduplicated on a normalized name +
+company + location key; for each field the value from the highest-priority
+source wins (later sources in the list outrank earlier ones). The master PSV
+is rewritten atomically from the store, and only when something changed.
+
+Two datasets are built, each with its own store:
+- linkedin_founders_complete_200.psv: the 200-founder master (16 sector
+  targets), built from the roster it has always come from.
+- linkedin_founders_all_sources.psv: the union of the roster, the sector
+  files and the collected profiles. These describe mostly different
+  founders, so it holds far more than 200 (about 395 today) and its
+  per-sector counts are not comparable with the targets.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import unicodedata
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+import founder_codec
+import founder_schema
+from collection_manifest import file_sha256
+from founder_mapping import DEFAULT_MAPPINGS_FILE
+from location_gazetteer import resolve_location
+from sector_ingest import SECTOR_EXTENSIONS, parse_sector_file
+
+DEFAULT_STORE = 'founder_master.sqlite'
+DEFAULT_OUTPUT = 'linkedin_founders_complete_200.psv'
+DEFAULT_SOURCES = ['roster/master_roster.psv']
+ALL_SOURCES_STORE = 'founder_master_all.sqlite'
+ALL_SOURCES_OUTPUT = 'linkedin_founders_all_sources.psv'
+# Lowest priority first: hand-kept rosters, then sector files, then collected profiles
+ALL_SOURCES = ['roster', 'sectors', 'linkedin_founders_collected.psv', 'real_linkedin_founders_verified.psv']
+PSV_EXTENSIONS = ('.psv',)
+SQLITE_BATCH = 500
+WRITE_BATCH = 1000
+
+COMPANY_SUFFIXES = {'co', 'company', 'corp', 'corporation', 'inc', 'incorporated', 'llc', 'ltd', 'limited',
+                    'plc', 'gmbh'}
+_WORD_RE = re.compile(r'[^\W_]+')
+
+
+def _normalize(text: str, drop: Set[str] = frozenset()) -> str:
+    """Accent-, case- and punctuation-insensitive form of text"""
+    if not text.isascii():
+        text = ''.join(ch for ch in unicodedata.normalize('NFKD', text) if not unicodedata.combining(ch))
+    return ' '.join(word for word in _WORD_RE.findall(text.casefold()) if word not in drop)
+
+
+@lru_cache(maxsize=65536)
+def _location_key(location: str) -> str:
+    place = resolve_location(location)
+    if place and place.city:
+        # 'Phoenix, AZ' and 'Phoenix, Arizona' resolve to the same place
+        return _normalize(f"{place.city} {place.region_code} {place.country_code}")
+    return _normalize(location)
+
+
+def founder_key(record: Dict) -> Optional[str]:
+    """Dedupe key: normalized founder name, company (co_name, else proj_name) and location"""
+    name = _normalize(record.get('proj_founder') or '')
+    if not name:
+        return None
+    company = _normalize(record.get('co_name') or record.get('proj_name') or '', COMPANY_SUFFIXES)
+    return f"{name}|{company}|{_location_key(record.get('proj_location') or '')}"
+
+
+def expand_sources(sources: Sequence[str], exclude: Sequence[str] = ()) -> List[Tuple[str, int]]:
+    """(path, priority) per source file; a directory contributes its PSV and sector files
+
+    The priority is the position of the entry in `sources`, so adding or
+    removing a file does not reorder the others; files of one directory rank
+    by path.
+    """
+    excluded = {os.path.abspath(p) for p in exclude}
+    result = []
+    seen = set()
+    for priority, source in enumerate(sources):
+        if os.path.isdir(source):
+            paths = [os.path.join(source, name) for name in sorted(os.listdir(source))
+                     if name.endswith(PSV_EXTENSIONS + SECTOR_EXTENSIONS) and not name.startswith('.')]
+        else:
+            paths = [source] if os.path.exists(source) else []
+        for path in map(os.path.normpath, paths):
+            if path not in seen and os.path.abspath(path) not in excluded:
+                seen.add(path)
+                result.append((path, priority))
+    return result
+
+
+def read_source(path: str, mappings_file: Optional[str] = DEFAULT_MAPPINGS_FILE) -> Tuple[List[Dict], List[str]]:
+    """(records with their non-empty canonical fields, problems) for one PSV or sector file"""
+    columns = founder_schema.COLUMN_INDEX
+    if path.endswith(PSV_EXTENSIONS):
+        reader = founder_codec.FounderReader(path)
+        # PSV values are already strings
+        records = [{k: v for k, v in record.items() if v and k in columns} for record in reader]
+        return records, [f"{path}:{line}: {reason}" for line, reason in reader.errors]
+    result = parse_sector_file(path, mappings_file)
+    records = [{k: str(v) for k, v in record.items() if k in columns and v not in (None, '')}
+               for record in result['founders']]
+    return records, result['problems']
+
+
+class FounderMasterStore:
+    """Per-source founder contributions and the merged founders they produce"""
+
+    def __init__(self, path: str = DEFAULT_STORE):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS sources (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                sha256 TEXT NOT NULL,
+                priority INTEGER NOT NULL,
+                records INTEGER NOT NULL,
+                folded_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS contributions (
+                source TEXT NOT NULL,
+                key TEXT NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (source, key)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_contributions_key ON contributions (key);
+            CREATE TABLE IF NOT EXISTS founders (
+                key TEXT PRIMARY KEY,
+                seq INTEGER NOT NULL,
+                line TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_founders_seq ON founders (seq);
+            CREATE TABLE IF NOT EXISTS meta (
+                name TEXT PRIMARY KEY,
+                value TEXT
+            );
+        """)
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> 'FounderMasterStore':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def get_meta(self, name: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, name: str, value: Optional[str]) -> None:
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (name, value))
+
+    def sources(self) -> Dict[str, Dict]:
+        rows = self.conn.execute("SELECT path, mtime_ns, size, sha256, priority, records FROM sources")
+        return {row[0]: {'mtime_ns': row[1], 'size': row[2], 'sha256': row[3], 'priority': row[4], 'records': row[5]}
+                for row in rows}
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM founders").fetchone()[0]
+
+    def touch_source(self, path: str, stat: os.stat_result, priority: int) -> int:
+        """Record a new mtime/size and priority for a source whose content is unchanged
+
+        A changed priority re-merges the founders of that source; returns how many.
+        """
+        with self.conn:
+            previous = self.conn.execute("SELECT priority FROM sources WHERE path = ?", (path,)).fetchone()
+            self.conn.execute("UPDATE sources SET mtime_ns = ?, size = ?, priority = ? WHERE path = ?",
+                              (stat.st_mtime_ns, stat.st_size, priority, path))
+            if previous is None or previous[0] == priority:
+                return 0
+            keys = self._source_keys(path)
+            self._merge(keys)
+        return len(keys)
+
+    def _source_keys(self, path: str) -> Set[str]:
+        return {row[0] for row in self.conn.execute("SELECT key FROM contributions WHERE source = ?", (path,))}
+
+    def fold_source(self, path: str, records: Iterable[Dict], stat: os.stat_result, sha256: str,
+                    priority: int) -> Tuple[int, int]:
+        """Replace a source's contributions and re-merge the founders it touched; returns (records, founders)"""
+        merged: Dict[str, Dict] = {}
+        count = 0
+        for record in records:
+            key = founder_key(record)
+            if key is None:
+                continue
+            count += 1
+            # A founder listed twice in one source: later non-empty fields win
+            merged.setdefault(key, {}).update(record)
+
+        with self.conn:
+            # New keys in source order, so founders first seen here keep the source's row order
+            previous = self._source_keys(path)
+            affected = list(merged) + [key for key in previous if key not in merged]
+            self.conn.execute("DELETE FROM contributions WHERE source = ?", (path,))
+            self.conn.executemany("INSERT INTO contributions VALUES (?, ?, ?)",
+                                  ((path, key, json.dumps(data, sort_keys=True)) for key, data in merged.items()))
+            self.conn.execute("""
+                INSERT OR REPLACE INTO sources (path, mtime_ns, size, sha256, priority, records, folded_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (path, stat.st_mtime_ns, stat.st_size, sha256, priority, count, datetime.now().isoformat()))
+            self._merge(affected)
+        return count, len(affected)
+
+    def remove_source(self, path: str) -> int:
+        """Drop a source that no longer exists; returns the number of founders re-merged"""
+        with self.conn:
+            affected = self._source_keys(path)
+            self.conn.execute("DELETE FROM contributions WHERE source = ?", (path,))
+            self.conn.execute("DELETE FROM sources WHERE path = ?", (path,))
+            self._merge(affected)
+        return len(affected)
+
+    def _merge(self, keys: Iterable[str]) -> None:
+        """Rebuild the merged row of each key from its contributions, lowest priority first
+
+        Keys not yet in the master are appended in the order given.
+        """
+        keys = list(keys)
+        next_seq = self.conn.execute("SELECT COALESCE(MAX(seq), -1) + 1 FROM founders").fetchone()[0]
+        for i in range(0, len(keys), SQLITE_BATCH):
+            group = keys[i:i + SQLITE_BATCH]
+            placeholders = ','.join('?' * len(group))
+            merged: Dict[str, Dict] = {}
+            for key, data in self.conn.execute(f"""
+                SELECT c.key, c.data FROM contributions c JOIN sources s ON s.path = c.source
+                WHERE c.key IN ({placeholders}) ORDER BY s.priority, s.path
+            """, group):
+                merged.setdefault(key, {}).update(json.loads(data))
+
+            gone = [(key,) for key in group if key not in merged]
+            self.conn.executemany("DELETE FROM founders WHERE key = ?", gone)
+            rows = []
+            # seq follows the order keys were passed in, not the order the query returned them
+            for key in group:
+                if key in merged:
+                    line = founder_codec.encode_row(founder_schema.row_from_mapping(merged[key]))
+                    rows.append((key, next_seq, line))
+                    next_seq += 1
+            # Existing founders keep their position in the master
+            self.conn.executemany("""
+                INSERT INTO founders (key, seq, line) VALUES (?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET line = excluded.line
+            """, rows)
+
+    def iter_blocks(self) -> Iterator[str]:
+        """Encoded master lines in first-seen order, in blocks for founder_codec.write_blocks"""
+        cursor = self.conn.execute("SELECT line FROM founders ORDER BY seq")
+        while True:
+            rows = cursor.fetchmany(WRITE_BATCH)
+            if not rows:
+                return
+            yield ''.join(line + '\n' for (line,) in rows)
+
+
+def consolidate(sources: Sequence[str] = DEFAULT_SOURCES, output: str = DEFAULT_OUTPUT,
+                store_path: str = DEFAULT_STORE, mappings_file: Optional[str] = DEFAULT_MAPPINGS_FILE,
+                full: bool = False) -> Dict:
+    """Fold changed sources into the store and rewrite the master if any founder changed"""
+    paths = dict(expand_sources(sources, exclude=[output]))
+    summary = {'sources': len(paths), 'read': 0, 'unchanged': 0, 'removed': 0, 'records': 0,
+               'founders_changed': 0, 'founders': 0, 'problems': [], 'written': False}
+
+    with FounderMasterStore(store_path) as store:
+        known = store.sources()
+        mappings_digest = file_sha256(mappings_file) if mappings_file else ''
+        # Sector files are translated with the mappings, so a new mapping re-reads them
+        remapped = store.get_meta('mappings_sha256') not in (None, mappings_digest)
+
+        for path, priority in paths.items():
+            stat = os.stat(path)
+            previous = known.get(path)
+            stale = full or (remapped and not path.endswith(PSV_EXTENSIONS))
+            digest = None
+            if previous and not stale:
+                unchanged = previous['mtime_ns'] == stat.st_mtime_ns and previous['size'] == stat.st_size
+                if not unchanged:
+                    digest = file_sha256(path)
+                # Touched but identical content: remember the new mtime so the next run skips hashing
+                if unchanged or previous['sha256'] == digest:
+                    if not unchanged or previous['priority'] != priority:
+                        summary['founders_changed'] += store.touch_source(path, stat, priority)
+                    summary['unchanged'] += 1
+                    continue
+
+            records, problems = read_source(path, mappings_file)
+            summary['problems'].extend(problems)
+            count, changed = store.fold_source(path, records, stat, digest or file_sha256(path), priority)
+            summary['read'] += 1
+            summary['records'] += count
+            summary['founders_changed'] += changed
+
+        for path in known:
+            if path not in paths:
+                summary['founders_changed'] += store.remove_source(path)
+                summary['removed'] += 1
+        store.set_meta('mappings_sha256', mappings_digest)
+
+        summary['founders'] = store.count()
+        if summary['founders_changed'] or summary['read'] or summary['removed'] or not os.path.exists(output):
+            founder_codec.write_blocks(output, store.iter_blocks(), founder_schema.COLUMNS)
+            summary['written'] = True
+    return summary
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    # python founder_master.py [source ...] [--all] [--output master.psv] [--store store.sqlite] [--full]
+    args = sys.argv[1:]
+    everything = '--all' in args
+    args = [a for a in args if a != '--all']
+    options = {}
+    for flag in ('--output', '--store'):
+        if flag in args:
+            i = args.index(flag)
+            options[flag] = args[i + 1]
+            del args[i:i + 2]
+    full = '--full' in args
+    args = [a for a in args if a != '--full']
+
+    if everything:
+        options.setdefault('--output', ALL_SOURCES_OUTPUT)
+        options.setdefault('--store', ALL_SOURCES_STORE)
+    start = time.time()
+    summary = consolidate(args or (ALL_SOURCES if everything else DEFAULT_SOURCES),
+                          options.get('--output', DEFAULT_OUTPUT), options.get('--store', DEFAULT_STORE), full=full)
+    print(f"📥 Read {summary['read']} of {summary['sources']} sources ({summary['unchanged']} unchanged, "
+          f"{summary['removed']} removed): {summary['records']} records, "
+          f"{summary['founders_changed']} founders re-merged")
+    for problem in summary['problems']:
+        print(f"⚠️  {problem}")
+    status = 'written' if summary['written'] else 'unchanged'
+    print(f"✅ {summary['founders']} unique founders; master {status} "
+          f"({options.get('--output', DEFAULT_OUTPUT)}) in {time.time() - start:.2f}s")
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Founder Value Normalizers
+Parsers for the free-text values in founder datasets: dates (month names,
+partial dates, ranges), currency ($12.5K, 12,500, USD 1M; other currencies
+only through a configured rate) and yes/no status.
+A column is normalized by factorizing it and parsing each distinct string
+once (parsers are also memoized across columns and calls), so cost tracks the
+number of distinct values rather than cells. Which parser runs on which
+column, with its options, comes from a JSON rules table, so a new dataset
+needs a rules file rather than code.
+"""
+
+import calendar
+import json
+import os
+import re
+import time
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'linkedin_reformat_rules.json')
+
+MONTHS = {name.lower(): i for i, name in enumerate(calendar.month_name) if name}
+MONTHS.update({name.lower(): i for i, name in enumerate(calendar.month_abbr) if name})
+MONTHS['sept'] = 9
+_MONTH = r'(?P<month>' + '|'.join(sorted(MONTHS, key=len, reverse=True)) + r')\.?'
+
+# Tried in order at every position; the earliest match in the text wins
+DATE_PATTERNS = [
+    ('iso', re.compile(r'\b(?P<year>\d{4})-(?P<mon>\d{1,2})-(?P<day>\d{1,2})\b')),
+    ('month_day_year', re.compile(r'\b' + _MONTH + r'\s+(?P<day>\d{1,2})(?:st|nd|rd|th)?,?\s+(?P<year>\d{4})\b', re.I)),
+    ('day_month_year', re.compile(r'\b(?P<day>\d{1,2})(?:st|nd|rd|th)?\s+' + _MONTH + r',?\s+(?P<year>\d{4})\b', re.I)),
+    ('us_slash', re.compile(r'\b(?P<mon>\d{1,2})/(?P<day>\d{1,2})/(?P<year>\d{4})\b')),
+    ('month_slash_year', re.compile(r'\b(?P<mon>\d{1,2})/(?P<year>\d{4})\b')),
+    ('month_year', re.compile(r'\b' + _MONTH + r',?\s+(?P<year>\d{4})\b', re.I)),
+    ('year_month', re.compile(r'\b(?P<year>\d{4})-(?P<mon>\d{1,2})\b(?!-)')),
+    ('year', re.compile(r'\b(?P<year>(?:19|20)\d{2})\b')),
+]
+
+# Currency marks -> ISO code; anything but USD needs a rate from the rules file
+CURRENCY_MARKS = {
+    '$': 'USD', 'us$': 'USD', 'usd': 'USD',
+    'c$': 'CAD', 'ca$': 'CAD', 'cad': 'CAD',
+    'a$': 'AUD', 'au$': 'AUD', 'aud': 'AUD',
+    '€': 'EUR', 'eur': 'EUR', '£': 'GBP', 'gbp': 'GBP', '¥': 'JPY', 'jpy': 'JPY',
+    '₹': 'INR', 'inr': 'INR', 'chf': 'CHF',
+}
+_CURRENCY_CODE = r'(?<![a-z])(?:USD|CAD|AUD|EUR|GBP|JPY|INR|CHF)(?![a-z])'
+_CURRENCY_SYMBOL = r'(?<![a-z])(?:US|CA|AU|C|A)?\$|[€£¥₹]'
+CURRENCY_PATTERN = re.compile(
+    r'(?P<prefix>' + _CURRENCY_CODE + '|' + _CURRENCY_SYMBOL + r')?\s*(?P<amount>\d[\d,]*(?:\.\d+)?)\s*'
+    r'(?P<scale>thousand|million|billion|[KMB](?![a-z]))?\s*(?P<suffix>' + _CURRENCY_CODE + r'|[€£])?',
+    re.I,
+)
+SCALES = {'k': 1e3, 'thousand': 1e3, 'm': 1e6, 'million': 1e6, 'b': 1e9, 'billion': 1e9}
+
+# Checked in order, as whole words
+YES_NO_WORDS = [
+    ('inactive', 'No'),
+    ('yes', 'Yes'), ('active', 'Yes'), ('funded', 'Yes'), ('verified', 'Yes'), ('true', 'Yes'),
+    ('no', 'No'), ('none', 'No'), ('false', 'No'), ('closed', 'No'),
+]
+# A negator earlier in the same clause flips the word ('Not publicly verified');
+# a negator with no listed word is a No ('Not found')
+NEGATION_PATTERN = re.compile(r"\b(?:not|no|never|without)\b|n't\b", re.I)
+CLAUSE_BREAK_PATTERN = re.compile(r"[,;.|()]|\bbut\b", re.I)
+FLIPPED = {'Yes': 'No', 'No': 'Yes'}
+
+
+def _day_for(year: int, month: int, resolve: str) -> int:
+    return calendar.monthrange(year, month)[1] if resolve == 'end' else 1
+
+
+@lru_cache(maxsize=65536)
+def parse_date(text: str, resolve: str = 'start') -> Optional[str]:
+    """YYYY-MM-DD from free text; partial dates and ranges resolve to their start or end"""
+    matches = []
+    for _, pattern in DATE_PATTERNS:
+        for m in pattern.finditer(text):
+            # Skip matches inside an already-found date ("2023" within "August 23, 2023")
+            if not any(start <= m.start() < end for start, end, _ in matches):
+                matches.append((m.start(), m.end(), m.groupdict()))
+    if not matches:
+        return None
+    matches.sort(key=lambda item: item[0])
+    parts = (matches[-1] if resolve == 'end' else matches[0])[2]
+
+    year = int(parts['year'])
+    if parts.get('month'):
+        month = MONTHS[parts['month'].lower()]
+    elif parts.get('mon'):
+        month = int(parts['mon'])
+    else:
+        month = 12 if resolve == 'end' else 1
+    if not 1 <= month <= 12:
+        return None
+    day = int(parts['day']) if parts.get('day') else _day_for(year, month, resolve)
+    if not 1 <= day <= calendar.monthrange(year, month)[1]:
+        return None
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+@lru_cache(maxsize=65536)
+def parse_currency(text: str, rates: Tuple[Tuple[str, float], ...] = ()) -> Optional[str]:
+    """'$12.5K', '12,500', 'USD 1M' -> '$12500'
+
+    The first amount marked with a currency or a K/M/B scale wins; otherwise
+    the first bare number that is not a year. Amounts in another currency
+    ('€5,000', '£10K') are converted with `rates` (USD per unit, by ISO code)
+    and are otherwise unparseable rather than read as dollars.
+    """
+    bare = None
+    foreign = False
+    for m in CURRENCY_PATTERN.finditer(text):
+        digits = m.group('amount').rstrip(',')
+        amount = float(digits.replace(',', ''))
+        scale = m.group('scale')
+        if scale:
+            amount *= SCALES[scale.lower()]
+        # A trailing code names the currency even after a '$' ('$5,000 CAD')
+        mark = m.group('suffix') or m.group('prefix')
+        currency = CURRENCY_MARKS[mark.lower()] if mark else 'USD'
+        if currency != 'USD':
+            rate = dict(rates).get(currency)
+            if rate is None:
+                foreign = True
+                continue
+            amount *= rate
+        if scale or mark:
+            break
+        if bare is None and not (len(digits) == 4 and 1900 <= amount <= 2100):
+            bare = amount
+    else:
+        # A bare number next to an unconvertible amount is not a dollar figure
+        if bare is None or foreign:
+            return None
+        amount = bare
+    return '$' + (str(int(amount)) if amount.is_integer() else f"{amount:.2f}")
+
+
+@lru_cache(maxsize=256)
+def _yes_no_pattern(words: Tuple[Tuple[str, str], ...]) -> List[Tuple[re.Pattern, str]]:
+    return [(re.compile(r'\b' + re.escape(word) + r'\b', re.I), value) for word, value in words]
+
+
+@lru_cache(maxsize=65536)
+def parse_yes_no(text: str, words: Tuple[Tuple[str, str], ...] = tuple(YES_NO_WORDS)) -> Optional[str]:
+    """First listed word found in the text decides Yes/No, flipped when negated within its clause"""
+    for pattern, value in _yes_no_pattern(words):
+        m = pattern.search(text)
+        if m:
+            clause_start = max((b.end() for b in CLAUSE_BREAK_PATTERN.finditer(text, 0, m.start())), default=0)
+            if NEGATION_PATTERN.search(text, clause_start, m.start()):
+                return FLIPPED[value]
+            return value
+    return 'No' if NEGATION_PATTERN.search(text) else None
+
+
+def map_unique(values, parse: Callable[[str], Optional[str]], default: str = '', missing: Optional[str] = None,
+               aliases: Optional[Dict[str, str]] = None) -> Tuple[np.ndarray, Dict[str, int]]:
+    """Normalize a column by parsing each distinct value once
+
+    Accepts a pandas Series, numpy array or list; returns an object array and
+    counts of parsed / defaulted / missing cells.
+    """
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=True)
+    aliases = aliases or {}
+    parsed = np.empty(len(uniques) + 1, dtype=object)
+    failed = np.zeros(len(uniques) + 1, dtype=bool)
+    for i, raw in enumerate(uniques):
+        text = str(raw).strip()
+        value = aliases.get(text)
+        if value is None:
+            value = parse(text)
+        if value is None:
+            value = default
+            failed[i] = True
+        parsed[i] = value
+    # Code -1 (missing) indexes the last slot
+    parsed[-1] = default if missing is None else missing
+    result = parsed[codes]
+    missing_cells = int((codes == -1).sum())
+    defaulted = int(failed[codes].sum())
+    return result, {'cells': len(codes), 'distinct': len(uniques), 'missing': missing_cells,
+                    'defaulted': defaulted, 'parsed': len(codes) - missing_cells - defaulted}
+
+
+def normalize_arrow(array, parse: Callable[[str], Optional[str]], **options):
+    """map_unique for a pyarrow Array/ChunkedArray: parses the dictionary, then takes by index"""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    encoded = pc.dictionary_encode(array)
+    chunks = encoded.chunks if isinstance(encoded, pa.ChunkedArray) else [encoded]
+    out = []
+    for chunk in chunks:
+        mapped, _ = map_unique(chunk.dictionary.to_pylist(), parse, **options)
+        missing = options.get('missing') if options.get('missing') is not None else options.get('default', '')
+        out.append(pa.array(list(mapped), type=pa.string()).take(chunk.indices).fill_null(missing))
+    return pa.chunked_array(out, type=pa.string())
+
+
+def _compile_parser(column: str, rule: Dict) -> Callable[[str], Optional[str]]:
+    parser = rule.get('parser')
+    if parser == 'date':
+        resolve = rule.get('resolve', 'start')
+        if resolve not in ('start', 'end'):
+            raise ValueError(f"Rule for '{column}': resolve must be 'start' or 'end'")
+        return lambda text: parse_date(text, resolve)
+    if parser == 'currency':
+        rates = rule.get('rates', {})
+        if not all(isinstance(rate, (int, float)) and rate > 0 for rate in rates.values()):
+            raise ValueError(f"Rule for '{column}': rates must be positive USD amounts per unit")
+        rates = tuple(sorted((code.upper(), float(rate)) for code, rate in rates.items()))
+        return lambda text: parse_currency(text, rates)
+    if parser == 'yes_no':
+        words = tuple((w, 'Yes') for w in rule['yes']) + tuple((w, 'No') for w in rule['no']) \
+            if 'yes' in rule or 'no' in rule else tuple(YES_NO_WORDS)
+        return lambda text: parse_yes_no(text, words)
+    raise ValueError(f"Rule for '{column}' has unknown parser '{parser}'")
+
+
+class ReformatRules:
+    """A compiled rules table: column renames, per-column parsers and lookup columns"""
+
+    def __init__(self, config: Dict, base_dir: str = '.'):
+        self.rename = dict(config.get('rename', {}))
+        self.fill = config.get('fill', '')
+        self.columns = []
+        for column, rule in config.get('columns', {}).items():
+            if rule.get('parser') == 'lookup':
+                self.columns.append((column, rule, None))
+            else:
+                self.columns.append((column, rule, _compile_parser(column, rule)))
+        self.lookups = {}
+        for name, path in config.get('lookups', {}).items():
+            with open(os.path.join(base_dir, path), 'r', encoding='utf-8') as f:
+                self.lookups[name] = json.load(f)
+
+    @classmethod
+    def from_file(cls, path: str = DEFAULT_RULES_FILE) -> 'ReformatRules':
+        with open(path, 'r') as f:
+            return cls(json.load(f), os.path.dirname(os.path.abspath(path)))
+
+    def apply(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Dict]]:
+        """Renamed and normalized copy of df, plus per-column stats"""
+        df = df.rename(columns=self.rename)
+        stats = {}
+        for column, rule, parse in self.columns:
+            start = time.perf_counter()
+            if parse is None:
+                table = self.lookups[rule['table']]
+                keys = df[rule['key']] if rule['key'] in df.columns else pd.Series([None] * len(df), index=df.index)
+                values = {k: v.get(rule['field'], rule.get('default', '')) for k, v in table.items()}
+                df[column] = keys.map(values).fillna(rule.get('default', '')).astype(object)
+                stats[column] = {'cells': len(df), 'parsed': int(keys.isin(values.keys()).sum())}
+            else:
+                source = df[column] if column in df.columns else pd.Series([None] * len(df), index=df.index)
+                result, stats[column] = map_unique(source, parse, default=rule.get('default', self.fill),
+                                                   missing=rule.get('missing'), aliases=rule.get('aliases'))
+                df[column] = result
+            stats[column]['seconds'] = time.perf_counter() - start
+        return df, stats
+
+
+_default_rules: Optional[ReformatRules] = None
+
+
+def load_default_rules() -> ReformatRules:
+    """Return the shared rules compiled from linkedin_reformat_rules.json"""
+    global _default_rules
+    if _default_rules is None:
+        _default_rules = ReformatRules.from_file(DEFAULT_RULES_FILE)
+    return _default_rules
+
+
+if __name__ == "__main__":
+    import sys
+
+    # Benchmark: python founder_normalizers.py [cells]
+    cells = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    samples = {
+        'date': ['August 23, 2023', 'September 2023', '2020-2022 timeframe', 'TBD', '11/11/2020', None],
+        'currency': ['$12,500', '$12.5K', 'USD 1M', '10,000', 'Thousands raised', None],
+        'yes_no': ['Yes - active', 'Not funded', 'Inactive', 'Verified profile', 'Unknown', None],
+    }
+    parsers = {'date': lambda t: parse_date(t, 'end'), 'currency': parse_currency, 'yes_no': parse_yes_no}
+    for name, values in samples.items():
+        column = pd.Series(values * (cells // len(values)), dtype=object)
+        start = time.perf_counter()
+        _, column_stats = map_unique(column, parsers[name], default='TBD')
+        seconds = time.perf_counter() - start
+        print(f"{name:<9} {len(column):>10,} cells in {seconds:.3f}s "
+              f"({len(column) / seconds / 1e6:.1f}M cells/s, {column_stats['distinct']} distinct)")
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Founder Collection Progress
+Progress toward the per-sector US/Canada targets, derived from the founder
+store with one group-by over its category and location columns. Only those
+two columns are read (founder_codec projection) and each distinct location
+is resolved once. Counts are cached until the store file's mtime or size
+changes, so repeated queries cost nothing.
+"""
+
+import os
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+import founder_codec
+from founder_normalizers import map_unique
+from location_gazetteer import country_code_of
+
+DEFAULT_STORE_FILE = 'linkedin_founders_collected.psv'
+COUNTRIES = ['US', 'Canada']
+PROGRESS_COLUMNS = ['Industry', 'Target', 'US_Target', 'Canada_Target', 'Collected', 'US_Collected',
+                    'Canada_Collected', 'Percentage', 'Status']
+
+SECTOR_TARGETS = {
+    'Food & Restaurant': {'target': 24, 'us_target': 22, 'canada_target': 2},
+    'Retail & E-commerce': {'target': 22, 'us_target': 20, 'canada_target': 2},
+    'Business Services': {'target': 22, 'us_target': 20, 'canada_target': 2},
+    'Health, Beauty & Fitness': {'target': 18, 'us_target': 16, 'canada_target': 2},
+    'Construction & Contracting': {'target': 16, 'us_target': 14, 'canada_target': 2},
+    'Other Services': {'target': 16, 'us_target': 14, 'canada_target': 2},
+    'Residential & Commercial Services': {'target': 14, 'us_target': 13, 'canada_target': 1},
+    'Technology': {'target': 12, 'us_target': 11, 'canada_target': 1},
+    'Healthcare': {'target': 11, 'us_target': 10, 'canada_target': 1},
+    'Financial Services': {'target': 9, 'us_target': 8, 'canada_target': 1},
+    'Education & Training': {'target': 8, 'us_target': 7, 'canada_target': 1},
+    'Manufacturing': {'target': 7, 'us_target': 6, 'canada_target': 1},
+    'Transportation & Logistics': {'target': 6, 'us_target': 6, 'canada_target': 0},
+    'Real Estate': {'target': 6, 'us_target': 6, 'canada_target': 0},
+    'Agriculture': {'target': 5, 'us_target': 5, 'canada_target': 0},
+    'Entertainment & Media': {'target': 4, 'us_target': 4, 'canada_target': 0}
+}
+
+
+def country_of(location: str) -> str:
+    """US or Canada (gazetteer first, province-code heuristic for unknown places)"""
+    country_code = country_code_of(location)
+    if country_code:
+        return 'Canada' if country_code == 'CA' else 'US'
+    return 'Canada' if 'Canada' in location or any(prov in location for prov in ['ON', 'BC', 'QC', 'AB']) else 'US'
+
+
+def count_founders(categories, locations) -> pd.DataFrame:
+    """Founders per industry (index) and country (US, Canada columns)"""
+    countries, _ = map_unique(locations, country_of, missing='US')
+    frame = pd.DataFrame({'Industry': pd.Series(categories, dtype=object), 'Country': countries})
+    counts = frame.groupby(['Industry', 'Country']).size().unstack(fill_value=0)
+    return counts.reindex(columns=COUNTRIES, fill_value=0)
+
+
+def counts_from_mapping(counts: Dict[Tuple[str, str], int]) -> pd.DataFrame:
+    """count_founders shape from {(industry, country): count}"""
+    if not counts:
+        return pd.DataFrame(columns=COUNTRIES, dtype=int)
+    series = pd.Series(counts)
+    series.index = pd.MultiIndex.from_tuples(series.index, names=['Industry', 'Country'])
+    return series.unstack(fill_value=0).reindex(columns=COUNTRIES, fill_value=0)
+
+
+def targets_frame(targets: Dict[str, Dict] = SECTOR_TARGETS) -> pd.DataFrame:
+    return pd.DataFrame({
+        'Industry': list(targets),
+        'Target': [t['target'] for t in targets.values()],
+        'US_Target': [t['us_target'] for t in targets.values()],
+        'Canada_Target': [t['canada_target'] for t in targets.values()],
+    })
+
+
+def progress_table(counts: pd.DataFrame, targets: Dict[str, Dict] = SECTOR_TARGETS) -> pd.DataFrame:
+    """Targets joined with counts, with percentage and status; industries without a target are left out"""
+    df = targets_frame(targets)
+    aligned = counts.reindex(df['Industry'], fill_value=0)
+    df['US_Collected'] = aligned['US'].to_numpy(dtype=int)
+    df['Canada_Collected'] = aligned['Canada'].to_numpy(dtype=int)
+    df['Collected'] = df['US_Collected'] + df['Canada_Collected']
+    df['Percentage'] = df['Collected'] / df['Target'] * 100
+    df['Status'] = np.select([df['Collected'] >= df['Target'], df['Collected'] > 0],
+                             ['Complete', 'In Progress'], 'Not Started')
+    return df[PROGRESS_COLUMNS]
+
+
+class FounderProgress:
+    """Progress over one founder store, re-aggregated only when the file changes"""
+
+    def __init__(self, store_file: str = DEFAULT_STORE_FILE, targets: Dict[str, Dict] = SECTOR_TARGETS):
+        self.store_file = store_file
+        self.targets = targets
+        self._signature = None
+        self._counts: Optional[pd.DataFrame] = None
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.store_file)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def counts(self) -> pd.DataFrame:
+        """Founders per industry and country in the store"""
+        signature = self._stat()
+        if self._counts is None or signature != self._signature:
+            if signature is None:
+                self._counts = counts_from_mapping({})
+            else:
+                columns = founder_codec.read_columns(self.store_file, ['proj_category', 'proj_location'])
+                self._counts = count_founders(columns['proj_category'], columns['proj_location'])
+            self._signature = signature
+        return self._counts
+
+    def table(self, pending: Optional[Dict[Tuple[str, str], int]] = None) -> pd.DataFrame:
+        """Progress table, optionally including (industry, country) counts not yet written to the store"""
+        counts = self.counts()
+        if pending:
+            counts = counts.add(counts_from_mapping(pending), fill_value=0)
+        return progress_table(counts, self.targets)
+
+    def sector(self, industry: str) -> Dict:
+        """One industry's row of the progress table"""
+        table = self.table()
+        rows = table[table['Industry'] == industry]
+        if rows.empty:
+            raise ValueError(f"No progress target for industry '{industry}'")
+        return rows.iloc[0].to_dict()
+
+    def totals(self, pending: Optional[Dict[Tuple[str, str], int]] = None) -> Dict[str, int]:
+        """Target and collected sums overall and per country"""
+        sums = self.table(pending)[['Target', 'US_Target', 'Canada_Target', 'Collected', 'US_Collected',
+                                    'Canada_Collected']].sum()
+        return {column: int(value) for column, value in sums.items()}
+
+    def next_priorities(self, limit: int = 5) -> List[Dict]:
+        """Least complete industries first, with how many founders each still needs"""
+        table = self.table()
+        incomplete = table[table['Percentage'] < 100].sort_values('Percentage', kind='stable').head(limit)
+        needed = incomplete['Target'] - incomplete['Collected']
+        return [{'Industry': industry, 'Needed': int(n)} for industry, n in zip(incomplete['Industry'], needed)]
+
+    def write_csv(self, path: str, pending: Optional[Dict[Tuple[str, str], int]] = None) -> pd.DataFrame:
+        """Export the progress table (atomically) for reports that read the CSV"""
+        table = self.table(pending)
+        tmp_file = f"{path}.tmp.{os.getpid()}"
+        table.to_csv(tmp_file, index=False)
+        os.replace(tmp_file, path)
+        return table
+
+
+_loaded: Dict[str, FounderProgress] = {}
+
+
+def get_progress(store_file: str = DEFAULT_STORE_FILE) -> FounderProgress:
+    """Shared FounderProgress for a store file, so its cache is reused across callers"""
+    key = os.path.abspath(store_file)
+    if key not in _loaded:
+        _loaded[key] = FounderProgress(store_file)
+    return _loaded[key]
+
+
+if __name__ == "__main__":
+    import sys
+
+    progress = get_progress(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_STORE_FILE)
+    print(progress.table().to_string(index=False))
+    totals = progress.totals()
+    print(f"\nOVERALL: {totals['Collected']}/{totals['Target']}")
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Founder Record Schema
+The 43-column founder record defined once: column order, value kinds and
+groups (from the name prefix). Rows are plain tuples in column order, built by
+direct indexing through COLUMN_INDEX, so writers never go through a DataFrame
+just to reorder columns.
+"""
+
+from collections import namedtuple
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+# (column, kind) in file order; kinds describe the text stored in each column
+FIELDS: Tuple[Tuple[str, str], ...] = (
+    # PROJECT GROUP
+    ('proj_name', 'text'), ('proj_founder', 'text'), ('proj_category', 'text'), ('proj_location', 'text'),
+    ('proj_launch_date', 'date'), ('proj_end_date', 'date'),
+    # FUNDING GROUP
+    ('fund_goal_usd', 'usd'), ('fund_raised_usd', 'usd'), ('fund_success_rate', 'percent'), ('fund_status', 'text'),
+    ('fund_backer_count', 'int'), ('funding_investment_history', 'text'),
+    # COMPANY GROUP
+    ('co_name', 'text'), ('co_website_url', 'url'), ('co_current_name', 'text'), ('co_current_title', 'text'),
+    ('co_operational_status', 'yes_no'), ('co_business_status', 'text'), ('co_growth_metrics', 'text'),
+    ('co_domain_status', 'text'),
+    # SOCIAL MEDIA GROUP
+    ('social_linkedin_url', 'url'), ('social_other_platforms', 'text'), ('social_media_activity', 'text'),
+    # TEAM GROUP
+    ('team_composition', 'text'), ('team_founder_bio', 'text'),
+    # RESEARCH GROUP
+    ('research_linkedin_query', 'text'), ('research_verification_sources', 'text'),
+    ('research_work_history', 'text'), ('research_education_summary', 'text'),
+    # MEDIA GROUP
+    ('media_press_coverage', 'text'), ('media_awards_recognition', 'text'),
+    # STATUS GROUP
+    ('status_legal_compliance', 'text'), ('status_professional_reputation', 'text'),
+    # LINKEDIN GROUP
+    ('li_profile_verified', 'text'), ('li_current_employer', 'text'), ('li_current_title', 'text'),
+    ('li_work_experience', 'text'), ('li_education_background', 'text'), ('li_professional_skills', 'text'),
+    ('li_recent_activity', 'text'),
+    # NOTES GROUP
+    ('notes_area_of_expertise', 'text'), ('notes_community_engagement', 'text'), ('notes_business_focus', 'text'),
+)
+
+# Name prefix -> group; 'funding_investment_history' belongs with the fund_ columns
+GROUP_PREFIXES: Tuple[Tuple[str, str], ...] = (
+    ('proj_', 'PROJECT'), ('fund_', 'FUNDING'), ('funding_', 'FUNDING'), ('co_', 'COMPANY'),
+    ('social_', 'SOCIAL'), ('team_', 'TEAM'), ('research_', 'RESEARCH'), ('media_', 'MEDIA'),
+    ('status_', 'STATUS'), ('li_', 'LINKEDIN'), ('notes_', 'NOTES'),
+)
+
+COLUMNS: Tuple[str, ...] = tuple(name for name, _ in FIELDS)
+COLUMN_INDEX: Dict[str, int] = {name: i for i, name in enumerate(COLUMNS)}
+KINDS: Dict[str, str] = dict(FIELDS)
+WIDTH = len(COLUMNS)
+
+REQUIRED_FIELDS = ('proj_founder', 'proj_category', 'proj_location')
+
+
+def group_of(column: str) -> str:
+    for prefix, group in GROUP_PREFIXES:
+        if column.startswith(prefix):
+            return group
+    raise ValueError(f"Column '{column}' has no known group prefix")
+
+
+GROUPS: Dict[str, List[str]] = {}
+for _column in COLUMNS:
+    GROUPS.setdefault(group_of(_column), []).append(_column)
+del _column
+
+
+def make_row_class(name: str, columns: Sequence[str] = COLUMNS):
+    """Tuple row class with one named field per column, all defaulting to ''"""
+    return namedtuple(name, columns, defaults=('',) * len(columns))
+
+
+FounderRow = make_row_class('FounderRow')
+
+
+def column_indexes(columns: Iterable[str]) -> List[int]:
+    """Positions of the given columns, for projecting rows"""
+    try:
+        return [COLUMN_INDEX[c] for c in columns]
+    except KeyError as e:
+        raise ValueError(f"Unknown founder column {e}") from None
+
+
+def row_from_mapping(data: Mapping, fill: str = '', unknown: Optional[List[str]] = None) -> FounderRow:
+    """Build a row by indexing each known key straight into place
+
+    Keys that are not columns are ignored, or collected into `unknown` if a list is given.
+    """
+    row = [fill] * WIDTH
+    index = COLUMN_INDEX
+    for key, value in data.items():
+        i = index.get(key)
+        if i is None:
+            if unknown is not None:
+                unknown.append(key)
+            continue
+        row[i] = '' if value is None else value
+    return FounderRow._make(row)
+
@@ -1,6 +1,77 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+
 import pandas as pd
-import re
-from datetime import datetime
+
+import founder_codec
+import founder_normalizers
+import founder_schema
+
+SOURCE_FILE = 'real_linkedin_founders_enhanced_clean.csv'
+OUTPUT_FILE = 'linkedin_founders_reformatted.psv'  # .psv for pipe-separated values
+DEFAULT_CHUNKSIZE = 100_000
+
+
+def transform_frame(df):
+    """Rename, normalize and split notes per the rules file, then fill and order the schema columns"""
+    df, stats = founder_normalizers.load_default_rules().apply(df)
+    if 'notes' in df.columns:
+        df = df.drop('notes', axis=1)
+    for col in founder_schema.COLUMNS:
+        if col not in df.columns:
+            df[col] = 'TBD'
+    return df[list(founder_schema.COLUMNS)], stats
+
+
+def _encode_chunk(df):
+    """Worker entry point: transform one chunk and return its encoded PSV lines with stats"""
+    df, stats = transform_frame(df)
+    return founder_codec.encode_dataframe(df, founder_schema.COLUMNS), len(df), stats
+
+
+def _transformed_chunks(chunks, workers: int):
+    """Yield _encode_chunk results in source order, with at most 2 chunks per worker in flight"""
+    if workers <= 1:
+        for chunk in chunks:
+            yield _encode_chunk(chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_encode_chunk, chunk))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def reformat_streaming(source: str = SOURCE_FILE, output: str = OUTPUT_FILE,
+                       chunksize: int = DEFAULT_CHUNKSIZE, workers: Optional[int] = None) -> Dict:
+    """Reformat a CSV of any size: read in chunks, transform chunks in worker processes, stream to the PSV
+
+    Memory holds a bounded number of chunks regardless of file size. The
+    output is written to a temporary file and only replaces `output` once
+    every chunk succeeded.
+    """
+    workers = workers or os.cpu_count() or 1
+    summary = {'founders': 0, 'chunks': 0, 'columns': {}}
+
+    def blocks():
+        # Every column as text, so each chunk is parsed the same way whatever its values look like
+        chunks = pd.read_csv(source, chunksize=chunksize, dtype=str)
+        for text, count, stats in _transformed_chunks(chunks, workers):
+            summary['founders'] += count
+            summary['chunks'] += 1
+            for column, column_stats in stats.items():
+                totals = summary['columns'].setdefault(column, {'cells': 0, 'parsed': 0})
+                totals['cells'] += column_stats['cells']
+                totals['parsed'] += column_stats['parsed']
+            yield text
+
+    founder_codec.write_blocks(output, blocks(), founder_schema.COLUMNS)
+    return summary
 
 def reformat_linkedin_dataset():
     """
@@ -18,267 +89,28 @@ def reformat_linkedin_dataset():
     
     # Load the dataset
     try:
-        df = pd.read_csv('real_linkedin_founders_enhanced_clean.csv')
+        df = pd.read_csv(SOURCE_FILE)
         print(f"✅ Loaded dataset with {len(df)} founders, {len(df.columns)} columns")
     except FileNotFoundError:
         print("❌ Source file not found")
         return
     
-    # 1. STANDARDIZE COLUMN NAMES - Group similar columns with consistent naming
-    print("\n📋 Step 1: Standardizing column names...")
-    
-    # Define new column structure with grouped naming
-    column_mapping = {
-        # PROJECT DATA GROUP (proj_*)
-        'project_name': 'proj_name',
-        'founder_name': 'proj_founder',
-        'category': 'proj_category', 
-        'location': 'proj_location',
-        'launch_date': 'proj_launch_date',
-        'end_date': 'proj_end_date',
-        
-        # FUNDING DATA GROUP (fund_*)
-        'funding_goal': 'fund_goal_usd',
-        'amount_raised': 'fund_raised_usd',
-        'success_rate': 'fund_success_rate',
-        'success_status': 'fund_status',
-        'backer_count': 'fund_backer_count',
-        
-        # COMPANY DATA GROUP (co_*)
-        'company_name': 'co_name',
-        'website_url': 'co_website_url',
-        'current_company': 'co_current_name',
-        'current_title': 'co_current_title',
-        'business_active': 'co_operational_status',
-        'current_status': 'co_business_status',
-        'business_growth': 'co_growth_metrics',
-        'domain_activity': 'co_domain_status',
-        
-        # SOCIAL MEDIA GROUP (social_*)
-        'linkedin_url': 'social_linkedin_url',
-        'other_social_links': 'social_other_platforms',
-        'social_activity': 'social_media_activity',
-        
-        # TEAM DATA GROUP (team_*)
-        'team_members': 'team_composition',
-        'founder_bio': 'team_founder_bio',
-        
-        # RESEARCH DATA GROUP (research_*)
-        'linkedin_search_query': 'research_linkedin_query',
-        'verification_sources': 'research_verification_sources',
-        'previous_experience': 'research_work_history',
-        'education': 'research_education_summary',
-        
-        # FUNDING HISTORY GROUP (funding_*)
-        'funding_history': 'funding_investment_history',
-        
-        # MEDIA GROUP (media_*)
-        'media_coverage': 'media_press_coverage',
-        'awards_recognition': 'media_awards_recognition',
-        
-        # STATUS GROUP (status_*)
-        'legal_issues': 'status_legal_compliance',
-        'reputation_status': 'status_professional_reputation',
-        
-        # LINKEDIN DATA GROUP (li_*)
-        'linkedin_profile_found': 'li_profile_verified',
-        'linkedin_current_employment': 'li_current_employer',
-        'linkedin_current_title': 'li_current_title',
-        'linkedin_career_history': 'li_work_experience',
-        'linkedin_education_details': 'li_education_background',
-        'linkedin_skills_list': 'li_professional_skills',
-        'linkedin_activity_posts': 'li_recent_activity'
-    }
-    
-    # Apply column renaming
-    df = df.rename(columns=column_mapping)
-    
-    # 2. STANDARDIZE DATES TO YYYY-MM-DD FORMAT
-    print("📅 Step 2: Standardizing dates...")
-    
-    def standardize_date(date_str):
-        """Convert various date formats to YYYY-MM-DD"""
-        if pd.isna(date_str) or str(date_str).upper() in ['TBD', 'SUCCESSFULLY FUNDED', 'CAMPAIGN COMPLETED']:
-            return 'TBD'
-            
-        date_str = str(date_str).strip()
-        
-        # Handle specific patterns
-        if 'August 23, 2023' in date_str:
-            return '2023-08-23'
-        elif 'September 2023' in date_str:
-            return '2023-09-30'
-        elif 'November 11, 2020' in date_str:
-            return '2020-11-11'
-        elif 'December 2020' in date_str:
-            return '2020-12-31'
-        elif 'April 1, 2023' in date_str:
-            return '2023-04-01'
-        elif 'May 1, 2023' in date_str:
-            return '2023-05-01'
-        elif 'January 26, 2021' in date_str:
-            return '2021-01-26'
-        elif 'February 2021' in date_str:
-            return '2021-02-28'
-        elif '2020-2022 timeframe' in date_str:
-            return '2020-01-01'
-        else:
-            return 'TBD'
-    
-    df['proj_launch_date'] = df['proj_launch_date'].apply(standardize_date)
-    df['proj_end_date'] = df['proj_end_date'].apply(standardize_date)
-    
-    # 3. STANDARDIZE CURRENCY VALUES
-    print("💰 Step 3: Standardizing currency values...")
-    
-    def standardize_currency(amount_str):
-        """Standardize currency formatting"""
-        if pd.isna(amount_str):
-            return 'TBD'
-            
-        amount_str = str(amount_str).strip()
-        
-        # Handle specific patterns
-        if '$12,500' in amount_str or '$12.5K' in amount_str:
-            return '$12500'
-        elif '$10,000' in amount_str:
-            return '$10000'
-        elif 'Thousands raised' in amount_str:
-            return '$5000'  # Estimate
-        else:
-            return 'TBD'
-    
-    df['fund_goal_usd'] = df['fund_goal_usd'].apply(standardize_currency)
-    df['fund_raised_usd'] = df['fund_raised_usd'].apply(standardize_currency)
-    
-    # 4. CONVERT STATUS FIELDS TO YES/NO VALUES
-    print("✅ Step 4: Converting status fields to Yes/No...")
-    
-    def convert_to_yes_no(status_str):
-        """Convert verbose status to Yes/No"""
-        if pd.isna(status_str):
-            return 'No'
-        
-        status_str = str(status_str).lower()
-        if 'yes' in status_str or 'active' in status_str or 'funded' in status_str:
-            return 'Yes'
-        elif 'no' in status_str or 'none' in status_str or 'not funded' in status_str:
-            return 'No'
-        else:
-            return 'Unknown'
-    
-    # Apply to boolean-style columns
-    df['co_operational_status'] = df['co_operational_status'].apply(convert_to_yes_no)
-    df['li_profile_verified'] = df['li_profile_verified'].apply(convert_to_yes_no)
-    df['status_legal_compliance'] = df['status_legal_compliance'].apply(lambda x: 'Yes' if 'None' in str(x) else 'No')
-    
-    # 5. BREAK OUT NOTES INTO 3 SEPARATE COLUMNS
-    print("📝 Step 5: Breaking out notes into structured columns...")
-    
-    # Define notes breakdown for each founder
-    notes_breakdown = {
-        'Tom Vazhekatt': {
-            'area_of_expertise': 'Mobile_App_Development|Route_Optimization|Startup_Technology',
-            'community_engagement': 'University_Tech_Ecosystem|LinkedIn_Startup_Promotion|Academic_Competition_Participation',
-            'business_focus': 'Navigation_Technology|Consumer_Mobile_Apps|Student_Entrepreneurship'
-        },
-        'Nelli Kim': {
-            'area_of_expertise': 'Fashion_Merchandising|Retail_Management|Social_Impact_Business',
-            'community_engagement': 'Fashion_Entrepreneurship_Community|Cancer_Survivor_Advocacy|Board_Leadership',
-            'business_focus': 'Sustainable_Fashion|Charitable_Business_Models|Comfort_Footwear'
-        },
-        'Shreyans Kokra': {
-            'area_of_expertise': 'Sustainable_Textiles|Hemp_Manufacturing|International_Trade',
-            'community_engagement': 'Sustainable_Fashion_Industry|Hemp_Innovation_Leadership|GOTS_Certification',
-            'business_focus': 'Hemp_Textile_Innovation|Circular_Economy|Environmental_Manufacturing'
-        },
-        'Robert Plante': {
-            'area_of_expertise': 'Wildlife_Illustration|Creative_Design|Educational_Content',
-            'community_engagement': 'Creative_Professional_Network|Canadian_Wildlife_Education|Independent_Artist_Community',
-            'business_focus': 'Educational_Games|Wildlife_Conservation_Awareness|Creative_Content_Development'
-        },
-        'Peter Granitski': {
-            'area_of_expertise': 'Embedded_Systems|Robotics_Engineering|Agricultural_Technology',
-            'community_engagement': 'University_Robotics_Community|Space_Concordia_Leadership|Student_Entrepreneurship',
-            'business_focus': 'Sustainable_Agriculture|Vertical_Farming_Automation|Environmental_Technology'
-        }
-    }
-    
-    # Create new columns
-    df['notes_area_of_expertise'] = ''
-    df['notes_community_engagement'] = ''
-    df['notes_business_focus'] = ''
-    
-    # Populate new columns
-    for index, row in df.iterrows():
-        founder_name = row['proj_founder']
-        if founder_name in notes_breakdown:
-            breakdown = notes_breakdown[founder_name]
-            df.loc[index, 'notes_area_of_expertise'] = breakdown['area_of_expertise']
-            df.loc[index, 'notes_community_engagement'] = breakdown['community_engagement']
-            df.loc[index, 'notes_business_focus'] = breakdown['business_focus']
-    
-    # Remove original notes column
-    if 'notes' in df.columns:
-        df = df.drop('notes', axis=1)
-    
-    # 6. FINAL COLUMN ORGANIZATION - Group similar columns together
-    print("🗂️ Step 6: Organizing column groups...")
-    
-    final_column_order = [
-        # PROJECT GROUP
-        'proj_name', 'proj_founder', 'proj_category', 'proj_location', 
-        'proj_launch_date', 'proj_end_date',
-        
-        # FUNDING GROUP  
-        'fund_goal_usd', 'fund_raised_usd', 'fund_success_rate', 'fund_status', 'fund_backer_count',
-        'funding_investment_history',
-        
-        # COMPANY GROUP
-        'co_name', 'co_website_url', 'co_current_name', 'co_current_title', 
-        'co_operational_status', 'co_business_status', 'co_growth_metrics', 'co_domain_status',
-        
-        # SOCIAL MEDIA GROUP
-        'social_linkedin_url', 'social_other_platforms', 'social_media_activity',
-        
-        # TEAM GROUP
-        'team_composition', 'team_founder_bio',
-        
-        # RESEARCH GROUP
-        'research_linkedin_query', 'research_verification_sources', 
-        'research_work_history', 'research_education_summary',
-        
-        # MEDIA GROUP
-        'media_press_coverage', 'media_awards_recognition',
-        
-        # STATUS GROUP
-        'status_legal_compliance', 'status_professional_reputation',
-        
-        # LINKEDIN GROUP
-        'li_profile_verified', 'li_current_employer', 'li_current_title', 
-        'li_work_experience', 'li_education_background', 'li_professional_skills', 'li_recent_activity',
-        
-        # NOTES GROUP
-        'notes_area_of_expertise', 'notes_community_engagement', 'notes_business_focus'
-    ]
-    
-    # Ensure all columns exist
-    for col in final_column_order:
-        if col not in df.columns:
-            df[col] = 'TBD'
-    
-    # Reorder columns
-    df = df[final_column_order]
+    # Steps 1-5 come from linkedin_reformat_rules.json: column renames, then
+    # date/currency/yes-no parsers and the notes lookup, each parsing every
+    # distinct value once instead of cell by cell. Step 6 fills and orders the
+    # schema columns. reformat_streaming runs the same steps chunk by chunk.
+    print("\n📋 Steps 1-6: Renaming columns, standardizing dates, currency and Yes/No, breaking out notes, "
+          "organizing column groups...")
+    df, stats = transform_frame(df)
+    for column, column_stats in stats.items():
+        print(f"  {column}: {column_stats['parsed']}/{column_stats['cells']} values normalized")
     
     # 7. EXPORT AS PIPE-SEPARATED FILE
     print("📊 Step 7: Exporting pipe-separated file...")
     
-    output_filename = 'linkedin_founders_reformatted.psv'  # .psv for pipe-separated values
+    output_filename = OUTPUT_FILE
     
-    df.to_csv(output_filename, 
-              sep='|',  # Use pipe as separator
-              index=False, 
-              encoding='utf-8')
+    founder_codec.write_dataframe(output_filename, df)
     
     print(f"✅ Created pipe-separated file: {output_filename}")
     
@@ -294,18 +126,7 @@ def reformat_linkedin_dataset():
     print(f"  Notes: Split into 3 focused columns")
     
     print(f"\n📊 COLUMN GROUPS:")
-    groups = {
-        'PROJECT': [col for col in df.columns if col.startswith('proj_')],
-        'FUNDING': [col for col in df.columns if col.startswith('fund_')],
-        'COMPANY': [col for col in df.columns if col.startswith('co_')],
-        'SOCIAL': [col for col in df.columns if col.startswith('social_')],
-        'TEAM': [col for col in df.columns if col.startswith('team_')],
-        'RESEARCH': [col for col in df.columns if col.startswith('research_')],
-        'MEDIA': [col for col in df.columns if col.startswith('media_')],
-        'STATUS': [col for col in df.columns if col.startswith('status_')],
-        'LINKEDIN': [col for col in df.columns if col.startswith('li_')],
-        'NOTES': [col for col in df.columns if col.startswith('notes_')]
-    }
+    groups = founder_schema.GROUPS
     
     for group_name, columns in groups.items():
         print(f"  {group_name}: {len(columns)} columns")
@@ -323,8 +144,36 @@ def reformat_linkedin_dataset():
     return output_filename, df
 
 if __name__ == "__main__":
-    output_file, reformatted_df = reformat_linkedin_dataset()
-    
-    print(f"\n🎯 REFORMATTING COMPLETE!")
-    print(f"New file created: {output_file}")
-    print(f"Ready for analysis with improved structure and formatting.")
\ No newline at end of file
+    import sys
+    import time
+
+    # python linkedin_csv_reformatter.py [source.csv] [output.psv] [--chunksize N] [--workers N]
+    args = sys.argv[1:]
+    options = {}
+    for flag in ('--chunksize', '--workers'):
+        if flag in args:
+            i = args.index(flag)
+            options[flag] = int(args[i + 1])
+            del args[i:i + 2]
+
+    if not args and not options:
+        output_file, reformatted_df = reformat_linkedin_dataset()
+        
+        print(f"\n🎯 REFORMATTING COMPLETE!")
+        print(f"New file created: {output_file}")
+        print(f"Ready for analysis with improved structure and formatting.")
+        sys.exit(0)
+
+    source = args[0] if args else SOURCE_FILE
+    output = args[1] if len(args) > 1 else OUTPUT_FILE
+    start = time.time()
+    try:
+        summary = reformat_streaming(source, output, options.get('--chunksize', DEFAULT_CHUNKSIZE),
+                                     options.get('--workers'))
+    except FileNotFoundError:
+        print(f"❌ Source file not found: {source}")
+        sys.exit(1)
+    for column, totals in summary['columns'].items():
+        print(f"  {column}: {totals['parsed']}/{totals['cells']} values normalized")
+    print(f"\n🎯 Reformatted {summary['founders']} founders in {summary['chunks']} chunks "
+          f"to {output} in {time.time() - start:.2f}s")
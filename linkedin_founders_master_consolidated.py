@@ -1,372 +1,58 @@
 #!/usr/bin/env python3
 """
 LinkedIn Founders Master Consolidation Script
-Creates the complete 200-founder dataset by consolidating all sector data
+Builds the 200-founder master dataset from roster/master_roster.psv.
+Consolidation is incremental (see founder_master): the roster is re-read and
+merged only when it changed since the last run. The union with the sector
+files and collected profiles is built by consolidate_all_sectors.py.
 """
 
-import csv
+from collections import Counter
+
+import founder_codec
+import founder_master
+from founder_progress import SECTOR_TARGETS
+from location_gazetteer import country_code_of
 
 def create_master_dataset():
-    """Create consolidated dataset with all 200 founders across 16 sectors"""
-    
-    # Header with all 43 columns
-    header = [
-        'proj_name', 'proj_founder', 'proj_category', 'proj_location', 'proj_launch_date', 
-        'proj_end_date', 'fund_goal_usd', 'fund_raised_usd', 'fund_success_rate', 
-        'fund_status', 'fund_backer_count', 'funding_investment_history', 'co_name', 
-        'co_website_url', 'co_current_name', 'co_current_title', 'co_operational_status', 
-        'co_business_status', 'co_growth_metrics', 'co_domain_status', 'social_linkedin_url', 
-        'social_other_platforms', 'social_media_activity', 'team_composition', 
-        'team_founder_bio', 'research_linkedin_query', 'research_verification_sources', 
-        'research_work_history', 'research_education_summary', 'media_press_coverage', 
-        'media_awards_recognition', 'status_legal_compliance', 'status_professional_reputation', 
-        'li_profile_verified', 'li_current_employer', 'li_current_title', 'li_work_experience', 
-        'li_education_background', 'li_professional_skills', 'li_recent_activity', 
-        'notes_area_of_expertise', 'notes_community_engagement', 'notes_business_focus'
-    ]
-    
-    # All 200 founders organized by sector
-    all_founders = []
-    
-    # Food & Restaurant (24 founders: 22 US, 2 Canada)
-    food_restaurant = [
-        ['FreshFarm Eats', 'Sarah Johnson', 'Food & Restaurant', 'Portland, OR'],
-        ['Urban Kitchen Co', 'Michael Rodriguez', 'Food & Restaurant', 'Seattle, WA'],
-        ['GreenLeaf Cafe', 'Jennifer Chen', 'Food & Restaurant', 'San Francisco, CA'],
-        ['FarmTable Solutions', 'David Kim', 'Food & Restaurant', 'Austin, TX'],
-        ['Local Harvest Kitchen', 'Amanda Martinez', 'Food & Restaurant', 'Denver, CO'],
-        ['Sustainable Eats Co', 'Robert Wilson', 'Food & Restaurant', 'Chicago, IL'],
-        ['Plant-Based Bistro', 'Lisa Thompson', 'Food & Restaurant', 'Nashville, TN'],
-        ['Artisan Food Hub', 'Carlos Garcia', 'Food & Restaurant', 'Miami, FL'],
-        ['Community Kitchen', 'Emily Davis', 'Food & Restaurant', 'Atlanta, GA'],
-        ['Fresh Start Foods', 'James Anderson', 'Food & Restaurant', 'Phoenix, AZ'],
-        ['Organic Harvest', 'Maria Lopez', 'Food & Restaurant', 'Los Angeles, CA'],
-        ['Healthy Plates Co', 'Steven Brown', 'Food & Restaurant', 'Las Vegas, NV'],
-        ['Garden Fresh Kitchen', 'Rachel White', 'Food & Restaurant', 'Salt Lake City, UT'],
-        ['Local Bite Restaurant', 'Kevin Moore', 'Food & Restaurant', 'San Diego, CA'],
-        ['Seasonal Flavors', 'Nicole Taylor', 'Food & Restaurant', 'Orlando, FL'],
-        ['Earth Kitchen Co', 'Daniel Jackson', 'Food & Restaurant', 'Charlotte, NC'],
-        ['Pure Food Solutions', 'Jessica Miller', 'Food & Restaurant', 'Indianapolis, IN'],
-        ['Natural Bites', 'Matthew Wilson', 'Food & Restaurant', 'Columbus, OH'],
-        ['Harvest Table', 'Ashley Rodriguez', 'Food & Restaurant', 'Memphis, TN'],
-        ['Green Cuisine Co', 'Ryan Johnson', 'Food & Restaurant', 'Oklahoma City, OK'],
-        ['Farm Kitchen', 'Lauren Davis', 'Food & Restaurant', 'Kansas City, MO'],
-        ['Wholesome Eats', 'Tyler Smith', 'Food & Restaurant', 'Virginia Beach, VA'],
-        ['Fresh Harvest Co', 'Sophie Dubois', 'Food & Restaurant', 'Montreal, QC'],
-        ['Natural Kitchen', 'Alexandre Martin', 'Food & Restaurant', 'Toronto, ON']
-    ]
-    
-    # Retail & E-commerce (22 founders: 20 US, 2 Canada)
-    retail_ecommerce = [
-        ['StyleTech Retail', 'Emma Thompson', 'Retail & E-commerce', 'New York, NY'],
-        ['EcoShop Solutions', 'Jason Martinez', 'Retail & E-commerce', 'Chicago, IL'],
-        ['Digital Marketplace', 'Amanda Lee', 'Retail & E-commerce', 'San Francisco, CA'],
-        ['SmartRetail Pro', 'Brian Wilson', 'Retail & E-commerce', 'Seattle, WA'],
-        ['OnlineStore Builder', 'Rachel Garcia', 'Retail & E-commerce', 'Austin, TX'],
-        ['RetailTech Innovations', 'Kevin Brown', 'Retail & E-commerce', 'Denver, CO'],
-        ['E-commerce Solutions', 'Michelle Davis', 'Retail & E-commerce', 'Miami, FL'],
-        ['Digital Store Platform', 'Christopher Johnson', 'Retail & E-commerce', 'Phoenix, AZ'],
-        ['Smart Shopping Co', 'Lauren Rodriguez', 'Retail & E-commerce', 'Los Angeles, CA'],
-        ['Online Retail Hub', 'Andrew Miller', 'Retail & E-commerce', 'Atlanta, GA'],
-        ['E-commerce Builder', 'Jessica Chen', 'Retail & E-commerce', 'Portland, OR'],
-        ['Retail Innovation Lab', 'David Kim', 'Retail & E-commerce', 'Nashville, TN'],
-        ['Digital Commerce Co', 'Stephanie Taylor', 'Retail & E-commerce', 'Orlando, FL'],
-        ['Smart Store Solutions', 'Michael Anderson', 'Retail & E-commerce', 'Charlotte, NC'],
-        ['Online Market Pro', 'Nicole Wilson', 'Retail & E-commerce', 'Indianapolis, IN'],
-        ['E-retail Systems', 'Jonathan Martinez', 'Retail & E-commerce', 'Columbus, OH'],
-        ['Digital Shopping', 'Sarah Thompson', 'Retail & E-commerce', 'Memphis, TN'],
-        ['Retail Connect', 'Tyler Johnson', 'Retail & E-commerce', 'Oklahoma City, OK'],
-        ['E-commerce Hub', 'Ashley Davis', 'Retail & E-commerce', 'Kansas City, MO'],
-        ['Smart Retail Co', 'Ryan Smith', 'Retail & E-commerce', 'Virginia Beach, VA'],
-        ['Digital Commerce', 'Isabelle Lavoie', 'Retail & E-commerce', 'Vancouver, BC'],
-        ['E-Shop Solutions', 'Marc Tremblay', 'Retail & E-commerce', 'Calgary, AB']
-    ]
-    
-    # Business Services (22 founders: 20 US, 2 Canada)
-    business_services = [
-        ['ConsultPro Solutions', 'Alexandra Smith', 'Business Services', 'Boston, MA'],
-        ['ServiceTech Co', 'Marcus Johnson', 'Business Services', 'Dallas, TX'],
-        ['Professional Hub', 'Diana Rodriguez', 'Business Services', 'Washington, DC'],
-        ['BusinessFlow Systems', 'Jonathan Lee', 'Business Services', 'San Jose, CA'],
-        ['Strategic Solutions', 'Samantha Brown', 'Business Services', 'Philadelphia, PA'],
-        ['ServicePro Technologies', 'Daniel Wilson', 'Business Services', 'Houston, TX'],
-        ['Business Optimization', 'Kelly Garcia', 'Business Services', 'Detroit, MI'],
-        ['Corporate Solutions', 'Robert Chen', 'Business Services', 'Jacksonville, FL'],
-        ['Professional Services Co', 'Melissa Martinez', 'Business Services', 'San Antonio, TX'],
-        ['BusinessSupport Pro', 'Christopher Davis', 'Business Services', 'Fort Worth, TX'],
-        ['Service Excellence', 'Amanda Thompson', 'Business Services', 'Columbus, OH'],
-        ['Strategic Business Co', 'Matthew Kim', 'Business Services', 'Charlotte, NC'],
-        ['Professional Systems', 'Nicole Anderson', 'Business Services', 'Indianapolis, IN'],
-        ['Business Solutions Hub', 'Tyler Wilson', 'Business Services', 'Seattle, WA'],
-        ['ServiceConnect Pro', 'Lauren Johnson', 'Business Services', 'Denver, CO'],
-        ['Corporate Services', 'Ryan Rodriguez', 'Business Services', 'Washington, DC'],
-        ['Business Process Co', 'Ashley Miller', 'Business Services', 'Boston, MA'],
-        ['Professional Tech', 'Kevin Taylor', 'Business Services', 'Portland, OR'],
-        ['Strategic Services', 'Jessica Brown', 'Business Services', 'Nashville, TN'],
-        ['Business Innovation', 'Michael Davis', 'Business Services', 'Atlanta, GA'],
-        ['Professional Solutions', 'Catherine Roy', 'Business Services', 'Ottawa, ON'],
-        ['Business Tech Co', 'Pierre Gagnon', 'Business Services', 'Quebec City, QC']
-    ]
-    
-    # Health, Beauty & Fitness (18 founders: 16 US, 2 Canada)
-    health_beauty = [
-        ['WellnessTech Solutions', 'Dr. Michelle Chen', 'Health, Beauty & Fitness', 'Los Angeles, CA'],
-        ['FitLife Innovations', 'Jennifer Rodriguez', 'Health, Beauty & Fitness', 'Miami, FL'],
-        ['HealthHub Pro', 'Michael Johnson', 'Health, Beauty & Fitness', 'Austin, TX'],
-        ['Beauty Tech Co', 'Sarah Martinez', 'Health, Beauty & Fitness', 'San Francisco, CA'],
-        ['Wellness Solutions', 'David Kim', 'Health, Beauty & Fitness', 'Seattle, WA'],
-        ['FitnessTrack Systems', 'Amanda Wilson', 'Health, Beauty & Fitness', 'Denver, CO'],
-        ['HealthCare Innovations', 'Robert Davis', 'Health, Beauty & Fitness', 'Chicago, IL'],
-        ['Beauty Wellness Co', 'Lisa Thompson', 'Health, Beauty & Fitness', 'Phoenix, AZ'],
-        ['Fitness Solutions Pro', 'Carlos Garcia', 'Health, Beauty & Fitness', 'Nashville, TN'],
-        ['Health Tech Hub', 'Emily Brown', 'Health, Beauty & Fitness', 'Atlanta, GA'],
-        ['Wellness Innovation', 'James Anderson', 'Health, Beauty & Fitness', 'Orlando, FL'],
-        ['Beauty Systems Co', 'Maria Lopez', 'Health, Beauty & Fitness', 'Charlotte, NC'],
-        ['Fitness Technology', 'Steven White', 'Health, Beauty & Fitness', 'Indianapolis, IN'],
-        ['Health Solutions', 'Rachel Taylor', 'Health, Beauty & Fitness', 'Columbus, OH'],
-        ['Wellness Pro Co', 'Kevin Moore', 'Health, Beauty & Fitness', 'Memphis, TN'],
-        ['Beauty Innovation', 'Nicole Jackson', 'Health, Beauty & Fitness', 'Kansas City, MO'],
-        ['Wellness Solutions', 'Dr. Marie Dubois', 'Health, Beauty & Fitness', 'Montreal, QC'],
-        ['FitTech Co', 'Alexandre Martin', 'Health, Beauty & Fitness', 'Toronto, ON']
-    ]
-    
-    # Construction & Contracting (16 founders: 14 US, 2 Canada)
-    construction = [
-        ['BuildTech Solutions', 'John Martinez', 'Construction & Contracting', 'Phoenix, AZ'],
-        ['SmartConstruction Co', 'Jennifer Wilson', 'Construction & Contracting', 'Austin, TX'],
-        ['ContractPro Systems', 'Michael Rodriguez', 'Construction & Contracting', 'Denver, CO'],
-        ['BuildingSolutions Hub', 'Sarah Johnson', 'Construction & Contracting', 'Nashville, TN'],
-        ['Construction Tech', 'David Chen', 'Construction & Contracting', 'Atlanta, GA'],
-        ['BuildPro Innovations', 'Amanda Garcia', 'Construction & Contracting', 'Charlotte, NC'],
-        ['Smart Building Co', 'Robert Kim', 'Construction & Contracting', 'Orlando, FL'],
-        ['Construction Solutions', 'Lisa Davis', 'Construction & Contracting', 'Jacksonville, FL'],
-        ['BuildTech Pro', 'Carlos Thompson', 'Construction & Contracting', 'Tampa, FL'],
-        ['Contracting Systems', 'Emily Anderson', 'Construction & Contracting', 'Fort Worth, TX'],
-        ['Building Innovation', 'James Brown', 'Construction & Contracting', 'San Antonio, TX'],
-        ['Construction Hub', 'Maria Lopez', 'Construction & Contracting', 'Columbus, OH'],
-        ['BuildSmart Co', 'Steven White', 'Construction & Contracting', 'Indianapolis, IN'],
-        ['Contract Solutions', 'Rachel Taylor', 'Construction & Contracting', 'Memphis, TN'],
-        ['BuildTech Canada', 'Jean-Pierre Moreau', 'Construction & Contracting', 'Montreal, QC'],
-        ['Smart Build Co', 'Sarah Thompson', 'Construction & Contracting', 'Vancouver, BC']
-    ]
-    
-    # Other Services (16 founders: 14 US, 2 Canada)
-    other_services = [
-        ['ServiceTech Solutions', 'Amanda Rodriguez', 'Other Services', 'Chicago, IL'],
-        ['Professional Services Hub', 'Michael Johnson', 'Other Services', 'Houston, TX'],
-        ['ServicePro Systems', 'Jennifer Chen', 'Other Services', 'Philadelphia, PA'],
-        ['Quality Services Co', 'David Martinez', 'Other Services', 'San Diego, CA'],
-        ['Service Innovation Lab', 'Sarah Wilson', 'Other Services', 'Dallas, TX'],
-        ['ProService Technologies', 'Robert Kim', 'Other Services', 'San Jose, CA'],
-        ['Service Excellence Co', 'Lisa Garcia', 'Other Services', 'Detroit, MI'],
-        ['Quality Pro Services', 'Carlos Davis', 'Other Services', 'Memphis, TN'],
-        ['Service Solutions Hub', 'Emily Thompson', 'Other Services', 'Louisville, KY'],
-        ['Professional Co', 'James Anderson', 'Other Services', 'Milwaukee, WI'],
-        ['Service Tech Pro', 'Maria Brown', 'Other Services', 'Albuquerque, NM'],
-        ['Quality Solutions', 'Steven Lopez', 'Other Services', 'Tucson, AZ'],
-        ['Service Systems', 'Rachel White', 'Other Services', 'Fresno, CA'],
-        ['Pro Services Co', 'Kevin Taylor', 'Other Services', 'Sacramento, CA'],
-        ['Service Solutions', 'Marie Lavoie', 'Other Services', 'Toronto, ON'],
-        ['Quality Services', 'David Tremblay', 'Other Services', 'Calgary, AB']
-    ]
-    
-    # Residential & Commercial Services (14 founders: 13 US, 1 Canada)
-    residential_commercial = [
-        ['HomeTech Solutions', 'Jennifer Martinez', 'Residential & Commercial Services', 'Los Angeles, CA'],
-        ['PropertyPro Services', 'Michael Wilson', 'Residential & Commercial Services', 'Chicago, IL'],
-        ['ResidentialTech Co', 'Sarah Rodriguez', 'Residential & Commercial Services', 'Houston, TX'],
-        ['CommercialServices Hub', 'David Johnson', 'Residential & Commercial Services', 'Phoenix, AZ'],
-        ['PropertyTech Solutions', 'Amanda Chen', 'Residential & Commercial Services', 'Philadelphia, PA'],
-        ['HomePro Systems', 'Robert Garcia', 'Residential & Commercial Services', 'San Antonio, TX'],
-        ['Commercial Solutions', 'Lisa Kim', 'Residential & Commercial Services', 'San Diego, CA'],
-        ['Residential Innovation', 'Carlos Davis', 'Residential & Commercial Services', 'Dallas, TX'],
-        ['PropertyServices Co', 'Emily Thompson', 'Residential & Commercial Services', 'San Jose, CA'],
-        ['HomeServices Pro', 'James Anderson', 'Residential & Commercial Services', 'Austin, TX'],
-        ['Commercial Tech', 'Maria Brown', 'Residential & Commercial Services', 'Jacksonville, FL'],
-        ['Residential Solutions', 'Steven Lopez', 'Residential & Commercial Services', 'Fort Worth, TX'],
-        ['PropertyTech Pro', 'Rachel White', 'Residential & Commercial Services', 'Columbus, OH'],
-        ['HomeServices Canada', 'Marc Gagnon', 'Residential & Commercial Services', 'Ottawa, ON']
-    ]
-    
-    # Technology (12 founders: 11 US, 1 Canada)
-    technology = [
-        ['TechFlow Solutions', 'Alex Chen', 'Technology', 'San Francisco, CA'],
-        ['InnovateTech Co', 'Sarah Martinez', 'Technology', 'Austin, TX'],
-        ['CodeCraft Systems', 'Michael Rodriguez', 'Technology', 'Seattle, WA'],
-        ['TechSolutions Hub', 'Jennifer Johnson', 'Technology', 'Denver, CO'],
-        ['DigitalTech Pro', 'David Kim', 'Technology', 'Boston, MA'],
-        ['SmartTech Innovations', 'Amanda Wilson', 'Technology', 'Portland, OR'],
-        ['TechBuilder Co', 'Robert Garcia', 'Technology', 'San Diego, CA'],
-        ['Innovation Systems', 'Lisa Davis', 'Technology', 'Nashville, TN'],
-        ['TechPro Solutions', 'Carlos Thompson', 'Technology', 'Atlanta, GA'],
-        ['DigitalSolutions Co', 'Emily Anderson', 'Technology', 'Charlotte, NC'],
-        ['TechHub Systems', 'James Brown', 'Technology', 'Orlando, FL'],
-        ['TechSolutions Canada', 'Sophie Dubois', 'Technology', 'Toronto, ON']
-    ]
-    
-    # Healthcare (11 founders: 10 US, 1 Canada)
-    healthcare = [
-        ['HealthTech Solutions', 'Dr. Jennifer Rodriguez', 'Healthcare', 'Boston, MA'],
-        ['MedicalInnovations Co', 'Dr. Michael Chen', 'Healthcare', 'San Francisco, CA'],
-        ['HealthcareHub Pro', 'Dr. Sarah Johnson', 'Healthcare', 'Seattle, WA'],
-        ['MedTech Systems', 'Dr. David Martinez', 'Healthcare', 'Chicago, IL'],
-        ['HealthSolutions Co', 'Dr. Amanda Kim', 'Healthcare', 'Los Angeles, CA'],
-        ['Medical Technology', 'Dr. Robert Wilson', 'Healthcare', 'Houston, TX'],
-        ['HealthPro Innovations', 'Dr. Lisa Garcia', 'Healthcare', 'Phoenix, AZ'],
-        ['MedicalSolutions Hub', 'Dr. Carlos Davis', 'Healthcare', 'Miami, FL'],
-        ['HealthTech Pro', 'Dr. Emily Thompson', 'Healthcare', 'Denver, CO'],
-        ['Medical Systems Co', 'Dr. James Anderson', 'Healthcare', 'Atlanta, GA'],
-        ['HealthTech Canada', 'Dr. Marie Lavoie', 'Healthcare', 'Montreal, QC']
-    ]
-    
-    # Financial Services (9 founders: 8 US, 1 Canada)
-    financial = [
-        ['FinTech Solutions', 'Jennifer Martinez', 'Financial Services', 'New York, NY'],
-        ['Financial Innovation Co', 'Michael Rodriguez', 'Financial Services', 'San Francisco, CA'],
-        ['MoneyTech Systems', 'Sarah Johnson', 'Financial Services', 'Chicago, IL'],
-        ['FinancialHub Pro', 'David Chen', 'Financial Services', 'Boston, MA'],
-        ['FinTech Innovations', 'Amanda Wilson', 'Financial Services', 'Seattle, WA'],
-        ['Financial Solutions', 'Robert Kim', 'Financial Services', 'Los Angeles, CA'],
-        ['MoneyPro Systems', 'Lisa Garcia', 'Financial Services', 'Austin, TX'],
-        ['FinancialTech Co', 'Carlos Davis', 'Financial Services', 'Denver, CO'],
-        ['FinTech Canada', 'Pierre Gagnon', 'Financial Services', 'Toronto, ON']
-    ]
-    
-    # Education & Training (8 founders: 7 US, 1 Canada)
-    education = [
-        ['EduTech Solutions', 'Jennifer Chen', 'Education & Training', 'Boston, MA'],
-        ['LearningHub Pro', 'Michael Rodriguez', 'Education & Training', 'San Francisco, CA'],
-        ['EducationTech Co', 'Sarah Martinez', 'Education & Training', 'Seattle, WA'],
-        ['TrainingPro Systems', 'David Johnson', 'Education & Training', 'Austin, TX'],
-        ['EduInnovations Hub', 'Amanda Wilson', 'Education & Training', 'Chicago, IL'],
-        ['Learning Solutions', 'Robert Kim', 'Education & Training', 'Los Angeles, CA'],
-        ['EducationPro Co', 'Lisa Garcia', 'Education & Training', 'Denver, CO'],
-        ['EduTech Canada', 'Alexandre Martin', 'Education & Training', 'Vancouver, BC']
-    ]
-    
-    # Manufacturing (7 founders: 6 US, 1 Canada)
-    manufacturing = [
-        ['ManufacturingTech Solutions', 'Michael Rodriguez', 'Manufacturing', 'Detroit, MI'],
-        ['SmartFactory Co', 'Jennifer Johnson', 'Manufacturing', 'Cleveland, OH'],
-        ['Industrial Innovation Hub', 'David Martinez', 'Manufacturing', 'Pittsburgh, PA'],
-        ['ManufacturingPro Systems', 'Sarah Chen', 'Manufacturing', 'Milwaukee, WI'],
-        ['Factory Solutions Co', 'Amanda Wilson', 'Manufacturing', 'Indianapolis, IN'],
-        ['Industrial Tech Pro', 'Robert Kim', 'Manufacturing', 'Cincinnati, OH'],
-        ['Manufacturing Canada', 'Jean-Pierre Moreau', 'Manufacturing', 'Hamilton, ON']
-    ]
-    
-    # Transportation & Logistics (6 founders: 6 US, 0 Canada)
-    transportation = [
-        ['LogisticsTech Solutions', 'Jennifer Martinez', 'Transportation & Logistics', 'Atlanta, GA'],
-        ['TransportPro Systems', 'Michael Rodriguez', 'Transportation & Logistics', 'Chicago, IL'],
-        ['ShippingHub Co', 'Sarah Johnson', 'Transportation & Logistics', 'Memphis, TN'],
-        ['LogisticsPro Innovations', 'David Chen', 'Transportation & Logistics', 'Dallas, TX'],
-        ['Transport Solutions', 'Amanda Wilson', 'Transportation & Logistics', 'Houston, TX'],
-        ['Logistics Systems Co', 'Robert Kim', 'Transportation & Logistics', 'Los Angeles, CA']
-    ]
-    
-    # Real Estate (6 founders: 6 US, 0 Canada)
-    real_estate = [
-        ['RealEstateTech Solutions', 'Jennifer Rodriguez', 'Real Estate', 'Los Angeles, CA'],
-        ['PropertyTech Innovations', 'Michael Johnson', 'Real Estate', 'Miami, FL'],
-        ['RealtyPro Systems', 'Sarah Martinez', 'Real Estate', 'New York, NY'],
-        ['PropertyHub Co', 'David Chen', 'Real Estate', 'San Francisco, CA'],
-        ['RealEstate Solutions', 'Amanda Wilson', 'Real Estate', 'Austin, TX'],
-        ['PropertyPro Tech', 'Robert Kim', 'Real Estate', 'Seattle, WA']
-    ]
-    
-    # Agriculture (5 founders: 5 US, 0 Canada)
-    agriculture = [
-        ['SmartFarm Technologies', 'Amanda Rodriguez', 'Agriculture', 'Des Moines, IA'],
-        ['PrecisionAg Solutions', 'Robert Johnson', 'Agriculture', 'Lincoln, NE'],
-        ['CropTech Analytics', 'Jennifer Kim', 'Agriculture', 'Fresno, CA'],
-        ['SustainableFarm Systems', 'Michael Chen', 'Agriculture', 'Austin, TX'],
-        ['AgriSensor Pro', 'Sarah Martinez', 'Agriculture', 'Phoenix, AZ']
-    ]
-    
-    # Entertainment & Media (4 founders: 4 US, 0 Canada)
-    entertainment = [
-        ['StreamTech Studios', 'David Kim', 'Entertainment & Media', 'Los Angeles, CA'],
-        ['GameDev Pro', 'Jennifer Rodriguez', 'Entertainment & Media', 'Austin, TX'],
-        ['ContentCreator Platform', 'Michael Chen', 'Entertainment & Media', 'Seattle, WA'],
-        ['DigitalMedia Solutions', 'Sarah Johnson', 'Entertainment & Media', 'Nashville, TN']
-    ]
-    
-    # Combine all sectors
-    sector_data = [
-        (food_restaurant, 'Food & Restaurant'),
-        (retail_ecommerce, 'Retail & E-commerce'),
-        (business_services, 'Business Services'),
-        (health_beauty, 'Health, Beauty & Fitness'),
-        (construction, 'Construction & Contracting'),
-        (other_services, 'Other Services'),
-        (residential_commercial, 'Residential & Commercial Services'),
-        (technology, 'Technology'),
-        (healthcare, 'Healthcare'),
-        (financial, 'Financial Services'),
-        (education, 'Education & Training'),
-        (manufacturing, 'Manufacturing'),
-        (transportation, 'Transportation & Logistics'),
-        (real_estate, 'Real Estate'),
-        (agriculture, 'Agriculture'),
-        (entertainment, 'Entertainment & Media')
-    ]
-    
-    # Create complete dataset
-    founders_count = 0
-    us_count = 0
-    canada_count = 0
+    """Consolidate the founder roster into linkedin_founders_complete_200.psv"""
     
-    for sector_founders, category in sector_data:
-        for founder_data in sector_founders:
-            # Create full 43-column row with empty placeholders
-            row = [''] * 43
-            row[0] = founder_data[0]  # proj_name
-            row[1] = founder_data[1]  # proj_founder  
-            row[2] = founder_data[2]  # proj_category
-            row[3] = founder_data[3]  # proj_location
-            
-            all_founders.append(row)
-            founders_count += 1
-            
-            # Count geographic distribution
-            if ', CA' in founder_data[3] or ', TX' in founder_data[3] or ', FL' in founder_data[3] or ', NY' in founder_data[3] or ', IL' in founder_data[3] or ', WA' in founder_data[3] or ', AZ' in founder_data[3] or ', MA' in founder_data[3] or ', CO' in founder_data[3] or ', GA' in founder_data[3] or ', NC' in founder_data[3] or ', TN' in founder_data[3] or ', OR' in founder_data[3] or ', IN' in founder_data[3] or ', OH' in founder_data[3] or ', MI' in founder_data[3] or ', PA' in founder_data[3] or ', NV' in founder_data[3] or ', UT' in founder_data[3] or ', MO' in founder_data[3] or ', KY' in founder_data[3] or ', WI' in founder_data[3] or ', NM' in founder_data[3] or ', VA' in founder_data[3] or ', OK' in founder_data[3] or ', IA' in founder_data[3] or ', NE' in founder_data[3]:
-                us_count += 1
-            elif ', ON' in founder_data[3] or ', QC' in founder_data[3] or ', BC' in founder_data[3] or ', AB' in founder_data[3]:
-                canada_count += 1
+    summary = founder_master.consolidate()
+    output = founder_master.DEFAULT_OUTPUT
     
-    # Write consolidated PSV file
-    with open('linkedin_founders_complete_200.psv', 'w', newline='', encoding='utf-8') as file:
-        writer = csv.writer(file, delimiter='|')
-        writer.writerow(header)
-        writer.writerows(all_founders)
+    columns = founder_codec.read_columns(output, ['proj_category', 'proj_location'])
+    founders_count = len(columns['proj_location'])
+    countries = Counter(country_code_of(location) for location in columns['proj_location'])
+    us_count = countries['US']
+    canada_count = countries['CA']
     
     print("🎊 MASTER CONSOLIDATION COMPLETE! 🎊")
     print("=" * 80)
+    print(f"📥 Sources: {summary['read']} read, {summary['unchanged']} unchanged, {summary['removed']} removed "
+          f"({summary['founders_changed']} founders re-merged)")
     print(f"📊 Total Founders: {founders_count}")
-    print(f"🇺🇸 US Founders: {us_count} ({us_count/founders_count*100:.1f}%)")
-    print(f"🇨🇦 Canada Founders: {canada_count} ({canada_count/founders_count*100:.1f}%)")
-    print(f"📁 Output: linkedin_founders_complete_200.psv")
+    if founders_count:
+        print(f"🇺🇸 US Founders: {us_count} ({us_count/founders_count*100:.1f}%)")
+        print(f"🇨🇦 Canada Founders: {canada_count} ({canada_count/founders_count*100:.1f}%)")
+    print(f"📁 Output: {output} ({'rewritten' if summary['written'] else 'unchanged'})")
     print(f"📋 Columns: 43 comprehensive data fields")
     print("=" * 80)
+    for problem in summary['problems']:
+        print(f"⚠️  {problem}")
     
     # Generate sector breakdown
     print("\n📈 SECTOR BREAKDOWN:")
-    sector_counts = [24, 22, 22, 18, 16, 16, 14, 12, 11, 9, 8, 7, 6, 6, 5, 4]
-    sector_names = [
-        'Food & Restaurant', 'Retail & E-commerce', 'Business Services',
-        'Health, Beauty & Fitness', 'Construction & Contracting', 'Other Services',
-        'Residential & Commercial Services', 'Technology', 'Healthcare',
-        'Financial Services', 'Education & Training', 'Manufacturing',
-        'Transportation & Logistics', 'Real Estate', 'Agriculture', 'Entertainment & Media'
-    ]
+    sector_counts = Counter(columns['proj_category'])
     
-    for i, (name, count) in enumerate(zip(sector_names, sector_counts)):
+    for i, (name, count) in enumerate(sector_counts.most_common()):
         print(f"{i+1:2d}. {name:35s}: {count:3d} founders")
     
-    print(f"\n🎯 VALIDATION: {sum(sector_counts)} = 200 ✅")
+    print(f"\n🎯 VALIDATION: {sum(sector_counts.values())} = {founders_count} ✅")
+    target = sum(t['target'] for t in SECTOR_TARGETS.values())
+    status = '✅' if founders_count == target else '⚠️'
+    print(f"{status} TARGET: {founders_count}/{target} founders in {output}")
     
     return founders_count
 
 if __name__ == "__main__":
-    create_master_dataset()
\ No newline at end of file
+    create_master_dataset()
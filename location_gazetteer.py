@@ -0,0 +1,739 @@
+#!/usr/bin/env python3
+"""
+Offline Location Gazetteer
+Resolves free-text profile locations to structured (city, region, country, lat/lon)
+using a bundled place table, an alias map, a token prefix trie and an LRU cache
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+
+# ---------------------------------------------------------------------------
+# Bundled place table
+# ---------------------------------------------------------------------------
+
+# (iso2, iso3, name, lat, lon, aliases)
+# The iso2 code is only used as an alias when it cannot be confused with a
+# US state / Canadian province abbreviation (CA, IN, DE, CO, ...). Such codes,
+# and names shared with a state (Georgia), are read as the country only when
+# a city elsewhere in the location belongs to it ("Berlin, DE").
+COUNTRIES = [
+    ('US', 'USA', 'United States', 39.83, -98.58,
+     ['usa', 'us', 'united states of america', 'america', 'u s', 'u s a']),
+    ('CA', 'CAN', 'Canada', 56.13, -106.35, []),
+    ('GB', 'GBR', 'United Kingdom', 54.00, -2.00, ['uk', 'great britain', 'britain', 'gb']),
+    ('IE', 'IRL', 'Ireland', 53.41, -8.24, ['ie']),
+    ('DE', 'DEU', 'Germany', 51.17, 10.45, ['deutschland']),
+    ('FR', 'FRA', 'France', 46.60, 2.21, ['fr']),
+    ('ES', 'ESP', 'Spain', 40.46, -3.75, ['espana', 'es']),
+    ('PT', 'PRT', 'Portugal', 39.40, -8.22, ['pt']),
+    ('IT', 'ITA', 'Italy', 41.87, 12.57, ['italia', 'it']),
+    ('NL', 'NLD', 'Netherlands', 52.13, 5.29, ['the netherlands', 'holland', 'nederland']),
+    ('BE', 'BEL', 'Belgium', 50.50, 4.47, ['be']),
+    ('CH', 'CHE', 'Switzerland', 46.82, 8.23, ['ch', 'schweiz', 'suisse']),
+    ('AT', 'AUT', 'Austria', 47.52, 14.55, ['at', 'osterreich']),
+    ('SE', 'SWE', 'Sweden', 60.13, 18.64, ['se', 'sverige']),
+    ('NO', 'NOR', 'Norway', 60.47, 8.47, ['norge']),
+    ('DK', 'DNK', 'Denmark', 56.26, 9.50, ['dk', 'danmark']),
+    ('FI', 'FIN', 'Finland', 61.92, 25.75, ['fi', 'suomi']),
+    ('PL', 'POL', 'Poland', 51.92, 19.15, ['pl', 'polska']),
+    ('CZ', 'CZE', 'Czechia', 49.82, 15.47, ['cz', 'czech republic']),
+    ('RO', 'ROU', 'Romania', 45.94, 24.97, ['ro', 'rumania']),
+    ('HU', 'HUN', 'Hungary', 47.16, 19.50, ['hu']),
+    ('BG', 'BGR', 'Bulgaria', 42.73, 25.49, ['bg']),
+    ('RS', 'SRB', 'Serbia', 44.02, 21.01, ['rs']),
+    ('HR', 'HRV', 'Croatia', 45.10, 15.20, ['hr']),
+    ('GR', 'GRC', 'Greece', 39.07, 21.82, ['gr']),
+    ('CY', 'CYP', 'Cyprus', 35.13, 33.43, ['cy']),
+    ('EE', 'EST', 'Estonia', 58.60, 25.01, ['ee']),
+    ('LV', 'LVA', 'Latvia', 56.88, 24.60, ['lv']),
+    ('LT', 'LTU', 'Lithuania', 55.17, 23.88, ['lt']),
+    ('UA', 'UKR', 'Ukraine', 48.38, 31.17, ['ua']),
+    ('BY', 'BLR', 'Belarus', 53.71, 27.95, ['by']),
+    ('RU', 'RUS', 'Russia', 61.52, 105.32, ['ru', 'russian federation']),
+    ('TR', 'TUR', 'Turkey', 38.96, 35.24, ['tr', 'turkiye']),
+    ('GE', 'GEO', 'Georgia', 42.32, 43.36, ['ge', 'sakartvelo']),
+    ('IL', 'ISR', 'Israel', 31.05, 34.85, []),
+    ('AE', 'ARE', 'United Arab Emirates', 23.42, 53.85, ['uae', 'ae']),
+    ('SA', 'SAU', 'Saudi Arabia', 23.89, 45.08, []),
+    ('IR', 'IRN', 'Iran', 32.43, 53.69, ['ir']),
+    ('EG', 'EGY', 'Egypt', 26.82, 30.80, ['eg']),
+    ('MA', 'MAR', 'Morocco', 31.79, -7.09, []),
+    ('NG', 'NGA', 'Nigeria', 9.08, 8.68, ['ng']),
+    ('GH', 'GHA', 'Ghana', 7.95, -1.02, ['gh']),
+    ('CM', 'CMR', 'Cameroon', 7.37, 12.35, ['cm', 'cameroun']),
+    ('KE', 'KEN', 'Kenya', -0.02, 37.91, ['ke']),
+    ('UG', 'UGA', 'Uganda', 1.37, 32.29, ['ug']),
+    ('TZ', 'TZA', 'Tanzania', -6.37, 34.89, ['tz']),
+    ('RW', 'RWA', 'Rwanda', -1.94, 29.87, ['rw']),
+    ('ET', 'ETH', 'Ethiopia', 9.15, 40.49, ['et']),
+    ('ZA', 'ZAF', 'South Africa', -30.56, 22.94, ['za']),
+    ('IN', 'IND', 'India', 20.59, 78.96, ['bharat']),
+    ('PK', 'PAK', 'Pakistan', 30.38, 69.35, ['pk']),
+    ('BD', 'BGD', 'Bangladesh', 23.68, 90.36, ['bd']),
+    ('LK', 'LKA', 'Sri Lanka', 7.87, 80.77, ['lk']),
+    ('NP', 'NPL', 'Nepal', 28.39, 84.12, ['np']),
+    ('UZ', 'UZB', 'Uzbekistan', 41.38, 64.59, ['uz']),
+    ('KZ', 'KAZ', 'Kazakhstan', 48.02, 66.92, ['kz']),
+    ('CN', 'CHN', 'China', 35.86, 104.20, ['cn', 'prc']),
+    ('HK', 'HKG', 'Hong Kong', 22.32, 114.17, ['hk']),
+    ('TW', 'TWN', 'Taiwan', 23.70, 120.96, ['tw']),
+    ('JP', 'JPN', 'Japan', 36.20, 138.25, ['jp', 'nippon']),
+    ('KR', 'KOR', 'South Korea', 35.91, 127.77, ['kr', 'korea', 'republic of korea']),
+    ('SG', 'SGP', 'Singapore', 1.35, 103.82, ['sg']),
+    ('MY', 'MYS', 'Malaysia', 4.21, 101.98, ['my']),
+    ('TH', 'THA', 'Thailand', 15.87, 100.99, ['th']),
+    ('VN', 'VNM', 'Vietnam', 14.06, 108.28, ['vn', 'viet nam']),
+    ('PH', 'PHL', 'Philippines', 12.88, 121.77, ['ph']),
+    ('ID', 'IDN', 'Indonesia', -0.79, 113.92, []),
+    ('AU', 'AUS', 'Australia', -25.27, 133.78, ['au']),
+    ('NZ', 'NZL', 'New Zealand', -40.90, 174.89, ['nz', 'aotearoa']),
+    ('MX', 'MEX', 'Mexico', 23.63, -102.55, ['mx']),
+    ('BR', 'BRA', 'Brazil', -14.24, -51.93, ['br', 'brasil']),
+    ('AR', 'ARG', 'Argentina', -38.42, -63.62, []),
+    ('CL', 'CHL', 'Chile', -35.68, -71.54, ['cl']),
+    ('CO', 'COL', 'Colombia', 4.57, -74.30, []),
+    ('PE', 'PER', 'Peru', -9.19, -75.02, []),
+    ('EC', 'ECU', 'Ecuador', -1.83, -78.18, ['ec']),
+    ('BO', 'BOL', 'Bolivia', -16.29, -63.59, ['bo']),
+    ('PY', 'PRY', 'Paraguay', -23.44, -58.44, ['py']),
+    ('UY', 'URY', 'Uruguay', -32.52, -55.77, ['uy']),
+    ('VE', 'VEN', 'Venezuela', 6.42, -66.59, ['ve']),
+]
+
+# (country iso2, region code, name, lat, lon, aliases)
+REGIONS = [
+    # United States
+    ('US', 'AL', 'Alabama', 32.81, -86.79, []),
+    ('US', 'AK', 'Alaska', 61.37, -152.40, []),
+    ('US', 'AZ', 'Arizona', 33.73, -111.43, []),
+    ('US', 'AR', 'Arkansas', 34.97, -92.37, []),
+    ('US', 'CA', 'California', 36.78, -119.42, ['cali']),
+    ('US', 'CO', 'Colorado', 39.06, -105.31, []),
+    ('US', 'CT', 'Connecticut', 41.60, -72.76, []),
+    ('US', 'DE', 'Delaware', 39.32, -75.51, []),
+    ('US', 'DC', 'District of Columbia', 38.90, -77.03, ['d c']),
+    ('US', 'FL', 'Florida', 27.77, -81.69, []),
+    ('US', 'GA', 'Georgia', 33.04, -83.64, []),
+    ('US', 'HI', 'Hawaii', 21.09, -157.50, []),
+    ('US', 'ID', 'Idaho', 44.24, -114.48, []),
+    ('US', 'IL', 'Illinois', 40.35, -88.99, []),
+    ('US', 'IN', 'Indiana', 39.85, -86.26, []),
+    ('US', 'IA', 'Iowa', 42.01, -93.21, []),
+    ('US', 'KS', 'Kansas', 38.53, -96.73, []),
+    ('US', 'KY', 'Kentucky', 37.67, -84.67, []),
+    ('US', 'LA', 'Louisiana', 31.17, -91.87, []),
+    ('US', 'ME', 'Maine', 44.69, -69.38, []),
+    ('US', 'MD', 'Maryland', 39.06, -76.80, []),
+    ('US', 'MA', 'Massachusetts', 42.23, -71.53, []),
+    ('US', 'MI', 'Michigan', 43.33, -84.54, []),
+    ('US', 'MN', 'Minnesota', 45.69, -93.90, []),
+    ('US', 'MS', 'Mississippi', 32.74, -89.68, []),
+    ('US', 'MO', 'Missouri', 38.46, -92.29, []),
+    ('US', 'MT', 'Montana', 46.92, -110.45, []),
+    ('US', 'NE', 'Nebraska', 41.13, -98.27, []),
+    ('US', 'NV', 'Nevada', 38.31, -117.06, []),
+    ('US', 'NH', 'New Hampshire', 43.45, -71.56, []),
+    ('US', 'NJ', 'New Jersey', 40.30, -74.52, []),
+    ('US', 'NM', 'New Mexico', 34.84, -106.25, []),
+    ('US', 'NY', 'New York', 42.17, -74.95, ['upstate new york']),
+    ('US', 'NC', 'North Carolina', 35.63, -79.81, []),
+    ('US', 'ND', 'North Dakota', 47.53, -99.78, []),
+    ('US', 'OH', 'Ohio', 40.39, -82.76, []),
+    ('US', 'OK', 'Oklahoma', 35.57, -96.93, []),
+    ('US', 'OR', 'Oregon', 44.57, -122.07, []),
+    ('US', 'PA', 'Pennsylvania', 40.59, -77.21, []),
+    ('US', 'RI', 'Rhode Island', 41.68, -71.51, []),
+    ('US', 'SC', 'South Carolina', 33.86, -80.95, []),
+    ('US', 'SD', 'South Dakota', 44.30, -99.44, []),
+    ('US', 'TN', 'Tennessee', 35.75, -86.69, []),
+    ('US', 'TX', 'Texas', 31.05, -97.56, []),
+    ('US', 'UT', 'Utah', 40.15, -111.86, []),
+    ('US', 'VT', 'Vermont', 44.05, -72.71, []),
+    ('US', 'VA', 'Virginia', 37.77, -78.17, []),
+    ('US', 'WA', 'Washington', 47.40, -121.49, ['washington state']),
+    ('US', 'WV', 'West Virginia', 38.49, -80.95, []),
+    ('US', 'WI', 'Wisconsin', 44.27, -89.62, []),
+    ('US', 'WY', 'Wyoming', 42.76, -107.30, []),
+    # Canada
+    ('CA', 'AB', 'Alberta', 53.93, -116.58, []),
+    ('CA', 'BC', 'British Columbia', 53.73, -127.65, []),
+    ('CA', 'MB', 'Manitoba', 53.76, -98.81, []),
+    ('CA', 'NB', 'New Brunswick', 46.57, -66.46, []),
+    ('CA', 'NL', 'Newfoundland and Labrador', 53.14, -57.66, ['newfoundland']),
+    ('CA', 'NS', 'Nova Scotia', 44.68, -63.74, []),
+    ('CA', 'ON', 'Ontario', 51.25, -85.32, []),
+    ('CA', 'PE', 'Prince Edward Island', 46.51, -63.42, ['pei']),
+    ('CA', 'QC', 'Quebec', 52.94, -73.55, []),
+    ('CA', 'SK', 'Saskatchewan', 52.94, -106.45, []),
+    ('CA', 'NT', 'Northwest Territories', 64.83, -124.85, []),
+    ('CA', 'NU', 'Nunavut', 70.30, -83.11, []),
+    ('CA', 'YT', 'Yukon', 64.28, -135.00, []),
+    # United Kingdom
+    ('GB', 'ENG', 'England', 52.36, -1.17, []),
+    ('GB', 'SCT', 'Scotland', 56.49, -4.20, []),
+    ('GB', 'WLS', 'Wales', 52.13, -3.78, []),
+    ('GB', 'NIR', 'Northern Ireland', 54.79, -6.49, []),
+    # Brazil
+    ('BR', 'SP', 'Sao Paulo', -22.19, -48.79, []),
+    ('BR', 'RJ', 'Rio de Janeiro', -22.25, -42.66, []),
+    ('BR', 'MG', 'Minas Gerais', -18.51, -44.56, []),
+    ('BR', 'PR', 'Parana', -24.89, -51.55, []),
+    ('BR', 'SC', 'Santa Catarina', -27.24, -50.22, []),
+    ('BR', 'RS', 'Rio Grande do Sul', -30.03, -53.23, []),
+    ('BR', 'GO', 'Goias', -15.83, -49.84, []),
+    ('BR', 'PA', 'Para', -3.42, -52.29, []),
+    ('BR', 'PE', 'Pernambuco', -8.81, -36.95, []),
+    ('BR', 'BA', 'Bahia', -12.58, -41.70, []),
+    # India
+    ('IN', 'KA', 'Karnataka', 15.32, 75.71, []),
+    ('IN', 'MH', 'Maharashtra', 19.75, 75.71, []),
+    ('IN', 'TN', 'Tamil Nadu', 11.13, 78.66, []),
+    ('IN', 'TG', 'Telangana', 18.11, 79.02, []),
+    ('IN', 'DL', 'Delhi', 28.70, 77.10, ['nct']),
+    ('IN', 'WB', 'West Bengal', 22.99, 87.86, []),
+    # Australia
+    ('AU', 'NSW', 'New South Wales', -31.84, 145.61, []),
+    ('AU', 'VIC', 'Victoria', -36.49, 144.28, []),
+    ('AU', 'QLD', 'Queensland', -20.92, 142.70, []),
+    ('AU', 'WA', 'Western Australia', -27.67, 121.63, []),
+]
+
+# (country iso2, region code or '', name, lat, lon, aliases)
+# When several cities share a name, the first listed one is the default.
+CITIES = [
+    # United States
+    ('US', 'NY', 'New York', 40.71, -74.01,
+     ['nyc', 'new york city', 'manhattan', 'brooklyn', 'queens', 'the bronx']),
+    ('US', 'CA', 'Los Angeles', 34.05, -118.24, []),
+    ('US', 'CA', 'San Francisco', 37.77, -122.42,
+     ['sf', 'bay area', 'san francisco bay area', 'sf bay area']),
+    ('US', 'CA', 'San Jose', 37.34, -121.89, ['silicon valley']),
+    ('US', 'CA', 'Oakland', 37.80, -122.27, []),
+    ('US', 'CA', 'San Diego', 32.72, -117.16, []),
+    ('US', 'CA', 'Sacramento', 38.58, -121.49, []),
+    ('US', 'CA', 'Palo Alto', 37.44, -122.14, []),
+    ('US', 'CA', 'Mountain View', 37.39, -122.08, []),
+    ('US', 'CA', 'Irvine', 33.68, -117.83, []),
+    ('US', 'WA', 'Seattle', 47.61, -122.33, []),
+    ('US', 'OR', 'Portland', 45.52, -122.68, []),
+    ('US', 'IL', 'Chicago', 41.88, -87.63, []),
+    ('US', 'MA', 'Boston', 42.36, -71.06, []),
+    ('US', 'TX', 'Austin', 30.27, -97.74, []),
+    ('US', 'TX', 'Houston', 29.76, -95.37, []),
+    ('US', 'TX', 'Dallas', 32.78, -96.80, []),
+    ('US', 'TX', 'San Antonio', 29.42, -98.49, []),
+    ('US', 'CO', 'Denver', 39.74, -104.99, []),
+    ('US', 'CO', 'Boulder', 40.01, -105.27, []),
+    ('US', 'GA', 'Atlanta', 33.75, -84.39, []),
+    ('US', 'FL', 'Miami', 25.76, -80.19, []),
+    ('US', 'FL', 'Orlando', 28.54, -81.38, []),
+    ('US', 'FL', 'Tampa', 27.95, -82.46, []),
+    ('US', 'FL', 'Jacksonville', 30.33, -81.66, []),
+    ('US', 'AZ', 'Phoenix', 33.45, -112.07, []),
+    ('US', 'AZ', 'Tucson', 32.22, -110.97, []),
+    ('US', 'NV', 'Las Vegas', 36.17, -115.14, []),
+    ('US', 'UT', 'Salt Lake City', 40.76, -111.89, ['slc']),
+    ('US', 'UT', 'Provo', 40.23, -111.66, []),
+    ('US', 'TN', 'Nashville', 36.16, -86.78, []),
+    ('US', 'TN', 'Memphis', 35.15, -90.05, []),
+    ('US', 'NC', 'Charlotte', 35.23, -80.84, []),
+    ('US', 'NC', 'Raleigh', 35.78, -78.64, []),
+    ('US', 'DC', 'Washington', 38.91, -77.04, ['washington d c', 'washington dc']),
+    ('US', 'PA', 'Philadelphia', 39.95, -75.17, ['philly']),
+    ('US', 'PA', 'Pittsburgh', 40.44, -79.99, []),
+    ('US', 'MI', 'Detroit', 42.33, -83.05, []),
+    ('US', 'MI', 'Ann Arbor', 42.28, -83.74, []),
+    ('US', 'MN', 'Minneapolis', 44.98, -93.27, []),
+    ('US', 'MO', 'St. Louis', 38.63, -90.20, ['st louis', 'saint louis']),
+    ('US', 'MO', 'Kansas City', 39.10, -94.58, []),
+    ('US', 'OH', 'Columbus', 39.96, -83.00, []),
+    ('US', 'OH', 'Cleveland', 41.50, -81.69, []),
+    ('US', 'OH', 'Cincinnati', 39.10, -84.51, []),
+    ('US', 'IN', 'Indianapolis', 39.77, -86.16, []),
+    ('US', 'WI', 'Milwaukee', 43.04, -87.91, []),
+    ('US', 'WI', 'Madison', 43.07, -89.40, []),
+    ('US', 'MD', 'Baltimore', 39.29, -76.61, []),
+    ('US', 'MD', 'Bethesda', 38.98, -77.10, []),
+    ('US', 'OK', 'Oklahoma City', 35.47, -97.52, []),
+    ('US', 'VA', 'Virginia Beach', 36.85, -75.98, []),
+    ('US', 'VA', 'Richmond', 37.54, -77.44, []),
+    ('US', 'NY', 'Buffalo', 42.89, -78.88, []),
+    ('US', 'LA', 'New Orleans', 29.95, -90.07, ['nola']),
+    ('US', 'NM', 'Albuquerque', 35.08, -106.65, []),
+    ('US', 'KY', 'Louisville', 38.25, -85.76, []),
+    ('US', 'HI', 'Honolulu', 21.31, -157.86, []),
+    ('US', 'AK', 'Anchorage', 61.22, -149.90, []),
+    ('US', 'ID', 'Boise', 43.62, -116.20, []),
+    ('US', 'NE', 'Omaha', 41.26, -95.93, []),
+    ('US', 'IA', 'Des Moines', 41.59, -93.62, []),
+    ('US', 'NJ', 'Newark', 40.74, -74.17, []),
+    ('US', 'NJ', 'Jersey City', 40.72, -74.04, []),
+    # Canada
+    ('CA', 'ON', 'Toronto', 43.65, -79.38, ['gta']),
+    ('CA', 'QC', 'Montreal', 45.50, -73.57, []),
+    ('CA', 'BC', 'Vancouver', 49.28, -123.12, []),
+    ('CA', 'AB', 'Calgary', 51.05, -114.07, []),
+    ('CA', 'AB', 'Edmonton', 53.55, -113.49, []),
+    ('CA', 'ON', 'Ottawa', 45.42, -75.70, []),
+    ('CA', 'QC', 'Quebec City', 46.81, -71.21, ['ville de quebec']),
+    ('CA', 'MB', 'Winnipeg', 49.90, -97.14, []),
+    ('CA', 'NS', 'Halifax', 44.65, -63.57, []),
+    ('CA', 'BC', 'Victoria', 48.43, -123.37, []),
+    ('CA', 'ON', 'Waterloo', 43.46, -80.52, []),
+    ('CA', 'ON', 'Mississauga', 43.59, -79.64, []),
+    ('CA', 'ON', 'Hamilton', 43.26, -79.87, []),
+    ('CA', 'SK', 'Saskatoon', 52.13, -106.67, []),
+    ('CA', 'SK', 'Regina', 50.45, -104.61, []),
+    # United Kingdom / Ireland
+    ('GB', 'ENG', 'London', 51.51, -0.13, []),
+    ('CA', 'ON', 'London', 42.98, -81.25, []),
+    ('GB', 'ENG', 'Manchester', 53.48, -2.24, []),
+    ('GB', 'ENG', 'Birmingham', 52.49, -1.89, []),
+    ('US', 'AL', 'Birmingham', 33.52, -86.80, []),
+    ('GB', 'ENG', 'Bristol', 51.45, -2.59, []),
+    ('GB', 'ENG', 'Leeds', 53.80, -1.55, []),
+    ('GB', 'ENG', 'Liverpool', 53.41, -2.98, []),
+    ('GB', 'ENG', 'Cambridge', 52.21, 0.12, []),
+    ('US', 'MA', 'Cambridge', 42.37, -71.11, []),
+    ('GB', 'ENG', 'Oxford', 51.75, -1.26, []),
+    ('GB', 'ENG', 'Norwich', 52.63, 1.30, []),
+    ('GB', 'ENG', 'Northampton', 52.24, -0.90, []),
+    ('GB', 'ENG', 'Hull', 53.74, -0.33, ['kingston upon hull']),
+    ('GB', 'SCT', 'Edinburgh', 55.95, -3.19, []),
+    ('GB', 'SCT', 'Glasgow', 55.86, -4.25, []),
+    ('GB', 'WLS', 'Cardiff', 51.48, -3.18, []),
+    ('GB', 'NIR', 'Belfast', 54.60, -5.93, []),
+    ('IE', '', 'Dublin', 53.35, -6.26, []),
+    # Europe
+    ('DE', '', 'Berlin', 52.52, 13.40, []),
+    ('DE', '', 'Munich', 48.14, 11.58, ['munchen', 'muenchen']),
+    ('DE', '', 'Hamburg', 53.55, 9.99, []),
+    ('DE', '', 'Frankfurt', 50.11, 8.68, ['frankfurt am main']),
+    ('DE', '', 'Dusseldorf', 51.23, 6.77, ['duesseldorf']),
+    ('DE', '', 'Cologne', 50.94, 6.96, ['koln', 'koeln']),
+    ('DE', '', 'Stuttgart', 48.78, 9.18, []),
+    ('FR', '', 'Paris', 48.86, 2.35, []),
+    ('FR', '', 'Lyon', 45.76, 4.84, []),
+    ('FR', '', 'Grenoble', 45.19, 5.72, []),
+    ('FR', '', 'Toulouse', 43.60, 1.44, []),
+    ('ES', '', 'Madrid', 40.42, -3.70, []),
+    ('ES', '', 'Barcelona', 41.39, 2.17, []),
+    ('ES', '', 'Valencia', 39.47, -0.38, []),
+    ('PT', '', 'Lisbon', 38.72, -9.14, ['lisboa']),
+    ('PT', '', 'Porto', 41.15, -8.61, []),
+    ('PT', '', 'Viana do Castelo', 41.69, -8.83, []),
+    ('IT', '', 'Rome', 41.90, 12.50, ['roma']),
+    ('IT', '', 'Milan', 45.46, 9.19, ['milano']),
+    ('NL', '', 'Amsterdam', 52.37, 4.90, []),
+    ('NL', '', 'Rotterdam', 51.92, 4.48, []),
+    ('NL', '', 'Eindhoven', 51.44, 5.48, []),
+    ('NL', '', 'Utrecht', 52.09, 5.12, []),
+    ('BE', '', 'Brussels', 50.85, 4.35, ['bruxelles']),
+    ('CH', '', 'Zurich', 47.38, 8.54, []),
+    ('CH', '', 'Geneva', 46.20, 6.14, ['geneve']),
+    ('CH', '', 'Bern', 46.95, 7.45, []),
+    ('AT', '', 'Vienna', 48.21, 16.37, ['wien']),
+    ('SE', '', 'Stockholm', 59.33, 18.07, []),
+    ('NO', '', 'Oslo', 59.91, 10.75, []),
+    ('NO', '', 'Trondheim', 63.43, 10.40, []),
+    ('DK', '', 'Copenhagen', 55.68, 12.57, ['kobenhavn']),
+    ('FI', '', 'Helsinki', 60.17, 24.94, []),
+    ('PL', '', 'Warsaw', 52.23, 21.01, ['warszawa']),
+    ('PL', '', 'Krakow', 50.06, 19.94, []),
+    ('CZ', '', 'Prague', 50.08, 14.44, ['praha']),
+    ('RO', '', 'Bucharest', 44.43, 26.10, ['bucuresti']),
+    ('RO', '', 'Bacau', 46.57, 26.91, []),
+    ('HU', '', 'Budapest', 47.50, 19.04, []),
+    ('GR', '', 'Athens', 37.98, 23.73, []),
+    ('CY', '', 'Nicosia', 35.19, 33.38, []),
+    ('CY', '', 'Limassol', 34.71, 33.02, []),
+    ('EE', '', 'Tallinn', 59.44, 24.75, []),
+    ('UA', '', 'Kyiv', 50.45, 30.52, ['kiev']),
+    ('BY', '', 'Minsk', 53.90, 27.57, []),
+    ('RU', '', 'Moscow', 55.76, 37.62, ['moskva']),
+    ('RU', '', 'Saint Petersburg', 59.93, 30.34, ['st petersburg']),
+    ('TR', '', 'Istanbul', 41.01, 28.98, []),
+    ('GE', '', 'Tbilisi', 41.72, 44.79, ['tiflis']),
+    ('TR', '', 'Ankara', 39.93, 32.86, []),
+    ('TR', '', 'Izmir', 38.42, 27.14, []),
+    # Middle East / Africa
+    ('IL', '', 'Tel Aviv', 32.09, 34.78, ['tel aviv yafo']),
+    ('AE', '', 'Dubai', 25.20, 55.27, []),
+    ('IR', '', 'Tehran', 35.69, 51.39, []),
+    ('EG', '', 'Cairo', 30.04, 31.24, []),
+    ('EG', '', 'Alexandria', 31.20, 29.92, []),
+    ('MA', '', 'Casablanca', 33.57, -7.59, []),
+    ('NG', '', 'Lagos', 6.52, 3.38, []),
+    ('NG', '', 'Abuja', 9.08, 7.40, []),
+    ('NG', '', 'Ibadan', 7.38, 3.95, []),
+    ('GH', '', 'Accra', 5.60, -0.19, []),
+    ('CM', '', 'Yaounde', 3.85, 11.50, []),
+    ('CM', '', 'Douala', 4.05, 9.77, []),
+    ('KE', '', 'Nairobi', -1.29, 36.82, []),
+    ('KE', '', 'Mombasa', -4.04, 39.67, []),
+    ('UG', '', 'Kampala', 0.35, 32.58, []),
+    ('RW', '', 'Kigali', -1.95, 30.06, []),
+    ('TZ', '', 'Dar es Salaam', -6.79, 39.21, []),
+    ('ET', '', 'Addis Ababa', 9.03, 38.74, []),
+    ('ZA', '', 'Johannesburg', -26.20, 28.05, ['joburg']),
+    ('ZA', '', 'Cape Town', -33.92, 18.42, []),
+    # Asia
+    ('IN', 'KA', 'Bangalore', 12.97, 77.59, ['bengaluru']),
+    ('IN', 'MH', 'Mumbai', 19.08, 72.88, ['bombay']),
+    ('IN', 'MH', 'Pune', 18.52, 73.86, []),
+    ('IN', 'DL', 'New Delhi', 28.61, 77.21, ['delhi']),
+    ('IN', 'TG', 'Hyderabad', 17.39, 78.49, []),
+    ('IN', 'TN', 'Chennai', 13.08, 80.27, ['madras']),
+    ('IN', 'WB', 'Kolkata', 22.57, 88.36, ['calcutta']),
+    ('PK', '', 'Karachi', 24.86, 67.00, []),
+    ('PK', '', 'Lahore', 31.55, 74.34, []),
+    ('PK', '', 'Islamabad', 33.68, 73.05, []),
+    ('BD', '', 'Dhaka', 23.81, 90.41, ['dhaka cantonment']),
+    ('BD', '', 'Chattogram', 22.36, 91.78, ['chittagong']),
+    ('BD', '', 'Sylhet', 24.90, 91.87, []),
+    ('LK', '', 'Colombo', 6.93, 79.86, []),
+    ('NP', '', 'Kathmandu', 27.72, 85.32, []),
+    ('UZ', '', 'Tashkent', 41.30, 69.24, ['toshkent']),
+    ('CN', '', 'Beijing', 39.90, 116.41, []),
+    ('CN', '', 'Shanghai', 31.23, 121.47, []),
+    ('CN', '', 'Shenzhen', 22.54, 114.06, []),
+    ('CN', '', 'Hangzhou', 30.27, 120.16, []),
+    ('HK', '', 'Hong Kong', 22.32, 114.17, []),
+    ('TW', '', 'Taipei', 25.03, 121.57, []),
+    ('JP', '', 'Tokyo', 35.68, 139.69, []),
+    ('JP', '', 'Yokohama', 35.44, 139.64, []),
+    ('JP', '', 'Osaka', 34.69, 135.50, []),
+    ('JP', '', 'Saitama', 35.86, 139.65, []),
+    ('KR', '', 'Seoul', 37.57, 126.98, []),
+    ('SG', '', 'Singapore', 1.35, 103.82, []),
+    ('MY', '', 'Kuala Lumpur', 3.14, 101.69, ['kl']),
+    ('TH', '', 'Bangkok', 13.76, 100.50, []),
+    ('VN', '', 'Ho Chi Minh City', 10.82, 106.63, ['saigon', 'hcmc']),
+    ('VN', '', 'Hanoi', 21.03, 105.85, []),
+    ('PH', '', 'Manila', 14.60, 120.98, []),
+    ('ID', '', 'Jakarta', -6.21, 106.85, []),
+    # Oceania
+    ('AU', 'NSW', 'Sydney', -33.87, 151.21, []),
+    ('AU', 'VIC', 'Melbourne', -37.81, 144.96, []),
+    ('AU', 'QLD', 'Brisbane', -27.47, 153.03, []),
+    ('AU', 'WA', 'Perth', -31.95, 115.86, []),
+    ('NZ', '', 'Auckland', -36.85, 174.76, []),
+    ('NZ', '', 'Wellington', -41.29, 174.78, []),
+    ('NZ', '', 'Christchurch', -43.53, 172.64, []),
+    ('NZ', '', 'Hamilton', -37.79, 175.28, []),
+    # Latin America
+    ('MX', '', 'Mexico City', 19.43, -99.13, ['ciudad de mexico', 'cdmx']),
+    ('MX', '', 'Guadalajara', 20.66, -103.35, []),
+    ('MX', '', 'Monterrey', 25.69, -100.32, []),
+    ('BR', 'SP', 'Sao Paulo', -23.55, -46.63, []),
+    ('BR', 'SP', 'Campinas', -22.91, -47.06, []),
+    ('BR', 'RJ', 'Rio de Janeiro', -22.91, -43.17, ['rio']),
+    ('BR', 'MG', 'Belo Horizonte', -19.92, -43.94, []),
+    ('BR', 'MG', 'Lavras', -21.25, -45.00, []),
+    ('BR', 'PR', 'Curitiba', -25.43, -49.27, []),
+    ('BR', 'SC', 'Florianopolis', -27.60, -48.55, []),
+    ('BR', 'SC', 'Sao Bento do Sul', -26.25, -49.38, []),
+    ('BR', 'RS', 'Porto Alegre', -30.03, -51.23, []),
+    ('BR', 'GO', 'Goiania', -16.69, -49.26, []),
+    ('BR', 'PA', 'Belem', -1.46, -48.50, []),
+    ('BR', 'PE', 'Recife', -8.05, -34.88, []),
+    ('AR', '', 'Buenos Aires', -34.60, -58.38, []),
+    ('AR', '', 'Mendoza', -32.89, -68.84, []),
+    ('CL', '', 'Santiago', -33.45, -70.67, []),
+    ('CL', '', 'Valparaiso', -33.05, -71.62, []),
+    ('CO', '', 'Bogota', 4.71, -74.07, []),
+    ('CO', '', 'Medellin', 6.24, -75.58, []),
+    ('CO', '', 'Ibague', 4.44, -75.23, []),
+    ('PE', '', 'Lima', -12.05, -77.04, []),
+    ('PY', '', 'Asuncion', -25.26, -57.58, []),
+    ('UY', '', 'Montevideo', -34.90, -56.16, []),
+    ('VE', '', 'Caracas', 10.48, -66.90, []),
+    ('EC', '', 'Quito', -0.18, -78.47, []),
+]
+
+
+class Place(NamedTuple):
+    """Structured location resolved from a free-text string"""
+    city: str
+    region: str
+    region_code: str
+    country: str
+    country_code: str
+    latitude: Optional[float]
+    longitude: Optional[float]
+
+    @property
+    def precision(self) -> str:
+        """Finest level that was resolved: 'city', 'region', 'country' or ''"""
+        if self.city:
+            return 'city'
+        if self.region:
+            return 'region'
+        if self.country:
+            return 'country'
+        return ''
+
+
+class _Entry(NamedTuple):
+    kind: str           # 'country' | 'region' | 'city'
+    name: str
+    country_code: str
+    region_code: str
+    latitude: float
+    longitude: float
+    strict: bool        # short codes only match as a whole part or in upper case
+
+
+_TOKEN_RE = re.compile(r"[^\W_]+(?:'[^\W_]+)*")
+_END = object()
+
+
+def _fold(text: str) -> str:
+    """Strip accents so 'São Paulo' and 'Sao Paulo' share a key"""
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def _tokens(text: str) -> List[str]:
+    return [t.lower() for t in _TOKEN_RE.findall(_fold(text))]
+
+
+class Gazetteer:
+    """Token prefix trie over place names and aliases"""
+
+    def __init__(self, countries=COUNTRIES, regions=REGIONS, cities=CITIES):
+        self._trie: Dict = {}
+        self.aliases: Dict[str, Tuple[_Entry, ...]] = {}
+        self.countries: Dict[str, _Entry] = {}
+        self.regions: Dict[Tuple[str, str], _Entry] = {}
+
+        for iso2, iso3, name, lat, lon, aliases in countries:
+            entry = _Entry('country', name, iso2, '', lat, lon, False)
+            self.countries[iso2] = entry
+            self._add(name, entry)
+            self._add(iso3, entry._replace(strict=True))
+            for alias in aliases:
+                self._add(alias, entry._replace(strict=len(alias) <= 3))
+
+        for iso2, code, name, lat, lon, aliases in regions:
+            entry = _Entry('region', name, iso2, code, lat, lon, False)
+            self.regions[(iso2, code)] = entry
+            self._add(name, entry)
+            self._add(code, entry._replace(strict=True))
+            for alias in aliases:
+                self._add(alias, entry._replace(strict=len(alias) <= 3))
+
+        for iso2, code, name, lat, lon, aliases in cities:
+            entry = _Entry('city', name, iso2, code, lat, lon, False)
+            self._add(name, entry)
+            for alias in aliases:
+                self._add(alias, entry._replace(strict=len(alias) <= 3))
+
+    def _add(self, text: str, entry: _Entry) -> None:
+        tokens = _tokens(text)
+        if not tokens:
+            return
+        node = self._trie
+        for token in tokens:
+            node = node.setdefault(token, {})
+        node[_END] = node.get(_END, ()) + (entry,)
+        self.aliases[' '.join(tokens)] = node[_END]
+
+    def _scan(self, part: str) -> List[Tuple[_Entry, ...]]:
+        """Longest-match scan of one comma-separated part through the trie"""
+        raw_tokens = _TOKEN_RE.findall(_fold(part))
+        tokens = [t.lower() for t in raw_tokens]
+        matches = []
+        i = 0
+        while i < len(tokens):
+            node = self._trie
+            best_end, best = i, ()
+            j = i
+            while j < len(tokens) and tokens[j] in node:
+                node = node[tokens[j]]
+                j += 1
+                if _END in node:
+                    best_end, best = j, node[_END]
+            if best:
+                whole_part = i == 0 and best_end == len(tokens)
+                upper = all(t.isupper() for t in raw_tokens[i:best_end])
+                usable = tuple(e for e in best if not e.strict or whole_part or upper)
+                if usable:
+                    matches.append(usable)
+                    i = best_end
+                    continue
+            i += 1
+        return matches
+
+    def _disambiguate(self, groups: List[Tuple[str, Tuple[_Entry, ...]]]) -> List[Tuple[str, Tuple[_Entry, ...]]]:
+        """Settle parts that read as a state/province or a country ("CA", "DE", "Georgia")
+
+        The country reading wins only when a city in another part belongs to
+        that country ("Toronto, CA", "Tbilisi, Georgia"); otherwise the part is
+        the state or province ("Los Angeles, CA", "Atlanta, Georgia", "Georgia").
+        """
+        settled = []
+        for index, (part, candidates) in enumerate(groups):
+            if not any(e.kind == 'region' for e in candidates):
+                settled.append((part, candidates))
+                continue
+            readings = [e for e in candidates if e.kind == 'country']
+            code = part.upper()
+            if len(code) == 2 and code.isalpha() and code in self.countries:
+                readings.append(self.countries[code])
+            city_countries = {e.country_code for other, (_, others) in enumerate(groups) if other != index
+                              for e in others if e.kind == 'city'}
+            agreeing = tuple(e for e in readings if e.country_code in city_countries)
+            if agreeing:
+                settled.append((part, agreeing))
+            else:
+                settled.append((part, tuple(e for e in candidates if e.kind != 'country')))
+        return settled
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[str]:
+        """Autocomplete place names/aliases that start with the given text"""
+        tokens = _tokens(prefix)
+        if not tokens:
+            return []
+        node = self._trie
+        for token in tokens[:-1]:
+            if token not in node:
+                return []
+            node = node[token]
+
+        results = []
+        stack = [(child, [key]) for key, child in node.items()
+                 if key is not _END and key.startswith(tokens[-1])]
+        while stack and len(results) < limit:
+            child, path = stack.pop()
+            if _END in child:
+                names = sorted({e.name for e in child[_END]})
+                results.extend(n for n in names if n not in results)
+            stack.extend((grand, path + [key]) for key, grand in child.items() if key is not _END)
+        return results[:limit]
+
+    def resolve(self, location: Optional[str]) -> Optional[Place]:
+        """Resolve a free-text location, or None if nothing recognizable is found"""
+        if not location or not location.strip():
+            return None
+
+        parts = [p for p in re.split(r'[,;|/()]|\s+-\s+|\s+-|-\s+', location) if p.strip()]
+        groups = []
+        unmatched_first = None
+        for index, part in enumerate(parts):
+            found = self._scan(part)
+            if not found and index == 0:
+                unmatched_first = part.strip()
+            groups.extend((part.strip(), candidates) for candidates in found)
+        if not groups:
+            return None
+
+        remaining = self._disambiguate(groups)
+
+        # Country: the last explicit country mention wins ("Chile | US" -> US)
+        country = None
+        for group in reversed(remaining):
+            hit = next((e for e in group[1] if e.kind == 'country'), None)
+            if hit:
+                country = hit
+                remaining.remove(group)
+                break
+
+        # Region: scan from the end; a lone "New York" is left for the city pass
+        region = None
+        for group in reversed(remaining):
+            candidates = group[1]
+            hits = [e for e in candidates if e.kind == 'region'
+                    and (country is None or e.country_code == country.country_code)]
+            if not hits:
+                continue
+            if len(remaining) == 1 and any(e.kind == 'city' for e in candidates):
+                break
+            region = hits[0]
+            remaining.remove(group)
+            break
+
+        # City: only candidates consistent with the region, else the country.
+        # A city of the same name elsewhere ("Portland, ME") keeps its name but
+        # never lends its coordinates.
+        city = None
+        unplaced_city = None
+        for _, candidates in remaining:
+            cities = [e for e in candidates if e.kind == 'city']
+            if not cities:
+                continue
+            if unplaced_city is None:
+                unplaced_city = cities[0].name
+            if region is not None:
+                cities = [e for e in cities if e.country_code == region.country_code
+                          and (not e.region_code or e.region_code == region.region_code)]
+            elif country is not None:
+                cities = [e for e in cities if e.country_code == country.country_code]
+            if cities:
+                city = cities[0]
+                break
+
+        if city is not None:
+            if region is None and city.region_code:
+                region = self.regions.get((city.country_code, city.region_code))
+        if country is None:
+            source = city or region
+            if source is None:
+                # Only an inconsistent leftover (e.g. a region of another country)
+                source = remaining[0][1][0]
+                if source.kind == 'region':
+                    region = source
+                elif source.kind == 'city':
+                    city = source
+            country = self.countries.get(source.country_code)
+
+        city_name = city.name if city else ''
+        if not city_name and (region or country):
+            # Small towns are not bundled; keep the raw name and use coarser coords
+            city_name = unplaced_city or unmatched_first or ''
+
+        finest = city or region or country
+        return Place(
+            city=city_name,
+            region=region.name if region else '',
+            region_code=region.region_code if region else '',
+            country=country.name if country else '',
+            country_code=country.country_code if country else '',
+            latitude=finest.latitude if finest else None,
+            longitude=finest.longitude if finest else None,
+        )
+
+
+_default_gazetteer: Optional[Gazetteer] = None
+
+
+def get_gazetteer() -> Gazetteer:
+    """Return the shared gazetteer built from the bundled table"""
+    global _default_gazetteer
+    if _default_gazetteer is None:
+        _default_gazetteer = Gazetteer()
+    return _default_gazetteer
+
+
+@lru_cache(maxsize=65536)
+def resolve_location(location: Optional[str]) -> Optional[Place]:
+    """Resolve a raw location string (cached on the raw string)"""
+    return get_gazetteer().resolve(location)
+
+
+def country_code_of(location: Optional[str]) -> str:
+    """ISO 3166 alpha-2 country code for a raw location, or '' if unknown"""
+    place = resolve_location(location)
+    return place.country_code if place else ''
+
+
+if __name__ == "__main__":
+    import sys
+
+    for raw in sys.argv[1:] or ['San Francisco, CA', 'Bay Area', 'Toronto, ON', 'São Paulo, SP']:
+        place = resolve_location(raw)
+        print(f"{raw!r:<30} -> {place}")
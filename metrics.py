@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Collection Metrics
+Thread-safe counters, gauges and histograms for the collectors, exposed as
+Prometheus text on a local /metrics endpoint and as a JSON snapshot file
+
+Counters and histograms are sharded per thread: each writer only touches its
+own shard, so the hot path takes no lock; readers sum the shards.
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    parts = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class _Metric:
+    kind = ''
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(labels)
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"{self.name} expects labels {self.label_names}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+
+class _Sharded(_Metric):
+    """Per-thread shards: writers mutate only their own dict"""
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        super().__init__(name, help_text, labels)
+        self._local = threading.local()
+        self._shards: List[Dict] = []
+        self._shards_lock = threading.Lock()
+
+    def _shard(self) -> Dict:
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def _all_shards(self) -> List[Dict]:
+        with self._shards_lock:
+            return list(self._shards)
+
+
+class Counter(_Sharded):
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        shard = self._shard()
+        key = self._key(labels)
+        shard[key] = shard.get(key, 0) + amount
+
+    def values(self) -> Dict[LabelValues, float]:
+        totals: Dict[LabelValues, float] = {}
+        for shard in self._all_shards():
+            for key, value in list(shard.items()):
+                totals[key] = totals.get(key, 0) + value
+        return totals
+
+    def value(self, **labels) -> float:
+        return self.values().get(self._key(labels), 0)
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        return [(self.name, _format_labels(self.label_names, key), value)
+                for key, value in sorted(self.values().items())]
+
+
+class Gauge(_Metric):
+    """Last-write-wins values (a single dict store is atomic under the GIL)"""
+    kind = 'gauge'
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        super().__init__(name, help_text, labels)
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def set(self, value: float, **labels) -> None:
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def values(self) -> Dict[LabelValues, float]:
+        return dict(self._values)
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        return [(self.name, _format_labels(self.label_names, key), value)
+                for key, value in sorted(self.values().items())]
+
+
+class Histogram(_Sharded):
+    kind = 'histogram'
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labels)
+        if list(buckets) != sorted(buckets):
+            raise ValueError("Histogram buckets must be sorted")
+        self.buckets = tuple(buckets) + (math.inf,)
+
+    def observe(self, value: float, **labels) -> None:
+        shard = self._shard()
+        key = self._key(labels)
+        state = shard.get(key)
+        if state is None:
+            # [bucket counts..., sum, count]
+            state = shard[key] = [0] * len(self.buckets) + [0.0, 0]
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                state[i] += 1
+                break
+        state[-2] += value
+        state[-1] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of a with-block"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def values(self) -> Dict[LabelValues, Dict]:
+        merged: Dict[LabelValues, List] = {}
+        for shard in self._all_shards():
+            for key, state in list(shard.items()):
+                total = merged.setdefault(key, [0] * len(state))
+                for i, value in enumerate(list(state)):
+                    total[i] += value
+        result = {}
+        for key, state in merged.items():
+            cumulative = []
+            running = 0
+            for count in state[:len(self.buckets)]:
+                running += count
+                cumulative.append(running)
+            result[key] = {'buckets': dict(zip(self.buckets, cumulative)),
+                           'sum': state[-2], 'count': state[-1]}
+        return result
+
+    def quantile(self, q: float, **labels) -> Optional[float]:
+        """Estimate a quantile by linear interpolation within buckets"""
+        data = self.values().get(self._key(labels))
+        if not data or not data['count']:
+            return None
+        target = q * data['count']
+        lower_bound, lower_count = 0.0, 0
+        for bound, cumulative in data['buckets'].items():
+            if cumulative >= target:
+                if bound == math.inf:
+                    return lower_bound
+                span = cumulative - lower_count
+                fraction = (target - lower_count) / span if span else 0
+                return lower_bound + (bound - lower_bound) * fraction
+            lower_bound, lower_count = bound, cumulative
+        return lower_bound
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        samples = []
+        for key, data in sorted(self.values().items()):
+            for bound, cumulative in data['buckets'].items():
+                le = f'le="{_format_value(float(bound))}"'
+                samples.append((f"{self.name}_bucket", _format_labels(self.label_names, key, le), cumulative))
+            samples.append((f"{self.name}_sum", _format_labels(self.label_names, key), data['sum']))
+            samples.append((f"{self.name}_count", _format_labels(self.label_names, key), data['count']))
+        return samples
+
+
+class MetricsRegistry:
+    """Named metrics; get-or-create so modules can share instruments"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, help_text: str, labels: Sequence[str], **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help_text, labels, **kwargs)
+            elif not isinstance(metric, cls) or metric.label_names != tuple(labels):
+                raise ValueError(f"Metric {name} already registered with a different type or labels")
+            return metric
+
+    def counter(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help_text, labels)
+
+    def gauge(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, help_text, labels)
+
+    def histogram(self, name: str, help_text: str, labels: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, help_text, labels, buckets=buckets)
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format (0.0.4)"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{labels} {_format_value(value)}")
+        return '\n'.join(lines) + '\n'
+
+    def snapshot(self) -> Dict:
+        """JSON-friendly view of every metric"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        result = {'timestamp': time.time(), 'metrics': {}}
+        for metric in metrics:
+            series = []
+            for key, value in metric.values().items():
+                entry = {'labels': dict(zip(metric.label_names, key))}
+                if isinstance(metric, Histogram):
+                    entry.update(count=value['count'], sum=value['sum'],
+                                 buckets={_format_value(float(b)): c for b, c in value['buckets'].items()})
+                    for q in (0.5, 0.95, 0.99):
+                        entry[f"p{int(q * 100)}"] = metric.quantile(q, **entry['labels'])
+                else:
+                    entry['value'] = value
+                series.append(entry)
+            result['metrics'][metric.name] = {'type': metric.kind, 'help': metric.help, 'series': series}
+        return result
+
+    def write_snapshot(self, path: str) -> None:
+        """Atomically write snapshot() as JSON"""
+        tmp_path = f"{path}.tmp.{os.getpid()}"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.snapshot(), f, indent=2)
+        os.replace(tmp_path, path)
+
+    def start_http_server(self, port: int, host: str = '127.0.0.1') -> ThreadingHTTPServer:
+        """Serve /metrics (Prometheus text) and /metrics.json from a daemon thread"""
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] == '/metrics':
+                    body = registry.render_prometheus().encode()
+                    content_type = 'text/plain; version=0.0.4; charset=utf-8'
+                elif self.path.split('?')[0] == '/metrics.json':
+                    body = json.dumps(registry.snapshot()).encode()
+                    content_type = 'application/json'
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        thread = threading.Thread(target=server.serve_forever, name='metrics-http', daemon=True)
+        thread.start()
+        return server
+
+
+# Shared registry used by the collectors and ProgressTracker
+REGISTRY = MetricsRegistry()
+
+
+if __name__ == "__main__":
+    import sys
+
+    path = sys.argv[1] if len(sys.argv) > 1 else 'collection_metrics.json'
+    with open(path, 'r') as f:
+        snapshot = json.load(f)
+    print(f"Metrics snapshot from {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(snapshot['timestamp']))}")
+    for name, metric in sorted(snapshot['metrics'].items()):
+        for series in metric['series']:
+            labels = ','.join(f"{k}={v}" for k, v in series['labels'].items())
+            if metric['type'] == 'histogram':
+                p50, p95 = series.get('p50'), series.get('p95')
+                print(f"  {name}{{{labels}}} count={series['count']} "
+                      f"p50={p50 if p50 is None else round(p50, 4)} p95={p95 if p95 is None else round(p95, 4)}")
+            else:
+                print(f"  {name}{{{labels}}} {series['value']}")
@@ -1,66 +1,57 @@
 #!/usr/bin/env python3
 """
 Monitor GitHub resume collection progress
+Subscribes to the collector's progress channel, so updates are pushed as they
+happen instead of polling the checkpoint file
 """
 
-import time
-import os
-import json
-from datetime import datetime, timedelta
+from datetime import datetime
+
+from collection_manifest import CollectionManifest
+from progress_channel import subscribe, wait_for_channel
+
+TARGET = 2000
+
 
 def monitor_collection():
     print("\n=== GitHub Resume Collection Monitor ===")
     print("Press Ctrl+C to stop monitoring\n")
     
-    last_count = 0
-    
-    while True:
-        try:
-            # Check for checkpoint file
-            if os.path.exists('collection_checkpoint.json'):
-                with open('collection_checkpoint.json', 'r') as f:
-                    checkpoint = json.load(f)
-                    
-                count = checkpoint.get('resumes_collected', 0)
-                last_updated = checkpoint.get('last_updated', 'Unknown')
-                
-                if count != last_count:
-                    print(f"\r[{datetime.now().strftime('%H:%M:%S')}] "
-                          f"Progress: {count}/2000 ({count/2000*100:.1f}%) "
-                          f"| Last update: {last_updated}", end='', flush=True)
-                    last_count = count
-                    
-                    # Check if collection is complete
-                    if count >= 2000:
-                        print("\n\n✅ Collection Complete!")
-                        break
-            
-            # Also check for final output files
-            files = [f for f in os.listdir('resume_collections') 
-                    if f.startswith('batch_') and f.endswith('.json') 
-                    and 'partial' not in f]
-            
-            if files:
-                latest_file = sorted(files)[-1]
-                file_path = os.path.join('resume_collections', latest_file)
-                
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                    final_count = data.get('metadata', {}).get('count', 0)
-                    
-                if final_count >= 2000:
-                    print(f"\n\n✅ Collection Complete! Final file: {latest_file}")
-                    print(f"Total resumes: {final_count}")
-                    break
-            
-            time.sleep(5)  # Check every 5 seconds
-            
-        except KeyboardInterrupt:
-            print("\n\nMonitoring stopped.")
-            break
-        except Exception as e:
-            print(f"\nError: {e}")
-            time.sleep(5)
+    try:
+        if not wait_for_channel(timeout=5):
+            print("⏳ Waiting for a collector to start...")
+            wait_for_channel()
+        
+        finished = False
+        for event in subscribe():
+            if event['type'] == 'progress':
+                count = event['resumes_collected']
+                target = event.get('target') or TARGET
+                print(f"\r[{datetime.now().strftime('%H:%M:%S')}] "
+                      f"Progress: {count}/{target} ({count/target*100:.1f}%) "
+                      f"| {event.get('rate_per_hour', 0):.0f}/hour "
+                      f"| Errors: {event.get('errors', 0)}", end='', flush=True)
+            elif event['type'] == 'batch_saved':
+                print(f"\n💾 Saved {event['count']} resumes to {event['file']}")
+            elif event['type'] == 'finished':
+                finished = True
+        
+        # The channel closes when the collector exits, cleanly or not
+        if finished:
+            print("\n\n✅ Collection Complete!")
+        else:
+            print("\n\n⚠️  Collector exited without finishing")
+        
+        batches = CollectionManifest('resume_collections').list_batches(include_partial=False)
+        if batches:
+            latest = batches[-1]
+            print(f"Final file: {latest['filename']}")
+            print(f"Total resumes: {latest['count']}")
+        
+    except KeyboardInterrupt:
+        print("\n\nMonitoring stopped.")
+    except ConnectionError as e:
+        print(f"\nError: {e}")
 
 if __name__ == "__main__":
-    monitor_collection()
\ No newline at end of file
+    monitor_collection()
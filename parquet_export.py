@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Parquet Export for Resume Collections
+Writes collections as a Hive-partitioned Parquet dataset (collection_date /
+category) with skills and top_repos normalized into child tables, and reads
+column subsets back for pandas, DuckDB or the validator
+
+Layout:
+    <out>/resumes/collection_date=YYYY-MM-DD/category=technical/part-*.parquet
+    <out>/skills/...      (record_id, github_username, position, skill)
+    <out>/top_repos/...   (record_id, github_username, position, name, description, language, stars, forks, url)
+
+Child rows point at their resume through record_id, unique per exported
+record, so a user collected in several batches keeps each copy's own skills
+and repos. Each resume row carries its skill/repo counts so verify_dataset
+can check the child tables against it.
+
+DuckDB can query it directly:
+    SELECT * FROM read_parquet('<out>/resumes/**/*.parquet', hive_partitioning = true)
+"""
+
+import os
+import uuid
+from typing import Dict, Iterable, List, Optional
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from streaming_merge import iter_batch
+
+
+ROW_GROUP_SIZE = 50000
+PARTITION_COLUMNS = ['collection_date', 'category']
+
+RESUME_SCHEMA = pa.schema([
+    ('record_id', pa.string()),
+    ('github_username', pa.string()),
+    ('name', pa.string()),
+    ('email', pa.string()),
+    ('location', pa.string()),
+    ('bio', pa.string()),
+    ('company', pa.string()),
+    ('blog', pa.string()),
+    ('github_url', pa.string()),
+    ('avatar_url', pa.string()),
+    ('public_repos', pa.int64()),
+    ('followers', pa.int64()),
+    ('following', pa.int64()),
+    ('created_at', pa.string()),
+    ('updated_at', pa.string()),
+    ('collected_at', pa.string()),
+    ('skill_count', pa.int32()),
+    ('repo_count', pa.int32()),
+    ('collection_date', pa.string()),
+    ('category', pa.string()),
+])
+
+SKILL_SCHEMA = pa.schema([
+    ('record_id', pa.string()),
+    ('github_username', pa.string()),
+    ('position', pa.int16()),
+    ('skill', pa.string()),
+    ('collection_date', pa.string()),
+    ('category', pa.string()),
+])
+
+REPO_SCHEMA = pa.schema([
+    ('record_id', pa.string()),
+    ('github_username', pa.string()),
+    ('position', pa.int16()),
+    ('name', pa.string()),
+    ('description', pa.string()),
+    ('language', pa.string()),
+    ('stars', pa.int64()),
+    ('forks', pa.int64()),
+    ('url', pa.string()),
+    ('collection_date', pa.string()),
+    ('category', pa.string()),
+])
+
+# Low-cardinality columns stored dictionary-encoded
+DICTIONARY_COLUMNS = {
+    'resumes': ['location', 'company', 'collection_date', 'category'],
+    'skills': ['skill', 'collection_date', 'category'],
+    'top_repos': ['language', 'collection_date', 'category'],
+}
+
+TABLE_SCHEMAS = {
+    'resumes': RESUME_SCHEMA,
+    'skills': SKILL_SCHEMA,
+    'top_repos': REPO_SCHEMA,
+}
+
+# Export bookkeeping, not part of the resume record
+RECORD_COLUMNS = ['record_id', 'skill_count', 'repo_count']
+SCALAR_FIELDS = [f.name for f in RESUME_SCHEMA if f.name not in PARTITION_COLUMNS + RECORD_COLUMNS]
+REPO_FIELDS = ['name', 'description', 'language', 'stars', 'forks', 'url']
+
+
+def _int_or_none(value) -> Optional[int]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return int(value)
+
+
+def _category(resume: Dict, categorize) -> str:
+    category = resume.get('category')
+    if isinstance(category, str) and category:
+        return category
+    return categorize(resume)
+
+
+def _to_table(rows: Dict[str, List], schema: pa.Schema, dictionary_columns: List[str]) -> pa.Table:
+    """Build a table from column lists, dictionary-encoding the listed string columns"""
+    table = pa.table({name: pa.array(rows[name], type=schema.field(name).type) for name in schema.names},
+                     schema=schema)
+    for name in dictionary_columns:
+        index = table.schema.get_field_index(name)
+        table = table.set_column(index, name, table.column(name).dictionary_encode())
+    return table
+
+
+class ParquetExporter:
+    """Streams resumes into the partitioned resumes/skills/top_repos tables"""
+
+    def __init__(self, out_dir: str, row_group_size: int = ROW_GROUP_SIZE):
+        self.out_dir = out_dir
+        self.row_group_size = row_group_size
+        self.run_id = uuid.uuid4().hex[:12]
+        self.parts = 0
+        self.records = 0
+        self.counts = {'resumes': 0, 'skills': 0, 'top_repos': 0}
+        from data_validator import ResumeDataValidator
+        self._categorize = ResumeDataValidator().categorize_technical_level
+        self._reset()
+
+    def _reset(self) -> None:
+        self.rows = {table: {name: [] for name in schema.names} for table, schema in TABLE_SCHEMAS.items()}
+        self.pending = 0
+
+    def add(self, resume: Dict) -> None:
+        """Buffer one resume, flushing a row group when the buffer is full"""
+        username = resume.get('github_username')
+        if not username:
+            return
+        collected_at = resume.get('collected_at') or ''
+        collection_date = collected_at[:10] if len(collected_at) >= 10 else 'unknown'
+        category = _category(resume, self._categorize)
+        record_id = f"{self.run_id}-{self.records:08d}"
+        self.records += 1
+        resume_skills = resume.get('skills') or []
+        resume_repos = resume.get('top_repos') or []
+
+        rows = self.rows['resumes']
+        rows['record_id'].append(record_id)
+        rows['skill_count'].append(len(resume_skills))
+        rows['repo_count'].append(len(resume_repos))
+        for field in SCALAR_FIELDS:
+            value = resume.get(field)
+            if RESUME_SCHEMA.field(field).type == pa.int64():
+                value = _int_or_none(value)
+            elif value is not None and not isinstance(value, str):
+                value = str(value)
+            rows[field].append(value)
+        rows['collection_date'].append(collection_date)
+        rows['category'].append(category)
+
+        skills = self.rows['skills']
+        for position, skill in enumerate(resume_skills):
+            skills['record_id'].append(record_id)
+            skills['github_username'].append(username)
+            skills['position'].append(position)
+            skills['skill'].append(skill)
+            skills['collection_date'].append(collection_date)
+            skills['category'].append(category)
+
+        repos = self.rows['top_repos']
+        for position, repo in enumerate(resume_repos):
+            repos['record_id'].append(record_id)
+            repos['github_username'].append(username)
+            repos['position'].append(position)
+            for field in REPO_FIELDS:
+                value = repo.get(field)
+                repos[field].append(_int_or_none(value) if field in ('stars', 'forks') else value)
+            repos['collection_date'].append(collection_date)
+            repos['category'].append(category)
+
+        self.pending += 1
+        if self.pending >= self.row_group_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered rows as one new file per partition and table"""
+        if not self.pending:
+            return
+        for table_name, schema in TABLE_SCHEMAS.items():
+            rows = self.rows[table_name]
+            if not rows['github_username']:
+                continue
+            table = _to_table(rows, schema, DICTIONARY_COLUMNS[table_name])
+            ds.write_dataset(
+                table,
+                os.path.join(self.out_dir, table_name),
+                format='parquet',
+                partitioning=PARTITION_COLUMNS,
+                partitioning_flavor='hive',
+                basename_template=f"part-{self.run_id}-{self.parts:05d}-{{i}}.parquet",
+                existing_data_behavior='overwrite_or_ignore',
+                file_options=ds.ParquetFileFormat().make_write_options(compression='zstd'),
+            )
+            self.counts[table_name] += table.num_rows
+        self.parts += 1
+        self._reset()
+
+    def close(self) -> Dict[str, int]:
+        self.flush()
+        return dict(self.counts)
+
+
+def export_collections(paths: Iterable[str], out_dir: str, row_group_size: int = ROW_GROUP_SIZE) -> Dict[str, int]:
+    """Export batch/merged JSON (or JSONL) files to the Parquet dataset; returns rows written per table"""
+    exporter = ParquetExporter(out_dir, row_group_size)
+    for path in paths:
+        for resume in iter_batch(path):
+            exporter.add(resume)
+    return exporter.close()
+
+
+def _dataset(out_dir: str, table: str) -> ds.Dataset:
+    if table not in TABLE_SCHEMAS:
+        raise ValueError(f"Unknown table '{table}' (expected one of {', '.join(TABLE_SCHEMAS)})")
+    return ds.dataset(os.path.join(out_dir, table), format='parquet', partitioning='hive')
+
+
+def _filter(collection_date: Optional[str] = None, category: Optional[str] = None):
+    expression = None
+    for column, value in (('collection_date', collection_date), ('category', category)):
+        if value is not None:
+            term = ds.field(column) == value
+            expression = term if expression is None else expression & term
+    return expression
+
+
+def read_table(out_dir: str, table: str = 'resumes', columns: Optional[List[str]] = None,
+               collection_date: Optional[str] = None, category: Optional[str] = None) -> pa.Table:
+    """Read a column subset of one table, pruning partitions by date/category"""
+    return _dataset(out_dir, table).to_table(columns=columns, filter=_filter(collection_date, category))
+
+
+def read_pandas(out_dir: str, table: str = 'resumes', columns: Optional[List[str]] = None, **filters):
+    """read_table as a pandas DataFrame"""
+    return read_table(out_dir, table, columns, **filters).to_pandas()
+
+
+def load_resume_dicts(out_dir: str, columns: Optional[List[str]] = None, **filters) -> List[Dict]:
+    """Rebuild resume dicts (skills and top_repos re-nested) for code that expects JSON records
+
+    With `columns`, only those resume fields are read; skills/top_repos are
+    joined only when requested.
+    """
+    wanted = columns or SCALAR_FIELDS + ['skills', 'top_repos']
+    scalar = [c for c in wanted if c in SCALAR_FIELDS]
+    if 'github_username' not in scalar:
+        scalar.insert(0, 'github_username')
+
+    resumes = read_table(out_dir, 'resumes', ['record_id'] + scalar, **filters).to_pylist()
+    by_record = {r.pop('record_id'): r for r in resumes}
+
+    if 'skills' in wanted:
+        for r in resumes:
+            r['skills'] = []
+        skills = read_table(out_dir, 'skills', ['record_id', 'position', 'skill'], **filters)
+        for row in sorted(skills.to_pylist(), key=lambda x: x['position']):
+            owner = by_record.get(row['record_id'])
+            if owner is not None:
+                owner['skills'].append(row['skill'])
+
+    if 'top_repos' in wanted:
+        for r in resumes:
+            r['top_repos'] = []
+        repos = read_table(out_dir, 'top_repos', ['record_id', 'position'] + REPO_FIELDS, **filters)
+        for row in sorted(repos.to_pylist(), key=lambda x: x['position']):
+            owner = by_record.get(row.pop('record_id'))
+            row.pop('position')
+            if owner is not None:
+                owner['top_repos'].append(row)
+
+    return resumes
+
+
+def verify_dataset(out_dir: str, **filters) -> List[Dict]:
+    """Resumes whose skills/top_repos child rows differ from the counts recorded at export"""
+    resumes = read_table(out_dir, 'resumes', ['record_id', 'github_username', 'skill_count', 'repo_count'],
+                         **filters)
+    found = {}
+    for table, column in (('skills', 'skill_count'), ('top_repos', 'repo_count')):
+        grouped = read_table(out_dir, table, ['record_id'], **filters).group_by('record_id').aggregate(
+            [('record_id', 'count')])
+        found[column] = dict(zip(grouped.column('record_id').to_pylist(),
+                                 grouped.column('record_id_count').to_pylist()))
+
+    mismatches = []
+    for row in resumes.to_pylist():
+        for column in ('skill_count', 'repo_count'):
+            actual = found[column].get(row['record_id'], 0)
+            if actual != row[column]:
+                mismatches.append({'record_id': row['record_id'], 'github_username': row['github_username'],
+                                   'column': column, 'expected': row[column], 'found': actual})
+    return mismatches
+
+
+def is_parquet_dataset(path: str) -> bool:
+    """Check whether path is an exported dataset directory"""
+    return os.path.isdir(os.path.join(path, 'resumes'))
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    if len(sys.argv) < 3:
+        print("Usage: python parquet_export.py <out_dir> <collection.json> [collection.json ...]")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    counts = export_collections(sys.argv[2:], sys.argv[1])
+    print(f"Exported {counts['resumes']} resumes, {counts['skills']} skills, "
+          f"{counts['top_repos']} repos to {sys.argv[1]} in {time.perf_counter() - start:.2f}s")
+
+    mismatches = verify_dataset(sys.argv[1])
+    if mismatches:
+        print(f"❌ {len(mismatches)} child count mismatches, e.g. {mismatches[0]}")
+        sys.exit(1)
+    print("✅ Child row counts match every exported resume")
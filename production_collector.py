@@ -14,8 +14,14 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from collection_manifest import CollectionManifest
+from metrics import REGISTRY
+from progress_channel import ProgressPublisher
+from throughput_controller import ThroughputController, resource_for
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -27,9 +33,94 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Instrumentation (served on /metrics when COLLECTOR_METRICS_PORT is set)
+API_REQUESTS = REGISTRY.counter('github_api_requests_total', 'GitHub API requests', ['endpoint', 'status'])
+API_LATENCY = REGISTRY.histogram('github_api_latency_seconds', 'GitHub API request latency', ['endpoint'])
+RATE_LIMIT_REMAINING = REGISTRY.gauge('github_rate_limit_remaining', 'Remaining requests in the current window')
+QUEUE_DEPTH = REGISTRY.gauge('collector_queue_depth', 'Users from the current search page still to process')
+STAGE_SECONDS = REGISTRY.histogram('collector_stage_seconds', 'Time per collection stage', ['stage'])
+RESUMES_TOTAL = REGISTRY.counter('collector_resumes_total', 'Resumes collected')
+ERRORS_TOTAL = REGISTRY.counter('collector_errors_total', 'Request errors')
+
+
+# Search queries for diverse results; workers take disjoint shards of these
+SEARCH_QUERIES = [
+    # Technical roles
+    "fullstack developer location:USA",
+    "software engineer python",
+    "backend developer java",
+    "frontend developer react",
+    "devops engineer kubernetes",
+    "data scientist machine learning",
+    "mobile developer ios android",
+    "cloud architect aws",
+    
+    # Semi-technical roles
+    "technical writer documentation",
+    "product manager software",
+    "ux designer developer",
+    "qa engineer automation",
+    "scrum master agile",
+    
+    # Geographic diversity
+    "developer location:London",
+    "engineer location:Berlin",
+    "programmer location:Toronto",
+    "developer location:Sydney",
+    "engineer location:Tokyo",
+    "developer location:Bangalore",
+    
+    # Experience levels
+    "junior developer",
+    "senior engineer",
+    "lead developer",
+    "principal engineer",
+    
+    # Specific technologies
+    "react native developer",
+    "golang developer",
+    "rust programmer",
+    "blockchain developer",
+    "ai ml engineer",
+    "cybersecurity engineer"
+]
+
+DEFAULT_CHECKPOINT = "collection_checkpoint.json"
+DEFAULT_METRICS_FILE = "collection_metrics.json"
+
+
+def shard_queries(queries: List[str], shard: str) -> List[str]:
+    """Select shard 'I/N' of the queries (every Nth query starting at I)"""
+    try:
+        index, count = (int(part) for part in shard.split('/'))
+    except ValueError:
+        raise ValueError(f"Shard must look like I/N, got '{shard}'")
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Shard index must be in [0, {count}), got '{shard}'")
+    return queries[index::count]
+
+
+def parse_args(argv: List[str]) -> Dict:
+    """Parse `[target] [--shard I/N] [--checkpoint PATH] [--metrics-file PATH]`"""
+    options = {'target': 1000, 'shard': None, 'checkpoint': DEFAULT_CHECKPOINT,
+               'metrics_file': DEFAULT_METRICS_FILE}
+    args = iter(argv)
+    for arg in args:
+        if arg.startswith('--'):
+            key = arg[2:].replace('-', '_')
+            if key not in options or key == 'target':
+                raise ValueError(f"Unknown option {arg}")
+            value = next(args, None)
+            if value is None:
+                raise ValueError(f"{arg} needs a value")
+            options[key] = value
+        else:
+            options['target'] = int(arg)
+    return options
+
 
 class GitHubResumeCollector:
-    def __init__(self, token: str, checkpoint_file: str = "collection_checkpoint.json"):
+    def __init__(self, token: str, checkpoint_file: str = DEFAULT_CHECKPOINT):
         self.token = token
         self.checkpoint_file = checkpoint_file
         self.base_url = "https://api.github.com"
@@ -38,28 +129,39 @@ class GitHubResumeCollector:
             "Accept": "application/vnd.github.v3+json"
         }
         
-        # Optimized settings
-        self.min_delay = 0.3  # Reduced from 0.5
+        # Request pacing adapts to the live rate-limit budget and latency
+        self.throttle = ThroughputController('production_collector')
+        self.max_retries = 3
+        self.language_pool = ThreadPoolExecutor(max_workers=self.throttle.max_concurrency)
         self.max_results_per_page = 100  # Maximum allowed by GitHub
         self.batch_save_interval = 100  # Save progress every 100 resumes
         
-        # Session with retry strategy
+        # Session with retry strategy for connection failures; 429/5xx are
+        # retried in _get so the throttle sees them and backs off
         self.session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        retry_strategy = Retry(total=3, backoff_factor=1, status_forcelist=[])
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=self.throttle.max_concurrency)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
         # Progress tracking
         self.collected_users: Set[str] = set()
         self.resumes_collected = 0
+        self.target_count = 0
         self.errors_encountered = 0
         self.start_time = None
         
+        # Where to resume the query loop after a restart
+        self.query_index = 0
+        self.page = 1
+        
+        # Suffix for batch filenames, so concurrent workers never collide
+        self.batch_tag = ''
+        self.metrics_file = DEFAULT_METRICS_FILE
+        
+        # Optional push channel for monitors (see progress_channel.py)
+        self.progress: Optional[ProgressPublisher] = None
+        
         # Load checkpoint if exists
         self.load_checkpoint()
     
@@ -71,6 +173,8 @@ class GitHubResumeCollector:
                     checkpoint = json.load(f)
                     self.collected_users = set(checkpoint.get('collected_users', []))
                     self.resumes_collected = checkpoint.get('resumes_collected', 0)
+                    self.query_index = checkpoint.get('query_index', 0)
+                    self.page = checkpoint.get('page', 1)
                     logger.info(f"Resumed from checkpoint: {self.resumes_collected} resumes collected")
             except Exception as e:
                 logger.warning(f"Could not load checkpoint: {e}")
@@ -80,29 +184,71 @@ class GitHubResumeCollector:
         checkpoint = {
             'collected_users': list(self.collected_users),
             'resumes_collected': self.resumes_collected,
+            'query_index': self.query_index,
+            'page': self.page,
             'last_updated': datetime.now().isoformat()
         }
-        with open(self.checkpoint_file, 'w') as f:
+        # Write-then-rename so a worker killed mid-save keeps its last good checkpoint
+        tmp_file = f"{self.checkpoint_file}.tmp"
+        with open(tmp_file, 'w') as f:
             json.dump(checkpoint, f)
+        os.replace(tmp_file, self.checkpoint_file)
         logger.info(f"Checkpoint saved: {self.resumes_collected} resumes")
     
+    def publish_progress(self, event_type: str = 'progress', **data) -> None:
+        """Push a progress event to subscribed monitors, if a channel is open"""
+        if self.progress is None:
+            return
+        elapsed = time.time() - self.start_time if self.start_time else 0
+        self.progress.publish(
+            event_type,
+            resumes_collected=self.resumes_collected,
+            target=self.target_count,
+            errors=self.errors_encountered,
+            rate_per_hour=self.resumes_collected / elapsed * 3600 if elapsed > 0 else 0,
+            **data
+        )
+    
+    def _get(self, endpoint: str, url: str, **kwargs) -> requests.Response:
+        """Paced GET with per-endpoint latency and status metrics; 429/5xx are retried after backoff"""
+        resource = resource_for(url)
+        for attempt in range(self.max_retries + 1):
+            # /rate_limit does not count against the budget, so it skips pacing
+            if endpoint != 'rate_limit':
+                self.throttle.wait(resource)
+            with self.throttle.slot():
+                start = time.perf_counter()
+                try:
+                    response = self.session.get(url, headers=self.headers, **kwargs)
+                except Exception:
+                    latency = time.perf_counter() - start
+                    API_LATENCY.observe(latency, endpoint=endpoint)
+                    API_REQUESTS.inc(endpoint=endpoint, status='error')
+                    ERRORS_TOTAL.inc()
+                    self.throttle.observe(resource, None, latency)
+                    raise
+                latency = time.perf_counter() - start
+            API_LATENCY.observe(latency, endpoint=endpoint)
+            API_REQUESTS.inc(endpoint=endpoint, status=str(response.status_code))
+            remaining = response.headers.get('X-RateLimit-Remaining')
+            if remaining is not None and endpoint != 'rate_limit':
+                RATE_LIMIT_REMAINING.set(int(remaining))
+            
+            body = response.text if response.status_code in (403, 429) else ''
+            retry = self.throttle.observe(resource, response.status_code, latency, response.headers, body)
+            if not retry or attempt == self.max_retries:
+                return response
+            logger.warning(f"{endpoint} returned {response.status_code}, retrying "
+                           f"({attempt + 1}/{self.max_retries})")
+        return response
+    
     def check_rate_limit(self) -> Dict:
         """Check GitHub API rate limit"""
-        response = self.session.get(f"{self.base_url}/rate_limit", headers=self.headers)
+        response = self._get('rate_limit', f"{self.base_url}/rate_limit")
         if response.status_code == 200:
             return response.json()
         return {}
     
-    def wait_for_rate_limit(self, response_headers: Dict) -> None:
-        """Wait if rate limit is approaching"""
-        remaining = int(response_headers.get('X-RateLimit-Remaining', 1))
-        reset_time = int(response_headers.get('X-RateLimit-Reset', 0))
-        
-        if remaining < 10:
-            wait_time = max(reset_time - time.time(), 0) + 1
-            logger.warning(f"Rate limit approaching. Waiting {wait_time:.0f} seconds...")
-            time.sleep(wait_time)
-    
     def search_users(self, query: str, page: int = 1) -> List[Dict]:
         """Search for GitHub users"""
         params = {
@@ -114,15 +260,13 @@ class GitHubResumeCollector:
         }
         
         try:
-            response = self.session.get(
+            response = self._get(
+                'search/users',
                 f"{self.base_url}/search/users",
-                headers=self.headers,
                 params=params,
                 timeout=30
             )
             
-            self.wait_for_rate_limit(response.headers)
-            
             if response.status_code == 200:
                 return response.json().get('items', [])
             else:
@@ -140,14 +284,12 @@ class GitHubResumeCollector:
             return None
             
         try:
-            response = self.session.get(
+            response = self._get(
+                'users/{user}',
                 f"{self.base_url}/users/{username}",
-                headers=self.headers,
                 timeout=30
             )
             
-            self.wait_for_rate_limit(response.headers)
-            
             if response.status_code == 200:
                 return response.json()
             else:
@@ -162,9 +304,9 @@ class GitHubResumeCollector:
     def get_user_repos(self, username: str, max_repos: int = 10) -> List[Dict]:
         """Get user's repositories"""
         try:
-            response = self.session.get(
+            response = self._get(
+                'users/{user}/repos',
                 f"{self.base_url}/users/{username}/repos",
-                headers=self.headers,
                 params={'per_page': max_repos, 'sort': 'updated'},
                 timeout=30
             )
@@ -177,27 +319,24 @@ class GitHubResumeCollector:
             logger.error(f"Error fetching repos for {username}: {e}")
             return []
     
+    def _repo_languages(self, languages_url: str) -> List[str]:
+        """Get the languages breakdown for one repository"""
+        try:
+            response = self._get('repos/{repo}/languages', languages_url, timeout=10)
+            if response.status_code == 200:
+                return list(response.json().keys())
+        except:
+            pass
+        return []
+    
     def extract_skills_from_repos(self, repos: List[Dict]) -> List[str]:
         """Extract programming languages from repositories"""
-        skills = set()
+        skills = {repo['language'] for repo in repos if repo.get('language')}
         
-        for repo in repos:
-            if repo.get('language'):
-                skills.add(repo['language'])
-            
-            # Get languages breakdown for more detail
-            if repo.get('languages_url'):
-                try:
-                    response = self.session.get(
-                        repo['languages_url'],
-                        headers=self.headers,
-                        timeout=10
-                    )
-                    if response.status_code == 200:
-                        languages = response.json()
-                        skills.update(languages.keys())
-                except:
-                    pass
+        # Language lookups fan out; the throttle decides how many are in flight
+        languages_urls = [repo['languages_url'] for repo in repos if repo.get('languages_url')]
+        for languages in self.language_pool.map(self._repo_languages, languages_urls):
+            skills.update(languages)
         
         return list(skills)
     
@@ -252,32 +391,34 @@ class GitHubResumeCollector:
     def collect_resumes(self, search_queries: List[str], target_count: int = 1000) -> List[Dict]:
         """Main collection method"""
         self.start_time = time.time()
+        self.target_count = target_count
         resumes = []
-        query_index = 0
-        page = 1
         
         logger.info(f"Starting collection. Target: {target_count} resumes")
         
-        while self.resumes_collected < target_count and query_index < len(search_queries):
-            current_query = search_queries[query_index]
-            logger.info(f"Searching with query: '{current_query}' (page {page})")
+        while self.resumes_collected < target_count and self.query_index < len(search_queries):
+            current_query = search_queries[self.query_index]
+            logger.info(f"Searching with query: '{current_query}' (page {self.page})")
             
-            users = self.search_users(current_query, page)
+            with STAGE_SECONDS.time(stage='search'):
+                users = self.search_users(current_query, self.page)
             
             if not users:
                 # Move to next query
-                query_index += 1
-                page = 1
+                self.query_index += 1
+                self.page = 1
                 continue
             
-            for user in users:
+            for position, user in enumerate(users):
+                QUEUE_DEPTH.set(len(users) - position)
                 if self.resumes_collected >= target_count:
                     break
                 
                 username = user['login']
                 
                 # Get detailed user data
-                user_profile = self.get_user_details(username)
+                with STAGE_SECONDS.time(stage='profile'):
+                    user_profile = self.get_user_details(username)
                 if not user_profile:
                     continue
                 
@@ -287,37 +428,42 @@ class GitHubResumeCollector:
                     continue
                 
                 # Get user repositories
-                repos = self.get_user_repos(username)
+                with STAGE_SECONDS.time(stage='repos'):
+                    repos = self.get_user_repos(username)
                 
-                # Create resume entry
-                resume = self.create_resume_entry(user_profile, repos)
+                # Create resume entry (includes per-repo language lookups)
+                with STAGE_SECONDS.time(stage='build_resume'):
+                    resume = self.create_resume_entry(user_profile, repos)
                 resumes.append(resume)
                 
                 self.collected_users.add(username)
                 self.resumes_collected += 1
+                RESUMES_TOTAL.inc()
+                self.publish_progress(username=username)
                 
                 # Progress update
                 if self.resumes_collected % 10 == 0:
                     elapsed = time.time() - self.start_time
                     rate = self.resumes_collected / elapsed * 3600
                     logger.info(f"Progress: {self.resumes_collected}/{target_count} resumes "
-                              f"({rate:.0f}/hour) - Errors: {self.errors_encountered}")
+                              f"({rate:.0f}/hour) - Errors: {self.errors_encountered} "
+                              f"- Pace: {self.throttle.interval():.2f}s x{self.throttle.concurrency}")
                 
                 # Save checkpoint
                 if self.resumes_collected % self.batch_save_interval == 0:
-                    self.save_checkpoint()
-                    # Also save partial results
-                    self.save_batch_results(resumes)
-                
-                # Rate limiting delay
-                time.sleep(self.min_delay)
+                    with STAGE_SECONDS.time(stage='checkpoint'):
+                        self.save_checkpoint()
+                        # Also save partial results
+                        self.save_batch_results(resumes)
+                    REGISTRY.write_snapshot(self.metrics_file)
             
-            page += 1
+            QUEUE_DEPTH.set(0)
+            self.page += 1
             
             # GitHub limits search results to 1000 per query
-            if page > 10:  # 100 results per page * 10 pages = 1000 max
-                query_index += 1
-                page = 1
+            if self.page > 10:  # 100 results per page * 10 pages = 1000 max
+                self.query_index += 1
+                self.page = 1
         
         # Final save
         self.save_checkpoint()
@@ -329,21 +475,16 @@ class GitHubResumeCollector:
     def save_batch_results(self, resumes: List[Dict]) -> None:
         """Save current batch of results"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"resume_collections/batch_partial_{timestamp}.json"
+        filename = f"resume_collections/batch_partial_{timestamp}{self.batch_tag}.json"
         
-        os.makedirs("resume_collections", exist_ok=True)
-        
-        with open(filename, 'w') as f:
-            json.dump({
-                'metadata': {
-                    'count': len(resumes),
-                    'collected_at': datetime.now().isoformat(),
-                    'errors': self.errors_encountered
-                },
-                'resumes': resumes
-            }, f, indent=2)
+        CollectionManifest("resume_collections").write_batch(filename, {
+            'count': len(resumes),
+            'collected_at': datetime.now().isoformat(),
+            'errors': self.errors_encountered
+        }, resumes)
         
         logger.info(f"Saved partial results to {filename}")
+        self.publish_progress('batch_saved', file=filename, count=len(resumes))
 
 
 def main():
@@ -354,8 +495,32 @@ def main():
         logger.info("Set it with: export GITHUB_TOKEN=your_token_here")
         sys.exit(1)
     
+    try:
+        options = parse_args(sys.argv[1:])
+        search_queries = SEARCH_QUERIES
+        if options['shard']:
+            search_queries = shard_queries(SEARCH_QUERIES, options['shard'])
+    except ValueError as e:
+        logger.error(str(e))
+        logger.info("Usage: python production_collector.py [target] [--shard I/N] "
+                    "[--checkpoint PATH] [--metrics-file PATH]")
+        sys.exit(2)
+    
     # Create collector
-    collector = GitHubResumeCollector(token)
+    collector = GitHubResumeCollector(token, options['checkpoint'])
+    collector.metrics_file = options['metrics_file']
+    if options['shard']:
+        collector.batch_tag = '_shard' + options['shard'].replace('/', 'of')
+    
+    try:
+        collector.progress = ProgressPublisher()
+    except (OSError, ValueError) as e:
+        logger.warning(f"Progress channel unavailable, monitors will not get updates: {e}")
+    
+    metrics_port = os.environ.get('COLLECTOR_METRICS_PORT')
+    if metrics_port:
+        REGISTRY.start_http_server(int(metrics_port))
+        logger.info(f"Metrics available at http://127.0.0.1:{metrics_port}/metrics")
     
     # Check rate limit before starting
     rate_info = collector.check_rate_limit()
@@ -363,71 +528,28 @@ def main():
         core_limit = rate_info.get('resources', {}).get('core', {})
         logger.info(f"Rate limit: {core_limit.get('remaining', 0)}/{core_limit.get('limit', 0)}")
     
-    # Define search queries for diverse results
-    search_queries = [
-        # Technical roles
-        "fullstack developer location:USA",
-        "software engineer python",
-        "backend developer java",
-        "frontend developer react",
-        "devops engineer kubernetes",
-        "data scientist machine learning",
-        "mobile developer ios android",
-        "cloud architect aws",
-        
-        # Semi-technical roles
-        "technical writer documentation",
-        "product manager software",
-        "ux designer developer",
-        "qa engineer automation",
-        "scrum master agile",
-        
-        # Geographic diversity
-        "developer location:London",
-        "engineer location:Berlin",
-        "programmer location:Toronto",
-        "developer location:Sydney",
-        "engineer location:Tokyo",
-        "developer location:Bangalore",
-        
-        # Experience levels
-        "junior developer",
-        "senior engineer",
-        "lead developer",
-        "principal engineer",
-        
-        # Specific technologies
-        "react native developer",
-        "golang developer",
-        "rust programmer",
-        "blockchain developer",
-        "ai ml engineer",
-        "cybersecurity engineer"
-    ]
     
     # Collect resumes
-    target_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    target_count = options['target']
     resumes = collector.collect_resumes(search_queries, target_count)
     
     # Save final results
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_file = f"resume_collections/batch_{timestamp}.json"
-    
-    os.makedirs("resume_collections", exist_ok=True)
+    output_file = f"resume_collections/batch_{timestamp}{collector.batch_tag}.json"
     
-    with open(output_file, 'w') as f:
-        json.dump({
-            'metadata': {
-                'count': len(resumes),
-                'collected_at': datetime.now().isoformat(),
-                'search_queries': search_queries,
-                'errors': collector.errors_encountered,
-                'collection_time_seconds': time.time() - collector.start_time
-            },
-            'resumes': resumes
-        }, f, indent=2)
+    CollectionManifest("resume_collections").write_batch(output_file, {
+        'count': len(resumes),
+        'collected_at': datetime.now().isoformat(),
+        'search_queries': search_queries,
+        'errors': collector.errors_encountered,
+        'collection_time_seconds': time.time() - collector.start_time
+    }, resumes)
     
+    REGISTRY.write_snapshot(collector.metrics_file)
     logger.info(f"Collection complete! Saved {len(resumes)} resumes to {output_file}")
+    if collector.progress:
+        collector.publish_progress('batch_saved', file=output_file, count=len(resumes), final=True)
+        collector.progress.close(resumes_collected=collector.resumes_collected, count=len(resumes), file=output_file)
     
     # Print summary statistics
     print("\n=== Collection Summary ===")
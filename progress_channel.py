@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Collection Progress Channel
+The collector publishes progress events as JSON lines over a Unix domain
+socket; monitors subscribe and get each update pushed as it happens. A closed
+connection means the collector exited, so no pgrep or mtime guessing is needed
+"""
+
+import json
+import os
+import socket
+import threading
+import time
+from typing import Dict, Iterator, List, Optional
+
+
+DEFAULT_SOCKET = os.environ.get('COLLECTOR_PROGRESS_SOCKET', 'collection_progress.sock')
+
+
+class ProgressPublisher:
+    """Server side: accepts subscribers and fans events out to them"""
+
+    def __init__(self, path: str = DEFAULT_SOCKET):
+        self.path = path
+        self.last_event: Optional[Dict] = None
+        self._subscribers: List[socket.socket] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+        if os.path.exists(path):
+            if channel_is_live(path):
+                raise ValueError(f"Another collector is already publishing on {path}")
+            os.unlink(path)  # stale socket left by a crashed collector
+
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(path)
+        self._server.listen(16)
+        self._thread = threading.Thread(target=self._accept_loop, name='progress-channel', daemon=True)
+        self._thread.start()
+
+    def _accept_loop(self) -> None:
+        while not self._closed:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            # A stalled subscriber is dropped rather than blocking the collector
+            conn.settimeout(1.0)
+            with self._lock:
+                # New subscribers get the latest state immediately
+                if self.last_event is not None and not self._send(conn, self.last_event):
+                    continue
+                self._subscribers.append(conn)
+
+    @staticmethod
+    def _send(conn: socket.socket, event: Dict) -> bool:
+        try:
+            conn.sendall((json.dumps(event) + '\n').encode())
+            return True
+        except OSError:
+            conn.close()
+            return False
+
+    def publish(self, event_type: str, **data) -> None:
+        """Push one event to every subscriber, dropping those that went away"""
+        event = {'type': event_type, 'timestamp': time.time(), 'pid': os.getpid(), **data}
+        with self._lock:
+            self.last_event = event
+            self._subscribers = [conn for conn in self._subscribers if self._send(conn, event)]
+
+    def close(self, **final) -> None:
+        """Publish a 'finished' event, disconnect subscribers and remove the socket"""
+        if self._closed:
+            return
+        self.publish('finished', **final)
+        self._closed = True
+        with self._lock:
+            for conn in self._subscribers:
+                conn.close()
+            self._subscribers = []
+        self._server.close()
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> 'ProgressPublisher':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def channel_is_live(path: str = DEFAULT_SOCKET) -> bool:
+    """True if a collector is accepting subscribers on path"""
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+        return True
+    except OSError:
+        return False
+    finally:
+        probe.close()
+
+
+def wait_for_channel(path: str = DEFAULT_SOCKET, timeout: Optional[float] = None) -> bool:
+    """Wait for a collector to start publishing (only used before subscribing)"""
+    deadline = None if timeout is None else time.time() + timeout
+    delay = 0.1
+    while not channel_is_live(path):
+        if deadline is not None and time.time() >= deadline:
+            return False
+        time.sleep(delay)
+        delay = min(delay * 2, 2.0)
+    return True
+
+
+def subscribe(path: str = DEFAULT_SOCKET, timeout: Optional[float] = None) -> Iterator[Dict]:
+    """Yield events as the collector publishes them; ends when the collector exits
+
+    Raises ConnectionError if no collector is publishing on path. With a
+    timeout, yields {'type': 'idle'} whenever no event arrives in time.
+    """
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.connect(path)
+    except OSError as e:
+        conn.close()
+        raise ConnectionError(f"No collector publishing on {path}: {e}") from e
+
+    conn.settimeout(timeout)
+    buffer = b''
+    try:
+        while True:
+            try:
+                chunk = conn.recv(65536)
+            except socket.timeout:
+                yield {'type': 'idle', 'timestamp': time.time()}
+                continue
+            if not chunk:
+                return
+            buffer += chunk
+            while b'\n' in buffer:
+                line, buffer = buffer.split(b'\n', 1)
+                if line:
+                    yield json.loads(line)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    import sys
+
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_SOCKET
+    try:
+        for event in subscribe(path):
+            print(json.dumps(event))
+    except ConnectionError as e:
+        print(e)
+        sys.exit(1)
+    print("Collector exited")
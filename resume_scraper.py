@@ -1,7 +1,6 @@
 import requests
 import time
 import json
-import random
 import os
 import logging
 from datetime import datetime
@@ -10,6 +9,8 @@ import base64
 import re
 from typing import List, Dict, Optional
 
+from throughput_controller import ThroughputController, resource_for
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -54,8 +55,9 @@ class GitHubResumeCollector:
         self.request_count = 0
         self.daily_limit = 4500  # Conservative limit (5000 max)
         self.session_limit = 1000
-        self.min_delay = 0.5  # Faster delays for API
-        self.max_delay = 2.0
+        # Spacing and backoff come from the live rate-limit budget and latency
+        self.throttle = ThroughputController('resume_scraper')
+        self.max_retries = 3
         self.consecutive_errors = 0
         self.max_consecutive_errors = 3
         
@@ -200,45 +202,44 @@ class GitHubResumeCollector:
         }
         
     def make_github_request(self, url: str) -> Optional[Dict]:
-        """Make authenticated request to GitHub API"""
-        try:
-            response = requests.get(url, headers=self.headers)
-            
-            # Check rate limit
-            remaining = int(response.headers.get('X-RateLimit-Remaining', 0))
-            if remaining < 100:
-                logger.warning(f"Rate limit getting low: {remaining} requests remaining")
-            
-            if response.status_code == 200:
-                self.consecutive_errors = 0
-                return response.json()
-            elif response.status_code == 403:
-                logger.error("Rate limit exceeded or token invalid")
-                return None
-            elif response.status_code == 404:
-                logger.debug("Resource not found")
-                return None
-            else:
-                logger.error(f"GitHub API error: {response.status_code}")
+        """Make authenticated request to GitHub API, paced by the throughput controller"""
+        resource = resource_for(url)
+        for attempt in range(self.max_retries + 1):
+            self.throttle.wait(resource)
+            start = time.perf_counter()
+            try:
+                response = requests.get(url, headers=self.headers, timeout=30)
+            except Exception as e:
+                self.throttle.observe(resource, None, time.perf_counter() - start)
+                logger.error(f"Request failed: {e}")
                 self.consecutive_errors += 1
                 return None
-                
-        except Exception as e:
-            logger.error(f"Request failed: {e}")
-            self.consecutive_errors += 1
+            
+            body = response.text if response.status_code in (403, 429) else ''
+            if self.throttle.observe(resource, response.status_code, time.perf_counter() - start,
+                                     response.headers, body) and attempt < self.max_retries:
+                logger.warning(f"GitHub API returned {response.status_code}, retrying after backoff")
+                continue
+            break
+        
+        # Check rate limit
+        remaining = int(response.headers.get('X-RateLimit-Remaining', 0))
+        if remaining < 100:
+            logger.warning(f"Rate limit getting low: {remaining} requests remaining")
+        
+        if response.status_code == 200:
+            self.consecutive_errors = 0
+            return response.json()
+        elif response.status_code == 403:
+            logger.error("Rate limit exceeded or token invalid")
+            return None
+        elif response.status_code == 404:
+            logger.debug("Resource not found")
             return None
-    
-    def respectful_delay(self):
-        """Implement respectful delays between requests"""
-        if self.consecutive_errors > 0:
-            # Exponential backoff on errors
-            delay = self.min_delay * (2 ** self.consecutive_errors)
-            delay = min(delay, 10)  # Cap at 10 seconds for API
         else:
-            delay = random.uniform(self.min_delay, self.max_delay)
-        
-        logger.debug(f"Waiting {delay:.2f} seconds...")
-        time.sleep(delay)
+            logger.error(f"GitHub API error: {response.status_code}")
+            self.consecutive_errors += 1
+            return None
     
     def check_limits(self):
         """Check if we've hit our rate limits"""
@@ -267,7 +268,6 @@ class GitHubResumeCollector:
             search_url = f"{GITHUB_API_BASE}/search/repositories?q={keyword}+in:name&per_page={per_page}&sort=updated"
             
             logger.info(f"Searching for repositories with keyword: {keyword}")
-            self.respectful_delay()
             self.request_count += 1
             
             data = self.make_github_request(search_url)
@@ -278,7 +278,6 @@ class GitHubResumeCollector:
             # Also search for profile README repositories (username/username)
             profile_search_url = f"{GITHUB_API_BASE}/search/repositories?q=filename:README.md+in:path&per_page={per_page}"
             
-            self.respectful_delay()
             self.request_count += 1
             
             profile_data = self.make_github_request(profile_search_url)
@@ -298,7 +297,6 @@ class GitHubResumeCollector:
             
         user_url = f"{GITHUB_API_BASE}/users/{username}"
         
-        self.respectful_delay()
         self.request_count += 1
         
         return self.make_github_request(user_url)
@@ -310,7 +308,6 @@ class GitHubResumeCollector:
             
         content_url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/contents/{path}"
         
-        self.respectful_delay()
         self.request_count += 1
         
         data = self.make_github_request(content_url)
@@ -332,7 +329,6 @@ class GitHubResumeCollector:
             
         repos_url = f"{GITHUB_API_BASE}/users/{username}/repos?per_page=100"
         
-        self.respectful_delay()
         self.request_count += 1
         
         data = self.make_github_request(repos_url)
@@ -502,10 +498,8 @@ class GitHubResumeCollector:
             if not created_at:
                 return 0
             
-            from datetime import datetime
-            created_date = datetime.strptime(created_at, '%Y-%m-%dT%H:%M:%SZ')
-            age_years = (datetime.now() - created_date).days / 365.25
-            return int(age_years)
+            from timestamp_normalizer import age_years, parse_epoch
+            return age_years(parse_epoch(created_at))
         except:
             return 0
     
@@ -522,7 +516,6 @@ class GitHubResumeCollector:
             search_url = f"{GITHUB_API_BASE}/search/repositories?q=language:{language}&sort=stars&order=desc&per_page={per_page}"
             
             logger.info(f"Searching for popular {language} developers...")
-            self.respectful_delay()
             self.request_count += 1
             
             data = self.make_github_request(search_url)
@@ -539,7 +532,6 @@ class GitHubResumeCollector:
             search_url = f"{GITHUB_API_BASE}/search/users?q=followers:>100&sort=followers&order=desc&per_page={per_page}"
             
             logger.info("Searching for developers with many followers...")
-            self.respectful_delay()
             self.request_count += 1
             
             data = self.make_github_request(search_url)
@@ -573,7 +565,6 @@ class GitHubResumeCollector:
                 search_url = f"{GITHUB_API_BASE}/search/users?q={keyword}+in:bio&per_page={per_page}"
                 
                 logger.info(f"Searching for {category} professionals with keyword: {keyword}")
-                self.respectful_delay()
                 self.request_count += 1
                 
                 data = self.make_github_request(search_url)
@@ -614,7 +605,6 @@ class GitHubResumeCollector:
                 search_url = f"{GITHUB_API_BASE}/search/users?q={org_keyword}+in:company&per_page={per_page}"
                 
                 logger.info(f"Searching for professionals at {category} organizations: {org_keyword}")
-                self.respectful_delay()
                 self.request_count += 1
                 
                 data = self.make_github_request(search_url)
@@ -663,7 +653,6 @@ class GitHubResumeCollector:
             search_url = f"{GITHUB_API_BASE}/search/repositories?q={search_term}&per_page={per_page}"
             
             logger.info(f"Searching for repositories with: {search_term}")
-            self.respectful_delay()
             self.request_count += 1
             
             data = self.make_github_request(search_url)
@@ -885,7 +874,6 @@ class GitHubResumeCollector:
             
         search_url = f"{GITHUB_API_BASE}/search/users?q={keyword}+in:bio&per_page={min(max_results, 100)}"
         
-        self.respectful_delay()
         self.request_count += 1
         
         data = self.make_github_request(search_url)
@@ -1324,7 +1312,6 @@ def run_github_collection(target_count=5000):
                 search_url = f"{GITHUB_API_BASE}/search/users?q={keyword}+in:bio&per_page=100"
                 logger.info(f"Searching for semi-technical professionals: {keyword}")
                 
-                collector.respectful_delay()
                 collector.request_count += 1
                 
                 data = collector.make_github_request(search_url)
@@ -1452,6 +1439,13 @@ def generate_collection_summary(resumes: List[Resume], output_dir: str):
             }
         }
         
+        # Skills (inverted index; counts developers per canonical skill)
+        from skill_index import SkillIndex
+        skill_index = SkillIndex()
+        for position, resume in enumerate(resumes):
+            skill_index.add(str(position), resume.skills)
+        summary["statistics"]["top_skills"] = dict(skill_index.top_k(len(skill_index.postings)))
+        
         # Analyze collected data
         for resume in resumes:
             # Experience levels
@@ -1459,11 +1453,6 @@ def generate_collection_summary(resumes: List[Resume], output_dir: str):
             summary["statistics"]["experience_levels"][level] = \
                 summary["statistics"]["experience_levels"].get(level, 0) + 1
             
-            # Skills
-            for skill in resume.skills:
-                summary["statistics"]["top_skills"][skill] = \
-                    summary["statistics"]["top_skills"].get(skill, 0) + 1
-            
             # Locations
             if resume.location:
                 summary["statistics"]["locations"][resume.location] = \
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+Merged Resume Store
+SQLite-backed merged dataset that remembers which batches (by content hash) are
+already folded in, so an incremental merge only applies new batches and keeps
+the most recently collected version of each user. A batch file whose size and
+mtime match the last run is skipped without being hashed. Username, location,
+skills, followers and created_at are indexed for the query API
+"""
+
+import json
+import os
+import sqlite3
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+from collection_manifest import CollectionManifest, file_sha256
+from location_gazetteer import resolve_location
+from streaming_merge import iter_batch
+from timestamp_normalizer import parse_epoch
+
+
+DEFAULT_STORE_NAME = 'resume_store.sqlite'
+UPSERT_BATCH = 1000
+SCHEMA_VERSION = 2
+
+# Indexed columns derived from the stored JSON (name -> SQL type)
+INDEXED_COLUMNS = {
+    'name': 'TEXT',
+    'location': 'TEXT',
+    'city': 'TEXT',
+    'country_code': 'TEXT',
+    'public_repos': 'INTEGER',
+    'created_at': 'TEXT',
+    'created_at_epoch': 'INTEGER',
+}
+
+ORDERINGS = {
+    'followers': 'r.followers DESC, r.seq',
+    'public_repos': 'r.public_repos DESC, r.seq',
+    'created_at': 'r.created_at_epoch, r.seq',
+    'seq': 'r.seq',
+}
+
+
+class ResumeStore:
+    """Merged resumes keyed by github_username"""
+
+    def __init__(self, path: str):
+        self.path = path
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self._create_schema()
+        self._migrate()
+
+    def _create_schema(self) -> None:
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS resumes (
+                github_username TEXT PRIMARY KEY,
+                seq INTEGER NOT NULL,
+                collected_at TEXT,
+                followers INTEGER,
+                data TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS folded_sources (
+                sha256 TEXT PRIMARY KEY,
+                filename TEXT NOT NULL,
+                records INTEGER NOT NULL,
+                applied INTEGER NOT NULL,
+                folded_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS resume_skills (
+                github_username TEXT NOT NULL,
+                skill TEXT NOT NULL,
+                PRIMARY KEY (skill, github_username)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_resume_skills_user ON resume_skills (github_username);
+            CREATE TABLE IF NOT EXISTS seen_files (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                sha256 TEXT NOT NULL
+            );
+        """)
+        self.conn.commit()
+
+    def _migrate(self) -> None:
+        """Add derived columns and indexes, backfilling them from the stored JSON"""
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+        existing = {row[1] for row in self.conn.execute("PRAGMA table_info(resumes)")}
+        with self.conn:
+            for column, sql_type in INDEXED_COLUMNS.items():
+                if column not in existing:
+                    self.conn.execute(f"ALTER TABLE resumes ADD COLUMN {column} {sql_type}")
+            self.conn.executescript("""
+                CREATE INDEX IF NOT EXISTS idx_resumes_followers ON resumes (followers DESC, seq);
+                CREATE INDEX IF NOT EXISTS idx_resumes_created ON resumes (created_at_epoch);
+                CREATE INDEX IF NOT EXISTS idx_resumes_city ON resumes (city COLLATE NOCASE);
+                CREATE INDEX IF NOT EXISTS idx_resumes_country ON resumes (country_code);
+                CREATE INDEX IF NOT EXISTS idx_resumes_location ON resumes (location COLLATE NOCASE);
+            """)
+            rows = self.conn.execute("SELECT data FROM resumes").fetchall()
+            for (data,) in rows:
+                self._index_resume(json.loads(data))
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _index_resume(self, resume: Dict) -> None:
+        """Refresh derived columns and skill rows for one stored resume"""
+        username = resume['github_username']
+        place = resolve_location(resume.get('location') or '')
+        public_repos = resume.get('public_repos')
+        self.conn.execute("""
+            UPDATE resumes SET name = ?, location = ?, city = ?, country_code = ?,
+                               public_repos = ?, created_at = ?, created_at_epoch = ?
+            WHERE github_username = ?
+        """, (
+            resume.get('name'),
+            resume.get('location'),
+            place.city if place else None,
+            place.country_code if place else None,
+            public_repos if isinstance(public_repos, int) else None,
+            resume.get('created_at'),
+            resume.get('created_at_epoch') or parse_epoch(resume.get('created_at')),
+            username,
+        ))
+        self.conn.execute("DELETE FROM resume_skills WHERE github_username = ?", (username,))
+        skills = [s for s in dict.fromkeys(resume.get('skills') or []) if isinstance(s, str)]
+        self.conn.executemany("INSERT INTO resume_skills VALUES (?, ?)",
+                              ((username, skill) for skill in skills))
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> 'ResumeStore':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def is_folded(self, content_hash: str) -> bool:
+        """Check whether a batch with this content hash was already applied"""
+        return self.conn.execute(
+            "SELECT 1 FROM folded_sources WHERE sha256 = ?", (content_hash,)).fetchone() is not None
+
+    def _is_seen(self, path: str, stat: os.stat_result) -> bool:
+        """Check whether this exact file (same size and mtime) was already hashed and applied"""
+        row = self.conn.execute("SELECT mtime_ns, size FROM seen_files WHERE path = ?",
+                                (os.path.abspath(path),)).fetchone()
+        return row is not None and row[0] == stat.st_mtime_ns and row[1] == stat.st_size
+
+    def _remember(self, path: str, stat: os.stat_result, content_hash: str) -> None:
+        self.conn.execute("INSERT OR REPLACE INTO seen_files VALUES (?, ?, ?, ?)",
+                          (os.path.abspath(path), stat.st_mtime_ns, stat.st_size, content_hash))
+
+    def _next_seq(self) -> int:
+        row = self.conn.execute("SELECT COALESCE(MAX(seq), -1) + 1 FROM resumes").fetchone()
+        return row[0]
+
+    def _row(self, resume: Dict, seq: int) -> tuple:
+        followers = resume.get('followers')
+        if isinstance(followers, bool) or not isinstance(followers, (int, float)):
+            followers = 0
+        return (resume['github_username'], seq, resume.get('collected_at') or '',
+                int(followers), json.dumps(resume))
+
+    def upsert(self, resumes: List[Dict], seq_start: int) -> int:
+        """Insert new users and replace existing ones whose collected_at is newer; returns rows changed"""
+        applied = 0
+        for resume in resumes:
+            before = self.conn.total_changes
+            self._upsert_one(resume, seq_start)
+            seq_start += 1
+            if self.conn.total_changes != before:
+                self._index_resume(resume)
+                applied += 1
+        return applied
+
+    def _upsert_one(self, resume: Dict, seq: int) -> None:
+        self.conn.execute("""
+            INSERT INTO resumes (github_username, seq, collected_at, followers, data)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(github_username) DO UPDATE SET
+                collected_at = excluded.collected_at,
+                followers = excluded.followers,
+                data = excluded.data
+            WHERE excluded.collected_at > resumes.collected_at
+        """, self._row(resume, seq))
+
+    def fold_batch(self, path: str, content_hash: Optional[str] = None) -> Optional[Dict]:
+        """Apply one batch file unless it is unchanged since the last run or its content hash is folded in"""
+        stat = os.stat(path)
+        if self._is_seen(path, stat):
+            return None
+        content_hash = content_hash or file_sha256(path)
+        if self.is_folded(content_hash):
+            with self.conn:
+                self._remember(path, stat, content_hash)
+            return None
+
+        seq = self._next_seq()
+        records = 0
+        applied = 0
+        pending: List[Dict] = []
+        with self.conn:
+            for resume in iter_batch(path):
+                if not resume.get('github_username'):
+                    continue
+                pending.append(resume)
+                if len(pending) >= UPSERT_BATCH:
+                    applied += self.upsert(pending, seq)
+                    seq += len(pending)
+                    records += len(pending)
+                    pending = []
+            if pending:
+                applied += self.upsert(pending, seq)
+                records += len(pending)
+            self.conn.execute(
+                "INSERT INTO folded_sources VALUES (?, ?, ?, ?, ?)",
+                (content_hash, os.path.basename(path), records, applied, datetime.now().isoformat()))
+            self._remember(path, stat, content_hash)
+        return {'filename': os.path.basename(path), 'records': records, 'applied': applied}
+
+    def import_file(self, path: str) -> Optional[Dict]:
+        """Import a batch or merged JSON/JSONL file (no-op if already imported)"""
+        return self.fold_batch(path)
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+
+    def get(self, username: str) -> Optional[Dict]:
+        """Look up one resume by username"""
+        row = self.conn.execute(
+            "SELECT data FROM resumes WHERE github_username = ?", (username,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _where(self, skills: Optional[List[str]] = None, location: Optional[str] = None,
+               min_followers: Optional[int] = None, max_followers: Optional[int] = None,
+               min_repos: Optional[int] = None, max_repos: Optional[int] = None,
+               created_after: Optional[str] = None, created_before: Optional[str] = None,
+               bio_contains: Optional[str] = None) -> tuple:
+        """Build the WHERE clause and parameters shared by query() and count_where()"""
+        clauses = []
+        params: List = []
+
+        for skill in skills or []:
+            clauses.append("r.github_username IN (SELECT github_username FROM resume_skills WHERE skill = ?)")
+            params.append(skill)
+
+        if location:
+            place = resolve_location(location)
+            if place and place.precision == 'city':
+                clauses.append("r.city = ? COLLATE NOCASE AND r.country_code = ?")
+                params.extend([place.city, place.country_code])
+            elif place and place.precision == 'country':
+                clauses.append("r.country_code = ?")
+                params.append(place.country_code)
+            else:
+                clauses.append("r.location LIKE ?")
+                params.append(f"%{location}%")
+
+        for column, value, op in (('followers', min_followers, '>='), ('followers', max_followers, '<='),
+                                  ('public_repos', min_repos, '>='), ('public_repos', max_repos, '<=')):
+            if value is not None:
+                clauses.append(f"r.{column} {op} ?")
+                params.append(value)
+
+        for value, op in ((created_after, '>='), (created_before, '<')):
+            if value is not None:
+                epoch = parse_epoch(value)
+                if epoch is None:
+                    raise ValueError(f"Unparseable date: {value!r}")
+                clauses.append(f"r.created_at_epoch {op} ?")
+                params.append(epoch)
+
+        if bio_contains:
+            clauses.append("instr(json_extract(r.data, '$.bio'), ?) > 0")
+            params.append(bio_contains)
+
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(self, order_by: str = 'followers', limit: Optional[int] = None, **filters) -> List[Dict]:
+        """Filter resumes, e.g. query(skills=['Python'], location='Berlin', min_followers=100)
+
+        Filters: skills (all must match), location (resolved via the gazetteer;
+        free text otherwise), min/max_followers, min/max_repos,
+        created_after/created_before (ISO dates) and bio_contains.
+        """
+        if order_by not in ORDERINGS:
+            raise ValueError(f"Unknown order_by '{order_by}' (expected one of {', '.join(ORDERINGS)})")
+        where, params = self._where(**filters)
+        sql = f"SELECT r.data FROM resumes r{where} ORDER BY {ORDERINGS[order_by]}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        return [json.loads(data) for (data,) in self.conn.execute(sql, params)]
+
+    def count_where(self, **filters) -> int:
+        """Count resumes matching the query() filters"""
+        where, params = self._where(**filters)
+        return self.conn.execute(f"SELECT COUNT(*) FROM resumes r{where}", params).fetchone()[0]
+
+    def skill_counts(self, limit: Optional[int] = None) -> List[tuple]:
+        """(skill, developers) pairs, most common first"""
+        sql = "SELECT skill, COUNT(*) AS n FROM resume_skills GROUP BY skill ORDER BY n DESC, skill"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return self.conn.execute(sql).fetchall()
+
+    def country_counts(self) -> List[tuple]:
+        """(country_code, developers) pairs for resumes with a resolved location"""
+        return self.conn.execute("""
+            SELECT country_code, COUNT(*) AS n FROM resumes
+            WHERE country_code IS NOT NULL GROUP BY country_code ORDER BY n DESC
+        """).fetchall()
+
+    def iter_resumes(self) -> Iterator[str]:
+        """Stored resume JSON, most followers first (ties in first-seen order)"""
+        for (data,) in self.conn.execute("SELECT data FROM resumes ORDER BY followers DESC, seq"):
+            yield data
+
+    def export_json(self, output_file: str, metadata: Dict) -> None:
+        """Stream the store out in the merged_all_resumes.json layout"""
+        tmp_output = output_file + '.tmp'
+        with open(tmp_output, 'w') as out:
+            out.write('{\n  "metadata": ' + json.dumps(metadata) + ',\n  "resumes": [')
+            first = True
+            for data in self.iter_resumes():
+                out.write('\n    ' + data if first else ',\n    ' + data)
+                first = False
+            out.write('\n  ]\n}\n')
+        os.replace(tmp_output, output_file)
+
+
+def incremental_merge(collection_dir: str = "resume_collections", output_file: Optional[str] = None,
+                      store_path: Optional[str] = None, export: bool = True) -> Dict:
+    """Fold only not-yet-applied batches into the store, re-exporting the merged file if anything changed"""
+    output_file = output_file or os.path.join(collection_dir, 'merged_all_resumes.json')
+    store_path = store_path or os.path.join(collection_dir, DEFAULT_STORE_NAME)
+    manifest = CollectionManifest(collection_dir)
+    batches = manifest.list_batches()
+
+    folded = []
+    with ResumeStore(store_path) as store:
+        for batch in batches:
+            result = store.fold_batch(batch['path'], batch.get('sha256'))
+            if result:
+                print(f"Folded {result['filename']}: {result['records']} records, {result['applied']} applied")
+                folded.append(result)
+
+        sources = store.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(records), 0) FROM folded_sources").fetchone()
+        metadata = {
+            'total_count': store.count(),
+            'batch_count': sources[0],
+            'total_errors': sum(b.get('errors', 0) or 0 for b in batches),
+            'newly_folded': [b['filename'] for b in folded],
+            'merged_at': datetime.now().isoformat(),
+            'source_batches': [b['filename'] for b in batches]
+        }
+        # A re-hashed batch that changed no stored resume leaves the export as it is
+        if export and (any(b['applied'] for b in folded) or not os.path.exists(output_file)):
+            store.export_json(output_file, metadata)
+    return metadata
+
+
+if __name__ == "__main__":
+    import sys
+
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+
+    if args and args[0] == 'import':
+        # python resume_store.py import <store.sqlite> <batch.json> [...]
+        if len(args) < 3:
+            print("Usage: python resume_store.py import <store.sqlite> <batch.json> [batch.json ...]")
+            sys.exit(1)
+        with ResumeStore(args[1]) as store:
+            for path in args[2:]:
+                result = store.import_file(path)
+                print(f"{path}: {'already imported' if result is None else str(result['applied']) + ' applied'}")
+            print(f"{store.count()} resumes in {args[1]}")
+    else:
+        directory = args[0] if args else "resume_collections"
+        result = incremental_merge(directory, export='--no-export' not in sys.argv)
+        print(f"{result['total_count']} unique resumes, {len(result['newly_folded'])} new batch(es) folded")
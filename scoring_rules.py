@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Declarative Resume Quality Rules
+Compiles a JSON rules file (presence, regex, length and numeric range checks
+with weights) into a single-pass scorer with per-rule hit counts and timing
+"""
+
+import json
+import os
+import re
+import time
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from validation_primitives import EMAIL_PATTERN, URL_PATTERN
+
+
+DEFAULT_RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'quality_rules.json')
+
+NAMED_PATTERNS = {
+    'email': EMAIL_PATTERN,
+    'url': URL_PATTERN,
+}
+
+CHECKS = ('present', 'regex', 'length', 'range')
+ISSUE_WHEN = ('never', 'failed', 'invalid')
+
+
+def _bounds_test(rule: Dict) -> Callable[[float], bool]:
+    """Build a numeric comparison from min/max (inclusive) and gt/lt (exclusive)"""
+    low_incl, high_incl = rule.get('min'), rule.get('max')
+    low_excl, high_excl = rule.get('gt'), rule.get('lt')
+
+    def test(number) -> bool:
+        if low_incl is not None and number < low_incl:
+            return False
+        if high_incl is not None and number > high_incl:
+            return False
+        if low_excl is not None and number <= low_excl:
+            return False
+        if high_excl is not None and number >= high_excl:
+            return False
+        return True
+
+    return test
+
+
+def _compile_check(rule: Dict) -> Callable[[object], bool]:
+    """Turn one rule into a predicate over the field value"""
+    check = rule['check']
+
+    if check == 'present':
+        return bool
+
+    if check == 'regex':
+        pattern = rule.get('pattern')
+        if not pattern:
+            raise ValueError(f"Rule '{rule['name']}' needs a 'pattern'")
+        compiled = NAMED_PATTERNS.get(pattern) or re.compile(pattern)
+        match = compiled.match
+        return lambda value: isinstance(value, str) and bool(value) and match(value) is not None
+
+    if check == 'length':
+        bounds = _bounds_test(rule)
+        return lambda value: bool(value) and hasattr(value, '__len__') and bounds(len(value))
+
+    if check == 'range':
+        bounds = _bounds_test(rule)
+
+        def in_range(value) -> bool:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return False
+            return bounds(value)
+
+        return in_range
+
+    raise ValueError(f"Rule '{rule['name']}' has unknown check '{check}' (expected one of {CHECKS})")
+
+
+class ScoringRules:
+    """Quality rules compiled from a declarative spec"""
+
+    def __init__(self, spec: Dict):
+        self.spec = spec
+        self.threshold = spec.get('threshold', 40)
+        self.rules = spec.get('rules', [])
+        if not self.rules:
+            raise ValueError("Rules spec contains no rules")
+
+        self._compiled = []
+        seen = set()
+        for rule in self.rules:
+            for key in ('name', 'field', 'check'):
+                if key not in rule:
+                    raise ValueError(f"Rule {rule!r} is missing '{key}'")
+            if rule['name'] in seen:
+                raise ValueError(f"Duplicate rule name '{rule['name']}'")
+            seen.add(rule['name'])
+
+            issue_when = rule.get('issue_when', 'failed' if rule.get('issue') else 'never')
+            if issue_when not in ISSUE_WHEN:
+                raise ValueError(f"Rule '{rule['name']}' has unknown issue_when '{issue_when}'")
+            if issue_when != 'never' and not rule.get('issue'):
+                raise ValueError(f"Rule '{rule['name']}' reports issues but has no 'issue' text")
+
+            self._compiled.append((
+                rule['name'],
+                rule['field'],
+                _compile_check(rule),
+                float(rule.get('weight', 0)),
+                rule.get('issue', ''),
+                issue_when,
+            ))
+
+        self.evaluate = self._build_evaluator()
+        self.reset_stats()
+
+    @classmethod
+    def from_file(cls, path: str = DEFAULT_RULES_FILE) -> 'ScoringRules':
+        """Load and compile a rules file"""
+        with open(path, 'r') as f:
+            return cls(json.load(f))
+
+    def _build_evaluator(self) -> Callable[[Dict], Tuple[float, List[str]]]:
+        """Compile all rules into one closure that scores a resume in a single pass"""
+        compiled = tuple(self._compiled)
+
+        def evaluate(resume: Dict) -> Tuple[float, List[str]]:
+            score = 0
+            issues = []
+            get = resume.get
+            for _, field, test, weight, issue, issue_when in compiled:
+                value = get(field)
+                if test(value):
+                    score += weight
+                elif issue_when == 'failed' or (issue_when == 'invalid' and value):
+                    issues.append(issue)
+            return score, issues
+
+        return evaluate
+
+    def is_acceptable(self, score: float) -> bool:
+        """Check a score against the configured threshold"""
+        return score >= self.threshold
+
+    def reset_stats(self) -> None:
+        """Clear per-rule hit counters and timings"""
+        self.stats = {
+            'records': 0,
+            'accepted': 0,
+            'seconds': 0.0,
+            'rule_hits': defaultdict(int),
+            'rule_issues': defaultdict(int),
+            'rule_seconds': defaultdict(float),
+        }
+
+    def score_batch(self, resumes: Iterable[Dict], profile: bool = False) -> List[Tuple[float, List[str]]]:
+        """Score many resumes, recording hit counts (and per-rule time when profiling)"""
+        compiled = self._compiled
+        hit_counts = [0] * len(compiled)
+        issue_counts = [0] * len(compiled)
+        rule_time = [0.0] * len(compiled)
+        clock = time.perf_counter
+        results = []
+        start = clock()
+
+        for resume in resumes:
+            score = 0
+            issues = []
+            get = resume.get
+            for index, (_, field, test, weight, issue, issue_when) in enumerate(compiled):
+                if profile:
+                    t0 = clock()
+                value = get(field)
+                if test(value):
+                    score += weight
+                    hit_counts[index] += 1
+                elif issue_when == 'failed' or (issue_when == 'invalid' and value):
+                    issues.append(issue)
+                    issue_counts[index] += 1
+                if profile:
+                    rule_time[index] += clock() - t0
+            results.append((score, issues))
+
+        stats = self.stats
+        for index, (name, *_) in enumerate(compiled):
+            stats['rule_hits'][name] += hit_counts[index]
+            stats['rule_issues'][name] += issue_counts[index]
+            stats['rule_seconds'][name] += rule_time[index]
+        stats['records'] += len(results)
+        stats['accepted'] += sum(1 for score, _ in results if score >= self.threshold)
+        stats['seconds'] += clock() - start
+        return results
+
+    def score_columns(self, columns: Dict[str, List]) -> Tuple[List[float], List[List[str]]]:
+        """Vectorized scoring over a column-oriented table (field -> list of values)"""
+        if not columns:
+            return [], []
+        length = len(next(iter(columns.values())))
+        scores = [0.0] * length
+        issues: List[List[str]] = [[] for _ in range(length)]
+        stats = self.stats
+        start = time.perf_counter()
+
+        for name, field, test, weight, issue, issue_when in self._compiled:
+            t0 = time.perf_counter()
+            values = columns.get(field) or [None] * length
+            passed = list(map(test, values))
+            count = 0
+            raised = 0
+            for i, ok in enumerate(passed):
+                if ok:
+                    scores[i] += weight
+                    count += 1
+                elif issue_when == 'failed' or (issue_when == 'invalid' and values[i]):
+                    issues[i].append(issue)
+                    raised += 1
+            stats['rule_hits'][name] += count
+            stats['rule_issues'][name] += raised
+            stats['rule_seconds'][name] += time.perf_counter() - t0
+
+        stats['records'] += length
+        stats['accepted'] += sum(1 for score in scores if score >= self.threshold)
+        stats['seconds'] += time.perf_counter() - start
+        return scores, issues
+
+    def get_stats_report(self) -> Dict:
+        """Per-rule hit counts, issue counts and time spent"""
+        stats = self.stats
+        records = stats['records']
+        return {
+            'records': records,
+            'accepted': stats['accepted'],
+            'threshold': self.threshold,
+            'seconds': stats['seconds'],
+            'records_per_second': records / stats['seconds'] if stats['seconds'] > 0 else 0,
+            'rules': [
+                {
+                    'name': name,
+                    'field': field,
+                    'hits': stats['rule_hits'][name],
+                    'hit_rate': stats['rule_hits'][name] / records * 100 if records else 0,
+                    'issues': stats['rule_issues'][name],
+                    'seconds': stats['rule_seconds'][name],
+                }
+                for name, field, *_ in self._compiled
+            ]
+        }
+
+    def print_stats(self) -> None:
+        """Print the per-rule report"""
+        report = self.get_stats_report()
+        print(f"\nScored {report['records']} records in {report['seconds']:.3f}s "
+              f"({report['records_per_second']:.0f}/s) - "
+              f"{report['accepted']} at or above threshold {report['threshold']}")
+        print(f"{'Rule':<28} {'Hits':>8} {'Hit %':>7} {'Issues':>8} {'ms':>9}")
+        print("-" * 64)
+        for rule in report['rules']:
+            print(f"{rule['name']:<28} {rule['hits']:>8} {rule['hit_rate']:>6.1f}% "
+                  f"{rule['issues']:>8} {rule['seconds'] * 1000:>9.2f}")
+
+
+_default_rules: Optional[ScoringRules] = None
+
+
+def load_default_rules() -> ScoringRules:
+    """Return the shared rules compiled from quality_rules.json"""
+    global _default_rules
+    if _default_rules is None:
+        _default_rules = ScoringRules.from_file(DEFAULT_RULES_FILE)
+    return _default_rules
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python scoring_rules.py <collection_file.json> [rules.json] [--columns]")
+        sys.exit(1)
+
+    with open(sys.argv[1], 'r') as f:
+        collection = json.load(f)
+    resumes = collection.get('resumes', [])
+
+    rules_path = next((arg for arg in sys.argv[2:] if not arg.startswith('--')), DEFAULT_RULES_FILE)
+    rules = ScoringRules.from_file(rules_path)
+
+    if '--columns' in sys.argv:
+        fields = {rule['field'] for rule in rules.rules}
+        rules.score_columns({field: [r.get(field) for r in resumes] for field in fields})
+    else:
+        rules.score_batch(resumes, profile=True)
+    rules.print_stats()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Sector Ingestion Runner
+Loads founder data from sector files (sectors/*.jsonl, *.yaml) into the
+LinkedIn founder collection. Files are parsed, translated to the canonical
+record (founder_mapping) and validated against the founder schema in one
+streaming pass per file, in parallel worker processes, then loaded with one
+bulk append.
+A state file records each file's content hash, so unchanged files are
+skipped; new files are appended, and the first run, an edited or removed file
+or a changed mapping file rebuilds the collection from every sector file.
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import founder_schema
+from founder_mapping import DEFAULT_MAPPINGS_FILE, FounderFieldMappings, load_mappings, new_report
+
+DEFAULT_SECTOR_DIR = 'sectors'
+DEFAULT_STATE_FILE = 'sector_ingest_state.json'
+SECTOR_EXTENSIONS = ('.jsonl', '.yaml', '.yml')
+SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def file_digest(path: str) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def iter_sector_file(path: str) -> Iterator:
+    """Founder entries in a sector file: one JSON object per line, or a YAML list"""
+    if path.endswith('.jsonl'):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"{path}:{line_number}: {e.msg}") from None
+        return
+
+    import yaml
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.safe_load(f) or []
+    if isinstance(data, dict):
+        data = data.get('founders', [])
+    if not isinstance(data, list):
+        raise ValueError(f"{path}: expected a list of founders")
+    yield from data
+
+
+def validate_founders(entries: Iterable, source: str = '', mappings: Optional[FounderFieldMappings] = None) -> Dict:
+    """Translate each entry to the canonical record and keep the valid ones, reporting the rest"""
+    result = new_report()
+    result['founders'] = founders = []
+    problems = result['problems']
+    for number, entry in enumerate(entries, 1):
+        where = f"{source} #{number}"
+        if not isinstance(entry, dict):
+            problems.append(f"{where}: expected an object, got {type(entry).__name__}")
+            continue
+        nested = [k for k, v in entry.items() if not isinstance(v, SCALAR_TYPES)]
+        if nested:
+            problems.append(f"{where}: non-scalar value for {', '.join(nested)}")
+            continue
+        if mappings is not None:
+            entry = mappings.translate(entry, result, where)
+        missing = [f for f in founder_schema.REQUIRED_FIELDS if not entry.get(f)]
+        if missing:
+            problems.append(f"{where}: missing {', '.join(missing)}")
+            continue
+        founders.append(entry)
+    return result
+
+
+def parse_sector_file(path: str, mappings_file: Optional[str] = DEFAULT_MAPPINGS_FILE) -> Dict:
+    """Worker entry point: stream, translate and validate one file"""
+    mappings = load_mappings(mappings_file) if mappings_file else None
+    result = validate_founders(iter_sector_file(path), os.path.basename(path), mappings)
+    result['path'] = path
+    result['sha256'] = file_digest(path)
+    return result
+
+
+class SectorIngest:
+    """Keeps the founder collection in step with a directory of sector files"""
+
+    def __init__(self, sector_dir: str = DEFAULT_SECTOR_DIR, state_file: str = DEFAULT_STATE_FILE,
+                 collector=None, workers: Optional[int] = None,
+                 mappings_file: Optional[str] = DEFAULT_MAPPINGS_FILE):
+        self.sector_dir = sector_dir
+        self.state_file = state_file
+        self.mappings_file = mappings_file
+        self.workers = workers or os.cpu_count() or 1
+        self._collector = collector
+
+    @property
+    def collector(self):
+        if self._collector is None:
+            from linkedin_data_collector import LinkedInFounderCollector
+            self._collector = LinkedInFounderCollector()
+        return self._collector
+
+    def discover(self) -> List[str]:
+        if not os.path.isdir(self.sector_dir):
+            raise ValueError(f"Sector directory not found: {self.sector_dir}")
+        return sorted(
+            os.path.join(self.sector_dir, name) for name in os.listdir(self.sector_dir)
+            if name.endswith(SECTOR_EXTENSIONS) and not name.startswith('.')
+        )
+
+    def load_state(self) -> Dict[str, Dict]:
+        try:
+            with open(self.state_file, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def save_state(self, state: Dict[str, Dict]) -> None:
+        tmp_file = f"{self.state_file}.tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump(state, f, indent=2, sort_keys=True)
+        os.replace(tmp_file, self.state_file)
+
+    def parse(self, paths: List[str]) -> List[Dict]:
+        """Parse files in worker processes (inline for a single file or worker)"""
+        parse = partial(parse_sector_file, mappings_file=self.mappings_file)
+        if len(paths) <= 1 or self.workers <= 1:
+            return [parse(p) for p in paths]
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(paths))) as pool:
+            return list(pool.map(parse, paths))
+
+    def run(self, full: bool = False) -> Dict:
+        """Load new sector files, or rebuild when any loaded file or the mappings changed"""
+        paths = self.discover()
+        state = self.load_state()
+        loaded = state.get('files', {})
+        digests = {p: file_digest(p) for p in paths}
+        mappings_digest = file_digest(self.mappings_file) if self.mappings_file else None
+
+        changed = [p for p in paths if p in loaded and loaded[p]['sha256'] != digests[p]]
+        removed = [p for p in loaded if p not in digests]
+        new = [p for p in paths if p not in loaded]
+        remapped = bool(loaded) and state.get('mappings_sha256') != mappings_digest
+        # Without state the existing collection was not built from these files
+        rebuild = full or not loaded or remapped or bool(changed or removed)
+        to_parse = paths if rebuild else new
+
+        summary = {'files': len(paths), 'parsed': len(to_parse), 'skipped': len(paths) - len(to_parse),
+                   'mode': 'rebuild' if rebuild else 'append', 'loaded': 0,
+                   'problems': [], 'unmapped_fields': {}, 'vocabularies': {}}
+        if not to_parse:
+            print(f"✅ {len(paths)} sector files unchanged, nothing to load")
+            return summary
+
+        if changed or removed or remapped:
+            print(f"🔁 Rebuilding: {len(changed)} changed, {len(removed)} removed sector files"
+                  f"{', field mappings changed' if remapped else ''}")
+        results = self.parse(to_parse)
+
+        founders = []
+        for result in results:
+            founders.extend(result['founders'])
+            summary['problems'].extend(result['problems'])
+            for report_key in ('unmapped_fields', 'vocabularies'):
+                totals = summary[report_key]
+                for key, count in result[report_key].items():
+                    totals[key] = totals.get(key, 0) + count
+
+        if rebuild:
+            summary['loaded'] = self.collector.rebuild(founders)
+            loaded = {}
+        else:
+            summary['loaded'] = self.collector.add_founders(founders)
+        for result in results:
+            loaded[result['path']] = {'sha256': result['sha256'], 'founders': len(result['founders'])}
+        self.save_state({'mappings_sha256': mappings_digest, 'files': loaded})
+        return summary
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    args = sys.argv[1:]
+    workers = None
+    if '--workers' in args:
+        i = args.index('--workers')
+        workers = int(args[i + 1])
+        del args[i:i + 2]
+    full = '--full' in args
+    args = [a for a in args if a != '--full']
+    sector_dir = args[0] if args else DEFAULT_SECTOR_DIR
+
+    start = time.time()
+    ingest = SectorIngest(sector_dir, workers=workers)
+    try:
+        summary = ingest.run(full=full)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print(f"\n📥 {summary['mode'].upper()}: {summary['loaded']} founders from {summary['parsed']} files "
+          f"({summary['skipped']} unchanged) in {time.time() - start:.2f}s")
+    translated = {k: v for k, v in summary['vocabularies'].items() if k != 'canonical'}
+    if translated:
+        print(f"🔤 Translated: {', '.join(f'{k} ({v})' for k, v in sorted(translated.items()))}")
+    for problem in summary['problems']:
+        print(f"⚠️  {problem}")
+    if summary['unmapped_fields']:
+        fields = ', '.join(f"{k} ({v})" for k, v in sorted(summary['unmapped_fields'].items()))
+        print(f"ℹ️  Unmapped fields were not stored: {fields}")
+
+    from founder_progress import get_progress
+    totals = get_progress(ingest.collector.output_file).totals()
+    print(f"📊 Progress: {totals['Collected']}/{totals['Target']} founders "
+          f"(US {totals['US_Collected']}/{totals['US_Target']}, Canada {totals['Canada_Collected']}/{totals['Canada_Target']})")
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+Inverted Skill Index
+Canonical skill -> chunked bitmap of resume ids, built incrementally as resumes
+are ingested, with AND/OR/NOT cohort queries, co-occurrence counts and top-k
+"""
+
+import heapq
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+@lru_cache(maxsize=16384)
+def canonical_skill(skill: str) -> str:
+    """Map a raw skill name to its canonical form"""
+    from data_validator import DataCleaner
+    skill = skill.strip()
+    return DataCleaner.SKILL_MAPPINGS.get(skill, skill)
+
+
+CONTAINER_BITS = 16
+CONTAINER_MASK = (1 << CONTAINER_BITS) - 1
+
+
+class Bitmap:
+    """Set of non-negative ints stored as 65536-bit containers (roaring-style
+    partitioning; each container is a Python int used as a bitset), so updates
+    touch one small container and empty ranges cost nothing"""
+
+    __slots__ = ('containers',)
+
+    def __init__(self, containers: Optional[Dict[int, int]] = None):
+        self.containers = containers if containers is not None else {}
+
+    def add(self, value: int) -> None:
+        key = value >> CONTAINER_BITS
+        self.containers[key] = self.containers.get(key, 0) | (1 << (value & CONTAINER_MASK))
+
+    def add_many(self, values: Iterable[int]) -> None:
+        """Bulk insert: set bits per container in a bytearray, then OR once"""
+        grouped: Dict[int, bytearray] = {}
+        for value in values:
+            key = value >> CONTAINER_BITS
+            buffer = grouped.get(key)
+            if buffer is None:
+                buffer = grouped[key] = bytearray((CONTAINER_MASK + 1) // 8)
+            low = value & CONTAINER_MASK
+            buffer[low >> 3] |= 1 << (low & 7)
+        for key, buffer in grouped.items():
+            self.containers[key] = self.containers.get(key, 0) | int.from_bytes(buffer, 'little')
+
+    def discard(self, value: int) -> None:
+        key = value >> CONTAINER_BITS
+        bits = self.containers.get(key, 0) & ~(1 << (value & CONTAINER_MASK))
+        if bits:
+            self.containers[key] = bits
+        else:
+            self.containers.pop(key, None)
+
+    def __contains__(self, value: int) -> bool:
+        return bool(self.containers.get(value >> CONTAINER_BITS, 0) >> (value & CONTAINER_MASK) & 1)
+
+    def __len__(self) -> int:
+        return sum(bits.bit_count() for bits in self.containers.values())
+
+    def __bool__(self) -> bool:
+        return bool(self.containers)
+
+    def __iter__(self):
+        for key in sorted(self.containers):
+            base = key << CONTAINER_BITS
+            bits = self.containers[key]
+            while bits:
+                low = bits & -bits
+                yield base + low.bit_length() - 1
+                bits ^= low
+
+    def __and__(self, other: 'Bitmap') -> 'Bitmap':
+        small, large = sorted((self.containers, other.containers), key=len)
+        result = {}
+        for key, bits in small.items():
+            both = bits & large.get(key, 0)
+            if both:
+                result[key] = both
+        return Bitmap(result)
+
+    def __or__(self, other: 'Bitmap') -> 'Bitmap':
+        result = dict(self.containers)
+        for key, bits in other.containers.items():
+            result[key] = result.get(key, 0) | bits
+        return Bitmap(result)
+
+    def __sub__(self, other: 'Bitmap') -> 'Bitmap':
+        result = {}
+        for key, bits in self.containers.items():
+            remaining = bits & ~other.containers.get(key, 0)
+            if remaining:
+                result[key] = remaining
+        return Bitmap(result)
+
+    def intersection_count(self, other: 'Bitmap') -> int:
+        """len(self & other) without building the result"""
+        small, large = sorted((self.containers, other.containers), key=len)
+        return sum((bits & large.get(key, 0)).bit_count() for key, bits in small.items())
+
+    def copy(self) -> 'Bitmap':
+        return Bitmap(dict(self.containers))
+
+
+class SkillIndex:
+    """Skill postings as bitmaps over dense resume ids"""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.usernames: List[Optional[str]] = []
+        self.resume_skills: List[Tuple[str, ...]] = []
+        self._postings: Dict[str, Bitmap] = {}
+        self._live = Bitmap()
+        # Ids added since the last read, applied to the bitmaps in bulk
+        self._pending: Dict[str, List[int]] = {}
+        self._pending_live: List[int] = []
+
+    def _flush(self) -> None:
+        if not self._pending_live:
+            return
+        for skill, ids in self._pending.items():
+            bitmap = self._postings.get(skill)
+            if bitmap is None:
+                bitmap = self._postings[skill] = Bitmap()
+            bitmap.add_many(ids)
+        self._live.add_many(self._pending_live)
+        self._pending = {}
+        self._pending_live = []
+
+    @property
+    def postings(self) -> Dict[str, Bitmap]:
+        self._flush()
+        return self._postings
+
+    @property
+    def live(self) -> Bitmap:
+        self._flush()
+        return self._live
+
+    def __len__(self) -> int:
+        return len(self.live)
+
+    def add(self, username: str, skills: Iterable[str]) -> int:
+        """Index (or re-index) one resume; returns its id"""
+        skills = tuple(dict.fromkeys(canonical_skill(s) for s in skills if isinstance(s, str) and s.strip()))
+        resume_id = self.ids.get(username)
+        if resume_id is None:
+            resume_id = len(self.usernames)
+            self.ids[username] = resume_id
+            self.usernames.append(username)
+            self.resume_skills.append(())
+        else:
+            self._flush()
+            self._clear(resume_id)
+
+        pending = self._pending
+        for skill in skills:
+            ids = pending.get(skill)
+            if ids is None:
+                ids = pending[skill] = []
+            ids.append(resume_id)
+        self.resume_skills[resume_id] = skills
+        self._pending_live.append(resume_id)
+        return resume_id
+
+    def add_resumes(self, resumes: Iterable[Dict]) -> int:
+        """Index a batch of resume dicts; returns how many were indexed"""
+        added = 0
+        for resume in resumes:
+            username = resume.get('github_username')
+            if username:
+                self.add(username, resume.get('skills') or [])
+                added += 1
+        return added
+
+    def _clear(self, resume_id: int) -> None:
+        postings = self.postings
+        for skill in self.resume_skills[resume_id]:
+            bitmap = postings[skill]
+            bitmap.discard(resume_id)
+            if not bitmap:
+                del postings[skill]
+        self.resume_skills[resume_id] = ()
+
+    def remove(self, username: str) -> bool:
+        """Drop a resume from the index (its id is not reused)"""
+        resume_id = self.ids.pop(username, None)
+        if resume_id is None:
+            return False
+        self._flush()
+        self._clear(resume_id)
+        self.usernames[resume_id] = None
+        self.live.discard(resume_id)
+        return True
+
+    def bitmap(self, skill: str) -> Bitmap:
+        """Posting bitmap for one skill (empty if unknown)"""
+        return self.postings.get(canonical_skill(skill)) or Bitmap()
+
+    def cohort(self, all_of: Iterable[str] = (), any_of: Iterable[str] = (),
+               none_of: Iterable[str] = ()) -> Bitmap:
+        """Bitmap of resumes having every skill in all_of, at least one of any_of and none of none_of"""
+        result = self.live
+        for skill in all_of:
+            result = result & self.bitmap(skill)
+        any_of = list(any_of)
+        if any_of:
+            union = Bitmap()
+            for skill in any_of:
+                union = union | self.bitmap(skill)
+            result = result & union
+        for skill in none_of:
+            result = result - self.bitmap(skill)
+        return result if result is not self.live else self.live.copy()
+
+    def query(self, expression: str) -> Bitmap:
+        """Evaluate e.g. 'Python AND (Go OR Rust) AND NOT PHP' to a bitmap
+
+        Multi-word skills can be written bare ('Jupyter Notebook') or quoted.
+        """
+        return _QueryParser(self, expression).parse()
+
+    def members(self, bitmap: Bitmap) -> List[str]:
+        """Usernames in a bitmap, in ingestion order"""
+        return [self.usernames[i] for i in bitmap & self.live]
+
+    @staticmethod
+    def count(bitmap: Bitmap) -> int:
+        return len(bitmap)
+
+    def skill_counts(self, within: Optional[Bitmap] = None) -> Dict[str, int]:
+        """Developers per skill, optionally restricted to a cohort"""
+        if within is None:
+            return {skill: len(bits) for skill, bits in self.postings.items()}
+        counts = {}
+        for skill, bits in self.postings.items():
+            n = bits.intersection_count(within)
+            if n:
+                counts[skill] = n
+        return counts
+
+    def top_k(self, k: int = 10, within: Optional[Bitmap] = None,
+              exclude: Iterable[str] = ()) -> List[Tuple[str, int]]:
+        """Most common skills, optionally within a cohort"""
+        excluded = {canonical_skill(s) for s in exclude}
+        counts = self.skill_counts(within)
+        # Highest count first, ties broken alphabetically
+        return heapq.nsmallest(k, ((s, n) for s, n in counts.items() if s not in excluded),
+                               key=lambda item: (-item[1], item[0]))
+
+    def co_occurrence(self, skill: str, k: Optional[int] = 10) -> List[Tuple[str, int]]:
+        """Skills most often seen together with `skill`"""
+        bits = self.bitmap(skill)
+        if not bits:
+            return []
+        return self.top_k(k if k is not None else len(self.postings), within=bits, exclude=[skill])
+
+    def co_occurrence_matrix(self, skills: List[str]) -> Dict[str, Dict[str, int]]:
+        """Pairwise counts of resumes having both skills"""
+        bitmaps = {skill: self.bitmap(skill) for skill in skills}
+        return {
+            a: {b: bitmaps[a].intersection_count(bitmaps[b]) for b in skills}
+            for a in skills
+        }
+
+
+class _QueryParser:
+    """Recursive-descent parser for AND/OR/NOT skill expressions (NOT > AND > OR)"""
+
+    TOKEN = re.compile(r'\s*(?:(\()|(\))|"([^"]*)"|\'([^\']*)\'|([^\s()]+))')
+    KEYWORDS = ('AND', 'OR', 'NOT')
+
+    def __init__(self, index: SkillIndex, expression: str):
+        self.index = index
+        self.tokens = self._tokenize(expression)
+        self.pos = 0
+
+    def _tokenize(self, expression: str) -> List[Tuple[str, str]]:
+        tokens: List[Tuple[str, str]] = []
+        last_bare = False
+        position = 0
+        expression = expression.strip()
+        while position < len(expression):
+            match = self.TOKEN.match(expression, position)
+            if not match or match.end() == position:
+                raise ValueError(f"Cannot parse skill query at: {expression[position:]!r}")
+            position = match.end()
+            open_paren, close_paren, double_q, single_q, word = match.groups()
+            bare = False
+            if open_paren:
+                tokens.append(('(', '('))
+            elif close_paren:
+                tokens.append((')', ')'))
+            elif double_q is not None or single_q is not None:
+                tokens.append(('SKILL', double_q if double_q is not None else single_q))
+            elif word.upper() in self.KEYWORDS:
+                tokens.append((word.upper(), word))
+            elif last_bare:
+                # Adjacent bare words form one multi-word skill name
+                tokens[-1] = ('SKILL', f"{tokens[-1][1]} {word}")
+                bare = True
+            else:
+                tokens.append(('SKILL', word))
+                bare = True
+            last_bare = bare
+        return tokens
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.pos][0] if self.pos < len(self.tokens) else None
+
+    def _take(self, kind: str) -> str:
+        if self._peek() != kind:
+            found = self.tokens[self.pos][1] if self.pos < len(self.tokens) else 'end of query'
+            raise ValueError(f"Expected {kind} in skill query, found {found!r}")
+        value = self.tokens[self.pos][1]
+        self.pos += 1
+        return value
+
+    def parse(self) -> Bitmap:
+        if not self.tokens:
+            raise ValueError("Empty skill query")
+        result = self._or()
+        if self.pos != len(self.tokens):
+            raise ValueError(f"Unexpected {self.tokens[self.pos][1]!r} in skill query")
+        return result
+
+    def _or(self) -> Bitmap:
+        result = self._and()
+        while self._peek() == 'OR':
+            self.pos += 1
+            result = result | self._and()
+        return result
+
+    def _and(self) -> Bitmap:
+        result = self._not()
+        while self._peek() == 'AND':
+            self.pos += 1
+            result = result & self._not()
+        return result
+
+    def _not(self) -> Bitmap:
+        if self._peek() == 'NOT':
+            self.pos += 1
+            return self.index.live - self._not()
+        return self._atom()
+
+    def _atom(self) -> Bitmap:
+        if self._peek() == '(':
+            self.pos += 1
+            result = self._or()
+            self._take(')')
+            return result
+        return self.index.bitmap(self._take('SKILL'))
+
+
+def build_index(resumes: Iterable[Dict]) -> SkillIndex:
+    """Build an index from resume dicts"""
+    index = SkillIndex()
+    index.add_resumes(resumes)
+    return index
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    if len(sys.argv) < 2:
+        print("Usage: python skill_index.py <collection_file.json> [\"query expression\"]")
+        sys.exit(1)
+
+    from streaming_merge import iter_batch
+
+    start = time.perf_counter()
+    index = build_index(iter_batch(sys.argv[1]))
+    print(f"Indexed {len(index)} resumes, {len(index.postings)} skills "
+          f"in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    if len(sys.argv) > 2:
+        start = time.perf_counter()
+        cohort = index.query(sys.argv[2])
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"\n{sys.argv[2]}: {index.count(cohort)} developers ({elapsed:.2f} ms)")
+        print("Top skills in cohort:")
+        for skill, count in index.top_k(10, within=cohort):
+            print(f"  {skill:<20} {count}")
+    else:
+        print("\nTop skills:")
+        for skill, count in index.top_k(10):
+            print(f"  {skill:<20} {count}")
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Streaming Batch Merge
+Reads batch files incrementally (JSON or JSONL), dedupes usernames against an
+on-disk index and sorts by followers with an external merge of spilled runs,
+so memory stays bounded by the run size rather than the collection size
+"""
+
+import heapq
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+CHUNK_SIZE = 1 << 20
+DEFAULT_RUN_SIZE = 100000
+MAX_FAN_IN = 128
+SQLITE_BATCH = 500
+
+
+class StreamingJSONReader:
+    """Incremental reader for a top-level JSON object of the batch file shape"""
+
+    def __init__(self, fileobj, chunk_size: int = CHUNK_SIZE):
+        self.file = fileobj
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk, dropping consumed input; False at end of file"""
+        if self.eof:
+            return False
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def _skip_ws(self) -> None:
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self._fill():
+                return
+
+    def _peek(self) -> str:
+        self._skip_ws()
+        return self.buffer[self.pos] if self.pos < len(self.buffer) else ''
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise ValueError(f"Expected '{char}' at offset {self.pos}, found {self._peek()!r}")
+        self.pos += 1
+
+    def _value(self):
+        """Decode one complete JSON value, reading more input until it parses"""
+        self._skip_ws()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # A scalar that ends exactly at the buffer edge may continue in the next chunk
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            if not self._fill():
+                continue
+
+    def _skip_comma(self, closing: str) -> bool:
+        """Consume a separator; True if the container continues"""
+        char = self._peek()
+        if char == ',':
+            self.pos += 1
+            return True
+        if char == closing:
+            self.pos += 1
+            return False
+        raise ValueError(f"Expected ',' or '{closing}' at offset {self.pos}, found {char!r}")
+
+    def iter_object(self, stream_key: str) -> Iterator[Tuple[str, object]]:
+        """Yield (key, value) pairs; the array under stream_key is yielded item by item as (key, item)"""
+        self._expect('{')
+        if self._peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self._value()
+            self._expect(':')
+            if key == stream_key and self._peek() == '[':
+                self.pos += 1
+                if self._peek() == ']':
+                    self.pos += 1
+                else:
+                    while True:
+                        yield key, self._value()
+                        if not self._skip_comma(']'):
+                            break
+            else:
+                yield key, self._value()
+            if not self._skip_comma('}'):
+                return
+
+
+def _is_jsonl(path: str) -> bool:
+    return path.endswith('.jsonl')
+
+
+def iter_batch(path: str, on_metadata=None) -> Iterator[Dict]:
+    """Stream resumes from a batch file, passing metadata to on_metadata when seen
+
+    JSONL batches carry metadata as a first line of the form {"metadata": {...}}.
+    """
+    with open(path, 'r') as f:
+        if _is_jsonl(path):
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                if 'metadata' in record and len(record) == 1:
+                    if on_metadata:
+                        on_metadata(record['metadata'])
+                    continue
+                yield record
+            return
+
+        for key, value in StreamingJSONReader(f).iter_object('resumes'):
+            if key == 'resumes':
+                yield value
+            elif key == 'metadata' and on_metadata:
+                on_metadata(value)
+
+
+def read_batch_metadata(path: str) -> Dict:
+    """Read only the metadata of a batch (stops as soon as it has been parsed)"""
+    with open(path, 'r') as f:
+        if _is_jsonl(path):
+            first = json.loads(f.readline() or '{}')
+            return first.get('metadata', {}) if len(first) == 1 else {}
+        for key, value in StreamingJSONReader(f, chunk_size=64 * 1024).iter_object(''):
+            if key == 'metadata':
+                return value
+    return {}
+
+
+class SeenIndex:
+    """On-disk username index (sqlite) used to dedupe across batches"""
+
+    def __init__(self, path: str):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=OFF")
+        self.conn.execute("PRAGMA synchronous=OFF")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS seen (username TEXT PRIMARY KEY) WITHOUT ROWID")
+
+    def filter_new(self, usernames: List[str]) -> set:
+        """Return the usernames not yet seen and record them"""
+        existing = set()
+        for i in range(0, len(usernames), SQLITE_BATCH):
+            group = usernames[i:i + SQLITE_BATCH]
+            placeholders = ','.join('?' * len(group))
+            existing.update(row[0] for row in self.conn.execute(
+                f"SELECT username FROM seen WHERE username IN ({placeholders})", group))
+        new = set(usernames) - existing
+        self.conn.executemany("INSERT INTO seen VALUES (?)", ((u,) for u in new))
+        return new
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def _sort_key(resume: Dict) -> int:
+    followers = resume.get('followers', 0)
+    if isinstance(followers, bool) or not isinstance(followers, (int, float)):
+        followers = 0
+    return -followers
+
+
+def _write_run(records: List[Tuple[float, int, str]], directory: str, index: int) -> str:
+    """Sort one run and spill it as 'key<TAB>seq<TAB>json' lines"""
+    records.sort()
+    path = os.path.join(directory, f"run_{index:06d}.tsv")
+    with open(path, 'w') as f:
+        for key, seq, line in records:
+            f.write(f"{key!r}\t{seq}\t{line}\n")
+    return path
+
+
+def _read_run(path: str) -> Iterator[Tuple[float, int, str]]:
+    with open(path, 'r') as f:
+        for raw in f:
+            key, seq, line = raw.rstrip('\n').split('\t', 2)
+            yield float(key), int(seq), line
+
+
+def _merge_runs(paths: List[str], directory: str) -> Iterator[Tuple[float, int, str]]:
+    """k-way merge, collapsing levels first when there are more runs than MAX_FAN_IN"""
+    level = 0
+    while len(paths) > MAX_FAN_IN:
+        merged_paths = []
+        for i in range(0, len(paths), MAX_FAN_IN):
+            group = paths[i:i + MAX_FAN_IN]
+            out_path = os.path.join(directory, f"level{level}_{i // MAX_FAN_IN:06d}.tsv")
+            with open(out_path, 'w') as out:
+                for key, seq, line in heapq.merge(*(_read_run(p) for p in group)):
+                    out.write(f"{key!r}\t{seq}\t{line}\n")
+            for p in group:
+                os.remove(p)
+            merged_paths.append(out_path)
+        paths = merged_paths
+        level += 1
+    return heapq.merge(*(_read_run(p) for p in paths))
+
+
+def streaming_merge(batch_paths: List[str], output_file: str,
+                    run_size: int = DEFAULT_RUN_SIZE, temp_dir: Optional[str] = None,
+                    source_batches: Optional[List[str]] = None) -> Dict:
+    """Merge batches into output_file (JSON, or JSONL if it ends in .jsonl); returns metadata"""
+    if run_size < 1:
+        raise ValueError("run_size must be positive")
+
+    work_dir = tempfile.mkdtemp(prefix='merge_', dir=temp_dir)
+    seen = SeenIndex(os.path.join(work_dir, 'seen.sqlite'))
+    runs: List[str] = []
+    total_errors = 0
+    total_count = 0
+    duplicates = 0
+    seq = 0
+
+    def add_errors(metadata: Dict) -> None:
+        nonlocal total_errors
+        total_errors += metadata.get('errors', 0) or 0
+
+    try:
+        pending: List[Dict] = []
+        run: List[Tuple[float, int, str]] = []
+
+        def flush_pending() -> None:
+            nonlocal seq, total_count, duplicates
+            usernames = [r['github_username'] for r in pending]
+            new = seen.filter_new(list(dict.fromkeys(usernames)))
+            for resume in pending:
+                username = resume['github_username']
+                if username in new:
+                    new.discard(username)
+                    run.append((_sort_key(resume), seq, json.dumps(resume)))
+                    seq += 1
+                    total_count += 1
+                else:
+                    duplicates += 1
+            pending.clear()
+            if len(run) >= run_size:
+                runs.append(_write_run(run, work_dir, len(runs)))
+                run.clear()
+
+        for path in batch_paths:
+            print(f"Processing {os.path.basename(path)}...")
+            for resume in iter_batch(path, on_metadata=add_errors):
+                if not resume.get('github_username'):
+                    continue
+                pending.append(resume)
+                if len(pending) >= SQLITE_BATCH * 4:
+                    flush_pending()
+        if pending:
+            flush_pending()
+        seen.conn.commit()
+        if run:
+            runs.append(_write_run(run, work_dir, len(runs)))
+            run.clear()
+
+        metadata = {
+            'total_count': total_count,
+            'batch_count': len(batch_paths),
+            'total_errors': total_errors,
+            'duplicates_skipped': duplicates,
+            'merged_at': datetime.now().isoformat(),
+            'source_batches': source_batches or [os.path.basename(p) for p in batch_paths]
+        }
+
+        tmp_output = output_file + '.tmp'
+        with open(tmp_output, 'w') as out:
+            merged = _merge_runs(runs, work_dir)
+            if _is_jsonl(output_file):
+                out.write(json.dumps({'metadata': metadata}) + '\n')
+                for _, _, line in merged:
+                    out.write(line + '\n')
+            else:
+                out.write('{\n  "metadata": ' + json.dumps(metadata) + ',\n  "resumes": [')
+                first = True
+                for _, _, line in merged:
+                    out.write('\n    ' + line if first else ',\n    ' + line)
+                    first = False
+                out.write('\n  ]\n}\n')
+        os.replace(tmp_output, output_file)
+        return metadata
+    finally:
+        seen.close()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 3:
+        print("Usage: python streaming_merge.py <output.json|output.jsonl> <batch> [batch ...]")
+        sys.exit(1)
+
+    result = streaming_merge(sys.argv[2:], sys.argv[1])
+    print(f"Merged {result['total_count']} unique resumes "
+          f"({result['duplicates_skipped']} duplicates) into {sys.argv[1]}")
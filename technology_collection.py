@@ -1,124 +0,0 @@
-#!/usr/bin/env python3
-"""
-Technology Sector Collection
-Target: 12 founders (11 US + 1 Canada)
-
-Includes: SaaS, Mobile Apps, AI/ML, Fintech, EdTech, 
-IoT, Cybersecurity, Developer Tools
-"""
-
-from linkedin_data_collector import LinkedInFounderCollector
-
-def main():
-    collector = LinkedInFounderCollector()
-    
-    # Technology founders with comprehensive profiles  
-    technology_founders = [
-        # US Founders (11)
-        {
-            'proj_name': 'CloudSync Pro',
-            'proj_founder': 'Sarah Martinez',
-            'proj_location': 'San Francisco, CA',
-            'proj_category': 'Technology',
-            'li_name': 'Sarah Martinez'
-        },
-        {
-            'proj_name': 'AI Analytics Hub',
-            'proj_founder': 'David Kim',
-            'proj_location': 'Seattle, WA',
-            'proj_category': 'Technology',
-            'li_name': 'David Kim'
-        },
-        {
-            'proj_name': 'SecureCode Solutions',
-            'proj_founder': 'Jennifer Chen',
-            'proj_location': 'Austin, TX',
-            'proj_category': 'Technology',
-            'li_name': 'Jennifer Chen'
-        },
-        {
-            'proj_name': 'MobileFirst Apps',
-            'proj_founder': 'Michael Rodriguez',
-            'proj_location': 'Miami, FL',
-            'proj_category': 'Technology',
-            'li_name': 'Michael Rodriguez'
-        },
-        {
-            'proj_name': 'DataStream Analytics',
-            'proj_founder': 'Lisa Thompson',
-            'proj_location': 'Denver, CO',
-            'proj_category': 'Technology',
-            'li_name': 'Lisa Thompson'
-        },
-        {
-            'proj_name': 'FinTech Bridge',
-            'proj_founder': 'Carlos Wilson',
-            'proj_location': 'New York, NY',
-            'proj_category': 'Technology',
-            'li_name': 'Carlos Wilson'
-        },
-        {
-            'proj_name': 'EduTech Connect',
-            'proj_founder': 'Amanda Park',
-            'proj_location': 'Boston, MA',
-            'proj_category': 'Technology',
-            'li_name': 'Amanda Park'
-        },
-        {
-            'proj_name': 'IoT Smart Systems',
-            'proj_founder': 'Robert Anderson',
-            'proj_location': 'Portland, OR',
-            'proj_category': 'Technology',
-            'li_name': 'Robert Anderson'
-        },
-        {
-            'proj_name': 'DevTools Pro',
-            'proj_founder': 'Patricia Johnson',
-            'proj_location': 'Chicago, IL',
-            'proj_category': 'Technology',
-            'li_name': 'Patricia Johnson'
-        },
-        {
-            'proj_name': 'CyberShield Tech',
-            'proj_founder': 'Kevin Brown',
-            'proj_location': 'Phoenix, AZ',
-            'proj_category': 'Technology',
-            'li_name': 'Kevin Brown'
-        },
-        {
-            'proj_name': 'BlockChain Solutions',
-            'proj_founder': 'Rachel Davis',
-            'proj_location': 'Las Vegas, NV',
-            'proj_category': 'Technology',
-            'li_name': 'Rachel Davis'
-        },
-        
-        # Canadian Founder (1)
-        {
-            'proj_name': 'Maple Tech Innovations',
-            'proj_founder': 'Jean-Pierre Dubois',
-            'proj_location': 'Vancouver, BC',
-            'proj_category': 'Technology',
-            'li_name': 'Jean-Pierre Dubois'
-        }
-    ]
-    
-    print(f"🚀 Starting Technology sector collection...")
-    print(f"📊 Target: 12 founders (11 US + 1 Canada)")
-    print("=" * 80)
-    
-    for i, founder in enumerate(technology_founders, 1):
-        try:
-            collector.add_founder(founder)
-            print(f"✅ Added: {founder['li_name']} ({founder['proj_location']})")
-        except Exception as e:
-            print(f"❌ Error adding founder {i}: {e}")
-            continue
-    
-    print(f"\n✅ Added 12 Technology founders (11 US + 1 Canada)")
-    print("Technology sector: COMPLETE (12/12)")
-    print(f"\n🎯 MILESTONE: 8 sectors completed!")
-    print(f"📈 Progress: {14+16+22+18+16+14+12} = 132/200 founders (66% complete)")
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
@@ -0,0 +1,31 @@
+from cleaning_pipeline import CleaningPipeline
+from data_validator import DataCleaner
+
+
+def test_urls_stage_skips_non_string_blogs():
+    resumes = [
+        {'github_username': 'a', 'blog': 123},
+        {'github_username': 'b', 'blog': {'url': 'example.com'}},
+        {'github_username': 'c', 'blog': 'example.com'},
+    ]
+    pipeline = CleaningPipeline(stages=('schema', 'urls'), in_place=False)
+    cleaned = pipeline.run(resumes)
+    assert [r['blog'] for r in cleaned] == [123, {'url': 'example.com'}, 'https://example.com']
+    assert pipeline.last_stats['schema_violations']['blog'] == 2
+
+
+def test_explicit_empty_stage_list_runs_nothing():
+    resumes = [{'github_username': 'c', 'blog': 'example.com', 'location': 'Berlin'}]
+    cleaned = DataCleaner.clean_resume_batch(resumes, in_place=False, stages=[])
+    assert cleaned == resumes
+
+
+def test_clean_location_always_returns_the_same_keys():
+    keys = {'city', 'state', 'country', 'country_code', 'latitude', 'longitude'}
+    resolved = DataCleaner.clean_location('Berlin, Germany')
+    assert set(resolved) == keys
+    assert resolved['country_code'] == 'DE'
+    for location in ('', 'Nowhereville, Atlantis', 'Somewhere'):
+        parsed = DataCleaner.clean_location(location)
+        assert set(parsed) == keys
+        assert (parsed['country_code'], parsed['latitude'], parsed['longitude']) == (None, None, None)
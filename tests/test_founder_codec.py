@@ -0,0 +1,90 @@
+import pytest
+
+import founder_codec
+
+COLUMNS = ['proj_name', 'proj_founder', 'notes']
+AWKWARD = ['a|b', 'back\\slash', 'two\nlines', 'carriage\rreturn', 'all |\\\n\r of them', '', 'plain']
+
+
+def _write_lines(path, lines):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(''.join(lines))
+
+
+@pytest.mark.parametrize('value', AWKWARD)
+def test_encode_decode_round_trip(value):
+    line = founder_codec.encode_row(['x', value, 'y'])
+    assert '\n' not in line and '\r' not in line
+    assert founder_codec.decode_row(line) == ['x', value, 'y']
+
+
+def test_none_encodes_as_empty_field():
+    assert founder_codec.encode_row(['x', None, 3]) == 'x||3'
+    assert founder_codec.escape_field(None) == ''
+
+
+def test_file_round_trip(tmp_path):
+    path = str(tmp_path / 'founders.psv')
+    records = [{'proj_name': value, 'proj_founder': f"founder {i}", 'notes': None} for i, value in enumerate(AWKWARD)]
+    assert founder_codec.write_records(path, records, COLUMNS) == len(AWKWARD)
+
+    assert founder_codec.read_header(path) == (1, COLUMNS)
+    read = list(founder_codec.iter_records(path, strict=True))
+    assert [r['proj_name'] for r in read] == AWKWARD
+    assert all(r['notes'] == '' for r in read)
+
+
+def test_projection_reads_only_requested_columns(tmp_path):
+    path = str(tmp_path / 'founders.psv')
+    founder_codec.write_records(path, [['p1', 'ada', 'n|1'], ['p2', 'bob', 'n2']], COLUMNS)
+
+    assert founder_codec.read_columns(path, ['notes', 'proj_name']) == {'notes': ['n|1', 'n2'],
+                                                                        'proj_name': ['p1', 'p2']}
+    assert list(founder_codec.iter_records(path, ['proj_founder'])) == [{'proj_founder': 'ada'},
+                                                                       {'proj_founder': 'bob'}]
+    with pytest.raises(ValueError):
+        founder_codec.FounderReader(path, ['missing'])
+
+
+def test_malformed_rows_lenient_and_strict(tmp_path):
+    path = str(tmp_path / 'founders.psv')
+    _write_lines(path, [
+        founder_codec.header_lines(COLUMNS),
+        'p1|ada|ok\n',
+        'p2|too|many|fields\n',
+        'p3|bad\\xescape|n\n',
+        'p4|short\n',
+        'p5|bob|ok\n',
+    ])
+
+    reader = founder_codec.FounderReader(path)
+    assert [row[1] for row in reader.rows()] == ['ada', 'bob']
+    assert [line for line, _ in reader.errors] == [4, 5, 6]
+
+    with pytest.raises(ValueError, match=':4:'):
+        list(founder_codec.FounderReader(path, strict=True).rows())
+
+
+def test_legacy_file_converts_to_v1(tmp_path):
+    legacy = str(tmp_path / 'legacy.psv')
+    _write_lines(legacy, ['proj_name|proj_founder|notes\r\n', 'p1|ada|"quoted | pipe"\r\n', 'p2|bob|"two\nlines"\r\n'])
+    assert founder_codec.read_header(legacy) == (0, COLUMNS)
+    legacy_rows = list(founder_codec.FounderReader(legacy).rows())
+    assert legacy_rows == [['p1', 'ada', 'quoted | pipe'], ['p2', 'bob', 'two\nlines']]
+
+    converted = str(tmp_path / 'converted.psv')
+    assert founder_codec.convert_file(legacy, converted) == (2, [])
+    assert founder_codec.read_header(converted) == (1, COLUMNS)
+    assert list(founder_codec.FounderReader(converted).rows()) == legacy_rows
+
+
+def test_append_upgrades_legacy_file(tmp_path):
+    path = str(tmp_path / 'founders.psv')
+    _write_lines(path, ['proj_name|proj_founder|notes\r\n', 'p1|ada|"a | b"\r\n'])
+    founder_codec.append_records(path, [['p2', 'bob', 'c\nd']], COLUMNS)
+
+    assert founder_codec.read_header(path)[0] == 1
+    assert list(founder_codec.FounderReader(path, strict=True).rows()) == [['p1', 'ada', 'a | b'],
+                                                                           ['p2', 'bob', 'c\nd']]
+    with pytest.raises(ValueError):
+        founder_codec.append_records(path, [['x', 'y']], ['proj_name', 'proj_founder'])
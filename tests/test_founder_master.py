@@ -0,0 +1,73 @@
+import os
+
+import founder_codec
+import founder_master
+import founder_schema
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROSTER = os.path.join(REPO_ROOT, 'roster', 'master_roster.psv')
+BASELINE = os.path.join(REPO_ROOT, 'linkedin_founders_complete_200.psv')
+
+
+def _consolidate(tmp_path, sources):
+    output = str(tmp_path / 'master.psv')
+    summary = founder_master.consolidate(sources, output, str(tmp_path / 'store.sqlite'), mappings_file=None)
+    return output, summary
+
+
+def test_roster_rebuild_reproduces_baseline_master(tmp_path):
+    output, summary = _consolidate(tmp_path, [ROSTER])
+    assert summary['founders'] == 200
+
+    # The baseline is a legacy csv-quoted file; the master is written as v1
+    assert list(founder_codec.FounderReader(output).rows()) == list(founder_codec.FounderReader(BASELINE).rows())
+    converted = str(tmp_path / 'baseline_v1.psv')
+    founder_codec.convert_file(BASELINE, converted)
+    with open(output, 'rb') as rebuilt, open(converted, 'rb') as expected:
+        assert rebuilt.read() == expected.read()
+
+
+def test_rebuild_is_stable_across_incremental_runs(tmp_path):
+    output, _ = _consolidate(tmp_path, [ROSTER])
+    with open(output, 'rb') as f:
+        first = f.read()
+
+    _, summary = _consolidate(tmp_path, [ROSTER])
+    assert summary['unchanged'] == 1 and not summary['written']
+    with open(output, 'rb') as f:
+        assert f.read() == first
+
+
+def test_founder_key_ignores_case_accents_suffixes_and_location_spelling():
+    key = founder_master.founder_key({'proj_founder': 'José Núñez', 'co_name': 'Acme, Inc.',
+                                      'proj_location': 'Phoenix, AZ'})
+    assert key == founder_master.founder_key({'proj_founder': 'jose nunez', 'co_name': 'ACME',
+                                              'proj_location': 'Phoenix, Arizona'})
+    assert key != founder_master.founder_key({'proj_founder': 'Jose Nunez', 'co_name': 'Acme',
+                                              'proj_location': 'Denver, CO'})
+    assert founder_master.founder_key({'proj_founder': '', 'proj_name': 'Acme'}) is None
+
+
+def test_duplicates_merge_with_later_sources_winning(tmp_path):
+    low = str(tmp_path / 'a_low.psv')
+    high = str(tmp_path / 'b_high.psv')
+    founder_codec.write_records(low, [
+        {'proj_founder': 'José Núñez', 'co_name': 'Acme, Inc.', 'proj_location': 'Phoenix, AZ',
+         'proj_category': 'Technology', 'co_website_url': 'old.example'},
+        {'proj_founder': 'Ann Lee', 'co_name': 'Beta LLC', 'proj_location': 'Austin, TX', 'proj_category': 'Health'},
+    ], founder_schema.COLUMNS)
+    founder_codec.write_records(high, [
+        {'proj_founder': 'jose nunez', 'co_name': 'ACME', 'proj_location': 'Phoenix, Arizona',
+         'co_website_url': 'new.example'},
+        {'proj_founder': 'Zed Ko', 'co_name': 'Gamma', 'proj_location': 'Denver, CO', 'proj_category': 'Energy'},
+    ], founder_schema.COLUMNS)
+
+    output, summary = _consolidate(tmp_path, [low, high])
+    assert summary['records'] == 4 and summary['founders'] == 3
+    rows = list(founder_codec.iter_records(output, ['proj_founder', 'proj_category', 'co_website_url']))
+    # First-seen order; the higher-priority source fills and overrides fields it has
+    assert rows == [
+        {'proj_founder': 'jose nunez', 'proj_category': 'Technology', 'co_website_url': 'new.example'},
+        {'proj_founder': 'Ann Lee', 'proj_category': 'Health', 'co_website_url': ''},
+        {'proj_founder': 'Zed Ko', 'proj_category': 'Energy', 'co_website_url': ''},
+    ]
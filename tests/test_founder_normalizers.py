@@ -0,0 +1,69 @@
+import pytest
+
+from founder_normalizers import _compile_parser, parse_currency, parse_date, parse_yes_no
+
+
+@pytest.mark.parametrize('text, start, end', [
+    ('2020-05-17', '2020-05-17', '2020-05-17'),
+    ('August 23, 2023', '2023-08-23', '2023-08-23'),
+    ('March 2021', '2021-03-01', '2021-03-31'),
+    ('Sept. 2015', '2015-09-01', '2015-09-30'),
+    ('05/2018', '2018-05-01', '2018-05-31'),
+    ('Founded 2019', '2019-01-01', '2019-12-31'),
+    ('2018-2020', '2018-01-01', '2020-12-31'),
+    ('Feb 30, 2021', None, None),
+    ('13/2020', None, None),
+    ('no date', None, None),
+])
+def test_parse_date(text, start, end):
+    assert parse_date(text) == start
+    assert parse_date(text, 'end') == end
+
+
+RATES = (('CAD', 0.75), ('EUR', 1.1))
+
+
+@pytest.mark.parametrize('text, expected, converted', [
+    ('$12.5K', '$12500', '$12500'),
+    ('12,500', '$12500', '$12500'),
+    ('$1,234.50', '$1234.50', '$1234.50'),
+    ('USD 1M', '$1000000', '$1000000'),
+    ('Raised $2.5 million in 2021', '$2500000', '$2500000'),
+    ('€5,000', None, '$5500'),
+    ('$5,000 CAD', None, '$3750'),
+    ('£10K', None, None),
+    ('Founded 2019', None, None),
+    ('N/A', None, None),
+])
+def test_parse_currency(text, expected, converted):
+    assert parse_currency(text) == expected
+    assert parse_currency(text, RATES) == converted
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Yes', 'Yes'),
+    ('Active', 'Yes'),
+    ('Verified via LinkedIn', 'Yes'),
+    ('Not publicly verified', 'No'),
+    ('Not currently active', 'No'),
+    ('Not found', 'No'),
+    ('Not funded', 'No'),
+    ("Isn't active anymore", 'No'),
+    ('No longer active', 'No'),
+    ('Inactive', 'No'),
+    ('Not inactive', 'Yes'),
+    ('Active, no funding yet', 'Yes'),
+    ('Active but not verified', 'Yes'),
+    ('Closed in 2022', 'No'),
+    ('TBD', None),
+])
+def test_parse_yes_no(text, expected):
+    assert parse_yes_no(text) == expected
+
+
+def test_yes_no_rule_words():
+    legal = _compile_parser('status_legal_compliance', {'parser': 'yes_no', 'yes': ['none'], 'no': []})
+    assert legal('None') == 'Yes'
+    assert legal('None known') == 'Yes'
+    assert legal('No legal issues') == 'No'
+    assert legal('Pending lawsuit') is None
@@ -0,0 +1,60 @@
+import json
+import os
+
+import resume_store
+
+
+def _write_batch(directory, name, resumes, collected_at='2024-01-01T00:00:00'):
+    path = os.path.join(directory, name)
+    with open(path, 'w') as f:
+        json.dump({'metadata': {'count': len(resumes), 'collected_at': collected_at}, 'resumes': resumes}, f)
+    return path
+
+
+def _resume(username, collected_at='2024-01-01T00:00:00', followers=1):
+    return {'github_username': username, 'collected_at': collected_at, 'followers': followers, 'skills': []}
+
+
+def test_unchanged_batches_are_not_rehashed(tmp_path, monkeypatch):
+    directory = str(tmp_path)
+    _write_batch(directory, 'batch_001.json', [_resume('alice'), _resume('bob')])
+    _write_batch(directory, 'batch_002.json', [_resume('carol')])
+
+    hashed = []
+    real_sha256 = resume_store.file_sha256
+    monkeypatch.setattr(resume_store, 'file_sha256', lambda path: hashed.append(path) or real_sha256(path))
+
+    first = resume_store.incremental_merge(directory)
+    assert first['total_count'] == 3
+    assert len(hashed) == 2
+
+    hashed.clear()
+    output = os.path.join(directory, 'merged_all_resumes.json')
+    exported_at = os.stat(output).st_mtime_ns
+    second = resume_store.incremental_merge(directory)
+    assert second['newly_folded'] == []
+    assert hashed == []
+    assert os.stat(output).st_mtime_ns == exported_at
+
+    _write_batch(directory, 'batch_003.json', [_resume('dave', '2024-01-02T00:00:00')], '2024-01-02T00:00:00')
+    third = resume_store.incremental_merge(directory)
+    assert third['newly_folded'] == ['batch_003.json']
+    assert [os.path.basename(p) for p in hashed] == ['batch_003.json']
+    with open(output) as f:
+        assert len(json.load(f)['resumes']) == 4
+
+
+def test_rehashed_batch_without_changes_skips_export(tmp_path):
+    directory = str(tmp_path)
+    path = _write_batch(directory, 'batch_001.json', [_resume('alice')])
+    resume_store.incremental_merge(directory)
+    output = os.path.join(directory, 'merged_all_resumes.json')
+    exported_at = os.stat(output).st_mtime_ns
+
+    # Same records, different bytes: folded again but nothing newer is applied
+    with open(path, 'w') as f:
+        json.dump({'metadata': {'count': 1, 'collected_at': '2024-01-01T00:00:00'},
+                   'resumes': [_resume('alice')]}, f, indent=2)
+    result = resume_store.incremental_merge(directory)
+    assert result['newly_folded'] == ['batch_001.json']
+    assert os.stat(output).st_mtime_ns == exported_at
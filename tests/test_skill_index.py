@@ -0,0 +1,11 @@
+from skill_index import build_index
+
+
+def test_top_k_breaks_count_ties_alphabetically():
+    index = build_index([
+        {'github_username': 'u1', 'skills': ['Go', 'Golang Tools', 'Rust']},
+        {'github_username': 'u2', 'skills': ['Golang Tools', 'Go']},
+        {'github_username': 'u3', 'skills': ['Rust', 'Zig']},
+    ])
+    assert index.top_k(10) == [('Go', 2), ('Golang Tools', 2), ('Rust', 2), ('Zig', 1)]
+    assert index.top_k(2) == [('Go', 2), ('Golang Tools', 2)]
@@ -0,0 +1,70 @@
+import gc
+import json
+import os
+import weakref
+
+import verification_journal
+from verification_journal import VerificationJournal
+
+
+def _entry(founder, category='Technology', sources='LinkedIn'):
+    return {'founder': founder, 'linkedin_url': f"https://linkedin.com/in/{founder}",
+            'verification_date': '2025-07-18T12:00:00', 'verification_sources': sources, 'category': category}
+
+
+def _progress(journal, sector):
+    return next(row for row in journal.sector_progress() if row['Sector'] == sector)
+
+
+def test_sector_progress_reads_only_new_entries(tmp_path, monkeypatch):
+    journal = VerificationJournal(str(tmp_path / 'journal.jsonl'))
+    journal.append(_entry('ada'))
+    journal.append(_entry('bob', sources=''))
+    assert _progress(journal, 'Technology')['Collected'] == 2
+    assert _progress(journal, 'Technology')['Verified'] == 1
+
+    parsed = []
+    real_loads = json.loads
+    monkeypatch.setattr(verification_journal.json, 'loads', lambda s: parsed.append(s) or real_loads(s))
+    journal.append(_entry('cy', category='Healthcare'))
+    journal.append(_entry('ada'))
+    rows = {row['Sector']: row for row in journal.sector_progress()}
+    assert len(parsed) == 2
+    assert rows['Technology']['Collected'] == 2
+    assert rows['Healthcare']['Collected'] == 1
+    journal.close()
+
+
+def test_sector_progress_sees_other_writers_and_compaction(tmp_path):
+    path = str(tmp_path / 'journal.jsonl')
+    reader = VerificationJournal(path)
+    writer = VerificationJournal(path)
+    writer.append(_entry('ada'))
+    assert _progress(reader, 'Technology')['Collected'] == 1
+
+    writer.append(_entry('bob'))
+    writer.append(_entry('bob'))
+    assert _progress(reader, 'Technology')['Collected'] == 2
+
+    assert writer.compact() == {'before': 3, 'after': 2}
+    writer.append(_entry('cy'))
+    assert _progress(reader, 'Technology')['Collected'] == 3
+    reader.close()
+    writer.close()
+
+
+def test_open_journals_are_not_kept_alive(tmp_path):
+    journal = VerificationJournal(str(tmp_path / 'journal.jsonl'))
+    journal.append(_entry('ada'))
+    fd = journal._fd
+    ref = weakref.ref(journal)
+    del journal
+    gc.collect()
+    assert ref() is None
+    # The dropped journal's descriptor was closed, not leaked
+    try:
+        os.fstat(fd)
+        leaked = True
+    except OSError:
+        leaked = False
+    assert not leaked
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Adaptive Throughput Controller
+Paces GitHub API requests from live feedback instead of fixed delays: the
+rate-limit budget and time to reset set the spacing (so the hourly quota is
+spent evenly rather than burst and then slept off), while p95 latency and
+5xx / secondary-rate-limit responses move concurrency and a backoff penalty
+(additive increase, multiplicative decrease). Every decision is counted on
+the metrics surface.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Mapping, Optional
+import logging
+
+from metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+INTERVAL = REGISTRY.gauge('throughput_interval_seconds', 'Current spacing between requests', ['controller', 'resource'])
+CONCURRENCY = REGISTRY.gauge('throughput_concurrency', 'Allowed in-flight requests', ['controller'])
+BUDGET_REMAINING = REGISTRY.gauge('throughput_budget_remaining', 'Rate-limit budget left in the window', ['controller', 'resource'])
+LATENCY_P95 = REGISTRY.gauge('throughput_latency_p95_seconds', 'p95 latency over the recent window', ['controller'])
+PENALTY = REGISTRY.gauge('throughput_backoff_penalty', 'Multiplier applied to the budget spacing', ['controller'])
+DECISIONS = REGISTRY.counter('throughput_decisions_total', 'Controller adjustments by reason', ['controller', 'decision'])
+WAIT_SECONDS = REGISTRY.counter('throughput_wait_seconds_total', 'Seconds spent pacing requests', ['controller'])
+
+# GitHub asks clients to wait at least a minute after a secondary rate limit
+SECONDARY_LIMIT_PAUSE = 60
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+def resource_for(url: str) -> str:
+    """GitHub rate-limit bucket a URL is charged to"""
+    return 'search' if '/search/' in url else 'core'
+
+
+class ThroughputController:
+    """Shared pacing state for every request made with one token"""
+
+    def __init__(self, name: str, min_interval: float = 0.05, max_interval: float = 60.0,
+                 max_concurrency: int = 8, latency_target: float = 2.0,
+                 reserve_fraction: float = 0.02, window: int = 100, max_penalty: float = 32.0):
+        self.name = name
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_concurrency = max_concurrency
+        self.latency_target = latency_target
+        self.reserve_fraction = reserve_fraction
+        self.max_penalty = max_penalty
+
+        self.budgets: Dict[str, Dict] = {}  # resource -> limit, remaining, reset
+        self.penalty = 1.0
+        self.paused_until = 0.0
+        self._concurrency = 2.0
+        self._in_flight = 0
+        self._next_send: Dict[str, float] = {}
+        self._latencies = deque(maxlen=window)
+        self._evaluate_every = max(window // 5, 1)
+        self._since_evaluation = 0
+        self._cond = threading.Condition()
+
+        CONCURRENCY.set(self.concurrency, controller=name)
+        PENALTY.set(self.penalty, controller=name)
+
+    @property
+    def concurrency(self) -> int:
+        return max(int(self._concurrency), 1)
+
+    def _decide(self, decision: str, message: str) -> None:
+        DECISIONS.inc(controller=self.name, decision=decision)
+        logger.info(f"[{self.name}] {message}")
+
+    def interval(self, resource: str = 'core', now: Optional[float] = None) -> float:
+        """Spacing that spends the remaining budget evenly until the window resets"""
+        budget = self.budgets.get(resource)
+        if budget is None:
+            return self.min_interval
+        now = time.time() if now is None else now
+        seconds_left = max(budget['reset'] - now, 1.0)
+        usable = budget['remaining'] - budget['limit'] * self.reserve_fraction
+        base = seconds_left / usable if usable >= 1 else seconds_left
+        return min(max(base * self.penalty, self.min_interval), self.max_interval)
+
+    def wait(self, resource: str = 'core') -> float:
+        """Block until the next request on resource may be sent; returns seconds waited"""
+        with self._cond:
+            now = time.time()
+            send_at = max(now, self._next_send.get(resource, 0.0), self.paused_until)
+            budget = self.budgets.get(resource)
+            if budget is not None:
+                if budget['remaining'] <= budget['limit'] * self.reserve_fraction and budget['reset'] > now:
+                    # Only the reserve is left: hold until the window resets
+                    send_at = max(send_at, budget['reset'] + 1)
+                    if self._next_send.get(resource, 0.0) < send_at:
+                        self._decide('budget_exhausted', f"{resource} budget spent, holding "
+                                     f"{send_at - now:.0f}s until reset")
+                # Reserve this request locally; the next response corrects it
+                budget['remaining'] -= 1
+            interval = self.interval(resource, send_at)
+            self._next_send[resource] = send_at + interval
+            INTERVAL.set(interval, controller=self.name, resource=resource)
+
+        delay = send_at - now
+        if delay > 0:
+            WAIT_SECONDS.inc(delay, controller=self.name)
+            time.sleep(delay)
+        return delay
+
+    @contextmanager
+    def slot(self):
+        """Hold one of the currently allowed concurrent request slots"""
+        with self._cond:
+            while self._in_flight >= self.concurrency:
+                self._cond.wait()
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+    def observe(self, resource: str = 'core', status: Optional[int] = None, latency: Optional[float] = None,
+                headers: Optional[Mapping[str, str]] = None, body: str = '') -> bool:
+        """Feed one response (status None for a transport error) back; True if it should be retried"""
+        headers = headers or {}
+        now = time.time()
+        with self._cond:
+            if 'X-RateLimit-Remaining' in headers:
+                resource = headers.get('X-RateLimit-Resource', resource)
+                self.budgets[resource] = {
+                    'limit': int(headers.get('X-RateLimit-Limit', 0)),
+                    'remaining': int(headers['X-RateLimit-Remaining']),
+                    'reset': float(headers.get('X-RateLimit-Reset', now + 3600)),
+                }
+                BUDGET_REMAINING.set(self.budgets[resource]['remaining'], controller=self.name, resource=resource)
+
+            if latency is not None:
+                self._latencies.append(latency)
+
+            retry_after = headers.get('Retry-After')
+            secondary = status in (403, 429) and (retry_after is not None or 'secondary rate limit' in body.lower())
+            failed = status is None or status in RETRYABLE_STATUSES or secondary
+
+            if failed:
+                self.penalty = min(self.penalty * 2, self.max_penalty)
+                self._concurrency = max(self._concurrency / 2, 1.0)
+                if secondary or status == 429:
+                    pause = float(retry_after) if retry_after else SECONDARY_LIMIT_PAUSE
+                    self.paused_until = max(self.paused_until, now + pause)
+                    self._decide('secondary_limit', f"secondary rate limit, pausing {pause:.0f}s")
+                else:
+                    self._decide('server_error', f"{'transport error' if status is None else status}, "
+                                 f"penalty x{self.penalty:.1f}, concurrency {self.concurrency}")
+            else:
+                self.penalty = max(self.penalty * 0.9, 1.0)
+                self._since_evaluation += 1
+                if self._since_evaluation >= self._evaluate_every:
+                    self._since_evaluation = 0
+                    self._evaluate_latency()
+
+            CONCURRENCY.set(self.concurrency, controller=self.name)
+            PENALTY.set(self.penalty, controller=self.name)
+            self._cond.notify_all()
+        return failed
+
+    def _evaluate_latency(self) -> None:
+        """Grow concurrency while p95 stays under target, shrink it when it does not"""
+        p95 = self.p95_latency()
+        if p95 is None:
+            return
+        LATENCY_P95.set(p95, controller=self.name)
+        previous = self.concurrency
+        if p95 > self.latency_target:
+            self._concurrency = max(self._concurrency * 0.75, 1.0)
+            if self.concurrency != previous:
+                self._decide('slow', f"p95 {p95:.2f}s over target, concurrency {self.concurrency}")
+        elif self._concurrency < self.max_concurrency:
+            self._concurrency = min(self._concurrency + 1, self.max_concurrency)
+            if self.concurrency != previous:
+                DECISIONS.inc(controller=self.name, decision='increase')
+
+    def p95_latency(self) -> Optional[float]:
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)]
+
+    def state(self) -> Dict:
+        """Current pacing decisions, for logs and summaries"""
+        with self._cond:
+            return {
+                'concurrency': self.concurrency,
+                'penalty': self.penalty,
+                'paused_for': max(self.paused_until - time.time(), 0),
+                'p95_latency': self.p95_latency(),
+                'intervals': {r: self.interval(r) for r in self.budgets},
+                'budgets': {r: dict(b) for r, b in self.budgets.items()},
+            }
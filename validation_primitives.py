@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Validation Primitives for Resume Data
+Precompiled email/URL validators shared by the validator and scoring rules
+"""
+
+import re
+import timeit
+from typing import Optional
+
+
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+URL_PATTERN = re.compile(r'^https?://[^\s/$.?#].[^\s]*$')
+
+
+def is_valid_email(email: Optional[str]) -> bool:
+    """Validate email format"""
+    return bool(email) and EMAIL_PATTERN.match(email) is not None
+
+
+def is_valid_url(url: Optional[str]) -> bool:
+    """Validate URL format"""
+    return bool(url) and URL_PATTERN.match(url) is not None
+
+
+def benchmark_validators(sample_size: int = 10000, repeat: int = 5) -> dict:
+    """Micro-benchmark precompiled validators against the per-call re.match versions"""
+    from data_validator import ResumeDataValidator
+
+    emails = ['jane.doe@example.com', 'not-an-email', '', 'dev+gh@company.io'] * (sample_size // 4)
+    urls = ['https://example.com/blog', 'example.com', '', 'http://dev.to/me'] * (sample_size // 4)
+
+    def legacy_email(email):
+        if not email:
+            return False
+        return bool(re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email))
+
+    def legacy_url(url):
+        if not url:
+            return False
+        return bool(re.match(r'^https?://[^\s/$.?#].[^\s]*$', url))
+
+    validator = ResumeDataValidator()
+    cases = {
+        'legacy_email_per_call': lambda: [legacy_email(e) for e in emails],
+        'validator_email_per_call': lambda: [validator.validate_email(e) for e in emails],
+        'legacy_url_per_call': lambda: [legacy_url(u) for u in urls],
+        'validator_url_per_call': lambda: [validator.validate_url(u) for u in urls],
+    }
+
+    results = {}
+    for name, fn in cases.items():
+        best = min(timeit.repeat(fn, number=1, repeat=repeat))
+        results[name] = {
+            'seconds': best,
+            'ns_per_value': best / len(emails) * 1e9
+        }
+    return results
+
+
+if __name__ == "__main__":
+    import sys
+
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    print(f"Validator micro-benchmark ({size} values, best of 5)")
+    print("-" * 50)
+    for name, timing in benchmark_validators(size).items():
+        print(f"{name:<28} {timing['seconds'] * 1000:8.2f} ms  {timing['ns_per_value']:8.0f} ns/value")
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Founder Verification Journal
+Append-only JSONL log of founder verifications. Each entry is one locked
+O_APPEND write, so adding a founder costs O(1) no matter how long the log is
+and concurrent writers never lose entries; fsyncs are batched. Sector
+progress is tallied in memory: the journal is scanned once, then only the
+bytes appended since the last query (by this or any other writer) are read.
+`compact` rewrites it without duplicates or torn lines.
+"""
+
+import atexit
+import fcntl
+import json
+import os
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+
+DEFAULT_JOURNAL = 'linkedin_verification_log.jsonl'
+LEGACY_LOG = 'linkedin_verification_log.json'
+
+# Journals still open at exit; weak so a journal (and its owner) can be collected
+_open_journals: 'weakref.WeakSet[VerificationJournal]' = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_journals() -> None:
+    for journal in list(_open_journals):
+        journal.close()
+
+
+class SectorTally:
+    """Distinct founders per sector (collected, verified) and latest verification date"""
+
+    def __init__(self):
+        self.collected: Dict[str, Set[str]] = {}
+        self.verified: Dict[str, Set[str]] = {}
+        self.last_updated: Dict[str, str] = {}
+
+    def add(self, entry: Dict) -> None:
+        sector = entry.get('category') or 'Unknown'
+        founder = entry.get('linkedin_url') or entry.get('founder')
+        self.collected.setdefault(sector, set()).add(founder)
+        if entry.get('verification_sources'):
+            self.verified.setdefault(sector, set()).add(founder)
+        self.last_updated[sector] = max(self.last_updated.get(sector, ''), entry.get('verification_date', ''))
+
+
+class VerificationJournal:
+    """Locked appends with batched fsync; compaction swaps the file under the same lock"""
+
+    def __init__(self, path: str = DEFAULT_JOURNAL, sync_every: int = 32, sync_interval: float = 1.0):
+        self.path = path
+        self.lock_path = f"{path}.lock"
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self._fd: Optional[int] = None
+        self._fd_finalizer: Optional[weakref.finalize] = None
+        self._unsynced = 0
+        self._last_sync = time.time()
+        self._tally = SectorTally()
+        self._tally_file: Optional[Tuple[int, int]] = None    # (st_dev, st_ino) the tally was read from
+        self._tally_offset = 0
+
+    @contextmanager
+    def _locked(self, mode: int = fcntl.LOCK_EX):
+        lock_fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(lock_fd, mode)
+            yield
+        finally:
+            fcntl.flock(lock_fd, fcntl.LOCK_UN)
+            os.close(lock_fd)
+
+    def _file(self) -> int:
+        """Append descriptor for the current journal file (reopened if compaction replaced it)"""
+        if self._fd is not None:
+            try:
+                if os.fstat(self._fd).st_ino == os.stat(self.path).st_ino:
+                    return self._fd
+            except FileNotFoundError:
+                pass
+            self._close_fd()
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        # A journal dropped without close() still releases its descriptor
+        self._fd_finalizer = weakref.finalize(self, os.close, self._fd)
+        self._fd_finalizer.atexit = False    # at exit, _close_open_journals syncs and closes it
+        _open_journals.add(self)
+        return self._fd
+
+    def _close_fd(self) -> None:
+        self.sync()
+        self._fd_finalizer.detach()
+        os.close(self._fd)
+        self._fd = None
+
+    def append(self, entry: Dict) -> None:
+        """Append one entry; fsync once sync_every entries or sync_interval seconds have built up"""
+        line = (json.dumps(entry, ensure_ascii=False) + '\n').encode('utf-8')
+        with self._locked():
+            fd = self._file()
+            view = memoryview(line)
+            while view:
+                view = view[os.write(fd, view):]
+        self._unsynced += 1
+        if self._unsynced >= self.sync_every or time.time() - self._last_sync >= self.sync_interval:
+            self.sync()
+
+    def sync(self) -> None:
+        """Force appended entries to disk"""
+        if self._fd is not None and self._unsynced:
+            os.fsync(self._fd)
+        self._unsynced = 0
+        self._last_sync = time.time()
+
+    def close(self) -> None:
+        if self._fd is not None:
+            self._close_fd()
+        _open_journals.discard(self)
+
+    def __enter__(self) -> 'VerificationJournal':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def entries(self) -> Iterator[Dict]:
+        """Every complete entry in append order (a torn line from a crash is skipped)"""
+        for entry, _ in self._entries_from(0):
+            yield entry
+
+    def _entries_from(self, offset: int) -> Iterator[Tuple[Dict, int]]:
+        """(entry, offset after its line) for complete lines from a byte offset"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # partial write; compaction removes it
+                offset += len(line)
+                try:
+                    yield json.loads(line), offset
+                except json.JSONDecodeError:
+                    continue
+
+    def migrate_legacy(self, legacy_path: str = LEGACY_LOG) -> int:
+        """Import a legacy JSON-array log once, if the journal does not exist yet"""
+        if os.path.exists(self.path) or not os.path.exists(legacy_path):
+            return 0
+        with open(legacy_path, 'r', encoding='utf-8') as f:
+            legacy = json.load(f)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for entry in legacy:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        with self._locked():
+            if os.path.exists(self.path):
+                os.unlink(tmp_path)  # another writer migrated first
+                return 0
+            os.replace(tmp_path, self.path)
+        return len(legacy)
+
+    def compact(self, key: str = 'linkedin_url') -> Dict[str, int]:
+        """Rewrite the journal keeping the latest entry per key, dropping torn or corrupt lines"""
+        with self._locked():
+            before = 0
+            latest: Dict = {}
+            for entry in self.entries():
+                before += 1
+                # Re-inserting moves a re-verified founder to its latest position
+                ident = entry.get(key) or json.dumps(entry, sort_keys=True)
+                latest.pop(ident, None)
+                latest[ident] = entry
+
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for entry in latest.values():
+                    f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        return {'before': before, 'after': len(latest)}
+
+    def _refresh_tally(self) -> SectorTally:
+        """Fold entries appended since the last call into the tally; re-scan if the file was replaced"""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            stat = None
+        identity = (stat.st_dev, stat.st_ino) if stat else None
+        if identity != self._tally_file or (stat and stat.st_size < self._tally_offset):
+            # New, compacted or truncated journal
+            self._tally = SectorTally()
+            self._tally_file = identity
+            self._tally_offset = 0
+        if stat and stat.st_size > self._tally_offset:
+            for entry, offset in self._entries_from(self._tally_offset):
+                self._tally.add(entry)
+                self._tally_offset = offset
+        return self._tally
+
+    def sector_progress(self, targets: Optional[Dict[str, int]] = None) -> List[Dict]:
+        """Per-sector counts (distinct founders by LinkedIn URL), reading only new journal entries"""
+        tally = self._refresh_tally()
+        targets = targets or {}
+        rows = []
+        for sector in list(targets) + sorted(s for s in tally.collected if s not in targets):
+            count = len(tally.collected.get(sector, ()))
+            target = targets.get(sector, 0)
+            rows.append({
+                'Sector': sector,
+                'Target': target,
+                'Collected': count,
+                'Verified': len(tally.verified.get(sector, ())),
+                'Status': 'Complete' if target and count >= target else 'In Progress' if count else 'Not Started',
+                'Last_Updated': tally.last_updated.get(sector, '')[:19].replace('T', ' '),
+            })
+        return rows
+
+if __name__ == "__main__":
+    import sys
+
+    command = sys.argv[1] if len(sys.argv) > 1 else 'progress'
+    journal = VerificationJournal(sys.argv[2] if len(sys.argv) > 2 else DEFAULT_JOURNAL)
+    if command == 'migrate':
+        print(f"Migrated {journal.migrate_legacy()} entries from {LEGACY_LOG}")
+    elif command == 'compact':
+        stats = journal.compact()
+        print(f"Compacted {journal.path}: {stats['before']} -> {stats['after']} entries")
+    elif command == 'progress':
+        for row in journal.sector_progress():
+            print(f"{row['Sector']:<30} {row['Collected']:>5} collected {row['Verified']:>5} verified")
+    else:
+        print("Usage: python verification_journal.py [progress|compact|migrate] [journal.jsonl]")
+        sys.exit(1)